@@ -0,0 +1,55 @@
+"""
+Times utils.anomalies.score_anomalies() on a large synthetic numeric frame: the model is
+fitted on a subsample and every row is scored in batches on a thread pool, against
+fitting and scoring all the rows in one scikit-learn call.
+
+Usage:
+    python benchmarks/bench_anomalies.py --rows 5000000 --columns 5 --workers -1
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sklearn.ensemble import IsolationForest
+
+from utils.anomalies import score_anomalies
+
+def make_frame(rows, columns, seed=0):
+    """Return normal columns with 0.1% of the rows shifted far away in all of them."""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(rows, columns))
+    values[rng.random(rows) < 0.001] += 6.0
+    return pd.DataFrame(values, columns=[f"c{i}" for i in range(columns)])
+
+def time_call(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--sample-size", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=-1)
+    parser.add_argument("--full", action="store_true", help="Also time fit_predict() on all the rows")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.columns)
+    print(f"{args.rows} rows, {args.columns} columns, {os.cpu_count()} cores\n")
+    if args.full:
+        time_call("IsolationForest on all rows", lambda: IsolationForest(random_state=0).fit_predict(df.to_numpy()))
+    time_call("score_anomalies(isolation_forest)",
+              lambda: score_anomalies(df, df.columns, sample_size=args.sample_size, workers=args.workers))
+    head = df.head(min(args.rows, 200_000))
+    time_call(f"score_anomalies(lof), {len(head)} rows",
+              lambda: score_anomalies(head, head.columns, 'lof', sample_size=10_000, workers=args.workers))
+
+if __name__ == "__main__":
+    main()
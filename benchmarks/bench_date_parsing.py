@@ -0,0 +1,61 @@
+"""
+Compares utils.date_parsing.parse_dates() with pd.to_datetime() on a synthetic date column
+written in several formats, with distinct timestamps (--distinct) or repeated dates.
+
+pd.to_datetime() without a format takes the format of the first value and turns the values
+in other formats into NaT; format='mixed' parses them all, one value at a time.
+
+Usage:
+    python benchmarks/bench_date_parsing.py --rows 1000000 --distinct
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.date_parsing import parse_dates
+
+FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%b %d, %Y", "%Y-%m-%d %H:%M:%S"]
+
+def make_dates(rows, distinct=False, seed=0):
+    """Return date strings in FORMATS and the timestamps they stand for."""
+    rng = np.random.default_rng(seed)
+    unit = "s" if distinct else "D"
+    span = 30 * 365 * (86_400 if distinct else 1)
+    timestamps = pd.Timestamp("1995-01-01") + pd.to_timedelta(rng.integers(0, span, rows), unit)
+    choice = rng.integers(0, len(FORMATS), rows)
+    strings = np.select([choice == i for i in range(len(FORMATS))], [timestamps.strftime(fmt) for fmt in FORMATS])
+    # Formats without a time part drop it
+    expected = timestamps.where(choice == len(FORMATS) - 1, timestamps.normalize())
+    return pd.Series(strings), expected
+
+def time_call(label, func, expected):
+    start = time.perf_counter()
+    dates = func()
+    seconds = time.perf_counter() - start
+    correct = (pd.Series(dates).to_numpy() == expected.to_numpy()).mean()
+    print(f"{label:<32} {seconds:8.3f} s  {correct:7.1%} correct")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", action="store_true", help="Distinct timestamps instead of repeated dates")
+    parser.add_argument("--mixed-max", type=int, default=200_000,
+                        help="Largest number of rows format='mixed' is run on")
+    args = parser.parse_args()
+
+    strings, expected = make_dates(args.rows, args.distinct)
+    print(f"{args.rows} rows, {strings.nunique()} distinct strings\n")
+    time_call("parse_dates()", lambda: parse_dates(strings, dayfirst=True)[0], expected)
+    time_call("pd.to_datetime()", lambda: pd.to_datetime(strings, errors="coerce"), expected)
+    if args.rows <= args.mixed_max:
+        time_call("pd.to_datetime(format='mixed')",
+                  lambda: pd.to_datetime(strings, errors="coerce", format="mixed", dayfirst=True), expected)
+
+if __name__ == "__main__":
+    main()
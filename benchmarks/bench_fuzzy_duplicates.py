@@ -0,0 +1,91 @@
+"""
+Compares fuzzy duplicate detection with blocking against the quadratic thefuzz loop it
+replaced, on synthetic company names of which a share are near-duplicates.
+
+The quadratic loop is only timed up to --baseline-max uniques; above that its time is
+extrapolated from the largest measured size (it grows with the square of the uniques).
+
+Usage:
+    python benchmarks/bench_fuzzy_duplicates.py --sizes 1000 10000 100000 --threshold 90
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kernels.duplicates import find_fuzzy_duplicates
+
+try:
+    from thefuzz import process
+    THEFUZZ_AVAILABLE = True
+except ImportError:
+    THEFUZZ_AVAILABLE = False
+
+def make_names(count, seed=0, duplicate_rate=0.2):
+    """Build distinct company-like names; about duplicate_rate of them are variants of earlier names."""
+    rng = random.Random(seed)
+    syllables = [c + v + e for c in "bcdfghklmnprstvz" for v in "aeiou" for e in ["", "n", "r", "s"]]
+    suffixes = ["", "", "", " Inc", " Ltd", " Co", " Group", " Holdings", " & Sons"]
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    names, originals = set(), []
+    while len(names) < count:
+        if originals and rng.random() < duplicate_rate:
+            name = rng.choice(originals)
+            i = rng.randrange(len(name))
+            name = rng.choice([name[:i] + name[i + 1:], name[:i] + rng.choice("aeiourst") + name[i:],
+                               name.upper(), name + " Inc"])
+        else:
+            name = " ".join(word() for _ in range(rng.randint(1, 3))).title() + rng.choice(suffixes)
+            originals.append(name)
+        names.add(name)
+    return sorted(names)
+
+def quadratic_fuzzy_duplicates(values, threshold):
+    """The previous implementation: one process.extract over all values per value."""
+    duplicates = []
+    for value in values:
+        matches = process.extract(value, values, limit=None)
+        duplicates.extend(match[0] for match in matches if match[1] >= threshold and match[0] != value)
+    return set(duplicates)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--threshold", type=int, default=90)
+    parser.add_argument("--baseline-max", type=int, default=2_000,
+                        help="Largest number of uniques the quadratic loop is run on")
+    args = parser.parse_args()
+
+    print(f"threshold {args.threshold}, {os.cpu_count()} CPUs\n")
+    print(f"{'uniques':>8} {'blocking':>10} {'quadratic':>12} {'speedup':>9} {'similar':>8}  check")
+    baseline = None
+    for size in args.sizes:
+        names = make_names(size, seed=size)
+        start = time.perf_counter()
+        similar = find_fuzzy_duplicates(pd.Series(names), args.threshold)
+        seconds = time.perf_counter() - start
+
+        check = ""
+        if THEFUZZ_AVAILABLE and size <= args.baseline_max:
+            start = time.perf_counter()
+            expected = quadratic_fuzzy_duplicates(names, args.threshold)
+            baseline = (size, time.perf_counter() - start)
+            quadratic = f"{baseline[1]:10.2f} s"
+            check = "identical" if expected == similar else f"{len(expected ^ similar)} values differ"
+        elif baseline:
+            quadratic = f"~{baseline[1] * (size / baseline[0]) ** 2:9.0f} s"
+        else:
+            quadratic = "n/a"
+        speedup = f"{float(quadratic.strip('~ s')) / seconds:8.0f}x" if quadratic != "n/a" else ""
+        print(f"{size:>8} {seconds:8.2f} s {quadratic:>12} {speedup:>9} {len(similar):>8}  {check}")
+
+if __name__ == "__main__":
+    main()
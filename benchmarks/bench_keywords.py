@@ -0,0 +1,66 @@
+"""
+Compares utils.keywords.find_keywords(), which compiles the keywords once into an
+Aho-Corasick automaton (with pyahocorasick) or a trie-shaped regular expression and scans
+each text once, with a regular-expression search per keyword and row like the one it
+replaced, on synthetic product descriptions. The per-keyword search is timed on the first
+--baseline-rows rows only.
+
+Usage:
+    python benchmarks/bench_keywords.py --rows 2000000 --keywords 5000 --baseline-rows 200
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.keywords import AHOCORASICK_AVAILABLE, find_keywords
+
+def make_texts(rows, vocabulary=20_000, seed=0):
+    """Return the vocabulary and rows descriptions of 5 to 25 random words from it."""
+    rng = np.random.default_rng(seed)
+    letters = list('abcdefghijklmnopqrstuvwxyz')
+    words = np.array([''.join(rng.choice(letters, rng.integers(3, 10))) for _ in range(vocabulary)])
+    lengths = rng.integers(5, 25, rows)
+    picked = words[rng.integers(0, vocabulary, lengths.sum())]
+    ends = np.cumsum(lengths)
+    return words, pd.Series([' '.join(picked[end - length:end]).capitalize() for end, length in zip(ends, lengths)])
+
+def per_keyword(texts, keywords):
+    """One case-insensitive whole-word search per keyword and row."""
+    return texts.apply(lambda text: ','.join(
+        kw for kw in keywords if isinstance(text, str) and re.search(r'\b' + re.escape(kw) + r'\b', text, re.IGNORECASE)))
+
+def time_call(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--keywords", type=int, default=5_000)
+    parser.add_argument("--baseline-rows", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    words, texts = make_texts(args.rows)
+    rng = np.random.default_rng(1)
+    # A fifth of the keywords are two-word phrases
+    phrases = args.keywords // 5
+    keywords = list(words[:args.keywords - phrases]) + [' '.join(words[rng.integers(0, len(words), 2)])
+                                                        for _ in range(phrases)]
+    print(f"{args.rows} rows, {len(keywords)} keywords\n")
+    time_call(f"per-keyword search, {args.baseline_rows} rows", lambda: per_keyword(texts[:args.baseline_rows], keywords))
+    backends = ['ahocorasick', 'regex'] if AHOCORASICK_AVAILABLE else ['regex']
+    for backend in backends:
+        time_call(f"find_keywords({backend!r})",
+                  lambda: find_keywords(texts, keywords, workers=args.workers, backend=backend))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares the exact and the approximate (sketch based) data profile on a synthetic frame.
+
+Usage:
+    python benchmarks/bench_profile.py --rows 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.profile import ProfileCache
+
+def make_frame(rows, seed=0):
+    """Build a frame with skewed numeric, high-cardinality text, categorical and datetime columns."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "amount": rng.lognormal(3, 1, rows),
+        "quantity": rng.integers(0, 500, rows),
+        "customer": rng.integers(0, rows // 10 + 1, rows).astype(str),
+        "country": pd.Categorical(rng.choice(["Greece", "Germany", "France", "Spain"], rows)),
+        "created": pd.to_datetime(rng.integers(0, 10 ** 9, rows), unit="s"),
+    })
+
+def time_call(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<24} {time.perf_counter() - start:8.3f} s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    print(f"{args.rows:,} rows, {df.memory_usage(deep=True).sum() / 1024 ** 2:.1f} MB, {os.cpu_count()} CPUs\n")
+
+    exact = time_call("exact profile", lambda: ProfileCache().profile(df))
+    approximate = time_call("approximate profile", lambda: ProfileCache().profile(df, approximate=True))
+
+    print("\nExact statistics:")
+    print(exact.describe())
+    print("\nApproximate statistics:")
+    print(approximate.describe())
+    print("\nError bounds:")
+    print(approximate.errors())
+
+if __name__ == "__main__":
+    main()
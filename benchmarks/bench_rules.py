@@ -0,0 +1,85 @@
+"""
+Compares utils.rules.evaluate_rules(), which shares the conversion and the distinct values
+of a column between all its rules, with checking each rule on its own with pandas, on a
+synthetic frame of numeric, text, categorical and date columns and a few hundred rules.
+
+Usage:
+    python benchmarks/bench_rules.py --rows 2000000 --rules 300
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.rules import evaluate_rules
+
+STATUSES = ['open', 'closed', 'pending', 'x1', '12345']
+
+def make_frame(rows, seed=0):
+    """Return 10 numeric, 10 text (half categorical) and 5 date columns."""
+    rng = np.random.default_rng(seed)
+    columns = {f"n{i}": rng.normal(50, 20, rows) for i in range(10)}
+    for i in range(10):
+        values = pd.Series(rng.choice(STATUSES, rows))
+        columns[f"s{i}"] = values.astype('category') if i % 2 else values
+    for i in range(5):
+        columns[f"d{i}"] = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1000, rows), unit='D')
+    return pd.DataFrame(columns)
+
+def make_rules(count):
+    rules = []
+    for k in range(count):
+        kind = k % 4
+        if kind == 0:
+            rules.append({"type": "range", "column": f"n{k % 10}", "min": k % 7, "max": 100 - k % 5})
+        elif kind == 1:
+            rules.append({"type": "regex", "column": f"s{k % 10}", "pattern": "[a-z]+"})
+        elif kind == 2:
+            rules.append({"type": "allowed", "column": f"s{k % 10}", "values": STATUSES[:3]})
+        elif k % 8 == 3:
+            rules.append({"type": "expression", "expression": f"n{k % 10} <= n{(k + 1) % 10} + 80"})
+        else:
+            rules.append({"type": "range", "column": f"d{k % 5}", "min": "2020-03-01"})
+    return rules
+
+def per_rule(df, rules):
+    """Each rule checked on its own, scanning its column again."""
+    counts = []
+    for rule in rules:
+        if rule["type"] == 'range':
+            column = df[rule["column"]]
+            low = pd.Timestamp(rule["min"]) if column.dtype.kind == 'M' else rule.get("min")
+            failed = (column < low) | (column > rule["max"]) if "max" in rule else column < low
+        elif rule["type"] == 'regex':
+            failed = ~df[rule["column"]].astype(str).str.fullmatch(rule["pattern"])
+        elif rule["type"] == 'allowed':
+            failed = ~df[rule["column"]].isin(rule["values"])
+        else:
+            failed = ~df.eval(rule["expression"])
+        counts.append(int(failed.sum()))
+    return counts
+
+def time_call(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--rules", type=int, default=300)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    rules = make_rules(args.rules)
+    print(f"{args.rows} rows, {args.rules} rules\n")
+    time_call("pandas check per rule", lambda: per_rule(df, rules))
+    time_call("evaluate_rules", lambda: evaluate_rules(df, rules))
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,21 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+import importlib
 import os
-from utils.file_operations import read_csv_file, generate_csv_download_link
-from components.overview import display_data_overview
-from components.missing_data import handle_missing_data
-from components.duplicates import remove_duplicates
-from components.formatting import fix_inconsistent_formats
-from components.categorical import standardize_categorical_data
-from components.error_correction import correct_errors, display_error_correction_options
-from components.text_parsing import parse_text_data
-from components.type_conversion import type_conversion
-from components.column_operations import display_column_operations
-from components.noisy_data import handle_noisy_data
-from components.reshape import reshape_data
-from components.unstructured_data import clean_unstructured_data
-from components.cleaning_history import display_cleaning_history
+from utils.file_operations import (
+    read_csv_file, read_columnar_file, read_columnar_schema, columnar_format,
+    to_csv_bytes, to_parquet_bytes, PYARROW_AVAILABLE
+)
+from utils.parse_cache import ParseCache, content_digest
+from utils.memory_optimizer import optimize_dtypes
+from utils.dataset_store import enable_copy_on_write
+from utils.session import init_dataset, undo_step, redo_step, reset_data
 from utils.labels import get_label
 
+# Versions of the dataset share column buffers, so writes must copy first
+enable_copy_on_write()
+
 # Set page configuration
 st.set_page_config(
     page_title="Data Cleaner App",
@@ -42,6 +40,12 @@ if 'file_name' not in st.session_state:
     st.session_state.file_name = ""
 if 'cleaning_report' not in st.session_state:
     st.session_state.cleaning_report = {}
+if 'upload_key' not in st.session_state:
+    st.session_state.upload_key = None
+if 'upload_digests' not in st.session_state:
+    st.session_state.upload_digests = {}
+if 'memory_report' not in st.session_state:
+    st.session_state.memory_report = None
 
 # Add language selector at the top right
 st.markdown("""
@@ -58,6 +62,140 @@ with cols[1]:
     lang = st.selectbox("", ["English", "Ελληνικά"], key="language_select", label_visibility="collapsed")
     st.session_state["language"] = 'el' if lang == "Ελληνικά" else 'en'
 
+# Upper bound for parsed uploads kept in memory across reruns and sessions
+PARSE_CACHE_MAX_BYTES = int(os.environ.get("DATA_CLEANER_PARSE_CACHE_MB", "2048")) * 1024 * 1024
+
+# Sections of the app: label key -> (module, function). A section's module is imported the
+# first time the section is shown and only the selected section runs on each rerun.
+SECTIONS = {
+    "data_overview": ("components.overview", "display_data_overview"),
+    "missing_data": ("components.missing_data", "display_missing_data_options"),
+    "duplicates": ("components.duplicates", "remove_duplicates"),
+    "format_fixing": ("components.formatting", "display_format_fixing"),
+    "categorical_data": ("components.categorical", "display_categorical_standardization"),
+    "error_correction_tab": ("components.error_correction", "display_error_correction_options"),
+    "text_parsing_tab": ("components.text_parsing", "parse_text_data"),
+    "type_conversion_tab": ("components.type_conversion", "display_type_conversion"),
+    "column_operations_tab": ("components.column_operations", "display_column_operations"),
+    "noisy_data_tab": ("components.noisy_data", "display_noisy_data_cleaning"),
+    "reshape_data_tab": ("components.reshape", "reshape_data"),
+    "unstructured_data_tab": ("components.unstructured_data", "display_unstructured_data_cleaning"),
+    "cleaning_history_tab": ("components.cleaning_history", "display_cleaning_history"),
+}
+
+def render_section(section):
+    """Import the module of a section and render it for the current data."""
+    module_name, function_name = SECTIONS[section]
+    render = getattr(importlib.import_module(module_name), function_name)
+    if section == "data_overview":
+        render(st.session_state.data, st.session_state.memory_report)
+    elif section == "cleaning_history_tab":
+        render()
+    else:
+        render(st.session_state.data)
+
+@st.cache_resource
+def get_parse_cache():
+    """Return the parse cache shared by all sessions of this server."""
+    return ParseCache(max_bytes=PARSE_CACHE_MAX_BYTES)
+
+# Uploads larger than this are parsed in parallel, and above the streaming
+# threshold streamed in chunks, by default
+PARALLEL_THRESHOLD_BYTES = 32 * 1024 * 1024
+STREAMING_THRESHOLD_BYTES = 100 * 1024 * 1024
+DEFAULT_CHUNK_ROWS = 100_000
+
+def load_uploaded_file(uploaded_file, chunksize=None, parallel=False, optimize=True, **read_options):
+    """
+    Returns the parsed upload from the parse cache, parsing it only on a cache miss.
+
+    The content digest is computed once per uploaded file and session, so reruns
+    triggered by widget interactions neither hash nor parse the file again. When
+    chunksize is set the file is streamed in chunks with a progress bar; when
+    parallel is set it is parsed on all cores.
+
+    Parquet, Feather and Arrow files are read with read_columnar_file(), and
+    read_options then carry the column projection and row filters. With optimize
+    set, the cached frame is converted to compact dtypes and the per-column
+    memory report is kept in the entry's metadata.
+
+    Returns:
+        tuple: The cache key and the cache entry with "data" and "metadata".
+    """
+    file_format = columnar_format(uploaded_file.name)
+    parse_options = dict(read_options, chunksize=chunksize, parallel=parallel, optimize=optimize, file_format=file_format)
+    upload_id = (getattr(uploaded_file, "file_id", None) or uploaded_file.name, uploaded_file.size, repr(sorted(parse_options.items())))
+    key = st.session_state.upload_digests.get(upload_id)
+    if key is None:
+        key = content_digest(uploaded_file.getvalue(), parse_options)
+        st.session_state.upload_digests[upload_id] = key
+
+    cache = get_parse_cache()
+    entry = cache.get(key)
+    if entry is None:
+        uploaded_file.seek(0)
+        if file_format:
+            df = read_columnar_file(uploaded_file, file_format, **read_options)
+        elif chunksize:
+            progress_text = get_label('reading_file_progress')
+            progress_bar = st.progress(0.0, text=progress_text.format(percent=0))
+            df = read_csv_file(
+                uploaded_file,
+                chunksize=chunksize,
+                progress_callback=lambda fraction: progress_bar.progress(fraction, text=progress_text.format(percent=int(fraction * 100))),
+                **read_options
+            )
+            progress_bar.empty()
+        else:
+            df = read_csv_file(uploaded_file, parallel=parallel, **read_options)
+        memory_report = None
+        if optimize:
+            df, memory_report = optimize_dtypes(df)
+        entry = cache.put(key, df, {
+            "rows": len(df),
+            "columns": len(df.columns),
+            "size_bytes": uploaded_file.size,
+            "memory_report": memory_report,
+        })
+    return key, entry
+
+def parse_filter_value(value, arrow_type):
+    """Convert a row filter value typed in the sidebar to the Python type of its Arrow column."""
+    if arrow_type.startswith(('int', 'uint')):
+        return int(value)
+    if arrow_type.startswith(('float', 'double', 'decimal')):
+        return float(value)
+    if arrow_type == 'bool':
+        return value.strip().lower() in ('true', '1', 'yes')
+    return value
+
+def display_sidebar_actions():
+    """Show the reset, undo and redo buttons and the export links for the current data."""
+    store = st.session_state.dataset_store
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button(get_label('reset'), key="reset_btn", help=get_label('reset_tooltip')):
+            reset_data()
+            st.toast(get_label('reset_success'))
+            st.rerun()
+    with col2:
+        if st.button(get_label('undo'), key="undo_btn", help=get_label('undo_tooltip'), disabled=not store.can_undo):
+            undo_step()
+            st.rerun()
+    with col3:
+        if st.button(get_label('redo'), key="redo_btn", help=get_label('redo_tooltip'), disabled=not store.can_redo):
+            redo_step()
+            st.rerun()
+    
+    # Add export options with clear labeling; the files are only built when a button is clicked
+    st.markdown(f"<h4>📤 {get_label('export_options')}</h4>", unsafe_allow_html=True)
+    data = st.session_state.data
+    st.download_button(get_label('download_csv'), data=lambda: to_csv_bytes(data), file_name="cleaned_data.csv",
+                       mime="text/csv", key="sidebar_csv_download")
+    if PYARROW_AVAILABLE:
+        st.download_button(get_label('download_parquet'), data=lambda: to_parquet_bytes(data), file_name="cleaned_data.parquet",
+                           mime="application/vnd.apache.parquet", key="sidebar_parquet_download")
+
 # Function to run the app
 def main():
     # Logo and title in branded wrapper
@@ -71,28 +209,70 @@ def main():
     st.markdown(f"<p style='font-size: 1.2rem; margin-bottom: 2rem;'>{get_label('app_description')}</p>", unsafe_allow_html=True)
     
     # Sidebar for file upload and basic information
+    sidebar_actions = None
     with st.sidebar:
         st.markdown(f"<h3>🗂 {get_label('upload')}</h3>", unsafe_allow_html=True)
-        uploaded_file = st.file_uploader(get_label('choose_file'), type=["csv"])
+        uploaded_file = st.file_uploader(get_label('choose_file'), type=["csv", "parquet", "pq", "feather", "arrow", "ipc"])
         
         # Add sidebar separator and info section
         st.markdown("<hr>", unsafe_allow_html=True)
         
         if uploaded_file is not None:
             try:
-                st.session_state.file_name = uploaded_file.name
-                df = read_csv_file(uploaded_file)
+                file_format = columnar_format(uploaded_file.name)
+                with st.expander(get_label('ingest_options'), expanded=file_format is not None):
+                    optimize = st.checkbox(get_label('optimize_memory'), value=True, help=get_label('optimize_memory_tooltip'))
+                    if file_format:
+                        # Columnar files: choose the columns and rows to load before reading any data
+                        schema = read_columnar_schema(uploaded_file, file_format)
+                        selected_columns = st.multiselect(
+                            get_label('columns_to_load'), schema['columns'],
+                            default=schema['columns'], help=get_label('columns_to_load_tooltip')
+                        )
+                        filter_column = st.selectbox(get_label('row_filter_column'), [get_label('no_row_filter')] + schema['columns'])
+                        filters = None
+                        if filter_column != get_label('no_row_filter'):
+                            filter_operator = st.selectbox(get_label('row_filter_operator'), ['==', '!=', '>', '>=', '<', '<='])
+                            filter_value = st.text_input(get_label('row_filter_value'))
+                            if filter_value:
+                                filters = [(filter_column, filter_operator, parse_filter_value(filter_value, schema['types'][filter_column]))]
+                        read_options = {
+                            "columns": selected_columns if len(selected_columns) < len(schema['columns']) else None,
+                            "filters": filters,
+                        }
+                    else:
+                        ingest_modes = [get_label('standard_ingest'), get_label('parallel_ingest'), get_label('streaming_ingest')]
+                        if uploaded_file.size > STREAMING_THRESHOLD_BYTES:
+                            default_mode = 2
+                        elif uploaded_file.size > PARALLEL_THRESHOLD_BYTES:
+                            default_mode = 1
+                        else:
+                            default_mode = 0
+                        ingest_mode = st.radio(get_label('ingest_mode'), ingest_modes, index=default_mode, help=get_label('ingest_mode_tooltip'))
+                        streaming = ingest_mode == get_label('streaming_ingest')
+                        chunk_rows = st.number_input(get_label('chunk_rows'), min_value=1_000, value=DEFAULT_CHUNK_ROWS, step=10_000, disabled=not streaming)
+                        read_options = {
+                            "chunksize": int(chunk_rows) if streaming else None,
+                            "parallel": ingest_mode == get_label('parallel_ingest'),
+                        }
+                
+                upload_key, cache_entry = load_uploaded_file(uploaded_file, optimize=optimize, **read_options)
+                file_info = cache_entry["metadata"]
                 
                 # File info display
                 st.markdown(f"<div class='card'><h4>📊 {get_label('file_info')}</h4>", unsafe_allow_html=True)
                 st.markdown(f"**{get_label('filename')}:** {uploaded_file.name}", unsafe_allow_html=True)
-                st.markdown(f"**{get_label('dimensions')}:** {len(df)} {get_label('rows')}, {len(df.columns)} {get_label('columns')}", unsafe_allow_html=True)
+                st.markdown(f"**{get_label('dimensions')}:** {file_info['rows']} {get_label('rows')}, {file_info['columns']} {get_label('columns')}", unsafe_allow_html=True)
                 st.markdown("</div>", unsafe_allow_html=True)
                 
-                # Store the original data
-                if st.session_state.data is None or st.session_state.file_name != uploaded_file.name:
-                    st.session_state.original_data = df.copy()
-                    st.session_state.data = df.copy()
+                # Store the original data once per distinct upload
+                if st.session_state.data is None or st.session_state.upload_key != upload_key:
+                    df = cache_entry["data"]
+                    st.session_state.upload_key = upload_key
+                    st.session_state.file_name = uploaded_file.name
+                    # The versioned store shares its column buffers with the parse cache
+                    init_dataset(df)
+                    st.session_state.memory_report = file_info.get("memory_report")
                     
                     # Initialize cleaning report
                     st.session_state.cleaning_report = {
@@ -105,19 +285,9 @@ def main():
                     
                     st.success(get_label('success_loaded').format(filename=uploaded_file.name))
                 
-                # Show reset button if data is loaded
-                if st.session_state.data is not None and st.session_state.original_data is not None:
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.button(get_label('reset'), key="reset_btn", help=get_label('reset_tooltip')):
-                            st.session_state.data = st.session_state.original_data.copy()
-                            st.session_state.cleaning_history = []
-                            st.session_state.cleaning_report["cleaning_steps"] = []
-                            st.success(get_label('reset_success'))
-                    
-                    # Add export options with clear labeling
-                    st.markdown(f"<h4>📤 {get_label('export_options')}</h4>", unsafe_allow_html=True)
-                    st.markdown(generate_csv_download_link(st.session_state.data, button_text=get_label('download_csv')), unsafe_allow_html=True)
+                # Reset, undo, redo and export are rendered after the tabs, so they
+                # reflect the steps applied during this run
+                sidebar_actions = st.container()
                     
             except Exception as e:
                 st.error(get_label('error').format(error=str(e)))
@@ -130,190 +300,13 @@ def main():
             </div>
             """, unsafe_allow_html=True)
     
-    # Create tabs for different operations
+    # Navigation between the sections; only the selected one is rendered
     if st.session_state.data is not None:
-        tabs = st.tabs([
-            get_label("data_overview"),
-            get_label("missing_data"),
-            get_label("duplicates"),
-            get_label("format_fixing"),
-            get_label("categorical_data"),
-            get_label("error_correction_tab"),
-            get_label("text_parsing_tab"),
-            get_label("type_conversion_tab"),
-            get_label("column_operations_tab"),
-            get_label("noisy_data_tab"),
-            get_label("reshape_data_tab"),
-            get_label("unstructured_data_tab"),
-            get_label("cleaning_history_tab")
-        ])
-        
-        # Tab 1: Data Overview
-        with tabs[0]:
-            display_data_overview(st.session_state.data)
-        
-        # Tab 2: Missing Data
-        with tabs[1]:
-            handle_missing_data()
-        
-        # Tab 3: Duplicates
-        with tabs[2]:
-            result = remove_duplicates(st.session_state.data)
-            if result is not None:
-                st.session_state.data = result
-        
-        # Tab 4: Format Fixing
-        with tabs[3]:
-            st.header(get_label("fix_inconsistent_formats"))
-            column = st.selectbox(
-                get_label("select_column_to_fix_format"), 
-                st.session_state.data.columns,
-                help=get_label("select_column_to_fix_format_tooltip")
-            )
-            
-            # Define display and canonical values for format types
-            format_options_display = [get_label("date"), get_label("phone_number"), get_label("currency")]
-            format_options_values = ["date", "phone_number", "currency"]
-
-            selected_display_format = st.selectbox(
-                get_label("select_format_type"), 
-                format_options_display,
-                help=get_label("select_format_type_tooltip")
-            )
-            
-            if st.button(get_label("fix_format_button")):
-                try:
-                    # Map selected display format back to its canonical value
-                    selected_value_format = format_options_values[format_options_display.index(selected_display_format)]
-                    
-                    # Store the original format type for the history message
-                    original_format_label = selected_display_format
-
-                    st.session_state.data = fix_inconsistent_formats(st.session_state.data, column, selected_value_format)
-                    
-                    # Add to cleaning history
-                    st.session_state.cleaning_history.append({
-                        "action": get_label("fixed_format_action").format(format_type=original_format_label, column=column),
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    
-                    st.success(get_label("format_fixed_success").format(column=column))
-                except Exception as e:
-                    st.error(get_label('error_generic').format(error=str(e)))
-        
-        # Tab 5: Categorical Data
-        with tabs[4]:
-            st.header(get_label("categorical_data"))
-            column = st.selectbox(get_label("select_categorical_column_to_standardize"), st.session_state.data.select_dtypes(include=['object']).columns)
-            
-            if st.button(get_label("standardize")):
-                try:
-                    st.session_state.data = standardize_categorical_data(st.session_state.data, column)
-                    
-                    # Add to cleaning history
-                    st.session_state.cleaning_history.append({
-                        "action": f"Standardized categorical data in column '{column}'",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                except Exception as e:
-                    st.error(get_label('error_generic').format(error=str(e)))
-        
-        # Tab 6: Error Correction
-        with tabs[5]:
-            display_error_correction_options(st.session_state.data)
-        
-        # Tab 7: Text Parsing
-        with tabs[6]:
-            st.header(get_label("text_parsing_tab"))
-            parse_option = st.selectbox(get_label("select_parsing_option"), [get_label("split_full_names"), get_label("extract_keywords"), get_label("clean_text_column"), get_label("parse_dates")])
-            
-            if parse_option == get_label("split_full_names"):
-                col = st.selectbox(get_label("select_column_full_names"), st.session_state.data.select_dtypes(include=['object']).columns)
-                if st.button(get_label("split_names")):
-                    try:
-                        from components.text_parsing import split_full_name
-                        st.session_state.data = split_full_name(st.session_state.data, col)
-                        st.success(get_label("split_names_success").format(col=col))
-                    except Exception as e:
-                        st.error(get_label('error_generic').format(error=str(e)))
-            
-            elif parse_option == get_label("clean_text_column"):
-                col = st.selectbox(get_label("select_text_column_clean"), st.session_state.data.select_dtypes(include=['object']).columns)
-                if st.button(get_label("clean_text_btn")):
-                    try:
-                        from components.text_parsing import clean_text_column
-                        st.session_state.data = clean_text_column(st.session_state.data, col)
-                        st.success(get_label("clean_text_success").format(col=col))
-                    except Exception as e:
-                        st.error(get_label('error_generic').format(error=str(e)))
-        
-        # Tab 8: Type Conversion
-        with tabs[7]:
-            st.header(get_label("type_conversion_tab"))
-            conversion_type = st.selectbox(get_label("select_conversion_type"), [get_label("string_to_number"), get_label("string_to_date"), get_label("number_to_string")])
-            
-            if conversion_type == get_label("string_to_number"):
-                cols = st.multiselect(get_label("select_columns_to_convert_numeric"), st.session_state.data.select_dtypes(include=['object']).columns)
-                if st.button(get_label("convert_to_numeric")):
-                    conversions = {'numeric': cols}
-                    st.session_state.data = type_conversion(st.session_state.data, conversions)
-                    st.success(get_label("converted_to_numeric"))
-            
-            elif conversion_type == get_label("string_to_date"):
-                cols = st.multiselect(get_label("select_columns_to_convert_datetime"), st.session_state.data.select_dtypes(include=['object']).columns)
-                if st.button(get_label("convert_to_datetime")):
-                    conversions = {'datetime': cols}
-                    st.session_state.data = type_conversion(st.session_state.data, conversions)
-                    st.success(get_label("converted_to_datetime"))
-            
-            elif conversion_type == get_label("number_to_string"):
-                cols = st.multiselect(get_label("select_columns_to_convert_string"), st.session_state.data.select_dtypes(include=['number']).columns)
-                if st.button(get_label("convert_to_string")):
-                    conversions = {'string': cols}
-                    st.session_state.data = type_conversion(st.session_state.data, conversions)
-                    st.success(get_label("converted_to_string"))
-        
-        # Tab 9: Column Operations
-        with tabs[8]:
-            display_column_operations(st.session_state.data)
-        
-        # Tab 10: Noisy Data
-        with tabs[9]:
-            st.header(get_label("noisy_data_tab"))
-            text_cols = st.multiselect(get_label("select_text_columns_to_clean"), st.session_state.data.select_dtypes(include=['object']).columns)
-            
-            if st.button(get_label("remove_noise")):
-                if text_cols:
-                    st.session_state.data = handle_noisy_data(st.session_state.data, text_cols)
-                    st.session_state.cleaning_history.append({
-                        "action": get_label("removed_noise_action"),
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    st.success(get_label("noisy_data_cleaned"))
-                else:
-                    st.warning(get_label("please_select_text_column"))
-        
-        # Tab 11: Reshape Data
-        with tabs[10]:
-            reshape_data(st.session_state.data)
-        
-        # Tab 12: Unstructured Data
-        with tabs[11]:
-            st.header(get_label("unstructured_data_tab"))
-            if st.button(get_label("clean_data_btn")):
-                try:
-                    st.session_state.data = clean_unstructured_data(st.session_state.data)
-                    st.session_state.cleaning_history.append({
-                        "action": get_label("cleaned_unstructured_data_action"),
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    st.success(get_label("data_cleaned_success"))
-                except Exception as e:
-                    st.error(get_label('error_generic').format(error=str(e)))
-        
-        # Tab 13: Cleaning History
-        with tabs[12]:
-            display_cleaning_history()
+        section = st.radio(
+            get_label("section"), list(SECTIONS), format_func=get_label,
+            horizontal=True, key="active_section", label_visibility="collapsed"
+        )
+        render_section(section)
     else:
         # Show landing page content when no file is loaded
         col1, col2 = st.columns([2, 1])
@@ -339,6 +332,10 @@ def main():
             </div>
             """, unsafe_allow_html=True)
     
+    if sidebar_actions is not None and st.session_state.data is not None:
+        with sidebar_actions:
+            display_sidebar_actions()
+    
     # Add footer
     st.markdown("""
     <footer>
@@ -0,0 +1,80 @@
+"""
+Applies a cleaning recipe exported from the app to many data files, one worker process per file.
+
+Usage:
+    python src/batch_clean.py recipe.json data/partner_*.csv --output-dir cleaned --workers 8
+
+With --dedup-keys or --hash-set, the cleaned files are then deduplicated one after the
+other against the rows of the earlier files; --hash-set keeps the row hashes in a .npy
+file so that the next batch of the same feed is deduplicated against this one as well:
+    python src/batch_clean.py recipe.json data/orders_*.csv -o cleaned --dedup-keys order_id --hash-set orders_seen.npy
+"""
+import argparse
+import glob
+import os
+import sys
+
+from utils.recipes import deduplicate_outputs, load_recipe, run_recipe_batch
+from utils.row_hashing import HASH_BITS, RowHashSet
+
+def expand_inputs(patterns):
+    """Expand glob patterns and keep the order of the arguments, listing each file once."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a cleaning recipe to many data files.")
+    parser.add_argument("recipe", help="Recipe JSON file downloaded from the Cleaning History tab")
+    parser.add_argument("inputs", nargs="+", help="CSV, Parquet, Feather or Arrow IPC files (glob patterns allowed)")
+    parser.add_argument("--output-dir", "-o", required=True, help="Directory the cleaned files are written to")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--format", choices=["csv", "parquet", "feather", "arrow"], default=None,
+                        help="Output format (default: same as each input file)")
+    parser.add_argument("--no-optimize", action="store_true", help="Keep the dtypes pandas infers instead of compacting them")
+    parser.add_argument("--dedup-keys", nargs="+", default=None,
+                        help="Remove rows whose key columns repeat a row of an earlier file (default with --hash-set: all columns)")
+    parser.add_argument("--hash-set", default=None,
+                        help="Row hash file (.npy) of earlier batches; created if missing and updated with the kept rows")
+    parser.add_argument("--hash-bits", type=int, choices=HASH_BITS, default=64,
+                        help="Size of the row hashes of a new hash set (default: 64)")
+    args = parser.parse_args(argv)
+
+    recipe = load_recipe(args.recipe)
+    inputs = expand_inputs(args.inputs)
+    missing = [path for path in inputs if not os.path.isfile(path)]
+    if missing:
+        parser.error(f"input files not found: {', '.join(missing)}")
+
+    def report(summary):
+        if summary["error"]:
+            print(f"FAILED {summary['input']}: {summary['error']}", file=sys.stderr)
+        else:
+            print(f"{summary['input']} -> {summary['output']} "
+                  f"({summary['rows_in']} -> {summary['rows_out']} rows, {summary['seconds']:.2f} s)")
+
+    summaries = run_recipe_batch(
+        recipe, inputs, args.output_dir,
+        workers=args.workers, output_format=args.format,
+        optimize=not args.no_optimize, progress_callback=report,
+    )
+    if args.dedup_keys or args.hash_set:
+        hash_set = RowHashSet.open(args.hash_set, args.hash_bits) if args.hash_set else RowHashSet(args.hash_bits)
+        known = len(hash_set)
+        summaries = deduplicate_outputs(summaries, hash_set, args.dedup_keys)
+        for summary in summaries:
+            if "duplicates_removed" in summary:
+                print(f"{summary['output']}: removed {summary['duplicates_removed']} duplicate rows")
+            elif summary["error"] and summary["error"].startswith("Deduplication failed"):
+                print(f"FAILED {summary['output']}: {summary['error']}", file=sys.stderr)
+        if args.hash_set:
+            hash_set.save(args.hash_set)
+            print(f"Saved {len(hash_set)} row hashes to {args.hash_set} ({len(hash_set) - known} new).")
+    failed = sum(1 for summary in summaries if summary["error"])
+    print(f"Cleaned {len(summaries) - failed} of {len(summaries)} files with {len(recipe['steps'])} steps.")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,90 @@
-import pandas as pd
 import streamlit as st
+from kernels.categorical import merge_category_clusters, standardize_categorical_data
+from utils.key_collision import KEY_METHODS, key_collision_clusters, readable_keys
 from utils.labels import get_label
+from utils.session import update_data
+from utils.synonyms import load_synonyms
 
-def standardize_categorical_data(df, column_name):
-    if column_name not in df.columns:
-        st.error(get_label("column_not_exist").format(column=column_name))
-        return df
+# Clusters listed for review at once, largest first
+MAX_CLUSTERS_SHOWN = 50
 
-    # Convert to string type for consistency
-    df[column_name] = df[column_name].astype(str)
+def display_categorical_standardization(df):
+    """Display interface for standardizing a categorical column"""
+    st.header(get_label("categorical_data"))
+    column = st.selectbox(get_label("select_categorical_column_to_standardize"), df.select_dtypes(include=['object', 'category', 'string']).columns)
+    synonym_file = st.file_uploader(get_label("upload_synonyms"), type=["json", "csv"], key="synonyms_upload",
+                                    help=get_label("upload_synonyms_tooltip"))
+    
+    if st.button(get_label("standardize")):
+        try:
+            synonyms = load_synonyms(synonym_file.getvalue(), synonym_file.name.rsplit('.', 1)[-1].lower()) \
+                if synonym_file is not None else None
+            standardized_df, record = standardize_categorical_data(df, column, synonyms)
+            update_data(standardized_df, f"Standardized categorical data in column '{column}'", operation=record)
+            st.success(get_label("standardized_column").format(column=column))
+            st.caption(get_label("values_mapped").format(count=record["details"]["values_mapped"]))
+        except Exception as e:
+            st.error(get_label('error_generic').format(error=str(e)))
 
-    # Standardize the categorical data
-    df[column_name] = df[column_name].str.lower().str.strip()
+    if column is not None:
+        display_value_clustering(df, column)
 
-    # Optionally, you can add more specific standardization rules here
-    # For example, fixing common typos
-    typos = {
-        "male": ["m", "male", "man"],
-        "female": ["f", "female", "woman"],
-        "other": ["o", "other", "non-binary"]
-    }
+def display_value_clustering(df, column):
+    """Find clusters of near-duplicate values of column and let the user merge each into a canonical value."""
+    st.subheader(get_label("cluster_values"))
+    col1, col2 = st.columns(2)
+    with col1:
+        method = st.selectbox(get_label("cluster_method"), KEY_METHODS, key="cluster_method",
+                              format_func=lambda name: get_label(f"cluster_method_{name}"))
+    with col2:
+        n = st.number_input(get_label("ngram_size"), 1, 5, 2, key="cluster_ngram_size", disabled=method != 'ngram')
 
-    for standard, variants in typos.items():
-        for variant in variants:
-            df[column_name] = df[column_name].replace(variant, standard)
+    if st.button(get_label("find_clusters")):
+        try:
+            clusters = key_collision_clusters(df[column], method, n)
+        except ValueError as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return
+        # Widget keys include the run, so new clusters do not inherit the choices made for old ones
+        run = st.session_state.get("category_clusters", {}).get("run", 0) + 1
+        st.session_state.category_clusters = {"column": column, "method": method, "n": n, "table": clusters, "run": run}
 
-    st.success(get_label("standardized_column").format(column=column_name))
-    return df
\ No newline at end of file
+    found = st.session_state.get("category_clusters")
+    if not found or found["column"] != column:
+        return
+    table, run = found["table"], found["run"]
+    count = int(table["cluster"].nunique())
+    if not count:
+        st.info(get_label("no_clusters_found"))
+        return
+    st.caption(get_label("clusters_found").format(clusters=count, values=len(table)))
+    if count > MAX_CLUSTERS_SHOWN:
+        st.caption(get_label("showing_first_clusters").format(count=MAX_CLUSTERS_SHOWN))
+
+    shown = [group for _, group in table[table["cluster"] < MAX_CLUSTERS_SHOWN].groupby("cluster", sort=True)]
+    keys = readable_keys([str(group["value"].iloc[0]) for group in shown], found["method"], found["n"])
+    merges = {}
+    for number, (group, key) in enumerate(zip(shown, keys)):
+        values = group["value"].tolist()
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            merge = st.checkbox(", ".join(f"{value} ({rows})" for value, rows in zip(values, group["rows"])),
+                                value=True, key=f"merge_cluster_{run}_{number}", help=get_label("cluster_key").format(key=key))
+        with col2:
+            # The most common value is the default canonical value
+            canonical = st.text_input(get_label("canonical_value"), str(values[0]), key=f"canonical_value_{run}_{number}")
+        if merge and canonical:
+            merges.setdefault(canonical, []).extend(value for value in values if value != canonical)
+
+    if st.button(get_label("merge_clusters_button")):
+        try:
+            merged_df, record = merge_category_clusters(df, column, merges)
+        except ValueError as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return
+        message = get_label("merged_clusters").format(clusters=record["details"]["clusters"],
+                                                      rows=record["details"]["rows_changed"], column=column)
+        if record["details"]["rows_changed"]:
+            update_data(merged_df, message, operation=record)
+        del st.session_state.category_clusters
+        st.success(message)
@@ -2,7 +2,11 @@ import streamlit as st
 import pandas as pd
 import json
 from datetime import datetime
-from utils.file_operations import generate_csv_download_link
+from components.data_viewer import display_data_viewer
+from utils.labels import get_label
+from utils.recipes import apply_step, recipe_from_history, recipe_from_json, recipe_to_json
+from utils.session import go_to_step, update_data
+from utils.file_operations import to_csv_bytes, to_parquet_bytes, PYARROW_AVAILABLE
 
 def display_cleaning_history():
     """
@@ -12,11 +16,26 @@ def display_cleaning_history():
     
     if not st.session_state.cleaning_history:
         st.info("No cleaning operations have been performed yet.")
+        display_recipe_options()
         return
     
-    # Display cleaning history as a table
-    history_df = pd.DataFrame(st.session_state.cleaning_history)
-    st.dataframe(history_df)
+    # Display cleaning history as a table; recipe steps are shown in the recipe section
+    history_df = pd.DataFrame(st.session_state.cleaning_history).drop(columns=["operation"], errors="ignore")
+    display_data_viewer(history_df, key="history_viewer")
+    
+    # Jump to the state after any step; later steps stay available for redo
+    store = st.session_state.get('dataset_store')
+    if store is not None:
+        steps = list(range(store.latest + 1))
+        step_actions = {step["step"]: "; ".join(entry["action"] for entry in step["entries"]) for step in store.steps()}
+        target_step = st.selectbox(
+            get_label("go_to_step"), steps, index=store.position,
+            format_func=lambda step: get_label("original_data_step") if step == 0 else f"{step}. {step_actions.get(step, '')}"
+        )
+        if st.button(get_label("go_to_step_btn"), disabled=target_step == store.position):
+            go_to_step(target_step)
+            st.rerun()
+        st.caption(get_label("versions_memory").format(count=store.latest + 1, size=store.nbytes() / 1024 ** 2))
     
     # Create a cleaning report
     st.subheader("Cleaning Report")
@@ -66,5 +85,44 @@ def display_cleaning_history():
         )
     
     with col2:
-        # Download cleaned data
-        st.markdown(generate_csv_download_link(df, "cleaned_data.csv"), unsafe_allow_html=True)
\ No newline at end of file
+        # Download cleaned data; the file is built only when the button is clicked
+        st.download_button("Download CSV File", data=lambda: to_csv_bytes(df), file_name="cleaned_data.csv",
+                           mime="text/csv", key="history_csv_download")
+        if PYARROW_AVAILABLE:
+            st.download_button("Download Parquet File", data=lambda: to_parquet_bytes(df), file_name="cleaned_data.parquet",
+                               mime="application/vnd.apache.parquet", key="history_parquet_download")
+    
+    display_recipe_options()
+
+def display_recipe_options():
+    """
+    Lets the user download the recorded steps as a replayable recipe and apply a saved
+    recipe to the current data, one history step per recipe step.
+    """
+    st.subheader(get_label("cleaning_recipe"))
+    
+    recipe = recipe_from_history(st.session_state.cleaning_history, st.session_state.get('file_name'))
+    if recipe["steps"]:
+        st.caption(get_label("recipe_summary").format(count=len(recipe["steps"])))
+        st.download_button(
+            label=get_label("download_recipe"),
+            data=recipe_to_json(recipe),
+            file_name="cleaning_recipe.json",
+            mime="application/json",
+        )
+    
+    recipe_file = st.file_uploader(get_label("upload_recipe"), type=["json"], key="recipe_upload")
+    if recipe_file is not None and st.button(get_label("apply_recipe")):
+        try:
+            recipe = recipe_from_json(recipe_file.getvalue())
+            for number, step in enumerate(recipe["steps"], start=1):
+                cleaned_df, record = apply_step(st.session_state.data, step)
+                update_data(
+                    cleaned_df,
+                    get_label("applied_recipe_step_action").format(step=number, operation=step["operation"]),
+                    operation=record
+                )
+        except Exception as e:
+            st.error(get_label("recipe_error").format(error=str(e)))
+        else:
+            st.success(get_label("recipe_applied").format(count=len(recipe["steps"])))
\ No newline at end of file
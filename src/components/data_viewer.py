@@ -0,0 +1,64 @@
+import streamlit as st
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from utils.data_view import DEFAULT_PREVIEW_ROWS, PAGE_SIZES, query_rows
+from utils.labels import get_label
+
+def _filter_options(df, key):
+    """Let the user filter one column by range (numeric columns) or by value, and return the filters."""
+    column = st.selectbox(get_label("filter_column"), [None] + list(df.columns), key=f"{key}_filter_column",
+                          format_func=lambda name: get_label("no_filter") if name is None else str(name))
+    if column is None:
+        return {}
+    series = df[column]
+    if is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+        col1, col2 = st.columns(2)
+        with col1:
+            low = st.number_input(get_label("filter_min"), value=None, key=f"{key}_filter_min")
+        with col2:
+            high = st.number_input(get_label("filter_max"), value=None, key=f"{key}_filter_max")
+        return {column: {"min": low, "max": high}}
+    # The most frequent values are offered; the search box covers the rest
+    options = series.value_counts().head(200).index.tolist()
+    values = st.multiselect(get_label("filter_values"), options, key=f"{key}_filter_values")
+    return {column: {"values": values}} if values else {}
+
+def display_data_viewer(df: pd.DataFrame, key: str, preview_rows: int = DEFAULT_PREVIEW_ROWS):
+    """
+    Shows a DataFrame without sending all of it to the browser.
+
+    By default only the first preview_rows rows are shown. Browsing pages through the
+    whole frame; search, filtering and sorting run in pandas on the server and only the
+    rows of the current page are rendered.
+
+    Args:
+        df: DataFrame to show
+        key: Prefix of the widget keys, unique per viewer on a page
+        preview_rows: Number of rows shown before browsing is turned on
+    """
+    if not st.toggle(get_label("browse_all_rows"), key=f"{key}_browse"):
+        st.dataframe(df.head(preview_rows))
+        if len(df) > preview_rows:
+            st.caption(get_label("preview_rows").format(count=preview_rows, total=len(df)))
+        return
+
+    search = st.text_input(get_label("search_rows"), key=f"{key}_search")
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_by = st.selectbox(get_label("sort_by"), [None] + list(df.columns), key=f"{key}_sort_by",
+                               format_func=lambda name: get_label("no_sorting") if name is None else str(name))
+    with col2:
+        descending = st.checkbox(get_label("sort_descending"), key=f"{key}_descending")
+    with col3:
+        page_size = st.selectbox(get_label("page_size"), PAGE_SIZES, index=1, key=f"{key}_page_size")
+    filters = _filter_options(df, key)
+
+    page = st.number_input(get_label("page"), min_value=1, value=1, step=1, key=f"{key}_page")
+    rows, matched = query_rows(df, page - 1, page_size, sort_by, not descending, search or None, filters=filters)
+    pages = max(1, -(-matched // page_size))
+    first = min(page, pages) - 1
+    st.dataframe(rows)
+    st.caption(get_label("rows_range").format(
+        start=first * page_size + 1 if matched else 0, end=first * page_size + len(rows),
+        matched=matched, total=len(df), page=first + 1, pages=pages
+    ))
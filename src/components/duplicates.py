@@ -1,13 +1,10 @@
+import io
 import streamlit as st
-import pandas as pd
+from kernels.duplicates import RAPIDFUZZ_AVAILABLE, drop_duplicates, remove_fuzzy_duplicates
+from kernels.entity_resolution import COMPARATOR_METHODS, SURVIVOR_RULES, resolve_entities
 from utils.labels import get_label
-
-# Pre-check if thefuzz is available
-try:
-    from thefuzz import process
-    THEFUZZ_AVAILABLE = True
-except ImportError:
-    THEFUZZ_AVAILABLE = False
+from utils.row_hashing import RowHashSet
+from utils.session import update_data
 
 def remove_duplicates(data):
     if data is not None:
@@ -15,37 +12,100 @@ def remove_duplicates(data):
         
         # Option to remove exact duplicates
         if st.checkbox(get_label("remove_exact_duplicates")):
-            original_shape = data.shape
-            data = data.drop_duplicates()
-            st.success(get_label("removed_exact_duplicates").format(count=original_shape[0] - data.shape[0]))
+            subset = st.multiselect(get_label("select_key_columns"), data.columns, key="duplicate_keys")
+            data, record = drop_duplicates(data, subset or None)
+            removed = record["details"]["rows_removed"]
+            if removed:
+                update_data(data, get_label("removed_exact_duplicates").format(count=removed), operation=record)
+            st.success(get_label("removed_exact_duplicates").format(count=removed))
+        
+        # Option to remove the rows of earlier files of the same feed
+        if st.checkbox(get_label("remove_seen_rows")):
+            data = remove_seen_rows(data)
         
         # Option for fuzzy matching duplicates
         if st.checkbox(get_label("remove_fuzzy_duplicates")):
-            try:
-                from thefuzz import process
-                
-                column_to_check = st.selectbox(get_label("select_column_fuzzy"), data.columns)
-                threshold = st.slider(get_label("set_similarity_threshold"), 0, 100, 90)
-                
-                # Convert unique values to strings and skip NaN
-                unique_values = data[column_to_check].unique()
-                unique_values_str = [str(x) for x in unique_values if not pd.isna(x)]
-                duplicates = []
-                
-                for value in unique_values_str:
-                    matches = process.extract(value, unique_values_str, limit=None)
-                    similar_values = [match[0] for match in matches if match[1] >= threshold and match[0] != value]
-                    duplicates.extend(similar_values)
-                
-                duplicates = set(duplicates)
-                original_shape = data.shape
-                # Compare as strings
-                data = data[~data[column_to_check].astype(str).isin(duplicates)]
-                st.success(get_label("removed_fuzzy_duplicates").format(count=original_shape[0] - data.shape[0]))
-            except ImportError:
+            if not RAPIDFUZZ_AVAILABLE:
                 st.warning(get_label("fuzzy_required"))
                 return None
+            
+            column_to_check = st.selectbox(get_label("select_column_fuzzy"), data.columns)
+            threshold = st.slider(get_label("set_similarity_threshold"), 0, 100, 90)
+            
+            data, record = remove_fuzzy_duplicates(data, column_to_check, threshold)
+            removed = record["details"]["rows_removed"]
+            if removed:
+                update_data(data, get_label("removed_fuzzy_duplicates").format(count=removed), operation=record)
+            st.success(get_label("removed_fuzzy_duplicates").format(count=removed))
+        
+        # Option for linking records across several columns
+        if st.checkbox(get_label("resolve_entities")):
+            data = resolve_entities_options(data)
         
         return data
     else:
-        st.warning(get_label("no_data_remove_duplicates"))
\ No newline at end of file
+        st.warning(get_label("no_data_remove_duplicates"))
+
+
+def remove_seen_rows(data):
+    """Remove the rows found in a hash set of earlier files and offer the updated hash set for download."""
+    subset = st.multiselect(get_label("select_key_columns"), data.columns, key="seen_keys")
+    hash_file = st.file_uploader(get_label("upload_hash_set"), type=["npy"], key="hash_set_upload")
+    bits = st.radio(get_label("hash_size"), [64, 128], horizontal=True, key="hash_bits",
+                    disabled=hash_file is not None)
+    if st.button(get_label("remove_seen_rows_button")):
+        # A fresh copy of the uploaded set on every click, so the same file is not added twice
+        try:
+            seen = RowHashSet.load(io.BytesIO(hash_file.getvalue())) if hash_file is not None else RowHashSet(bits)
+            data, record = drop_duplicates(data, subset or None, seen=seen)
+        except ValueError as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return data
+        details = record["details"]
+        message = get_label("removed_seen_rows").format(count=details["rows_removed"], seen=details["seen_before"])
+        if details["rows_removed"]:
+            update_data(data, message, operation=record)
+        st.success(message)
+        buffer = io.BytesIO()
+        seen.save(buffer)
+        st.download_button(get_label("download_hash_set").format(count=len(seen)), buffer.getvalue(),
+                           file_name="seen_rows.npy", mime="application/octet-stream")
+    return data
+
+def resolve_entities_options(data):
+    """Let the user pick the compared columns, their comparators and the survivor rule, and resolve the entities."""
+    columns = st.multiselect(get_label("select_columns_entities"), data.columns)
+    comparators = []
+    for column in columns:
+        col1, col2 = st.columns(2)
+        with col1:
+            method = st.selectbox(get_label("comparison_method").format(col=column), COMPARATOR_METHODS,
+                                  format_func=lambda name: get_label(f"comparator_{name}"), key=f"entity_method_{column}")
+        with col2:
+            weight = st.number_input(get_label("comparison_weight").format(col=column), 0.0, 10.0, 1.0, 0.5,
+                                     key=f"entity_weight_{column}")
+        comparators.append({"column": column, "method": method, "weight": weight})
+    threshold = st.slider(get_label("match_threshold"), 0, 100, 85, key="entity_threshold")
+    survivor = st.radio(get_label("survivor_rule"), SURVIVOR_RULES, format_func=lambda name: get_label(f"survivor_{name}"))
+    recency_column = None
+    if survivor == 'most_recent':
+        recency_column = st.selectbox(get_label("recency_column"), data.columns)
+    keep_all = st.checkbox(get_label("keep_all_add_cluster"))
+
+    if columns and st.button(get_label("resolve_entities_button")):
+        if not RAPIDFUZZ_AVAILABLE and any(comparator["method"] == 'fuzzy' for comparator in comparators):
+            st.warning(get_label("fuzzy_required"))
+            return data
+        try:
+            data, record = resolve_entities(data, comparators, threshold, survivor, recency_column,
+                                            drop=not keep_all, cluster_column="cluster_id" if keep_all else None)
+        except ValueError as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return data
+        details = record["details"]
+        message = get_label("resolved_entities").format(clusters=details["clusters"], rows=details["rows_in_clusters"],
+                                                        removed=details["rows_removed"])
+        if details["clusters"]:
+            update_data(data, message, operation=record)
+        st.success(message)
+    return data
@@ -1,70 +1,132 @@
-import streamlit as st
 import pandas as pd
-import numpy as np
+import streamlit as st
 from datetime import datetime
+from kernels.error_correction import (ANOMALY_ACTIONS, RULE_ACTIONS, cap_percentiles, correct_errors, detect_anomalies,
+                                     find_impossible_values, fix_negative_values, replace_outliers, validate_rules)
+from utils.anomalies import ANOMALY_METHODS, SKLEARN_AVAILABLE
+from utils.dataset_store import make_history_entry
+from utils.file_operations import to_csv_bytes
 from utils.labels import get_label
+from utils.outliers import DEFAULT_THRESHOLDS, OUTLIER_METHODS, REPLACEMENTS
+from utils.profile import APPROXIMATE_PROFILE_ROWS
+from utils.rules import load_rules
+from utils.session import current_profile, update_data
 
-def correct_errors(df):
-    """
-    Function to correct errors in the data.
-    This includes identifying outliers and impossible values.
-    """
-    # Example: Identify and replace outliers in a numeric column
-    for column in df.select_dtypes(include=[np.number]).columns:
-        if df[column].isnull().any():
-            continue  # Skip if there are missing values
-        
-        # Calculate the z-scores
-        z_scores = (df[column] - df[column].mean()) / df[column].std()
-        
-        # Identify outliers
-        outliers = df[np.abs(z_scores) > 3]
-        
-        # Replace outliers with the median
-        median_value = df[column].median()
-        df[column] = np.where(np.abs(z_scores) > 3, median_value, df[column])
-        
-        # Log the cleaning step
-        st.session_state.cleaning_history.append({
-            "action": get_label("corrected_outliers_action").format(column=column, median=median_value),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
-        
-        # Add to cleaning report
-        st.session_state.cleaning_report["cleaning_steps"].append({
-            "action": get_label("corrected_outliers_report").format(column=column),
-            "method": get_label("replaced_with_median"),
-            "outliers_count": len(outliers),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
-    
-    st.success(get_label("errors_corrected"))
-    return df
+# Threshold slider range of each outlier method
+THRESHOLD_RANGES = {'zscore': (2.0, 5.0), 'mad': (2.0, 6.0), 'iqr': (1.0, 4.0)}
 
 def check_for_impossible_values(df):
     """
     Check for impossible values in the data based on column names and types.
     """
-    issues_found = False
-    
-    # Check age columns for impossible values
-    age_columns = [col for col in df.columns if 'age' in col.lower()]
-    for col in age_columns:
-        if pd.api.types.is_numeric_dtype(df[col]):
-            # Check for negative ages or extremely high ages
-            if (df[col] < 0).any() or (df[col] > 120).any():
-                issues_found = True
-                st.warning(get_label("impossible_age").format(col=col))
-    
-    # Check percentage columns for values outside 0-100
-    pct_columns = [col for col in df.columns if any(x in col.lower() for x in ['percent', 'pct', '%'])]
-    for col in pct_columns:
-        if pd.api.types.is_numeric_dtype(df[col]):
-            if (df[col] < 0).any() or (df[col] > 100).any():
-                issues_found = True
-                st.warning(get_label("impossible_pct").format(col=col))
-    
-    return issues_found
+    # Minimum and maximum are exact in approximate profiles too
+    issues = find_impossible_values(df, current_profile(len(df) >= APPROXIMATE_PROFILE_ROWS))
+    for kind, col in issues:
+        st.warning(get_label("impossible_age" if kind == 'age' else "impossible_pct").format(col=col))
+    return bool(issues)
+
+def display_group_by(df, selected_cols, key):
+    """
+    Let the user pick columns whose groups get their own statistics; returns the picked columns.
+    """
+    return st.multiselect(get_label("group_by_columns"), [col for col in df.columns if col not in selected_cols],
+                          key=key, help=get_label("group_by_tooltip"))
+
+def display_rule_validation(df):
+    """
+    Check the data against the rules of an uploaded rule file and report, flag or remove the violating rows.
+    """
+    rule_file = st.file_uploader(get_label("upload_rules"), type=["json"], key="rules_upload",
+                                 help=get_label("upload_rules_tooltip"))
+    if rule_file is None:
+        return
+    action = st.radio(get_label("rule_action"), RULE_ACTIONS, key="rule_action", horizontal=True,
+                      format_func=lambda name: get_label(f"rule_action_{name}"))
+
+    if st.button(get_label("check_rules")):
+        try:
+            rules = load_rules(rule_file.getvalue())
+            modified_df, record = validate_rules(df, rules, action)
+        except Exception as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return
+
+        report = pd.DataFrame(record["details"]["rules"])
+        report["rows"] = report["rows"].map(lambda rows: ", ".join(map(str, rows[:10])))
+        st.dataframe(report.rename(columns=lambda name: get_label(f"rule_{name}")), hide_index=True)
+        violating = record["details"]["rows_violating"]
+        if not violating:
+            st.success(get_label("no_rule_violations"))
+        elif action == 'report':
+            st.warning(get_label("rule_violations_found").format(count=violating, rules=len(rules)))
+        else:
+            action_label = "flagged_rule_violations_action" if action == 'flag' else "removed_rule_violations_action"
+            update_data(modified_df, get_label(action_label).format(count=violating), operation=record)
+            st.success(get_label(action_label).format(count=violating))
+
+def display_anomaly_detection(df):
+    """
+    Options to flag or quarantine the rows whose combination of values is anomalous.
+    """
+    numeric_cols = df.select_dtypes(include=['number']).columns
+    if not SKLEARN_AVAILABLE:
+        st.warning(get_label("sklearn_missing"))
+        return
+    if len(numeric_cols) == 0:
+        st.warning(get_label("no_numeric_columns"))
+        return
+    selected_cols = st.multiselect(get_label("select_columns_anomalies"), numeric_cols, key="anomaly_columns")
+    col1, col2 = st.columns(2)
+    with col1:
+        method = st.selectbox(get_label("anomaly_method"), ANOMALY_METHODS, key="anomaly_method",
+                              format_func=lambda name: get_label(f"anomaly_method_{name}"))
+        contamination = st.slider(get_label("anomaly_contamination"), 0.001, 0.2, 0.01, 0.001, format="%.3f",
+                                  key="anomaly_contamination")
+    with col2:
+        # LOF scores each row against its neighbours in the sample, so it gets a smaller one
+        default_sample = 100_000 if method == 'isolation_forest' else 10_000
+        sample_size = st.number_input(get_label("anomaly_sample_size"), 1_000, 1_000_000,
+                                      min(default_sample, max(len(df), 1_000)), 1_000, key=f"anomaly_sample_{method}")
+        action = st.radio(get_label("anomaly_action"), ANOMALY_ACTIONS, key="anomaly_action",
+                          format_func=lambda name: get_label(f"anomaly_action_{name}"))
+    flag_column = st.text_input(get_label("anomaly_flag_column"), "is_anomaly", key="anomaly_flag_column") \
+        if action == 'flag' else None
+    keep_scores = st.checkbox(get_label("anomaly_keep_scores"), key="anomaly_keep_scores")
+
+    if selected_cols and st.button(get_label("detect_anomalies_button")):
+        progress_text = get_label("scoring_rows_progress")
+        progress_bar = st.progress(0.0, text=progress_text.format(percent=0))
+        try:
+            modified_df, record = detect_anomalies(
+                df, selected_cols, method, contamination, int(sample_size), action, flag_column or 'is_anomaly',
+                'anomaly_score' if keep_scores else None,
+                progress_callback=lambda fraction: progress_bar.progress(
+                    fraction, text=progress_text.format(percent=int(fraction * 100)))
+            )
+        except Exception as e:
+            st.error(get_label('error_generic').format(error=str(e)))
+            return
+        finally:
+            progress_bar.empty()
+
+        count = record["details"]["anomalies"]["count"]
+        if action == 'flag':
+            action_text = get_label("flagged_anomalies_action").format(count=count, col=flag_column or 'is_anomaly')
+        else:
+            action_text = get_label("quarantined_anomalies_action").format(count=count)
+            # Rows are told apart by their labels, so the quarantined ones can only be listed with a unique index
+            if count and df.index.is_unique:
+                st.session_state.quarantined_rows = df[~df.index.isin(modified_df.index)]
+        update_data(modified_df, action_text, operation=record)
+        if count:
+            st.success(get_label("anomalies_found").format(count=count))
+        else:
+            st.info(get_label("no_anomalies_found"))
+
+    quarantined = st.session_state.get("quarantined_rows")
+    if quarantined is not None and action == 'quarantine':
+        st.download_button(get_label("download_quarantined").format(count=len(quarantined)),
+                           data=lambda: to_csv_bytes(quarantined), file_name="quarantined_rows.csv", mime="text/csv")
 
 def display_error_correction_options(df):
     """
@@ -78,13 +140,16 @@ def display_error_correction_options(df):
     
     if not issues_found:
         st.success(get_label("no_obvious_issues"))
+    with st.expander(get_label("validate_with_rules")):
+        display_rule_validation(df)
     
     # Options for different error corrections
     st.subheader(get_label("correct_data_errors"))
     
     option = st.selectbox(
         get_label("select_correction_method"),
-        [get_label("correct_outliers"), get_label("fix_negative_values"), get_label("cap_percentile")]
+        [get_label("correct_outliers"), get_label("fix_negative_values"), get_label("cap_percentile"),
+         get_label("detect_anomalies")]
     )
     
     if option == get_label("correct_outliers"):
@@ -93,34 +158,43 @@ def display_error_correction_options(df):
             st.warning(get_label("no_numeric_outlier"))
         else:
             selected_cols = st.multiselect(get_label("select_columns_outliers"), numeric_cols)
-            z_threshold = st.slider(get_label("zscore_threshold"), 2.0, 5.0, 3.0, 0.1)
+            col1, col2 = st.columns(2)
+            with col1:
+                method = st.selectbox(get_label("outlier_method"), OUTLIER_METHODS, key="outlier_method",
+                                      format_func=lambda name: get_label(f"outlier_method_{name}"))
+            with col2:
+                replacement = st.selectbox(get_label("outlier_replacement"), REPLACEMENTS, key="outlier_replacement",
+                                           format_func=lambda name: get_label(f"outlier_replacement_{name}"))
+            low, high = THRESHOLD_RANGES[method]
+            threshold = st.slider(get_label(f"outlier_threshold_{method}"), low, high, DEFAULT_THRESHOLDS[method], 0.1,
+                                  key=f"outlier_threshold_{method}")
+            group_by = display_group_by(df, selected_cols, "outlier_group_by")
+            approximate = st.checkbox(get_label("approximate_quantiles"), value=len(df) >= APPROXIMATE_PROFILE_ROWS,
+                                      key="approximate_outliers", disabled=bool(group_by))
             
             if selected_cols and st.button(get_label("detect_fix_outliers")):
-                modified_df = df.copy()
-                outliers_found = False
+                approximate = approximate and not group_by
+                sketches = current_profile(True).quantile_sketches(selected_cols) if approximate else None
+                modified_df, record = replace_outliers(df, selected_cols, threshold, approximate, sketches, method,
+                                                       replacement, group_by or None)
                 
-                for col in selected_cols:
-                    # Calculate z-scores
-                    z_scores = np.abs((modified_df[col] - modified_df[col].mean()) / modified_df[col].std())
-                    outlier_mask = z_scores > z_threshold
-                    outlier_count = outlier_mask.sum()
-                    
-                    if outlier_count > 0:
-                        outliers_found = True
-                        st.write(get_label("found_outliers").format(count=outlier_count, col=col))
-                        
-                        # Replace outliers with median
-                        median_val = modified_df[col].median()
-                        modified_df.loc[outlier_mask, col] = median_val
-                        
-                        # Add to history
-                        st.session_state.cleaning_history.append({
-                            "action": get_label("replaced_outliers_action").format(count=outlier_count, col=col, median=median_val),
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        })
+                corrected = record["details"]["columns"]
+                if corrected:
+                    st.dataframe(pd.DataFrame(corrected).rename(columns=lambda name: get_label(f"outlier_{name}")),
+                                 hide_index=True)
+                for item in corrected:
+                    if group_by:
+                        action = get_label("replaced_outliers_grouped_action").format(
+                            count=item["count"], col=item["column"], groups=item["groups"],
+                            group_by=", ".join(map(str, group_by)))
+                    else:
+                        action = get_label(f"replaced_outliers_{replacement}_action").format(
+                            count=item["count"], col=item["column"], median=item["median"],
+                            lower=item["lower"], upper=item["upper"])
+                    st.session_state.cleaning_history.append(make_history_entry(action))
                 
-                if outliers_found:
-                    st.session_state.data = modified_df
+                if corrected:
+                    update_data(modified_df, operation=record)
                     st.success(get_label("outliers_replaced"))
                 else:
                     st.info(get_label("no_outliers_found"))
@@ -131,38 +205,21 @@ def display_error_correction_options(df):
             st.warning(get_label("no_numeric_columns"))
         else:
             selected_cols = st.multiselect(get_label("select_columns_negative"), numeric_cols)
-            fix_method = st.radio(get_label("how_fix_negative"), [get_label("set_zero"), get_label("set_abs"), get_label("remove_rows")])
+            fix_methods = {get_label("set_zero"): "zero", get_label("set_abs"): "abs", get_label("remove_rows"): "remove"}
+            fix_method = st.radio(get_label("how_fix_negative"), list(fix_methods))
             
             if selected_cols and st.button(get_label("fix_negative_values")):
-                modified_df = df.copy()
-                negative_found = False
+                method = fix_methods[fix_method]
+                modified_df, record = fix_negative_values(df, selected_cols, method)
                 
-                for col in selected_cols:
-                    negative_mask = modified_df[col] < 0
-                    negative_count = negative_mask.sum()
-                    
-                    if negative_count > 0:
-                        negative_found = True
-                        
-                        if fix_method == get_label("set_zero"):
-                            modified_df.loc[negative_mask, col] = 0
-                            action = get_label("set_negative_zero").format(count=negative_count, col=col)
-                        
-                        elif fix_method == get_label("set_abs"):
-                            modified_df.loc[negative_mask, col] = modified_df.loc[negative_mask, col].abs()
-                            action = get_label("set_negative_abs").format(count=negative_count, col=col)
-                        
-                        elif fix_method == get_label("remove_rows"):
-                            modified_df = modified_df[~negative_mask]
-                            action = get_label("removed_negative_rows").format(count=negative_count, col=col)
-                        
-                        st.session_state.cleaning_history.append({
-                            "action": action,
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        })
+                action_labels = {"zero": "set_negative_zero", "abs": "set_negative_abs", "remove": "removed_negative_rows"}
+                for item in record["details"]["columns"]:
+                    st.session_state.cleaning_history.append(make_history_entry(
+                        get_label(action_labels[method]).format(count=item["count"], col=item["column"])
+                    ))
                 
-                if negative_found:
-                    st.session_state.data = modified_df
+                if record["details"]["columns"]:
+                    update_data(modified_df, operation=record)
                     st.success(get_label("negative_fixed"))
                 else:
                     st.info(get_label("no_negative_found"))
@@ -175,46 +232,53 @@ def display_error_correction_options(df):
             selected_cols = st.multiselect(get_label("select_columns_cap"), numeric_cols)
             lower_percentile = st.slider(get_label("lower_percentile"), 0, 10, 5)
             upper_percentile = st.slider(get_label("upper_percentile"), 90, 100, 95)
+            group_by = display_group_by(df, selected_cols, "cap_group_by")
+            approximate = st.checkbox(get_label("approximate_quantiles"), value=len(df) >= APPROXIMATE_PROFILE_ROWS,
+                                      key="approximate_cap", disabled=bool(group_by))
             
             if selected_cols and st.button(get_label("cap_values")):
-                modified_df = df.copy()
-                caps_applied = False
+                approximate = approximate and not group_by
+                sketches = current_profile(True).quantile_sketches(selected_cols) if approximate else None
+                modified_df, record = cap_percentiles(df, selected_cols, lower_percentile, upper_percentile,
+                                                      approximate, sketches, group_by or None)
                 
-                for col in selected_cols:
-                    lower_bound = modified_df[col].quantile(lower_percentile/100)
-                    upper_bound = modified_df[col].quantile(upper_percentile/100)
-                    
-                    # Count values outside bounds
-                    below_count = (modified_df[col] < lower_bound).sum()
-                    above_count = (modified_df[col] > upper_bound).sum()
-                    
-                    if below_count > 0 or above_count > 0:
-                        caps_applied = True
-                        
-                        # Cap the values
-                        modified_df[col] = modified_df[col].clip(lower=lower_bound, upper=upper_bound)
-                        
-                        # Add to history
-                        action = get_label("capped_values").format(col=col, lower=lower_percentile, upper=upper_percentile)
-                        if below_count > 0:
-                            action += get_label("below_limit").format(count=below_count)
-                        if above_count > 0:
-                            action += get_label("above_limit").format(count=above_count)
-                            
-                        st.session_state.cleaning_history.append({
-                            "action": action,
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        })
+                for item in record["details"]["columns"]:
+                    action = get_label("capped_values").format(col=item["column"], lower=lower_percentile, upper=upper_percentile)
+                    if group_by:
+                        action += get_label("within_groups").format(group_by=", ".join(map(str, group_by)))
+                    if item["below"] > 0:
+                        action += get_label("below_limit").format(count=item["below"])
+                    if item["above"] > 0:
+                        action += get_label("above_limit").format(count=item["above"])
+                    st.session_state.cleaning_history.append(make_history_entry(action))
                 
-                if caps_applied:
-                    st.session_state.data = modified_df
+                if record["details"]["columns"]:
+                    update_data(modified_df, operation=record)
                     st.success(get_label("values_capped"))
                 else:
                     st.info(get_label("no_values_outside"))
     
+    elif option == get_label("detect_anomalies"):
+        display_anomaly_detection(df)
+    
     # Button to apply general error correction
     if st.button(get_label("apply_general_error_correction")):
-        st.session_state.data = correct_errors(df)
+        corrected_df, record = correct_errors(df)
+        
+        for item in record["details"]["columns"]:
+            st.session_state.cleaning_history.append(make_history_entry(
+                get_label("corrected_outliers_action").format(column=item["column"], median=item["median"])
+            ))
+            # Add to cleaning report
+            st.session_state.cleaning_report["cleaning_steps"].append({
+                "action": get_label("corrected_outliers_report").format(column=item["column"]),
+                "method": get_label("replaced_with_median"),
+                "outliers_count": item["outliers"],
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+        
+        update_data(corrected_df, operation=record)
+        st.success(get_label("errors_corrected"))
         st.success(get_label("general_error_applied"))
 
 # This function can be called from the main app to integrate error correction functionality.
\ No newline at end of file
@@ -1,30 +1,64 @@
-import pandas as pd
-import numpy as np
+import streamlit as st
+from kernels.formatting import fix_inconsistent_formats
 from utils.labels import get_label
+from utils.phone_numbers import REGIONS
+from utils.session import update_data
 
-def fix_date_format(df, column_name, date_format="%Y-%m-%d"):
-    """Fix inconsistent date formats in a specified column."""
-    df[column_name] = pd.to_datetime(df[column_name], errors='coerce').dt.strftime(date_format)
-    return df
+def decimal_separator_option(key=None):
+    """Let the user pick the decimal separator of numbers written as text, or leave it to be detected."""
+    return st.selectbox(get_label("decimal_separator"), [None, ".", ","], key=key, help=get_label("decimal_separator_tooltip"),
+                        format_func=lambda separator: get_label("detect_automatically") if separator is None else separator)
 
-def fix_phone_numbers(df, column_name):
-    """Standardize phone numbers to a consistent format."""
-    df[column_name] = df[column_name].replace(r'\D', '', regex=True)  # Remove non-digit characters
-    df[column_name] = df[column_name].apply(lambda x: f"+1-{x[:3]}-{x[3:6]}-{x[6:]}" if len(x) == 10 else x)
-    return df
+def show_failed_rows(df, failures, label="failed_rows"):
+    """Warn about the values a conversion could not handle and show the first of them."""
+    for column, failed in failures.items():
+        if failed["count"]:
+            st.warning(get_label(label).format(count=failed["count"], column=column))
+            st.dataframe(df.loc[failed["rows"], [column]])
 
-def fix_currency_format(df, column_name):
-    """Standardize currency formats in a specified column."""
-    df[column_name] = df[column_name].replace(r'[\$,]', '', regex=True).astype(float)
-    return df
+def display_format_fixing(df):
+    """Display interface for fixing inconsistent date, phone number and currency formats"""
+    st.header(get_label("fix_inconsistent_formats"))
+    column = st.selectbox(
+        get_label("select_column_to_fix_format"), 
+        df.columns,
+        help=get_label("select_column_to_fix_format_tooltip")
+    )
+    
+    # Define display and canonical values for format types
+    format_options_display = [get_label("date"), get_label("phone_number"), get_label("currency")]
+    format_options_values = ["date", "phone", "currency"]
 
-def fix_inconsistent_formats(df, column_name, format_type):
-    """Apply specific format fixing based on the type."""
-    if format_type == 'date':
-        return fix_date_format(df, column_name)
-    elif format_type == 'phone':
-        return fix_phone_numbers(df, column_name)
-    elif format_type == 'currency':
-        return fix_currency_format(df, column_name)
-    else:
-        raise ValueError(get_label("unsupported_format_type"))
\ No newline at end of file
+    selected_display_format = st.selectbox(
+        get_label("select_format_type"), 
+        format_options_display,
+        help=get_label("select_format_type_tooltip")
+    )
+    
+    # Map selected display format back to its canonical value
+    selected_value_format = format_options_values[format_options_display.index(selected_display_format)]
+    options = {}
+    if selected_value_format == "date":
+        options["dayfirst"] = st.checkbox(get_label("dates_day_first"), help=get_label("dates_day_first_tooltip"))
+    elif selected_value_format == "phone":
+        options["default_region"] = st.selectbox(get_label("default_phone_region"), sorted(REGIONS),
+                                                 index=sorted(REGIONS).index("US"), help=get_label("default_phone_region_tooltip"))
+        if st.checkbox(get_label("add_phone_valid_column"), value=True):
+            options["valid_column"] = f"{column}_valid"
+    elif selected_value_format == "currency":
+        options["decimal"] = decimal_separator_option()
+    
+    if st.button(get_label("fix_format_button")):
+        try:
+            fixed_df, record = fix_inconsistent_formats(df, column, selected_value_format, **options)
+            show_failed_rows(df, {column: record["details"]["failed"]},
+                             "invalid_phone_rows" if selected_value_format == "phone" else "failed_rows")
+            update_data(
+                fixed_df,
+                get_label("fixed_format_action").format(format_type=selected_display_format, column=column),
+                operation=record
+            )
+            
+            st.success(get_label("format_fixed_success").format(column=column))
+        except Exception as e:
+            st.error(get_label('error_generic').format(error=str(e)))
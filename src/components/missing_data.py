@@ -1,13 +1,17 @@
 import streamlit as st
 import pandas as pd
-from utils.data_cleaning import handle_missing_data
+from components.data_viewer import display_data_viewer
+from kernels.missing_data import handle_missing_data as apply_missing_data_strategy
 from utils.labels import get_label
+from utils.profile import APPROXIMATE_PROFILE_ROWS
+from utils.session import current_profile, update_data
 
 def display_missing_data_options(data):
     st.header(get_label("handle_missing_data"))
     
     # Display missing data information
-    missing_info = data.isnull().sum()
+    # Missing counts are exact in approximate profiles too
+    missing_info = current_profile(len(data) >= APPROXIMATE_PROFILE_ROWS).missing_counts()
     st.write(get_label("missing_values_count"))
     st.write(missing_info[missing_info > 0])
     
@@ -19,27 +23,31 @@ def display_missing_data_options(data):
     if option == get_label("impute_values"):
         fill_value = st.text_input(get_label("enter_value_impute"))
     if st.button(get_label("apply")):
-        cleaned_data = None
+        if option == get_label("impute_values") and not fill_value:
+            st.error(get_label("please_enter_value"))
+            return
+        
         if option == get_label("drop_rows"):
-            cleaned_data = data.dropna()
-            st.success(get_label("dropped_rows"))
+            cleaned_data, record = apply_missing_data_strategy(data, 'drop')
+            action = get_label("dropped_rows")
         elif option == get_label("impute_values"):
-            if fill_value:
-                cleaned_data = data.fillna(fill_value)
-                st.success(get_label("imputed_values").format(value=fill_value))
-            else:
-                st.error(get_label("please_enter_value"))
-        elif option == get_label("flag_missing"):
-            cleaned_data = data.copy()
-            cleaned_data['missing_flag'] = cleaned_data.isnull().any(axis=1)
-            st.success(get_label("flagged_missing"))
-        if cleaned_data is not None:
-            st.session_state.data = cleaned_data
-            st.write(get_label("cleaned_data"))
-            st.dataframe(cleaned_data)
+            cleaned_data, record = apply_missing_data_strategy(data, 'impute', fill_value)
+            action = get_label("imputed_values").format(value=fill_value)
+        else:
+            cleaned_data, record = apply_missing_data_strategy(data, 'flag')
+            action = get_label("flagged_missing")
+        
+        update_data(cleaned_data, action, operation=record)
+        st.session_state.missing_data_result = True
+        st.success(action)
+    
+    # Shown outside the button so that paging through the result survives reruns
+    if st.session_state.get("missing_data_result"):
+        st.write(get_label("cleaned_data"))
+        display_data_viewer(st.session_state.data, key="missing_data_viewer")
 
 def handle_missing_data():
     if st.session_state.data is not None:
         display_missing_data_options(st.session_state.data)
     else:
-        st.warning(get_label("please_upload"))
\ No newline at end of file
+        st.warning(get_label("please_upload"))
@@ -1,32 +1,67 @@
 import streamlit as st
 import pandas as pd
+from components.data_viewer import display_data_viewer
 from utils.labels import get_label
+from utils.profile import APPROXIMATE_PROFILE_ROWS, DataProfile
+from utils.session import current_profile
 
-def display_data_overview(data: pd.DataFrame):
+def display_profile_errors(profile: DataProfile):
+    """Show the error bounds of an approximate profile."""
+    errors = profile.errors()
+    if errors.empty:
+        return
+    st.caption(get_label("approximate_errors"))
+    st.dataframe(pd.DataFrame({
+        get_label("error_unique"): (errors["unique"] * 100).round(2),
+        get_label("error_freq"): errors["freq"],
+        get_label("error_quantile"): (errors["quantile_rank"] * 100).round(2),
+    }))
+
+def display_data_overview(data: pd.DataFrame, memory_report: pd.DataFrame = None):
     """
     Display summary information about the loaded dataset.
     
-    Shows statistics, data types, missing values, sample rows and dataset shape.
+    Shows statistics (estimated with sketches for large data), data types, missing values, sample rows, dataset shape and,
+    when the data was optimized at load time, memory usage per column.
     
     Args:
         data: DataFrame to analyze
+        memory_report: Per-column report from optimize_dtypes()
     """
     st.header(get_label("data_overview"))
     
     if data is not None:
+        approximate = st.toggle(
+            get_label("approximate_statistics"),
+            value=len(data) >= APPROXIMATE_PROFILE_ROWS,
+            help=get_label("approximate_statistics_help"),
+        )
+        profile = current_profile(approximate)
+        
         st.subheader(get_label("basic_statistics"))
-        st.write(data.describe(include='all'))
+        st.write(profile.describe())
+        if profile.approximate:
+            display_profile_errors(profile)
 
         st.subheader(get_label("data_types"))
         st.write(data.dtypes)
 
         st.subheader(get_label("missing_values"))
-        st.write(data.isnull().sum())
+        st.write(profile.missing_counts())
 
         st.subheader(get_label("sample_data"))
-        st.write(data.head())
+        display_data_viewer(data, key="overview_viewer", preview_rows=5)
 
         st.subheader(get_label("shape_of_data"))
         st.write(get_label("rows_cols").format(rows=data.shape[0], cols=data.shape[1]))
+
+        if memory_report is not None:
+            st.subheader(get_label("memory_usage"))
+            before_mb = memory_report["memory_before"].sum() / 1024 ** 2
+            after_mb = memory_report["memory_after"].sum() / 1024 ** 2
+            st.write(get_label("memory_usage_summary").format(
+                before=before_mb, after=after_mb, ratio=before_mb / after_mb if after_mb else 1.0
+            ))
+            st.dataframe(memory_report, hide_index=True)
     else:
         st.warning(get_label("no_data_display"))
\ No newline at end of file
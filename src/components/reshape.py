@@ -1,7 +1,7 @@
 import streamlit as st
-import pandas as pd
+from kernels.reshape import melt_data, pivot_data, transpose_data
 from utils.labels import get_label
-from datetime import datetime
+from utils.session import update_data
 
 def reshape_data(df):
     """
@@ -27,14 +27,12 @@ def reshape_data(df):
             if st.button(get_label("pivot_data")):
                 try:
                     # Perform pivot operation
-                    pivoted_df = df.pivot(index=index_col, columns=columns_col, values=values_col)
-                    st.session_state.data = pivoted_df.reset_index()
-                    
-                    # Add to cleaning history
-                    st.session_state.cleaning_history.append({
-                        "action": f"Pivoted data using {index_col} as index, {columns_col} as columns, and {values_col} as values",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
+                    pivoted_df, record = pivot_data(df, index_col, columns_col, values_col)
+                    update_data(
+                        pivoted_df,
+                        f"Pivoted data using {index_col} as index, {columns_col} as columns, and {values_col} as values",
+                        operation=record
+                    )
                     
                     st.success(get_label("data_pivoted"))
                     st.write(st.session_state.data.head())
@@ -53,14 +51,8 @@ def reshape_data(df):
                         return
                     
                     # Perform melt operation
-                    melted_df = pd.melt(df, id_vars=id_vars, value_vars=value_vars if value_vars else None)
-                    st.session_state.data = melted_df
-                    
-                    # Add to cleaning history
-                    st.session_state.cleaning_history.append({
-                        "action": f"Melted data using {', '.join(id_vars)} as identifier variables",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
+                    melted_df, record = melt_data(df, id_vars, value_vars)
+                    update_data(melted_df, f"Melted data using {', '.join(id_vars)} as identifier variables", operation=record)
                     
                     st.success(get_label("data_melted"))
                     st.write(st.session_state.data.head())
@@ -71,14 +63,8 @@ def reshape_data(df):
             if st.button(get_label("transpose_data")):
                 try:
                     # Perform transpose operation
-                    transposed_df = df.transpose()
-                    st.session_state.data = transposed_df
-                    
-                    # Add to cleaning history
-                    st.session_state.cleaning_history.append({
-                        "action": "Transposed data",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
+                    transposed_df, record = transpose_data(df)
+                    update_data(transposed_df, "Transposed data", operation=record)
                     
                     st.success(get_label("data_transposed"))
                     st.write(st.session_state.data.head())
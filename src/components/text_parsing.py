@@ -1,78 +1,7 @@
-import pandas as pd
-import re
 import streamlit as st
-from datetime import datetime
+from kernels.text_parsing import KEYWORD_OUTPUTS, clean_text_column, extract_keywords, parse_dates, split_full_name
 from utils.labels import get_label
-
-def split_full_name(df, full_name_column):
-    """Split a full name column into first name and last name"""
-    if full_name_column not in df.columns:
-        st.error(f"Column '{full_name_column}' not found.")
-        return df
-    
-    # Create a copy of the dataframe
-    result_df = df.copy()
-    
-    # Split the full name into first and last name
-    result_df[[get_label("first_name_col"), get_label("last_name_col")]] = df[full_name_column].str.split(' ', n=1, expand=True)
-    
-    # Add to cleaning history
-    st.session_state.cleaning_history.append({
-        "action": get_label("split_full_names_action").format(col=full_name_column),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    
-    return result_df
-
-def extract_keywords(df, text_column, keywords):
-    """Extracts specified keywords from a given text column."""
-    if text_column not in df.columns:
-        raise ValueError(get_label("column_not_exist").format(column=text_column))
-    
-    # Create a new column to store extracted keywords
-    df[f"{text_column}_keywords"] = df[text_column].apply(
-        lambda text: ','.join([kw for kw in keywords if isinstance(text, str) and re.search(r'\\b' + re.escape(kw) + r'\\b', text, re.IGNORECASE)])
-    )
-    
-    # Add to cleaning history
-    st.session_state.cleaning_history.append({
-        "action": get_label("extracted_keywords_action").format(col=text_column),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    
-    return df
-
-def clean_text_column(df, text_column):
-    """Cleans a text column by removing unwanted characters and extra spaces."""
-    if text_column not in df.columns:
-        raise ValueError(get_label("column_not_exist").format(column=text_column))
-    
-    # Clean the text
-    df[text_column] = df[text_column].astype(str).str.replace(r'[\w\s]', '', regex=True).str.strip()
-    
-    # Add to cleaning history
-    st.session_state.cleaning_history.append({
-        "action": get_label("cleaned_text_action").format(col=text_column),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    
-    return df
-
-def parse_dates(df, date_column, format='%Y-%m-%d'):
-    """Parses a date column into datetime format."""
-    if date_column not in df.columns:
-        raise ValueError(get_label("column_not_exist").format(column=date_column))
-    
-    # Convert to datetime
-    df[date_column] = pd.to_datetime(df[date_column], format=format, errors='coerce')
-    
-    # Add to cleaning history
-    st.session_state.cleaning_history.append({
-        "action": get_label("parsed_dates_action").format(col=date_column, fmt=format),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    
-    return df
+from utils.session import update_data
 
 def parse_text_data(df):
     """Display interface for text parsing options"""
@@ -87,7 +16,7 @@ def parse_text_data(df):
     
     if option == get_label("split_full_names"):
         # Select column containing full names
-        text_columns = df.select_dtypes(include=['object']).columns.tolist()
+        text_columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
         if not text_columns:
             st.error(get_label("no_text_columns"))
             return df
@@ -96,31 +25,50 @@ def parse_text_data(df):
         
         if st.button(get_label("split_names")):
             try:
-                df = split_full_name(df, full_name_col)
+                df, record = split_full_name(df, full_name_col, get_label("first_name_col"), get_label("last_name_col"))
+                update_data(df, get_label("split_full_names_action").format(col=full_name_col), operation=record)
                 st.success(get_label("split_names_success").format(col=full_name_col))
             except Exception as e:
                 st.error(get_label("error_generic").format(error=str(e)))
     
     elif option == get_label("extract_keywords"):
         # Select text column and keywords to extract
-        text_columns = df.select_dtypes(include=['object']).columns.tolist()
+        text_columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
         if not text_columns:
             st.error(get_label("no_text_columns"))
             return df
         
         text_col = st.selectbox(get_label("select_text_column"), text_columns)
         keywords = st.text_input(get_label("enter_keywords")).split(',')
+        keyword_file = st.file_uploader(get_label("upload_keywords"), type=["txt", "csv"], key="keywords_upload",
+                                        help=get_label("upload_keywords_tooltip"))
+        col1, col2 = st.columns(2)
+        with col1:
+            whole_words = st.checkbox(get_label("match_whole_words"), value=True, key="keywords_whole_words")
+            case_sensitive = st.checkbox(get_label("match_case"), key="keywords_case_sensitive")
+        with col2:
+            output = st.radio(get_label("keyword_output"), KEYWORD_OUTPUTS, key="keywords_output",
+                              format_func=lambda name: get_label(f"keyword_output_{name}"))
+            all_cores = st.checkbox(get_label("use_all_cores"), key="keywords_all_cores")
         
         if st.button(get_label("extract_keywords_btn")) and keywords:
             try:
-                df = extract_keywords(df, text_col, [k.strip() for k in keywords if k.strip()])
+                if keyword_file is not None:
+                    # One keyword per line
+                    keywords += keyword_file.getvalue().decode('utf-8').splitlines()
+                keywords = [k.strip() for k in keywords if k.strip()]
+                df, record = extract_keywords(df, text_col, keywords, case_sensitive, whole_words, output,
+                                              workers=-1 if all_cores else 1)
+                action = "extracted_keywords_action" if output == 'list' else "extracted_keyword_columns_action"
+                update_data(df, get_label(action).format(col=text_col, count=len(keywords)), operation=record)
                 st.success(get_label("extract_keywords_success").format(col=text_col))
+                st.caption(get_label("rows_with_keywords").format(count=record["details"]["rows_with_keywords"]))
             except Exception as e:
                 st.error(get_label("error_generic").format(error=str(e)))
     
     elif option == get_label("clean_text_column"):
         # Select text column to clean
-        text_columns = df.select_dtypes(include=['object']).columns.tolist()
+        text_columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
         if not text_columns:
             st.error(get_label("no_text_columns"))
             return df
@@ -129,7 +77,8 @@ def parse_text_data(df):
         
         if st.button(get_label("clean_text_btn")):
             try:
-                df = clean_text_column(df, text_col)
+                df, record = clean_text_column(df, text_col)
+                update_data(df, get_label("cleaned_text_action").format(col=text_col), operation=record)
                 st.success(get_label("clean_text_success").format(col=text_col))
             except Exception as e:
                 st.error(get_label("error_generic").format(error=str(e)))
@@ -153,7 +102,8 @@ def parse_text_data(df):
         
         if st.button(get_label("parse_dates_btn")) and date_format:
             try:
-                df = parse_dates(df, date_col, date_format)
+                df, record = parse_dates(df, date_col, date_format)
+                update_data(df, get_label("parsed_dates_action").format(col=date_col, fmt=date_format), operation=record)
                 st.success(get_label("parse_dates_success").format(col=date_col))
             except Exception as e:
                 st.error(get_label("error_generic").format(error=str(e)))
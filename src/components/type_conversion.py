@@ -1,29 +1,31 @@
-import pandas as pd
+import streamlit as st
+from components.formatting import decimal_separator_option, show_failed_rows
+from kernels.type_conversion import type_conversion
 from utils.labels import get_label
+from utils.session import update_data
 
-def convert_to_numeric(df, columns):
-    for column in columns:
-        df[column] = pd.to_numeric(df[column], errors='coerce')
-    # Optionally, add a message: st.success(get_label('converted_to_numeric'))
-    return df
-
-def convert_to_datetime(df, columns):
-    for column in columns:
-        df[column] = pd.to_datetime(df[column], errors='coerce')
-    # Optionally, add a message: st.success(get_label('converted_to_datetime'))
-    return df
-
-def convert_to_string(df, columns):
-    for column in columns:
-        df[column] = df[column].astype(str)
-    # Optionally, add a message: st.success(get_label('converted_to_string'))
-    return df
-
-def type_conversion(df, conversions):
-    if 'numeric' in conversions:
-        df = convert_to_numeric(df, conversions['numeric'])
-    if 'datetime' in conversions:
-        df = convert_to_datetime(df, conversions['datetime'])
-    if 'string' in conversions:
-        df = convert_to_string(df, conversions['string'])
-    return df
\ No newline at end of file
+def display_type_conversion(df):
+    """Display interface for converting columns to numbers, dates or strings"""
+    st.header(get_label("type_conversion_tab"))
+    conversion_type = st.selectbox(get_label("select_conversion_type"), [get_label("string_to_number"), get_label("string_to_date"), get_label("number_to_string")])
+    
+    text_columns = df.select_dtypes(include=['object', 'category', 'string']).columns
+    if conversion_type == get_label("string_to_number"):
+        kind, columns = 'numeric', text_columns
+    elif conversion_type == get_label("string_to_date"):
+        kind, columns = 'datetime', text_columns
+    else:
+        kind, columns = 'string', df.select_dtypes(include=['number']).columns
+    
+    cols = st.multiselect(get_label(f"select_columns_to_convert_{kind}"), columns)
+    options = {}
+    if kind == 'datetime':
+        options["dayfirst"] = st.checkbox(get_label("dates_day_first"), help=get_label("dates_day_first_tooltip"),
+                                          key="conversion_dayfirst")
+    elif kind == 'numeric':
+        options["decimal"] = decimal_separator_option(key="conversion_decimal")
+    if st.button(get_label(f"convert_to_{kind}")):
+        converted_df, record = type_conversion(df, {kind: cols}, **options)
+        show_failed_rows(df, record["details"]["failed"])
+        update_data(converted_df, get_label(f"converted_to_{kind}_action").format(columns=", ".join(cols)), operation=record)
+        st.success(get_label(f"converted_to_{kind}"))
@@ -0,0 +1,39 @@
+"""
+Data cleaning kernels: the pure functions behind every cleaning operation of the app.
+
+A kernel takes a DataFrame and its parameters, never modifies its input, and returns the
+cleaned DataFrame together with an operation record (see operation_record()). Kernels do
+not import Streamlit or touch session state, so they can run in worker processes, be
+cached and be benchmarked; the components only collect parameters, call a kernel and
+report its record.
+
+Kernels return shallow copies and rely on pandas copy-on-write to leave their input
+untouched, so importing this package turns copy-on-write on.
+"""
+from utils.dataset_store import enable_copy_on_write
+
+enable_copy_on_write()
+
+def operation_record(operation: str, params: dict, **details) -> dict:
+    """
+    Describes an applied operation.
+
+    Args:
+        operation (str): The name of the operation, a key of utils.recipes.OPERATIONS.
+        params (dict): The keyword arguments that replay the operation on other data.
+        **details: What the operation found or changed, e.g. the number of rows removed.
+
+    Returns:
+        dict: The record, with the keys "operation", "params" and "details".
+    """
+    return {"operation": operation, "params": params, "details": details}
+
+def require_columns(df, *columns):
+    """Raise a ValueError naming the first of columns that is not in df."""
+    for column in columns:
+        if column not in df.columns:
+            raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
+
+def failure_report(index, failed, limit: int = 100) -> dict:
+    """Describe the rows a conversion failed on: their number and the labels of the first limit of them."""
+    return {"count": int(failed.sum()), "rows": index[failed][:limit].tolist()}
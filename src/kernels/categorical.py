@@ -0,0 +1,41 @@
+from kernels import operation_record, require_columns
+from utils.synonyms import load_synonyms, merge_values, standardize_values
+
+# Common spellings of the standard categories
+TYPOS = {
+    "male": ["m", "male", "man"],
+    "female": ["f", "female", "woman"],
+    "other": ["o", "other", "non-binary"]
+}
+
+def standardize_categorical_data(df, column_name, synonyms=None):
+    """
+    Lower-case and trim a categorical column and map the variants of synonyms to their standard value.
+
+    synonyms maps standard values to lists of variants, or is the path of a JSON or CSV
+    synonym file (see utils.synonyms.load_synonyms()); it defaults to TYPOS. Missing
+    values stay missing.
+    """
+    require_columns(df, column_name)
+    df = df.copy(deep=False)
+
+    lookup = load_synonyms(synonyms) if isinstance(synonyms, str) else (TYPOS if synonyms is None else synonyms)
+    df[column_name], mapped = standardize_values(df[column_name], lookup)
+
+    params = {"column_name": column_name}
+    if synonyms is not None:
+        params["synonyms"] = synonyms
+    return df, operation_record("standardize_categorical_data", params, values_mapped=mapped)
+
+def merge_category_clusters(df, column_name, merges):
+    """
+    Replace the values of clusters of near-duplicates by their canonical value.
+
+    merges maps each canonical value to the values merged into it, e.g. the clusters found
+    by utils.key_collision.key_collision_clusters(); values are matched exactly.
+    """
+    require_columns(df, column_name)
+    df = df.copy(deep=False)
+    df[column_name], changed = merge_values(df[column_name], merges)
+    return df, operation_record("merge_category_clusters", {"column_name": column_name, "merges": merges},
+                                clusters=len(merges), rows_changed=changed)
@@ -0,0 +1,51 @@
+import pandas as pd
+from kernels import operation_record
+
+def merge_columns(df, column1, column2, new_column, separator=' '):
+    """
+    Merge two columns into a new column with a specified separator.
+    
+    Args:
+        df (pd.DataFrame): The DataFrame containing the columns to merge
+        column1 (str): The name of the first column to merge
+        column2 (str): The name of the second column to merge
+        new_column (str): The name of the new merged column
+        separator (str): The separator to use between values (default is space)
+    
+    Returns:
+        tuple: The DataFrame with the new merged column and the operation record
+    """
+    if column1 not in df.columns or column2 not in df.columns:
+        raise ValueError(f"One or both columns '{column1}' and '{column2}' do not exist in the DataFrame.")
+    
+    # A shallow copy is enough: with copy-on-write only the columns written below are copied
+    result_df = df.copy(deep=False)
+    # Convert columns to string before merging
+    result_df[column1] = result_df[column1].astype(str)
+    result_df[column2] = result_df[column2].astype(str)
+    result_df[new_column] = result_df[column1] + separator + result_df[column2]
+    
+    return result_df, operation_record("merge_columns", {
+        "column1": column1, "column2": column2, "new_column": new_column, "separator": separator
+    })
+
+def split_column(df, column, new_column1, new_column2, separator=' '):
+    """
+    Split a column into two new columns based on a separator.
+    
+    Args:
+        df (pd.DataFrame): The DataFrame containing the column to split
+        column (str): The name of the column to split
+        new_column1 (str): The name of the first new column
+        new_column2 (str): The name of the second new column
+        separator (str): The separator to split on (default is space)
+    
+    Returns:
+        tuple: The DataFrame with the column split into two new columns and the operation record
+    """
+    result_df = df.copy(deep=False)
+    result_df[[new_column1, new_column2]] = result_df[column].str.split(separator, n=1, expand=True)
+    
+    return result_df, operation_record("split_column", {
+        "column": column, "new_column1": new_column1, "new_column2": new_column2, "separator": separator
+    })
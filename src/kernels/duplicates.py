@@ -0,0 +1,67 @@
+import pandas as pd
+from kernels import operation_record, require_columns
+from utils.fuzzy_matching import RAPIDFUZZ_AVAILABLE, similar_strings
+from utils.row_hashing import first_occurrences, row_hashes
+
+def drop_duplicates(df, subset=None, keep='first', hash_bits=None, seen=None):
+    """
+    Remove rows that are exact duplicates of an earlier row (over subset when given).
+
+    Args:
+        df (pd.DataFrame): The data.
+        subset (list, optional): The key columns. Defaults to all columns.
+        keep (str or bool, optional): Which of the duplicates to keep, as in DataFrame.drop_duplicates().
+        hash_bits (int, optional): Compare rows by their 64- or 128-bit hash over the key
+                                   columns (see utils.row_hashing), which needs 8 or 16 bytes
+                                   per row instead of factorizing every key column.
+        seen (RowHashSet, optional): Hashes of the rows of earlier files. Rows found in it
+                                     are removed too, and the rows kept are added to it.
+
+    Returns:
+        tuple: The deduplicated DataFrame and its operation record.
+    """
+    if isinstance(subset, str):
+        subset = [subset]
+    if subset is not None:
+        require_columns(df, *subset)
+    if hash_bits is None and seen is None:
+        cleaned = df.drop_duplicates(subset=subset, keep=keep)
+        return cleaned, operation_record("drop_duplicates", {"subset": subset, "keep": keep}, rows_removed=len(df) - len(cleaned))
+
+    hashes = row_hashes(df, subset, seen.bits if seen is not None else hash_bits)
+    keep_rows = first_occurrences(hashes, keep)
+    seen_before = 0
+    if seen is not None:
+        known = seen.contains(hashes)
+        seen_before = int(known.sum())
+        keep_rows &= ~known
+        seen.add(hashes[keep_rows])
+    cleaned = df[keep_rows]
+    # The hash set itself is not part of the record: a replayed recipe deduplicates within the file
+    return cleaned, operation_record(
+        "drop_duplicates", {"subset": subset, "keep": keep, "hash_bits": hashes.ndim * 64},
+        rows_removed=len(df) - len(cleaned), seen_before=seen_before
+    )
+
+def find_fuzzy_duplicates(values, threshold=90, workers=-1):
+    """
+    Return the set of values (as strings) that have a different value at least threshold
+    similar (WRatio, as thefuzz.process.extract scores it). Only values sharing character
+    n-grams are compared, on all cores (see utils.fuzzy_matching).
+    """
+    # Convert unique values to strings and skip NaN
+    unique_values_str = dict.fromkeys(str(x) for x in pd.unique(values) if not pd.isna(x))
+    return similar_strings(unique_values_str, threshold, workers=workers)
+
+def remove_fuzzy_duplicates(df, column, threshold=90):
+    """Remove the rows whose value in column is similar to another value of the column."""
+    if not RAPIDFUZZ_AVAILABLE:
+        raise ImportError("rapidfuzz is required for fuzzy duplicate removal.")
+    require_columns(df, column)
+    duplicates = find_fuzzy_duplicates(df[column], threshold)
+    # Compare as strings
+    cleaned = df[~df[column].astype(str).isin(duplicates)]
+    return cleaned, operation_record(
+        "remove_fuzzy_duplicates", {"column": column, "threshold": threshold},
+        rows_removed=len(df) - len(cleaned), similar_values=len(duplicates)
+    )
@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from kernels import operation_record, require_columns
+from utils.fuzzy_matching import (RAPIDFUZZ_AVAILABLE, candidate_pairs, iter_block_pairs, process_strings,
+                                  score_pairs)
+
+COMPARATOR_METHODS = ('fuzzy', 'exact', 'numeric')
+SURVIVOR_RULES = ('most_complete', 'most_recent', 'first')
+
+def component_roots(size, left, right) -> np.ndarray:
+    """
+    Groups 0..size-1 into the connected components of the edges (left[k], right[k]).
+
+    Returns:
+        np.ndarray: The smallest member of its component for every element.
+    """
+    graph = coo_matrix((np.ones(len(left), dtype=np.int8), (left, right)), shape=(size, size))
+    _, labels = connected_components(graph, directed=False)
+    # The first element with each label is the smallest member of its component
+    first = np.unique(labels, return_index=True)[1]
+    return first[labels].astype(np.int64)
+
+def _check_pairs(total, max_pairs):
+    if total > max_pairs:
+        raise ValueError(f"Blocking produced {total:,} candidate pairs, more than the limit of {max_pairs:,}. "
+                         "Block on more selective columns or raise the trigram overlap.")
+
+def _cross_pairs(codes, value_pairs, max_block, max_pairs):
+    """Return every pair of a record with value a and a record with value b, for each value pair (a, b)."""
+    order = np.argsort(codes, kind='stable')
+    sizes = np.bincount(codes[codes >= 0], minlength=codes.max() + 1)
+    starts = np.searchsorted(codes[order], np.arange(len(sizes)))
+    a, b = value_pairs[:, 0], value_pairs[:, 1]
+    counts = sizes[a] * sizes[b]
+    keep = counts <= max_block
+    a, b, counts = a[keep], b[keep], counts[keep]
+    _check_pairs(int(counts.sum()), max_pairs)
+    pair = np.repeat(np.arange(len(a)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    width = sizes[b][pair]
+    return order[starts[a][pair] + k // width], order[starts[b][pair] + k % width]
+
+def blocking_columns(comparators) -> list:
+    """
+    Return the columns used for blocking: the ones whose comparator sets "block", and by
+    default the exact columns and the fuzzy column with the highest weight.
+    """
+    fuzzy = [comparator for comparator in comparators if comparator["method"] == 'fuzzy']
+    main = max(fuzzy, key=lambda comparator: comparator.get("weight", 1)) if fuzzy else None
+    return [comparator for comparator in comparators
+            if comparator.get("block", comparator["method"] == 'exact' or comparator is main)]
+
+def _blocking_pairs(records, comparators, max_block, min_overlap, max_pairs):
+    """
+    Candidate pairs of records: records sharing a value of a blocking column, or whose
+    values of a fuzzy blocking column share enough character trigrams.
+    """
+    lefts, rights = [], []
+    total = 0
+    for comparator in blocking_columns(comparators):
+        codes, uniques = pd.factorize(records[comparator["column"]], sort=False)
+        valid = np.flatnonzero(codes >= 0)
+        order = valid[np.argsort(codes[valid], kind='stable')]
+        sizes = np.bincount(codes[valid], minlength=len(uniques))
+        sizes = sizes[sizes <= max_block]
+        total += int((sizes * (sizes - 1) // 2).sum())
+        _check_pairs(total, max_pairs)
+        for left, right in iter_block_pairs(codes[order], order, max_block, max_pairs):
+            lefts.append(left)
+            rights.append(right)
+        if comparator["method"] == 'fuzzy' and len(uniques) > 1:
+            _, choices = process_strings(pd.Index(uniques).astype(str))
+            value_pairs = candidate_pairs(choices, max_block=max_block, min_overlap=min_overlap,
+                                          max_pairs=max_pairs)
+            if len(value_pairs):
+                left, right = _cross_pairs(codes, value_pairs, max_block, max_pairs - total)
+                total += len(left)
+                lefts.append(left)
+                rights.append(right)
+    if not lefts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    left, right = np.concatenate(lefts), np.concatenate(rights)
+    codes = np.unique(np.minimum(left, right) * len(records) + np.maximum(left, right))
+    return codes // len(records), codes % len(records)
+
+def _column_scores(values, method, left, right, workers):
+    """Score one column for the record pairs (left[k], right[k]); NaN where a value is missing."""
+    scores = np.full(len(left), np.nan)
+    if method == 'numeric':
+        numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+        a, b = numbers[left], numbers[right]
+        scale = np.maximum(np.abs(a), np.abs(b))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            similarity = np.where(scale == 0, 100.0, 100.0 * (1 - np.abs(a - b) / scale))
+        return np.where(np.isnan(a) | np.isnan(b), np.nan, np.clip(similarity, 0, 100))
+
+    codes, uniques = pd.factorize(values, sort=False)
+    a, b = codes[left], codes[right]
+    valid = (a >= 0) & (b >= 0)
+    scores[valid] = np.where(a[valid] == b[valid], 100.0, 0.0)
+    if method == 'fuzzy':
+        # Score each pair of distinct values once
+        different = np.flatnonzero(valid & (a != b))
+        value_codes, inverse = np.unique(np.minimum(a, b)[different] * len(uniques) + np.maximum(a, b)[different],
+                                         return_inverse=True)
+        _, choices = process_strings(pd.Index(uniques).astype(str))
+        choices = np.asarray(choices, dtype=object)
+        scores[different] = score_pairs(choices[value_codes // len(uniques)], choices[value_codes % len(uniques)],
+                                        workers=workers)[inverse]
+    return scores
+
+def _survivors(df, clusters, rule, recency_column):
+    """Return a boolean mask with one True row per cluster, chosen by the survivor rule."""
+    if rule == 'most_complete':
+        preference = df.notna().sum(axis=1).to_numpy()
+    elif rule == 'most_recent':
+        preference = pd.to_datetime(df[recency_column], errors='coerce').to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        # NaT is the smallest int64, so rows without a date are chosen last
+    else:
+        preference = np.zeros(len(df), dtype=np.int64)
+    # Sort by cluster, then by preference (highest first, as dense ranks so they negate safely), then by position
+    rank = np.unique(preference, return_inverse=True)[1].reshape(-1)
+    order = np.lexsort((np.arange(len(df)), -rank, clusters))
+    first = np.r_[True, clusters[order][1:] != clusters[order][:-1]]
+    mask = np.zeros(len(df), dtype=bool)
+    mask[order[first]] = True
+    return mask
+
+def resolve_entities(df, comparators, threshold=85, survivor='most_complete', recency_column=None,
+                     drop=True, cluster_column=None, max_block=1_000, min_overlap=0.5, max_pairs=20_000_000,
+                     workers=-1):
+    """
+    Links the rows that describe the same entity across several columns, groups them into
+    clusters and keeps one surviving row per cluster.
+
+    Rows with the same values in all compared columns are merged first. Candidate pairs are
+    found by blocking (see blocking_columns()), scored column by column (fuzzy columns
+    with rapidfuzz on all cores) and combined into a weighted average over the
+    columns both rows have a value in. Pairs scoring at least threshold are linked and
+    the linked rows are clustered into the connected components of the links.
+
+    Args:
+        df (pd.DataFrame): The data.
+        comparators (list): One dict per compared column with the keys "column", "method"
+                            ('fuzzy', 'exact' or 'numeric'), "weight" (default 1) and
+                            optionally "block" (see blocking_columns()).
+        threshold (float, optional): Minimum weighted score of a match, from 0 to 100.
+        survivor (str, optional): 'most_complete' keeps the row with the fewest missing
+                                  values, 'most_recent' the row with the latest date in
+                                  recency_column and 'first' the first row of the cluster.
+        recency_column (str, optional): Date column used by the 'most_recent' rule.
+        drop (bool, optional): Remove every row of a cluster but its survivor.
+        cluster_column (str, optional): Add the cluster id of each row in this column.
+        max_block (int, optional): Largest block of candidate pairs, see utils.fuzzy_matching.
+        min_overlap (float, optional): Share of trigrams fuzzy blocking values must have in common.
+        max_pairs (int, optional): Largest number of candidate pairs; more raise a ValueError.
+        workers (int, optional): Threads used for fuzzy scoring; -1 uses all cores.
+
+    Returns:
+        tuple: The resolved DataFrame and its operation record.
+    """
+    if not comparators:
+        raise ValueError("At least one column must be compared.")
+    for comparator in comparators:
+        require_columns(df, comparator["column"])
+        if comparator.get("method", 'fuzzy') not in COMPARATOR_METHODS:
+            raise ValueError(f"Invalid method. Choose one of {', '.join(COMPARATOR_METHODS)}.")
+    if survivor not in SURVIVOR_RULES:
+        raise ValueError(f"Invalid survivor rule. Choose one of {', '.join(SURVIVOR_RULES)}.")
+    if survivor == 'most_recent':
+        if recency_column is None:
+            raise ValueError("The 'most_recent' survivor rule needs a recency column.")
+        require_columns(df, recency_column)
+    comparators = [dict(comparator, method=comparator.get("method", 'fuzzy')) for comparator in comparators]
+    if not RAPIDFUZZ_AVAILABLE and any(comparator["method"] == 'fuzzy' for comparator in comparators):
+        raise ImportError("rapidfuzz is required for fuzzy comparisons.")
+
+    # Identical records are always the same entity; compare each distinct record once
+    columns = list(dict.fromkeys(comparator["column"] for comparator in comparators))
+    record_ids = df.groupby(columns, dropna=False, sort=False, observed=True).ngroup().to_numpy()
+    first_rows = np.unique(record_ids, return_index=True)[1]
+    records = df[columns].iloc[first_rows].reset_index(drop=True)
+
+    left, right = _blocking_pairs(records, comparators, max_block, min_overlap, max_pairs)
+    weighted = np.zeros(len(left))
+    weights = np.zeros(len(left))
+    for comparator in comparators:
+        scores = _column_scores(records[comparator["column"]], comparator["method"], left, right, workers)
+        valid = ~np.isnan(scores)
+        weight = float(comparator.get("weight", 1))
+        weighted[valid] += weight * scores[valid]
+        weights[valid] += weight
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matched = np.flatnonzero(weights > 0)[weighted[weights > 0] / weights[weights > 0] >= threshold]
+
+    # Number clusters by their first row
+    roots = component_roots(len(records), left[matched], right[matched])[record_ids]
+    clusters = pd.factorize(roots, sort=False)[0]
+    cluster_sizes = np.bincount(clusters)
+    survivors = _survivors(df, clusters, survivor, recency_column)
+
+    resolved = df.copy(deep=False)
+    if cluster_column:
+        resolved[cluster_column] = clusters
+    if drop:
+        resolved = resolved[survivors]
+    return resolved, operation_record(
+        "resolve_entities",
+        {"comparators": comparators, "threshold": threshold, "survivor": survivor, "recency_column": recency_column,
+         "drop": drop, "cluster_column": cluster_column, "max_block": max_block, "min_overlap": min_overlap,
+         "max_pairs": max_pairs},
+        pairs_compared=int(len(left)), matches=int(len(matched)),
+        clusters=int((cluster_sizes > 1).sum()), rows_in_clusters=int(cluster_sizes[cluster_sizes > 1].sum()),
+        rows_removed=int(len(df) - len(resolved)),
+    )
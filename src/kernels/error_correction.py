@@ -0,0 +1,211 @@
+import pandas as pd
+import numpy as np
+from kernels import failure_report, operation_record, require_columns
+from utils.anomalies import score_anomalies
+from utils.outliers import correct_outliers, group_codes, group_quantiles
+from utils.rules import compile_rules, evaluate_rules, load_rules
+from utils.sketches import quantile_sketch
+
+ANOMALY_ACTIONS = ('flag', 'quarantine')
+RULE_ACTIONS = ('report', 'flag', 'remove')
+
+def _quantiles(series, fractions, approximate=False, sketch=None):
+    """
+    Return quantiles of a column. With approximate, they are read from a QuantileSketch of
+    the column (built here when sketch is None) instead of sorting the column.
+    """
+    if not approximate:
+        return series.quantile(fractions).to_numpy()
+    if sketch is None:
+        sketch = quantile_sketch(series)
+    return sketch.quantiles(fractions)
+
+def _group_columns(group_by):
+    """The columns of a group_by argument: None, a column or a list of columns."""
+    if not group_by:
+        return []
+    return [group_by] if isinstance(group_by, str) else list(group_by)
+
+def correct_errors(df, columns=None, method='zscore', threshold=3.0, replacement='median', group_by=None):
+    """
+    Replace the outliers of numeric columns (all of them by default) with the column median:
+    by default the values more than 3 standard deviations from the mean. Missing values are
+    ignored. See utils.outliers for the methods and replacements; with group_by, the
+    statistics are those of each row's group.
+    """
+    params = {"method": method, "threshold": threshold, "replacement": replacement}
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    else:
+        params["columns"] = list(columns)
+    if group_by:
+        params["group_by"] = group_by
+    require_columns(df, *columns, *_group_columns(group_by))
+    df, corrected = correct_outliers(df, columns, method, threshold, replacement, group_by=group_by)
+    return df, operation_record("correct_errors", params,
+                                columns=[dict(item, outliers=item["count"]) for item in corrected])
+
+def replace_outliers(df, columns, z_threshold=3.0, approximate=False, sketches=None, method='zscore',
+                     replacement='median', group_by=None):
+    """
+    Replace values whose z-score is above z_threshold with the column median.
+    method and replacement select another estimator or replacement (see utils.outliers), in
+    which case z_threshold is the threshold of that estimator.
+    With approximate, medians and quartiles are estimated with quantile sketches; sketches
+    maps columns to QuantileSketch objects to reuse, e.g. from DataProfile.quantile_sketches().
+    With group_by (a column or a list of columns), z-scores, bounds and medians are computed
+    within each group of rows instead, exactly.
+    """
+    require_columns(df, *columns, *_group_columns(group_by))
+    modified_df, replaced = correct_outliers(df, columns, method, z_threshold, replacement, approximate, sketches,
+                                             group_by=group_by)
+    params = {"columns": list(columns), "z_threshold": z_threshold, "approximate": approximate, "method": method,
+              "replacement": replacement}
+    if group_by:
+        params["group_by"] = group_by
+    return modified_df, operation_record("replace_outliers", params, columns=replaced)
+
+def fix_negative_values(df, columns, method='zero'):
+    """
+    Fix negative values by setting them to zero ('zero'), taking their absolute value ('abs')
+    or removing their rows ('remove').
+    """
+    if method not in ('zero', 'abs', 'remove'):
+        raise ValueError("Invalid method. Choose 'zero', 'abs', or 'remove'.")
+    require_columns(df, *columns)
+    modified_df = df.copy(deep=False)
+    fixed = []
+    for col in columns:
+        negative_mask = (modified_df[col] < 0).fillna(False)
+        negative_count = int(negative_mask.sum())
+        
+        if negative_count > 0:
+            if method == 'zero':
+                modified_df.loc[negative_mask, col] = 0
+            elif method == 'abs':
+                modified_df.loc[negative_mask, col] = modified_df.loc[negative_mask, col].abs()
+            else:
+                modified_df = modified_df[~negative_mask]
+            fixed.append({"column": col, "count": negative_count})
+    return modified_df, operation_record(
+        "fix_negative_values", {"columns": list(columns), "method": method}, columns=fixed
+    )
+
+def cap_percentiles(df, columns, lower=5, upper=95, approximate=False, sketches=None, group_by=None):
+    """
+    Clip values to the lower and upper percentiles of each column.
+    With approximate, the percentiles are estimated with quantile sketches instead of
+    sorting each column; sketches maps columns to QuantileSketch objects to reuse.
+    With group_by (a column or a list of columns), each value is clipped to the percentiles
+    of its group, computed exactly for all the columns in one grouped pass.
+    """
+    require_columns(df, *columns, *_group_columns(group_by))
+    modified_df = df.copy(deep=False)
+    sketches = sketches or {}
+    capped = []
+    if group_by:
+        values = df[list(columns)].to_numpy(dtype=np.float64, na_value=np.nan)
+        group_bounds = group_quantiles(values, group_codes(df, group_by), [lower/100, upper/100])
+    for j, col in enumerate(columns):
+        if group_by:
+            lower_bound, upper_bound = group_bounds[0][:, j], group_bounds[1][:, j]
+        else:
+            lower_bound, upper_bound = _quantiles(modified_df[col], [lower/100, upper/100], approximate,
+                                                  sketches.get(col))
+        
+        # Count values outside bounds
+        below_count = int((modified_df[col] < lower_bound).sum())
+        above_count = int((modified_df[col] > upper_bound).sum())
+        
+        if below_count > 0 or above_count > 0:
+            # Cap the values
+            modified_df[col] = modified_df[col].clip(lower=lower_bound, upper=upper_bound)
+            capped.append({"column": col, "below": below_count, "above": above_count})
+    params = {"columns": list(columns), "lower": lower, "upper": upper, "approximate": approximate}
+    if group_by:
+        params["group_by"] = group_by
+    return modified_df, operation_record("cap_percentiles", params, columns=capped)
+
+def detect_anomalies(df, columns, method='isolation_forest', contamination=0.01, sample_size=100_000,
+                     action='flag', flag_column='is_anomaly', score_column=None, n_estimators=100, n_neighbors=20,
+                     seed=0, workers=-1, progress_callback=None):
+    """
+    Find the rows whose combination of values in columns is anomalous with an isolation
+    forest or Local Outlier Factor fitted on sample_size random rows (see utils.anomalies).
+    action 'flag' marks them True in flag_column, 'quarantine' removes them; score_column
+    optionally keeps the anomaly score of every row (lower is more anomalous).
+    The labels of the first anomalous rows are recorded under "anomalies".
+    """
+    if action not in ANOMALY_ACTIONS:
+        raise ValueError(f"Invalid action. Choose one of {', '.join(ANOMALY_ACTIONS)}.")
+    require_columns(df, *columns)
+    scores, anomalous = score_anomalies(df, columns, method, contamination, sample_size, n_estimators, n_neighbors,
+                                        seed=seed, workers=workers, progress_callback=progress_callback)
+    modified_df = df.copy(deep=False)
+    if score_column:
+        modified_df[score_column] = scores
+    if action == 'flag':
+        modified_df[flag_column] = anomalous
+    else:
+        modified_df = modified_df[~anomalous]
+    return modified_df, operation_record(
+        "detect_anomalies",
+        {"columns": list(columns), "method": method, "contamination": contamination, "sample_size": sample_size,
+         "action": action, "flag_column": flag_column, "score_column": score_column, "n_estimators": n_estimators,
+         "n_neighbors": n_neighbors, "seed": seed},
+        anomalies=failure_report(df.index, anomalous)
+    )
+
+def validate_rules(df, rules, action='report', flag_column='rule_violations', limit=100):
+    """
+    Check every row against declarative rules (see utils.rules): a list of rule dicts or
+    the path of a JSON rule file. action 'report' leaves the data as it is, 'flag' adds the
+    number of rules each row violates in flag_column and 'remove' drops the rows that
+    violate any rule. Each rule's violation count and first limit row labels are recorded
+    under "rules".
+    """
+    if action not in RULE_ACTIONS:
+        raise ValueError(f"Invalid action. Choose one of {', '.join(RULE_ACTIONS)}.")
+    checked = load_rules(rules) if isinstance(rules, str) else compile_rules(rules)
+    report, counts = evaluate_rules(df, checked, limit)
+    modified_df = df
+    if action == 'flag':
+        modified_df = df.copy(deep=False)
+        modified_df[flag_column] = counts
+    elif action == 'remove':
+        modified_df = df[counts == 0]
+    return modified_df, operation_record(
+        "validate_rules", {"rules": rules, "action": action, "flag_column": flag_column, "limit": limit},
+        rules=report, rows_violating=int(np.count_nonzero(counts))
+    )
+
+def impossible_value_rules(df):
+    """
+    Rules guessed from column names: numeric columns named like ages must lie in 0-120
+    and the ones named like percentages in 0-100. The rules are named 'age' and 'pct'.
+    """
+    rules = []
+    for col in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        name = str(col).lower()
+        if 'age' in name:
+            rules.append({"name": "age", "type": "range", "column": col, "min": 0, "max": 120})
+        if any(x in name for x in ['percent', 'pct', '%']):
+            rules.append({"name": "pct", "type": "range", "column": col, "min": 0, "max": 100})
+    return rules
+
+def find_impossible_values(df, profile=None):
+    """
+    Check for impossible values in the data based on column names and types, with the rules
+    of impossible_value_rules().
+    When a DataProfile of df is given, its minimum and maximum are used instead of scanning.
+    Returns a list of (kind, column) pairs where kind is 'age' or 'pct'.
+    """
+    rules = impossible_value_rules(df)
+    if profile is not None:
+        return [(rule["name"], rule["column"]) for rule in rules
+                if profile.stat(rule["column"], 'min', rule["min"]) < rule["min"]
+                or profile.stat(rule["column"], 'max', rule["max"]) > rule["max"]]
+    report, _ = evaluate_rules(df, rules, limit=0)
+    return [(rule["name"], rule["column"]) for rule, result in zip(rules, report) if result["count"]]
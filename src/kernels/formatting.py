@@ -0,0 +1,67 @@
+import numpy as np
+from kernels import failure_report, operation_record, require_columns
+from utils.date_parsing import parse_dates
+from utils.number_parsing import parse_numbers
+from utils.phone_numbers import normalize_phone_numbers
+
+def fix_date_format(df, column_name, date_format="%Y-%m-%d", dayfirst=False):
+    """
+    Fix inconsistent date formats in a specified column.
+
+    Returns the fixed DataFrame and a boolean array marking the rows whose value could not
+    be parsed as a date; they become missing.
+    """
+    df = df.copy(deep=False)
+    dates, failed, _ = parse_dates(df[column_name], dayfirst=dayfirst)
+    df[column_name] = dates.dt.strftime(date_format)
+    return df, failed
+
+def fix_phone_numbers(df, column_name, default_region='US', valid_column=None):
+    """
+    Standardize phone numbers to E.164, numbers without a country code being in default_region.
+
+    Numbers that are not valid are left as they are. Returns the fixed DataFrame and a
+    boolean array marking the rows whose value is not a valid number; valid_column, when
+    given, receives the validity of every row.
+    """
+    df = df.copy(deep=False)
+    numbers, valid = normalize_phone_numbers(df[column_name], default_region)
+    df[column_name] = numbers.where(valid, df[column_name].astype(object))
+    if valid_column:
+        df[valid_column] = valid
+    return df, ~valid & df[column_name].notna().to_numpy()
+
+def fix_currency_format(df, column_name, decimal=None):
+    """
+    Standardize currency formats in a specified column.
+
+    Returns the fixed DataFrame and a boolean array marking the rows whose value is not an
+    amount; they become missing.
+    """
+    df = df.copy(deep=False)
+    df[column_name], failed, _ = parse_numbers(df[column_name], decimal)
+    return df, failed
+
+def fix_inconsistent_formats(df, column_name, format_type, dayfirst=False, default_region='US', valid_column=None,
+                             decimal=None):
+    """
+    Apply specific format fixing based on the type.
+
+    The record's details list the rows whose value could not be converted under "failed"
+    (see kernels.failure_report()).
+    """
+    require_columns(df, column_name)
+    failed = np.zeros(len(df), dtype=bool)
+    if format_type == 'date':
+        fixed, failed = fix_date_format(df, column_name, dayfirst=dayfirst)
+    elif format_type == 'phone':
+        fixed, failed = fix_phone_numbers(df, column_name, default_region, valid_column)
+    elif format_type == 'currency':
+        fixed, failed = fix_currency_format(df, column_name, decimal)
+    else:
+        raise ValueError("Unsupported format type. Choose 'date', 'phone' or 'currency'.")
+    return fixed, operation_record(
+        "fix_inconsistent_formats", {"column_name": column_name, "format_type": format_type, "dayfirst": dayfirst,
+                                     "default_region": default_region, "valid_column": valid_column, "decimal": decimal},
+        failed=failure_report(df.index, failed)
+    )
@@ -0,0 +1,32 @@
+import pandas as pd
+from kernels import operation_record
+
+def handle_missing_data(df, strategy='drop', fill_value=None):
+    """Drop rows with missing values ('drop'), fill them with fill_value ('impute') or flag them ('flag')."""
+    params = {"strategy": strategy, "fill_value": fill_value}
+    if strategy == 'drop':
+        cleaned = df.dropna()
+        return cleaned, operation_record("handle_missing_data", params, rows_removed=len(df) - len(cleaned))
+    
+    if strategy == 'impute':
+        cleaned = df.copy(deep=False)
+        missing_columns = cleaned.columns[cleaned.isnull().any()]
+        values_filled = int(cleaned[missing_columns].isnull().sum().sum())
+        for column in missing_columns:
+            series = cleaned[column]
+            # Categorical columns only accept fill values that are one of their categories
+            if isinstance(series.dtype, pd.CategoricalDtype) and fill_value not in series.cat.categories:
+                series = series.cat.add_categories([fill_value])
+            try:
+                cleaned[column] = series.fillna(fill_value)
+            except (TypeError, ValueError):
+                # Nullable integer and boolean columns reject text values
+                cleaned[column] = series.astype(object).fillna(fill_value)
+        return cleaned, operation_record("handle_missing_data", params, values_filled=values_filled)
+    
+    if strategy == 'flag':
+        cleaned = df.copy(deep=False)
+        cleaned['missing_flag'] = cleaned.isnull().any(axis=1)
+        return cleaned, operation_record("handle_missing_data", params, rows_flagged=int(cleaned['missing_flag'].sum()))
+    
+    raise ValueError("Invalid strategy. Choose 'drop', 'impute', or 'flag'.")
@@ -0,0 +1,39 @@
+import pandas as pd
+import re
+from kernels import operation_record
+
+def remove_noisy_data(df, text_columns):
+    """
+    Remove noisy data from specified text columns in the DataFrame.
+    
+    Parameters:
+    df (pd.DataFrame): The DataFrame from which to remove noisy data.
+    text_columns (list): List of column names that contain text data to be cleaned.
+    
+    Returns:
+    pd.DataFrame: A cleaned copy of the DataFrame with noisy data removed.
+    """
+    df = df.copy(deep=False)
+    for column in text_columns:
+        if column in df.columns:
+            # Remove extra spaces
+            df[column] = df[column].str.strip()
+            # Remove irrelevant characters (e.g., special characters)
+            df[column] = df[column].apply(lambda x: re.sub(r'[^a-zA-Z0-9\s]', '', x) if isinstance(x, str) else x)
+            # Remove duplicate spaces
+            df[column] = df[column].str.replace(r'\s+', ' ', regex=True)
+    
+    return df
+
+def handle_noisy_data(df, text_columns):
+    """
+    Handle noisy data in the given text columns.
+    
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing the data to be cleaned.
+    text_columns (list): List of text columns to clean.
+    
+    Returns:
+    tuple: The cleaned DataFrame and the operation record.
+    """
+    return remove_noisy_data(df, text_columns), operation_record("handle_noisy_data", {"text_columns": list(text_columns)})
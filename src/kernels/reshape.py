@@ -0,0 +1,16 @@
+import pandas as pd
+from kernels import operation_record
+
+def pivot_data(df, index, columns, values):
+    """Pivot df so that the values of columns become new columns, keeping index as a column."""
+    pivoted = df.pivot(index=index, columns=columns, values=values).reset_index()
+    return pivoted, operation_record("pivot", {"index": index, "columns": columns, "values": values})
+
+def melt_data(df, id_vars, value_vars=None):
+    """Unpivot df from wide to long format around the identifier variables."""
+    melted = pd.melt(df, id_vars=id_vars, value_vars=value_vars or None)
+    return melted, operation_record("melt", {"id_vars": list(id_vars), "value_vars": list(value_vars or [])})
+
+def transpose_data(df):
+    """Swap the rows and columns of df."""
+    return df.transpose(), operation_record("transpose", {})
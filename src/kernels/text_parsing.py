@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+from kernels import operation_record, require_columns
+from utils.keywords import find_keywords
+
+KEYWORD_OUTPUTS = ('list', 'multi_hot')
+
+def split_full_name(df, full_name_column, first_name_column="First Name", last_name_column="Last Name"):
+    """Split a full name column into first name and last name"""
+    require_columns(df, full_name_column)
+    
+    # Create a shallow copy of the dataframe; copy-on-write copies only the new columns
+    result_df = df.copy(deep=False)
+    
+    # Split the full name into first and last name
+    result_df[[first_name_column, last_name_column]] = df[full_name_column].str.split(' ', n=1, expand=True)
+    
+    return result_df, operation_record("split_full_name", {
+        "full_name_column": full_name_column,
+        "first_name_column": first_name_column,
+        "last_name_column": last_name_column,
+    })
+
+def extract_keywords(df, text_column, keywords, case_sensitive=False, whole_words=True, output='list', workers=1):
+    """
+    Extracts specified keywords from a given text column.
+
+    The keywords are compiled once and every distinct text is scanned once for all of them
+    (see utils.keywords); workers > 1 searches in that many processes (-1: all cores).
+    output 'list' adds a "<text_column>_keywords" column of the keywords found, comma
+    separated in the order of keywords; 'multi_hot' adds a True/False column
+    "<text_column>_<keyword>" per keyword instead.
+    """
+    if output not in KEYWORD_OUTPUTS:
+        raise ValueError(f"Invalid output. Choose one of {', '.join(KEYWORD_OUTPUTS)}.")
+    require_columns(df, text_column)
+    df = df.copy(deep=False)
+
+    found_keywords, codes, found = find_keywords(df[text_column], keywords, case_sensitive, whole_words, workers)
+    if output == 'list':
+        # Joined once per distinct text; missing values have the code -1, which picks the last ''
+        joined = [','.join(str(found_keywords[i]) for i in ids) for ids in found]
+        df[f"{text_column}_keywords"] = np.array(joined + [''], dtype=object)[codes]
+    else:
+        counts = np.fromiter(map(len, found), dtype=np.int64, count=len(found))
+        hits = np.zeros((len(found) + 1, len(found_keywords)), dtype=bool)
+        hits[np.repeat(np.arange(len(found)), counts), np.fromiter(
+            (i for ids in found for i in ids), dtype=np.int64, count=counts.sum())] = True
+        hits = hits[codes]
+        new_columns = pd.DataFrame({f"{text_column}_{keyword}": hits[:, j] for j, keyword in enumerate(found_keywords)},
+                                   index=df.index)
+        df = pd.concat([df.drop(columns=new_columns.columns, errors='ignore'), new_columns], axis=1)
+
+    params = {"text_column": text_column, "keywords": list(keywords)}
+    if case_sensitive or not whole_words or output != 'list':
+        params.update(case_sensitive=case_sensitive, whole_words=whole_words, output=output)
+    rows = int((np.array([bool(ids) for ids in found] + [False])[codes]).sum())
+    return df, operation_record("extract_keywords", params, rows_with_keywords=rows)
+
+def clean_text_column(df, text_column):
+    """Cleans a text column by removing unwanted characters and extra spaces."""
+    require_columns(df, text_column)
+    df = df.copy(deep=False)
+    
+    # Clean the text
+    df[text_column] = df[text_column].astype(str).str.replace(r'[\w\s]', '', regex=True).str.strip()
+    
+    return df, operation_record("clean_text_column", {"text_column": text_column})
+
+def parse_dates(df, date_column, format='%Y-%m-%d'):
+    """Parses a date column into datetime format."""
+    require_columns(df, date_column)
+    df = df.copy(deep=False)
+    
+    # Convert to datetime
+    df[date_column] = pd.to_datetime(df[date_column], format=format, errors='coerce')
+    
+    return df, operation_record("parse_dates", {"date_column": date_column, "format": format})
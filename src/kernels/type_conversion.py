@@ -0,0 +1,49 @@
+import pandas as pd
+from kernels import failure_report, operation_record, require_columns
+from utils.date_parsing import parse_dates
+from utils.number_parsing import parse_numbers
+
+def convert_to_numeric(df, columns, decimal=None):
+    """Parse columns as numbers; return the DataFrame and, per column, a boolean array of the rows that are not numbers."""
+    df = df.copy(deep=False)
+    failures = {}
+    for column in columns:
+        df[column], failures[column], _ = parse_numbers(df[column], decimal)
+    return df, failures
+
+def convert_to_datetime(df, columns, dayfirst=False):
+    """Parse columns as dates; return the DataFrame and, per column, a boolean array of the rows that could not be parsed."""
+    df = df.copy(deep=False)
+    failures = {}
+    for column in columns:
+        df[column], failures[column], _ = parse_dates(df[column], dayfirst=dayfirst)
+    return df, failures
+
+def convert_to_string(df, columns):
+    df = df.copy(deep=False)
+    for column in columns:
+        df[column] = df[column].astype(str)
+    return df
+
+def type_conversion(df, conversions, dayfirst=False, decimal=None):
+    """
+    Convert columns to numbers, dates or strings; conversions maps 'numeric', 'datetime' and 'string' to column lists.
+
+    The record's details map each numeric and date column to the rows that could not be
+    parsed under "failed" (see kernels.failure_report()).
+    """
+    require_columns(df, *[column for columns in conversions.values() for column in columns])
+    failures = {}
+    if 'numeric' in conversions:
+        df, numeric_failures = convert_to_numeric(df, conversions['numeric'], decimal)
+        failures.update(numeric_failures)
+    if 'datetime' in conversions:
+        df, date_failures = convert_to_datetime(df, conversions['datetime'], dayfirst)
+        failures.update(date_failures)
+    if 'string' in conversions:
+        df = convert_to_string(df, conversions['string'])
+    return df, operation_record(
+        "type_conversion", {"conversions": {kind: list(columns) for kind, columns in conversions.items()}, "dayfirst": dayfirst,
+                            "decimal": decimal},
+        failed={column: failure_report(df.index, failed) for column, failed in failures.items()}
+    )
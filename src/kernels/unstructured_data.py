@@ -0,0 +1,28 @@
+import pandas as pd
+from kernels import operation_record
+
+def clean_unstructured_data(df):
+    """
+    Cleans unstructured data by applying various text processing techniques.
+    
+    Parameters:
+    df (DataFrame): The input DataFrame containing unstructured data.
+    
+    Returns:
+    tuple: The cleaned DataFrame and the operation record.
+    """
+    df = df.copy(deep=False)
+    cleaned_columns = []
+    for column in df.columns:
+        if df[column].dtype == 'object' or isinstance(df[column].dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            # Remove leading and trailing whitespace
+            df[column] = df[column].str.strip()
+            # Convert to lowercase
+            df[column] = df[column].str.lower()
+            # Remove special characters
+            df[column] = df[column].str.replace(r'[^a-zA-Z0-9\s]', '', regex=True)
+            # Replace multiple spaces with a single space
+            df[column] = df[column].str.replace(r'\s+', ' ', regex=True)
+            cleaned_columns.append(column)
+    
+    return df, operation_record("clean_unstructured_data", {}, columns=cleaned_columns)
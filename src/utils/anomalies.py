@@ -0,0 +1,105 @@
+"""
+Multivariate anomaly detection: rows whose combination of values is unusual even when each
+value is normal on its own, which per-column rules such as z-scores cannot see.
+
+A scikit-learn IsolationForest or LocalOutlierFactor (in novelty mode) is fitted on a
+random subsample of the rows, which is enough to learn what normal rows look like, and
+every row is then scored in batches on a pool of threads (the tree and neighbour queries
+of scikit-learn release the GIL). Identical rows are scored once. The contamination, the
+expected share of anomalies, sets the score threshold on the subsample.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.row_hashing import row_hashes
+
+try:
+    from sklearn.ensemble import IsolationForest
+    from sklearn.neighbors import LocalOutlierFactor
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+ANOMALY_METHODS = ('isolation_forest', 'lof')
+
+def _model(method, contamination, n_estimators, n_neighbors, seed):
+    if method == 'isolation_forest':
+        return IsolationForest(n_estimators=n_estimators, contamination=contamination, random_state=seed)
+    return LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination, novelty=True)
+
+def _features(df, columns, sample):
+    """The columns as a float32 matrix, missing values filled with the medians of the sample rows, and scaled by them."""
+    values = np.empty((len(df), len(columns)), dtype=np.float32, order='F')
+    for j, col in enumerate(columns):
+        values[:, j] = df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+    with np.errstate(invalid='ignore'):
+        quartiles = np.nanpercentile(values[sample], [25, 50, 75], axis=0)
+    median = np.nan_to_num(quartiles[1])
+    # Robust scaling, so that distances (LOF) weigh every column alike; a zero IQR keeps the scale
+    scale = quartiles[2] - quartiles[0]
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1).astype(np.float32)
+    missing = np.isnan(values)
+    if missing.any():
+        values[missing] = np.broadcast_to(median, values.shape)[missing]
+    values -= median
+    values /= scale
+    return np.ascontiguousarray(values)
+
+def score_anomalies(df, columns, method: str = 'isolation_forest', contamination: float = 0.01,
+                    sample_size: int = 100_000, n_estimators: int = 100, n_neighbors: int = 20,
+                    batch_size: int = 100_000, workers: int = -1, seed: int = 0, progress_callback=None) -> tuple:
+    """
+    Scores every row of df by how anomalous the combination of its values is.
+
+    Args:
+        df (pd.DataFrame): The data.
+        columns (list): Numeric columns the rows are compared on.
+        method (str, optional): 'isolation_forest' or 'lof' (Local Outlier Factor, which
+                                compares the density around a row with that around its
+                                neighbours and is slower to score).
+        contamination (float, optional): Expected share of anomalies, in (0, 0.5].
+        sample_size (int, optional): Number of rows the model is fitted on.
+        n_estimators (int, optional): Number of trees of the isolation forest.
+        n_neighbors (int, optional): Number of neighbours of LOF.
+        batch_size (int, optional): Number of rows scored per batch.
+        workers (int, optional): Number of threads scoring batches; -1 for all cores.
+        seed (int, optional): Seed of the subsample and the forest.
+        progress_callback (callable, optional): Called with the fraction of batches scored.
+
+    Returns:
+        tuple: The scores (higher is more normal, as scikit-learn's score_samples()) and a
+               boolean array marking the anomalous rows.
+    """
+    if not SKLEARN_AVAILABLE:
+        raise ImportError("Anomaly detection needs scikit-learn. Install it with 'pip install scikit-learn'.")
+    if method not in ANOMALY_METHODS:
+        raise ValueError(f"Invalid anomaly method. Choose one of {', '.join(ANOMALY_METHODS)}.")
+    if not 0 < contamination <= 0.5:
+        raise ValueError("The contamination must be between 0 and 0.5.")
+    if not len(columns):
+        raise ValueError("Select at least one column.")
+
+    # Identical rows get identical scores, so each distinct row is scored once
+    codes, _ = pd.factorize(row_hashes(df, columns))
+    # The first row of each distinct row, in the order of the codes
+    first = np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
+    rng = np.random.default_rng(seed)
+    sample = np.sort(rng.choice(len(df), min(sample_size, len(df)), replace=False))
+    values = _features(df, list(columns), sample)
+
+    model = _model(method, contamination, n_estimators, n_neighbors, seed).fit(values[sample])
+    batches = [first[start:start + batch_size] for start in range(0, len(first), batch_size)]
+    workers = os.cpu_count() or 1 if workers in (None, -1) else max(1, workers)
+    scores = np.empty(len(first), dtype=np.float64)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        offset = 0
+        for done, batch_scores in enumerate(pool.map(lambda rows: model.score_samples(values[rows]), batches), 1):
+            scores[offset:offset + len(batch_scores)] = batch_scores
+            offset += len(batch_scores)
+            if progress_callback is not None:
+                progress_callback(done / len(batches))
+    scores = scores[codes]
+    return scores, scores < model.offset_
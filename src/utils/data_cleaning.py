@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
 import re
+from utils.date_parsing import parse_dates
+from utils.number_parsing import parse_numbers
+from utils.row_hashing import first_occurrences, row_hashes
 
 def handle_missing_data(df, strategy='drop', fill_value=None):
     if strategy == 'drop':
@@ -14,14 +17,20 @@ def handle_missing_data(df, strategy='drop', fill_value=None):
         raise ValueError("Invalid strategy. Choose 'drop', 'impute', or 'flag'.")
     return df_cleaned
 
-def remove_duplicates(df, subset=None, keep='first'):
-    return df.drop_duplicates(subset=subset, keep=keep)
+def remove_duplicates(df, subset=None, keep='first', seen=None):
+    if seen is None:
+        return df.drop_duplicates(subset=subset, keep=keep)
+    # Also drop the rows already in the hash set of earlier files (see utils.row_hashing)
+    hashes = row_hashes(df, subset, seen.bits)
+    keep_rows = first_occurrences(hashes, keep) & ~seen.contains(hashes)
+    seen.add(hashes[keep_rows])
+    return df[keep_rows]
 
 def fix_inconsistent_formats(df, column, format_type='date'):
     if format_type == 'date':
-        df[column] = pd.to_datetime(df[column], errors='coerce')
+        df[column] = parse_dates(df[column])[0]
     elif format_type == 'currency':
-        df[column] = df[column].replace({'\\$': '', ',': ''}, regex=True).astype(float)
+        df[column] = parse_numbers(df[column])[0]
     return df
 
 def standardize_categorical_data(df, column):
@@ -0,0 +1,92 @@
+"""
+Server-side querying for the data viewer: search, filters, sorting and paging run in
+pandas and only the rows of the requested page are handed to the browser.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
+
+DEFAULT_PREVIEW_ROWS = 100
+PAGE_SIZES = [25, 50, 100, 500]
+
+def search_mask(df: pd.DataFrame, text: str, columns=None) -> np.ndarray:
+    """
+    Return a boolean mask of the rows where any of the columns contains text, ignoring case.
+
+    Each column is factorized and only its distinct values are searched, so repeated
+    values are matched once.
+    """
+    text = text.lower()
+    mask = np.zeros(len(df), dtype=bool)
+    for name in (columns if columns is not None else df.columns):
+        codes, uniques = pd.factorize(df[name], sort=False)
+        matches = pd.Index(uniques).astype(str).str.lower().str.contains(text, regex=False)
+        if matches.any():
+            mask |= np.isin(codes, np.flatnonzero(matches))
+    return mask
+
+def filter_mask(df: pd.DataFrame, filters: dict) -> np.ndarray:
+    """
+    Return a boolean mask of the rows that pass every filter.
+
+    Args:
+        df (pd.DataFrame): The data to filter.
+        filters (dict): Column name to a filter: {"min": x, "max": y} keeps values in the
+                        range (either bound may be omitted), {"values": [...]} keeps the
+                        listed values.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for name, condition in filters.items():
+        column = df[name]
+        if "values" in condition:
+            mask &= column.isin(condition["values"]).to_numpy(dtype=bool)
+        if condition.get("min") is not None:
+            mask &= (column >= condition["min"]).to_numpy(dtype=bool, na_value=False)
+        if condition.get("max") is not None:
+            mask &= (column <= condition["max"]).to_numpy(dtype=bool, na_value=False)
+    return mask
+
+def _sorted_head(df: pd.DataFrame, column, ascending: bool, rows: int) -> pd.DataFrame:
+    """
+    Return the first rows of df sorted by column, as sort_values(kind='stable') would,
+    selecting them with a partial sort when they lie among the non-missing values.
+    """
+    series = df[column]
+    if (is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype)
+            and df.index.is_unique and rows <= series.count()):
+        select = series.nsmallest if ascending else series.nlargest
+        return df.loc[select(rows, keep='first').index]
+    return df.sort_values(column, ascending=ascending, kind='stable').head(rows)
+
+def query_rows(df: pd.DataFrame, page: int = 0, page_size: int = 50, sort_by=None, ascending: bool = True,
+               search: str = None, search_columns=None, filters: dict = None) -> tuple:
+    """
+    Computes one page of a DataFrame after filtering, searching and sorting it.
+
+    Args:
+        df (pd.DataFrame): The full data. It is not modified.
+        page (int, optional): Zero-based page number; clamped to the last page.
+        page_size (int, optional): Rows per page.
+        sort_by (optional): Column to sort by; missing values sort last.
+        ascending (bool, optional): Sort order.
+        search (str, optional): Keep rows where any searched column contains this text.
+        search_columns (list, optional): Columns to search. Defaults to all columns.
+        filters (dict, optional): Column filters, see filter_mask().
+
+    Returns:
+        tuple: The rows of the page and the number of rows that matched.
+    """
+    if filters or search:
+        mask = np.ones(len(df), dtype=bool)
+        if filters:
+            mask &= filter_mask(df, filters)
+        if search:
+            mask &= search_mask(df, search, search_columns)
+        df = df[mask]
+    matched = len(df)
+    pages = max(1, -(-matched // page_size))
+    page = min(max(page, 0), pages - 1)
+    start, stop = page * page_size, (page + 1) * page_size
+    if sort_by is not None:
+        return _sorted_head(df, sort_by, ascending, stop).iloc[start:stop], matched
+    return df.iloc[start:stop], matched
@@ -0,0 +1,194 @@
+from datetime import datetime
+from itertools import count
+
+import pandas as pd
+
+def enable_copy_on_write():
+    """
+    Turns on pandas copy-on-write so that DataFrames built from shared column buffers
+    copy a column before modifying it instead of writing through to other versions.
+    """
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, pd.errors.OptionError):
+        # Copy-on-write is always enabled from pandas 3.0 on and the option no longer exists
+        pass
+
+def _buffer_address(series: pd.Series):
+    """Return a key identifying the memory a numpy-backed column lives in, or None."""
+    values = series._values
+    interface = getattr(values, '__array_interface__', None)
+    if interface is None:
+        return None
+    return (interface['data'][0], values.shape, values.strides, values.dtype)
+
+def _same_values(new: pd.Series, old: pd.Series) -> bool:
+    """Check if two columns over the same index hold the same data, without scanning when possible."""
+    if new.dtype != old.dtype:
+        return False
+    if new._values is old._values:
+        return True
+    address = _buffer_address(new)
+    if address is not None and address == _buffer_address(old):
+        return True
+    return new.equals(old)
+
+class DatasetStore:
+    """
+    Keeps every version of a dataset produced by the cleaning steps, with undo and redo.
+
+    A version holds one Series per column. Columns that a step did not change are shared
+    with the previous version, so each step only stores the columns it modified and the
+    memory used grows with what changed rather than with the size of the dataset. Every
+    stored column carries a token that stays the same for as long as the column is
+    unchanged, which makes the tokens usable as per-column fingerprints.
+
+    Frames returned by the store share their column buffers with the stored versions, so
+    pandas copy-on-write must be enabled (see enable_copy_on_write()) before they are
+    modified in place.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._tokens = count()
+        self._versions = [{
+            "columns": df.columns,
+            "index": df.index,
+            "arrays": [df.iloc[:, i] for i in range(df.shape[1])],
+            "tokens": [next(self._tokens) for _ in range(df.shape[1])],
+            "changed": list(df.columns),
+            "entries": [],
+        }]
+        self._position = 0
+        # Never hand out df itself, so callers replacing its columns cannot affect the caller's frame
+        self._current = self.materialize(0)
+
+    @property
+    def position(self) -> int:
+        """The number of the current version; 0 is the original data."""
+        return self._position
+
+    @property
+    def latest(self) -> int:
+        """The number of the newest version that can be reached with redo."""
+        return len(self._versions) - 1
+
+    @property
+    def current(self) -> pd.DataFrame:
+        return self._current
+
+    @property
+    def original(self) -> pd.DataFrame:
+        return self.materialize(0)
+
+    @property
+    def can_undo(self) -> bool:
+        return self._position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._position < self.latest
+
+    def materialize(self, position: int) -> pd.DataFrame:
+        """Build the DataFrame of a version from its stored columns without copying them."""
+        version = self._versions[position]
+        if not version["arrays"]:
+            return pd.DataFrame(index=version["index"], columns=version["columns"])
+        frame = pd.DataFrame(dict(enumerate(version["arrays"])), copy=False)
+        frame.columns = version["columns"]
+        return frame
+
+    def column_tokens(self, position: int = None) -> dict:
+        """Return a mapping of column name to the token of its stored data in a version."""
+        version = self._versions[self._position if position is None else position]
+        return dict(zip(version["columns"], version["tokens"]))
+
+    def commit(self, df: pd.DataFrame, entries=None) -> list:
+        """
+        Stores df as a new version after the current one, discarding any versions that
+        could have been reached with redo. A df identical to the current version is not
+        stored unless entries describe a step.
+
+        Args:
+            df (pd.DataFrame): The new state of the dataset.
+            entries (list, optional): History entries (dicts with an "action" key)
+                                      describing the step.
+
+        Returns:
+            list: The names of the columns that were added or changed by the step.
+        """
+        previous = self._versions[self._position]
+        same_rows = df.index.equals(previous["index"])
+        previous_columns = {name: (array, token) for name, array, token
+                            in zip(previous["columns"], previous["arrays"], previous["tokens"])}
+
+        arrays, tokens, changed = [], [], []
+        for i, name in enumerate(df.columns):
+            series = df.iloc[:, i]
+            old = previous_columns.get(name) if same_rows else None
+            if old is not None and _same_values(series, old[0]):
+                arrays.append(old[0])
+                tokens.append(old[1])
+            else:
+                # Changed columns get their own buffer so they do not pin the rest of df's blocks
+                arrays.append(series.copy())
+                tokens.append(next(self._tokens))
+                changed.append(name)
+
+        if same_rows and not changed and not entries and df.columns.equals(previous["columns"]):
+            return changed
+
+        del self._versions[self._position + 1:]
+        self._versions.append({
+            "columns": df.columns,
+            "index": previous["index"] if same_rows else df.index,
+            "arrays": arrays,
+            "tokens": tokens,
+            "changed": changed,
+            "entries": list(entries or []),
+        })
+        self._position += 1
+        self._current = self.materialize(self._position)
+        return changed
+
+    def checkout(self, position: int) -> pd.DataFrame:
+        """Move to any stored version, keeping the versions after it available for redo."""
+        if not 0 <= position <= self.latest:
+            raise IndexError(f"Version {position} does not exist.")
+        self._position = position
+        self._current = self.materialize(position)
+        return self._current
+
+    def undo(self) -> pd.DataFrame:
+        return self.checkout(self._position - 1) if self.can_undo else self._current
+
+    def redo(self) -> pd.DataFrame:
+        return self.checkout(self._position + 1) if self.can_redo else self._current
+
+    def reset(self) -> pd.DataFrame:
+        """Go back to the original data and drop every later version."""
+        del self._versions[1:]
+        return self.checkout(0)
+
+    def history(self, position: int = None) -> list:
+        """Return the history entries of all steps up to a version, each tagged with its step number."""
+        position = self._position if position is None else position
+        return [dict(entry, step=step)
+                for step in range(1, position + 1)
+                for entry in self._versions[step]["entries"]]
+
+    def steps(self) -> list:
+        """Return one summary per stored step: its number, changed columns and entries."""
+        return [{"step": step, "changed": list(version["changed"]), "entries": list(version["entries"])}
+                for step, version in enumerate(self._versions) if step > 0]
+
+    def nbytes(self) -> int:
+        """Return the memory held by all versions, counting shared columns once."""
+        seen = {}
+        for version in self._versions:
+            for array in version["arrays"]:
+                seen.setdefault(id(array), array)
+        return int(sum(array.memory_usage(deep=True, index=False) for array in seen.values()))
+
+def make_history_entry(action: str, **details) -> dict:
+    """Build a cleaning history entry in the format used across the app."""
+    return dict({"action": action, "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}, **details)
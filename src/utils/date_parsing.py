@@ -0,0 +1,142 @@
+"""
+Fast parsing of date columns written in several formats.
+
+pd.to_datetime() without a format guesses one from the first value and turns every value
+in another format into NaT, while format='mixed' hands each value to dateutil one by one.
+Here the formats of a column are inferred from a sample of its distinct values and
+tried one after the other, each as a single vectorized strptime pass, and every distinct
+string is parsed once: the results are broadcast back to the rows through the codes of
+pd.factorize(). Values that no format parses are reported instead of silently dropped.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype
+
+_DATES = [
+    '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%Y%m%d',
+    '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%m-%d-%Y', '%d.%m.%Y', '%m.%d.%Y',
+    '%d/%m/%y', '%m/%d/%y', '%d-%m-%y', '%m-%d-%y', '%d.%m.%y',
+    '%d %b %Y', '%d %B %Y', '%b %d, %Y', '%B %d, %Y', '%b %d %Y', '%B %d %Y', '%d-%b-%Y', '%d-%b-%y',
+]
+_TIMES = ['', ' %H:%M', ' %H:%M:%S', ' %I:%M %p', ' %I:%M:%S %p']
+# ISO 8601 covers the ISO dates with any time part and offset; the rest in order of preference
+DATE_FORMATS = ['ISO8601'] + [date + time for date in _DATES for time in _TIMES]
+
+def _day_first(formats, dayfirst):
+    """Order formats so that day-first formats come before month-first ones when dayfirst is set, and after them otherwise."""
+    def other_order(fmt):
+        if '%d' not in fmt or '%m' not in fmt:
+            return False
+        return (fmt.index('%d') < fmt.index('%m')) != dayfirst
+    # sorted() is stable, so the order is kept otherwise
+    return sorted(formats, key=other_order)
+
+def _to_datetime(strings, fmt, dayfirst=False):
+    """Parse strings with one format; return naive UTC datetimes and whether any value had an offset."""
+    options = {'format': fmt} if fmt != 'mixed' else {'format': 'mixed', 'dayfirst': dayfirst}
+    with warnings.catch_warnings():
+        # Mixed offsets give an object Index (with a FutureWarning); they are handled below
+        warnings.simplefilter('ignore', FutureWarning)
+        parsed = pd.to_datetime(pd.Index(strings, dtype=object), errors='coerce', **options)
+    if not isinstance(parsed, pd.DatetimeIndex):
+        # Values with different UTC offsets; parse them as UTC instead
+        parsed = pd.to_datetime(pd.Index(strings, dtype=object), errors='coerce', utc=True, **options)
+    if parsed.tz is not None:
+        return parsed.tz_convert('UTC').tz_localize(None).as_unit('ns'), True
+    return parsed.as_unit('ns'), False
+
+def infer_date_formats(strings, sample_size: int = 1_000, dayfirst: bool = False, formats=None, seed: int = 0) -> list:
+    """
+    Infers the formats of date strings from a sample of them.
+
+    The format that parses most of the sample is chosen first, then the format that parses
+    most of what is left, and so on, until no format parses any of the remaining strings.
+    Strings such as 03/04/2024 are ambiguous; day-first formats win ties when dayfirst is set.
+
+    Args:
+        strings (list): Distinct, stripped, non-empty strings.
+        sample_size (int, optional): Number of strings the formats are inferred from.
+        dayfirst (bool, optional): Prefer day-first formats for ambiguous dates.
+        formats (list, optional): The candidate formats. Defaults to DATE_FORMATS.
+        seed (int, optional): Seed of the random sample.
+
+    Returns:
+        list: The chosen formats, most common first.
+    """
+    strings = np.asarray(strings, dtype=object)
+    if len(strings) > sample_size:
+        strings = np.random.default_rng(seed).choice(strings, sample_size, replace=False)
+    candidates = _day_first(formats or DATE_FORMATS, dayfirst)
+    chosen = []
+    while len(strings) and candidates:
+        best, best_parsed = None, None
+        for fmt in candidates:
+            parsed = _to_datetime(strings, fmt)[0].notna()
+            if parsed.any() and (best is None or parsed.sum() > best_parsed.sum()):
+                best, best_parsed = fmt, parsed
+        if best is None:
+            break
+        chosen.append(best)
+        candidates.remove(best)
+        strings = strings[~np.asarray(best_parsed)]
+    return chosen
+
+def parse_dates(values, formats=None, dayfirst: bool = False, sample_size: int = 1_000, fallback: bool = True) -> tuple:
+    """
+    Parses a column of dates written in one or several formats.
+
+    Each distinct string is parsed once, by the first of formats that parses it. Formats
+    are inferred from a sample of the distinct strings when not given (see
+    infer_date_formats()). With fallback, the distinct strings no format parsed are then
+    parsed by dateutil one by one. Strings with a UTC offset are converted to UTC; if any
+    has one, the result is in UTC and the strings without one are taken as UTC.
+
+    Args:
+        values (pd.Series): The values. Datetime columns are returned as they are and
+                            numeric columns are converted as pd.to_datetime() does.
+        formats (list, optional): strptime formats (or 'ISO8601') to try in order.
+        dayfirst (bool, optional): Prefer day-first formats for ambiguous dates.
+        sample_size (int, optional): Number of distinct strings formats are inferred from.
+        fallback (bool, optional): Parse the strings no format matched with dateutil.
+
+    Returns:
+        tuple: The dates as a Series aligned with values, a boolean array marking the rows
+               with a value that could not be parsed (missing values and empty strings
+               are not failures), and the formats used.
+    """
+    series = pd.Series(values)
+    if is_datetime64_any_dtype(series.dtype):
+        return series, np.zeros(len(series), dtype=bool), []
+    if is_numeric_dtype(series.dtype):
+        dates = pd.to_datetime(series, errors='coerce')
+        return dates, (dates.isna() & series.notna()).to_numpy(), []
+    if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype)):
+        raise TypeError(f"Cannot parse dates from a column of type {series.dtype}.")
+
+    codes, uniques = pd.factorize(series)
+    strings = pd.Index(uniques, dtype=object).astype(str).str.strip()
+    present = np.asarray(strings != '')
+    parsed = np.full(len(strings), np.datetime64('NaT'), dtype='datetime64[ns]')
+    if formats is None:
+        formats = infer_date_formats(np.asarray(strings[present]), sample_size, dayfirst)
+    aware = False
+    pending = np.flatnonzero(present)
+    for fmt in list(formats) + (['mixed'] if fallback else []):
+        if not len(pending):
+            break
+        dates, with_offset = _to_datetime(strings[pending], fmt, dayfirst)
+        aware |= with_offset and bool(dates.notna().any())
+        done = np.asarray(dates.notna())
+        parsed[pending[done]] = dates[done]
+        pending = pending[~done]
+
+    # Missing values have the code -1, which picks the NaT (and False) appended at the end
+    unparsed = np.append(np.isnat(parsed) & present, False)
+    parsed = np.append(parsed, np.datetime64('NaT', 'ns'))
+    dates = pd.Series(parsed[codes], index=series.index, name=series.name)
+    if aware:
+        dates = dates.dt.tz_localize('UTC')
+    failed = unparsed[codes]
+    return dates, failed, list(formats)
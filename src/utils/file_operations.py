@@ -2,15 +2,42 @@ import pandas as pd
 import os
 import json
 import base64
-from io import StringIO
+from io import BytesIO, StringIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pandas.api.types import infer_dtype, union_categoricals
 
-def read_csv_file(uploaded_file):
+# Pre-check if pyarrow is available for the columnar formats
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# File extensions of the supported columnar formats
+COLUMNAR_EXTENSIONS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'arrow',
+    '.ipc': 'arrow',
+}
+
+def read_csv_file(uploaded_file, chunksize=None, progress_callback=None, parallel=False, **read_options):
     """
     Reads an uploaded CSV file into a pandas DataFrame.
 
     Args:
         uploaded_file: The file object from a Streamlit file uploader.
                        Expected to have a .read() method or be directly readable by pandas.read_csv().
+        chunksize (int, optional): When set, the file is streamed in chunks of this many rows
+                                   with read_csv_chunked() instead of being parsed in one shot.
+        progress_callback (callable, optional): Called with the fraction of the file read so far
+                                                while streaming.
+        parallel (bool, optional): When True, the file is parsed on all cores with
+                                   read_csv_parallel().
+        **read_options: Additional keyword arguments passed to pandas.read_csv().
 
     Returns:
         pd.DataFrame: The DataFrame created from the CSV file.
@@ -19,20 +46,375 @@ def read_csv_file(uploaded_file):
         Exception: If there is an error reading or parsing the CSV file.
     """
     try:
-        return pd.read_csv(uploaded_file)
+        if parallel:
+            return read_csv_parallel(uploaded_file, **read_options)
+        if chunksize:
+            return read_csv_chunked(uploaded_file, chunksize=chunksize, progress_callback=progress_callback, **read_options)
+        return pd.read_csv(uploaded_file, **read_options)
     except Exception as e:
         raise Exception(f"Error reading CSV file: {str(e)}")
 
-def read_csv(file_path):
-    """Read a CSV file and return a DataFrame."""
+def read_csv(file_path, chunksize=None, progress_callback=None, **read_options):
+    """Read a CSV file and return a DataFrame, streaming it in chunks when chunksize is set."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
-    return pd.read_csv(file_path)
+    if chunksize:
+        return read_csv_chunked(file_path, chunksize=chunksize, progress_callback=progress_callback, **read_options)
+    return pd.read_csv(file_path, **read_options)
+
+def infer_csv_dtypes(sample: pd.DataFrame, category_ratio: float = 0.5) -> dict:
+    """
+    Infers the dtypes to request for every chunk of a streamed CSV from a sample of its rows.
+
+    Text columns are pinned so that a chunk that happens to be empty or numeric-looking does
+    not come back as float64 and force the concatenated column to object. Text columns whose
+    share of distinct values in the sample is at most category_ratio are read as categoricals.
+    Numeric columns are left to the parser, since int64 and float64 chunks concatenate without
+    falling back to object.
+
+    Args:
+        sample (pd.DataFrame): The first rows of the file.
+        category_ratio (float, optional): Maximum distinct/non-null ratio for a categorical column.
+
+    Returns:
+        dict: A mapping of column name to dtype suitable for pandas.read_csv(dtype=...).
+    """
+    dtypes = {}
+    for column in sample.columns:
+        series = sample[column]
+        if series.dtype != object:
+            continue
+        non_null = series.notna().sum()
+        if non_null and series.nunique(dropna=True) / non_null <= category_ratio:
+            dtypes[column] = 'category'
+        else:
+            dtypes[column] = 'object'
+    return dtypes
+
+def _concat_column_chunks(chunks):
+    """Concatenate the chunks of one column, merging categoricals without expanding them to object."""
+    if all(isinstance(chunk.dtype, pd.CategoricalDtype) for chunk in chunks):
+        return pd.Series(union_categoricals(chunks, ignore_order=True), name=chunks[0].name)
+    return pd.concat(chunks, ignore_index=True)
+
+def read_csv_chunked(source, chunksize=100_000, sample_rows=10_000, progress_callback=None, **read_options):
+    """
+    Streams a CSV file into a compact DataFrame, chunksize rows at a time.
+
+    Dtypes are inferred once from the first sample_rows rows and requested for every chunk,
+    so low-cardinality text is parsed straight into categoricals. Each chunk is split into
+    per-column pieces as soon as it is parsed and the pieces are concatenated column by
+    column at the end, so peak memory stays close to the size of the final frame.
+
+    Args:
+        source: A path or a binary file-like object positioned at the start of the CSV data.
+        chunksize (int, optional): Number of rows parsed per chunk.
+        sample_rows (int, optional): Number of rows used to infer dtypes.
+        progress_callback (callable, optional): Called after every chunk with the fraction
+                                                (0.0 to 1.0) of the input consumed so far.
+        **read_options: Additional keyword arguments passed to pandas.read_csv().
+
+    Returns:
+        pd.DataFrame: The DataFrame created from the CSV file.
+    """
+    close_handle = isinstance(source, (str, os.PathLike))
+    handle = open(source, 'rb') if close_handle else source
+    try:
+        start = handle.tell()
+        handle.seek(0, os.SEEK_END)
+        total_bytes = max(handle.tell() - start, 1)
+        handle.seek(start)
+
+        sample = pd.read_csv(handle, nrows=sample_rows, **read_options)
+        handle.seek(start)
+        dtypes = infer_csv_dtypes(sample)
+        dtypes.update(read_options.pop('dtype', None) or {})
+
+        column_chunks = {column: [] for column in sample.columns}
+        for chunk in pd.read_csv(handle, chunksize=chunksize, dtype=dtypes, **read_options):
+            for column in chunk.columns:
+                # Copy the column out so the chunk's 2-D blocks can be released right away
+                column_chunks.setdefault(column, []).append(chunk[column].copy())
+            del chunk
+            if progress_callback is not None:
+                progress_callback(min((handle.tell() - start) / total_bytes, 1.0))
+
+        columns = {}
+        for column in list(column_chunks):
+            chunks = column_chunks.pop(column)
+            columns[column] = _concat_column_chunks(chunks) if chunks else sample[column].iloc[:0]
+        if progress_callback is not None:
+            progress_callback(1.0)
+        return pd.DataFrame(columns)
+    finally:
+        if close_handle:
+            handle.close()
+
+# Options that change which lines hold the header or the records; files read with them
+# are not split into byte ranges
+_UNSPLITTABLE_OPTIONS = {'header', 'names', 'skiprows', 'skipfooter', 'nrows', 'chunksize', 'iterator', 'lineterminator', 'index_col'}
+# Inputs smaller than this are parsed in one piece
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+def split_csv_ranges(content: bytes, parts: int, quotechar: bytes = b'"'):
+    """
+    Splits the records of a CSV buffer into about equally sized byte ranges.
+
+    Every range ends right after a newline that lies outside quoted fields: a newline is a
+    record boundary exactly when the number of quote characters before it is even, which
+    also holds for quotes escaped by doubling them.
+
+    Args:
+        content (bytes): The CSV data, including the header line.
+        parts (int): The number of ranges to aim for.
+        quotechar (bytes, optional): The quote character of the file.
+
+    Returns:
+        tuple: The header line as bytes and a list of (start, end) offsets of the record ranges.
+    """
+    def next_record_end(position, quotes_before):
+        # Returns the offset after the first unquoted newline at or after position
+        while True:
+            newline = content.find(b'\n', position)
+            if newline == -1:
+                return len(content), quotes_before
+            quotes_before += content.count(quotechar, position, newline)
+            if quotes_before % 2 == 0:
+                return newline + 1, quotes_before
+            position = newline + 1
+
+    header_end, quotes = next_record_end(0, 0)
+    ranges = []
+    start = header_end
+    step = max((len(content) - header_end) // max(parts, 1), 1)
+    while start < len(content):
+        target = min(start + step, len(content))
+        quotes += content.count(quotechar, start, target)
+        # The target may fall inside a quoted field, which next_record_end() accounts for
+        end, quotes = next_record_end(target, quotes) if target < len(content) else (len(content), quotes)
+        ranges.append((start, end))
+        start = end
+    return content[:header_end], ranges
+
+def _parse_csv_range(header: bytes, records: bytes, read_options: dict) -> pd.DataFrame:
+    """Parse one byte range of records under the file's header line."""
+    return pd.read_csv(BytesIO(header + records), **read_options)
+
+def _reparse_columns(df: pd.DataFrame, content: bytes, positions: list, read_options: dict) -> pd.DataFrame:
+    """Replace the columns of df at positions by the same columns parsed from the whole file in one piece."""
+    options = dict(read_options)
+    # Without usecols the columns of df are those of the file, in order
+    options['usecols'] = [df.columns[position] for position in positions] if 'usecols' in read_options else positions
+    reparsed = pd.read_csv(BytesIO(content), **options)
+    df = df.copy(deep=False)
+    for position, column in zip(positions, reparsed.columns):
+        df.isetitem(position, reparsed[column])
+    return df
+
+def read_csv_parallel(source, workers=None, use_processes=True, **read_options):
+    """
+    Parses a CSV file on several cores and returns the same DataFrame as pandas.read_csv().
+
+    The records are split into one byte range per worker at quote-safe newlines, every
+    range is parsed by the pandas C engine under the original header line, and the parts
+    are concatenated in file order. Every range infers its own dtypes, so a column may come
+    out as int64 in one part and as text in another ('007' early in the file and 'A7' later
+    on). Columns whose parts were inferred as int64 and float64 are combined into float64,
+    as pandas would infer them; columns with any other disagreement are parsed again from
+    the whole file, so that they are inferred once over all their values. Small inputs and
+    options that change how lines map to records fall back to a single pandas.read_csv()
+    call.
+
+    Args:
+        source: A path, raw bytes or a binary file-like object with the CSV data.
+        workers (int, optional): Number of workers. Defaults to the number of CPUs.
+        use_processes (bool, optional): Parse in a process pool (True) or a thread pool (False).
+        **read_options: Additional keyword arguments passed to pandas.read_csv().
+
+    Returns:
+        pd.DataFrame: The DataFrame created from the CSV file.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            content = f.read()
+    elif isinstance(source, (bytes, bytearray)):
+        content = bytes(source)
+    else:
+        content = source.read()
+        if isinstance(content, str):
+            content = content.encode(read_options.get('encoding') or 'utf-8')
+
+    workers = workers or os.cpu_count() or 1
+    encoding = (read_options.get('encoding') or 'utf-8').lower().replace('_', '-')
+    if (workers < 2 or len(content) < PARALLEL_MIN_BYTES or _UNSPLITTABLE_OPTIONS & set(read_options)
+            or encoding.startswith(('utf-16', 'utf-32'))):
+        return pd.read_csv(BytesIO(content), **read_options)
+
+    quotechar = read_options.get('quotechar', '"').encode()
+    header, ranges = split_csv_ranges(content, workers, quotechar)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=min(workers, len(ranges))) as executor:
+        futures = [executor.submit(_parse_csv_range, header, content[start:end], read_options) for start, end in ranges]
+        parts = [future.result() for future in futures]
+    # Ranges without records would turn every column they hold into object when concatenated
+    parts = [part for part in parts if len(part)] or parts[:1]
+    df = pd.concat(parts, ignore_index=True)
+    # The dtypes each column was inferred as by the parts
+    inferred = [{str(part.dtypes.iloc[position]) for part in parts} for position in range(df.shape[1])]
+    mixed = [position for position, dtypes in enumerate(inferred) if len(dtypes) > 1 and not dtypes <= {'int64', 'float64'}]
+    return _reparse_columns(df, content, mixed, read_options) if mixed else df
 
 def write_csv(dataframe, file_path):
     """Write a DataFrame to a CSV file."""
     dataframe.to_csv(file_path, index=False)
 
+def columnar_format(file_name):
+    """Return 'parquet', 'feather' or 'arrow' for a columnar file name, or None for anything else."""
+    return COLUMNAR_EXTENSIONS.get(os.path.splitext(str(file_name))[1].lower())
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Reading and writing Parquet, Feather and Arrow files requires 'pyarrow'. Install it with 'pip install pyarrow'.")
+
+def _rewind(source):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+def read_columnar_schema(source, file_format):
+    """
+    Reads only the schema of a Parquet, Feather or Arrow IPC file.
+
+    Args:
+        source: A path or a binary file-like object.
+        file_format (str): 'parquet', 'feather' or 'arrow'.
+
+    Returns:
+        dict: The column names under "columns", their Arrow types under "types" and, for
+              Parquet, the number of row groups and rows under "row_groups" and "rows".
+    """
+    _require_pyarrow()
+    if file_format == 'parquet':
+        parquet_file = pq.ParquetFile(_rewind(source))
+        schema = parquet_file.schema_arrow
+        info = {"row_groups": parquet_file.metadata.num_row_groups, "rows": parquet_file.metadata.num_rows}
+    else:
+        schema = pa.ipc.open_file(_rewind(source)).schema
+        info = {}
+    _rewind(source)
+    info.update({"columns": schema.names, "types": {field.name: str(field.type) for field in schema}})
+    return info
+
+def read_columnar_file(source, file_format, columns=None, filters=None, row_groups=None):
+    """
+    Reads a Parquet, Feather or Arrow IPC file into a pandas DataFrame.
+
+    Only the requested columns are read from disk. For Parquet, filters are pushed down so
+    row groups whose statistics cannot match are skipped without being decoded, and
+    row_groups restricts the read to the given row group indices.
+
+    Args:
+        source: A path or a binary file-like object.
+        file_format (str): 'parquet', 'feather' or 'arrow'.
+        columns (list, optional): Columns to load. Defaults to all columns.
+        filters (list, optional): Row filters in pyarrow's DNF form, for example
+                                  [('country', '==', 'Greece'), ('amount', '>', 100)].
+        row_groups (list, optional): Parquet row group indices to read.
+
+    Returns:
+        pd.DataFrame: The DataFrame created from the file.
+    """
+    _require_pyarrow()
+    source = _rewind(source)
+    columns = list(columns) if columns else None
+    # Tables filtered after reading need the filtered columns too, even when they are not selected
+    read_columns = columns + [col for col in _filter_columns(filters) if col not in columns] if columns and filters else columns
+    if file_format == 'parquet':
+        if row_groups is None:
+            return pq.read_table(source, columns=columns, filters=filters or None).to_pandas()
+        table = pq.ParquetFile(source).read_row_groups(row_groups, columns=read_columns)
+    elif file_format in ('feather', 'arrow'):
+        # Feather v2 is the Arrow IPC file format; paths are memory mapped and only the
+        # selected columns are materialized
+        table = feather.read_table(source, columns=read_columns, memory_map=isinstance(source, (str, os.PathLike)))
+    else:
+        raise ValueError(f"Unsupported columnar format: {file_format}")
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    if read_columns != columns:
+        table = table.select(columns)
+    return table.to_pandas()
+
+def _filter_columns(filters) -> list:
+    """The columns filters in pyarrow's DNF form (a list of conditions, or a list of such lists) test."""
+    conditions = [condition for group in filters for condition in (group if isinstance(group, list) else [group])]
+    return list(dict.fromkeys(condition[0] for condition in conditions))
+
+def read_data_file(source, file_name=None, **read_options):
+    """
+    Reads a CSV, Parquet, Feather or Arrow IPC file, choosing the reader from the file extension.
+
+    Args:
+        source: A path or a file-like object.
+        file_name (str, optional): The name used to detect the format when source is not a path.
+        **read_options: Keyword arguments for read_columnar_file() or read_csv_file().
+
+    Returns:
+        pd.DataFrame: The DataFrame created from the file.
+    """
+    file_format = columnar_format(file_name or source)
+    if file_format:
+        return read_columnar_file(source, file_format, **read_options)
+    return read_csv_file(source, **read_options)
+
+def _to_arrow_table(df: pd.DataFrame):
+    """Convert a DataFrame to an Arrow table, storing mixed-type text columns as strings."""
+    df = df.rename(columns=str)
+    mixed = [column for column in df.columns if df[column].dtype == object and infer_dtype(df[column], skipna=True).startswith('mixed')]
+    if mixed:
+        df = df.astype({column: str for column in mixed})
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def write_parquet(dataframe, file_path, compression='zstd', row_group_size=None):
+    """Write a DataFrame to a compressed Parquet file."""
+    _require_pyarrow()
+    pq.write_table(_to_arrow_table(dataframe), file_path, compression=compression, row_group_size=row_group_size)
+
+def write_feather(dataframe, file_path, compression='lz4'):
+    """Write a DataFrame to a Feather (Arrow IPC file format) file."""
+    write_arrow_ipc(dataframe, file_path, compression=compression)
+
+def write_arrow_ipc(dataframe, file_path, compression=None):
+    """Write a DataFrame to an Arrow IPC file, optionally compressed with 'lz4' or 'zstd'."""
+    _require_pyarrow()
+    table = _to_arrow_table(dataframe)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(str(file_path), 'wb') as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+def write_data_file(dataframe, file_path):
+    """Write a DataFrame to CSV, Parquet, Feather or Arrow IPC, choosing the writer from the file extension."""
+    file_format = columnar_format(file_path)
+    if file_format == 'parquet':
+        write_parquet(dataframe, file_path)
+    elif file_format == 'feather':
+        write_feather(dataframe, file_path)
+    elif file_format == 'arrow':
+        write_arrow_ipc(dataframe, file_path)
+    else:
+        write_csv(dataframe, file_path)
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Return a DataFrame as UTF-8 encoded CSV, without the index."""
+    return df.to_csv(index=False).encode()
+
+def to_parquet_bytes(df: pd.DataFrame, compression='zstd') -> bytes:
+    """Return a DataFrame as the bytes of a compressed Parquet file."""
+    _require_pyarrow()
+    buffer = pa.BufferOutputStream()
+    pq.write_table(_to_arrow_table(df), buffer, compression=compression)
+    return buffer.getvalue().to_pybytes()
+
 def generate_csv_download_link(df: pd.DataFrame, filename: str = "cleaned_data.csv", button_text: str = "Download CSV File") -> str:
     """
     Generates an HTML download link for a pandas DataFrame to be saved as a CSV file.
@@ -47,11 +429,28 @@ def generate_csv_download_link(df: pd.DataFrame, filename: str = "cleaned_data.c
     Returns:
         str: An HTML string representing the download link.
     """
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
+    b64 = base64.b64encode(to_csv_bytes(df)).decode()
     href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{button_text}</a>'
     return href
 
+def generate_parquet_download_link(df: pd.DataFrame, filename: str = "cleaned_data.parquet", button_text: str = "Download Parquet File") -> str:
+    """
+    Generates an HTML download link for a pandas DataFrame saved as a zstd-compressed Parquet file.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to be downloaded.
+        filename (str, optional): The desired name for the downloaded file.
+                                  Defaults to "cleaned_data.parquet".
+        button_text (str, optional): The text to display on the download button/link.
+                                     Defaults to "Download Parquet File".
+
+    Returns:
+        str: An HTML string representing the download link.
+    """
+    b64 = base64.b64encode(to_parquet_bytes(df)).decode()
+    href = f'<a href="data:application/vnd.apache.parquet;base64,{b64}" download="{filename}">{button_text}</a>'
+    return href
+
 def save_cleaning_report(report, file_path):
     """Save the cleaning report as a JSON file."""
     with open(file_path, 'w') as f:
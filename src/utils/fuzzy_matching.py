@@ -0,0 +1,213 @@
+"""
+Fuzzy matching of many strings without comparing every pair.
+
+Candidate pairs are generated by blocking: strings are indexed by their character
+n-grams and only strings that share an n-gram are compared. The candidate pairs are
+then scored in batches with rapidfuzz, which runs the comparisons in C++ on all cores.
+"""
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Characters removed by thefuzz's force_ascii processing (it only drops the Latin-1 range)
+_LATIN1 = {i: None for i in range(128, 256)}
+
+def process_strings(strings) -> tuple:
+    """
+    Normalizes strings the way thefuzz.process.extract() does with its default processor.
+
+    extract() processes the query once without and once with force_ascii, and each choice
+    once with force_ascii, so a string can end up slightly different as query and as choice.
+
+    Returns:
+        tuple: The query forms and the choice forms of the strings, as lists.
+    """
+    queries = [default_process(default_process(s).translate(_LATIN1)) for s in strings]
+    choices = [default_process(s.translate(_LATIN1)) for s in strings]
+    return queries, choices
+
+def ngram_index(strings, n: int = 3) -> tuple:
+    """
+    Builds an inverted index of the character n-grams of every word of the strings.
+    Words are padded with a space on each side so that short words have n-grams too.
+
+    Returns:
+        tuple: Two aligned arrays of n-gram ids and string positions, sorted by n-gram,
+               with each (n-gram, string) pair listed once.
+    """
+    grams, owners = {}, []
+    for position, text in enumerate(strings):
+        for word in text.split():
+            padded = f" {word} "
+            for start in range(max(1, len(padded) - n + 1)):
+                owners.append((grams.setdefault(padded[start:start + n], len(grams)), position))
+    if not owners:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    codes = np.unique(np.array(owners, dtype=np.int64) @ np.array([len(strings), 1], dtype=np.int64))
+    return codes // len(strings), codes % len(strings)
+
+def iter_block_pairs(block_ids: np.ndarray, members: np.ndarray, max_block: int = 1_000,
+                     max_pairs: int = 20_000_000, chunk_pairs: int = 5_000_000):
+    """
+    Pairs up the members of every block, a chunk of blocks at a time.
+
+    Args:
+        block_ids (np.ndarray): Block of every member, sorted.
+        members (np.ndarray): The members, aligned with block_ids.
+        max_block (int, optional): Blocks with more members are skipped.
+        max_pairs (int, optional): Bound on the number of pairs. When the blocks would
+                                   produce more, the largest blocks are skipped as well.
+        chunk_pairs (int, optional): About how many pairs each chunk holds.
+
+    Yields:
+        tuple: Two aligned arrays with one (member, member) pair per pair of positions
+               within a block.
+    """
+    if len(block_ids) == 0:
+        return
+    starts = np.flatnonzero(np.r_[True, block_ids[1:] != block_ids[:-1]])
+    sizes = np.diff(np.r_[starts, len(block_ids)])
+    keep = (sizes > 1) & (sizes <= max_block)
+    pairs_by_size = np.bincount(sizes[keep], weights=sizes[keep] * (sizes[keep] - 1) / 2)
+    if pairs_by_size.sum() > max_pairs:
+        # Larger blocks separate less, so they are the first to go
+        largest = np.flatnonzero(np.cumsum(pairs_by_size) <= max_pairs)
+        keep &= sizes <= (largest[-1] if len(largest) else 1)
+    starts, sizes = starts[keep], sizes[keep]
+    chunks = np.cumsum(sizes * (sizes - 1) // 2) // chunk_pairs
+    for chunk in np.unique(chunks):
+        chunk_starts, chunk_sizes = starts[chunks == chunk], sizes[chunks == chunk]
+        offsets = np.arange(chunk_sizes.sum()) - np.repeat(np.cumsum(chunk_sizes) - chunk_sizes, chunk_sizes)
+        positions = np.repeat(chunk_starts, chunk_sizes) + offsets
+        # Pair every member of a block with each member after it: the member at offset k of
+        # a block of s members starts s - 1 - k pairs
+        counts = np.repeat(chunk_sizes, chunk_sizes) - 1 - offsets
+        left = np.repeat(positions, counts)
+        right = left + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        yield members[left], members[right]
+
+def candidate_pairs(strings, n: int = 3, max_block: int = 1_000, min_overlap: float = 0.0,
+                    max_pairs: int = 20_000_000) -> np.ndarray:
+    """
+    Returns the pairs of strings that share character n-grams.
+
+    N-grams shared by more than max_block strings (such as the n-grams of 'inc' or
+    'ltd' in company names) are too common to separate anything and are skipped, which
+    keeps the number of pairs close to linear in the number of strings. The next most
+    common n-grams are skipped too while the blocks would produce more than max_pairs.
+
+    Args:
+        strings (list): The strings to pair.
+        n (int, optional): Length of the n-grams.
+        max_block (int, optional): Largest number of strings an n-gram may be shared by.
+        min_overlap (float, optional): Keep only pairs sharing at least this fraction of
+                                       the n-grams of the string with fewer n-grams.
+        max_pairs (int, optional): Bound on the pairs generated before deduplication.
+
+    Returns:
+        np.ndarray: One row (i, j) with i < j per candidate pair.
+    """
+    size = len(strings)
+    gram_ids, owners = ngram_index(strings, n)
+    # Count the n-grams each pair shares chunk by chunk, so only distinct pairs are held
+    codes, shared = [], []
+    for i, j in iter_block_pairs(gram_ids, owners, max_block, max_pairs):
+        chunk_codes, chunk_shared = np.unique(np.minimum(i, j) * size + np.maximum(i, j), return_counts=True)
+        codes.append(chunk_codes)
+        shared.append(chunk_shared)
+    if not codes:
+        return np.empty((0, 2), dtype=np.int64)
+    if len(codes) == 1:
+        codes, shared = codes[0], shared[0]
+    else:
+        codes, inverse = np.unique(np.concatenate(codes), return_inverse=True)
+        shared = np.bincount(inverse.reshape(-1), weights=np.concatenate(shared))
+    pairs = np.column_stack([codes // size, codes % size])
+    if min_overlap > 0:
+        grams_per_string = np.bincount(owners, minlength=size)
+        smaller = np.minimum(grams_per_string[pairs[:, 0]], grams_per_string[pairs[:, 1]])
+        pairs = pairs[shared >= min_overlap * smaller]
+    return pairs
+
+def score_pairs(left, right, scorer=None, score_cutoff: float = 0, workers: int = -1,
+                batch_size: int = 1_000_000) -> np.ndarray:
+    """
+    Scores left[k] against right[k] for every k with rapidfuzz, batch by batch.
+
+    Args:
+        left, right (list or np.ndarray): Aligned sequences of strings.
+        scorer (callable, optional): A rapidfuzz scorer. Defaults to fuzz.WRatio.
+        score_cutoff (float, optional): Scores below it are returned as 0.
+        workers (int, optional): Threads used by rapidfuzz; -1 uses all cores.
+        batch_size (int, optional): Pairs scored per call, bounding the memory used.
+
+    Returns:
+        np.ndarray: The scores, from 0 to 100.
+    """
+    scorer = scorer or fuzz.WRatio
+    scores = np.empty(len(left), dtype=np.float64)
+    for start in range(0, len(left), batch_size):
+        stop = start + batch_size
+        scores[start:stop] = process.cpdist(left[start:stop], right[start:stop], scorer=scorer,
+                                            score_cutoff=score_cutoff, workers=workers)
+    return scores
+
+def min_overlap_for(threshold: float) -> float:
+    """
+    Return the share of n-grams that two strings scoring at least threshold with WRatio
+    have in common, at least. Scores of 88 and more need a close edit match or one string
+    contained in the other, which keeps most n-grams of the shorter string; lower scores
+    are reached by any pair sharing a word. Measured against exhaustive WRatio comparisons.
+    """
+    return 0.2 if threshold >= 88 else 0.0
+
+def similar_strings(strings, threshold: float = 90, workers: int = -1, max_block: int = 1_000) -> set:
+    """
+    Finds the strings that have another string at least threshold similar, with the
+    semantics of thefuzz: process.extract(s, strings, limit=None) for every s, keeping
+    the matches other than s whose WRatio score, rounded, is at least threshold.
+
+    Only pairs found by candidate_pairs() are scored. Pairs sharing no n-gram hardly ever
+    reach the usual thresholds of 88 and more; at low thresholds most strings have many
+    similar strings, and a few of their matches can be missed.
+
+    Args:
+        strings (list): Distinct strings.
+        threshold (float, optional): Minimum WRatio score, from 0 to 100.
+        workers (int, optional): Threads used for scoring; -1 uses all cores.
+        max_block (int, optional): Largest n-gram block that is compared, see candidate_pairs().
+
+    Returns:
+        set: The strings that have a similar string.
+    """
+    strings = np.asarray(list(strings), dtype=object)
+    if len(strings) < 2:
+        return set()
+    if threshold <= 0:
+        # Every pair scores at least 0, so every string matches another one
+        return set(strings)
+    queries, choices = (np.asarray(forms, dtype=object) for forms in process_strings(strings))
+    pairs = candidate_pairs(choices, max_block=max_block, min_overlap=min_overlap_for(threshold))
+    if len(pairs) == 0:
+        return set()
+
+    # A rounded score reaches threshold from threshold - 0.5 on (round half to even)
+    cutoff = threshold - 0.5
+    left, right = pairs[:, 0], pairs[:, 1]
+    similar = set()
+    directions = [(left, right)]
+    if not np.array_equal(queries, choices):
+        directions.append((right, left))
+    for query, choice in directions:
+        scores = score_pairs(queries[query], choices[choice], score_cutoff=cutoff, workers=workers)
+        matched = np.round(scores) >= threshold
+        similar.update(strings[choice[matched]])
+        if len(directions) == 1:
+            # WRatio is symmetric, so the query of a matching pair is matched too
+            similar.update(strings[query[matched]])
+    return similar
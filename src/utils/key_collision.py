@@ -0,0 +1,179 @@
+"""
+Key-collision clustering of near-duplicate values, as in OpenRefine.
+
+Each distinct value gets a key that stays the same under the differences that do not
+change what the value means, and values that share a key form a cluster:
+
+- fingerprint: the set of words of the value after case, accents and punctuation are
+  folded, so "Acme Inc.", "ACME, Inc" and "inc acme" share the key "acme inc";
+- ngram: the set of character n-grams of the folded value without whitespace, which also
+  catches words run together or split apart ("Data Corp" and "DataCorp");
+- phonetic: the set of Soundex codes of the fingerprint words, which catches spellings
+  that sound alike ("Smith Jonson" and "Smyth Johnson").
+
+Keys are computed once per distinct value, as 64-bit hashes of these sets built with
+vectorized operations over all the words or n-grams at once, and values are grouped by
+their hash, so clustering takes linear time in the number of distinct values, with no
+pairwise comparisons. readable_keys() spells keys out for display.
+"""
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _STRING_DTYPE = pd.ArrowDtype(pa.string())
+except ImportError:
+    _STRING_DTYPE = 'string[python]'
+
+KEY_METHODS = ('fingerprint', 'ngram', 'phonetic')
+
+# Soundex digits of the consonants; vowels, h, w and y have none
+_SOUNDEX = {'[bfpv]': '1', '[cgjkqsxz]': '2', '[dt]': '3', 'l': '4', '[mn]': '5', 'r': '6'}
+
+def _fold(strings) -> pd.Series:
+    """Lower-case strings, drop their accents and replace runs of punctuation and whitespace by single spaces."""
+    strings = pd.Series(strings, dtype=object).astype(_STRING_DTYPE).str.lower()
+    if strings.empty:
+        return strings
+    # NFKD splits accented letters into the letter and its combining mark, which is then dropped.
+    # Series.str.normalize() runs in Python one value at a time, pyarrow's kernel does not
+    if isinstance(strings.dtype, pd.ArrowDtype):
+        strings = pd.Series(pd.arrays.ArrowExtensionArray(pc.utf8_normalize(pa.array(strings.array), 'NFKD')))
+    else:
+        strings = strings.str.normalize('NFKD')
+    strings = strings.str.replace(r'\p{Mn}', '', regex=True)
+    return strings.str.replace(r'(?:[^\w\s]|_|\s)+', ' ', regex=True).str.strip()
+
+def _soundex(words) -> np.ndarray:
+    """American Soundex codes of lower-case words, e.g. 'robert' -> 'r163', as string operations over all of them."""
+    words = pd.Series(words, dtype=object).astype(_STRING_DTYPE)
+    if words.empty:
+        return np.array([], dtype=object)
+    # H and w do not separate repeated digits, so they are dropped after the first letter;
+    # vowels and anything else do, and become dots
+    digits = (words.str[:1] + words.str[1:].str.replace('[hw]', '', regex=True)).str.replace(
+        '[^bcdfgjklmnpqrstvxz]', '.', regex=True)
+    for consonants, digit in _SOUNDEX.items():
+        digits = digits.str.replace(consonants, digit, regex=True)
+    # RE2 has no backreferences, so each digit's runs are collapsed in turn
+    for digit in set(_SOUNDEX.values()):
+        digits = digits.str.replace(digit + '+', digit, regex=True)
+    # The first letter stands for itself, so its digit is dropped
+    codes = words.str[:1] + (digits.str[1:].str.replace('.', '', regex=False) + '000').str[:3]
+    return codes.to_numpy(dtype=object)
+
+def _words(folded: pd.Series) -> tuple:
+    """Split folded strings into words; return the position of the string of every word, and the words."""
+    lists = folded.str.split(' ')
+    if isinstance(lists.dtype, pd.ArrowDtype):
+        lengths = lists.list.len().fillna(0).to_numpy(dtype=np.int64)
+        owner, words = np.repeat(np.arange(len(lists)), lengths), lists.list.flatten().to_numpy(dtype=object)
+    else:
+        exploded = lists.reset_index(drop=True).explode().dropna()
+        owner, words = exploded.index.to_numpy(dtype=np.int64), exploded.to_numpy(dtype=object)
+    # Strings of only punctuation and whitespace fold to '', which has no words
+    keep = words != ''
+    return owner[keep], words[keep]
+
+def _ngrams(folded: pd.Series, n: int) -> tuple:
+    """Character n-grams of folded strings without whitespace, as 64-bit codes; strings shorter than n are one n-gram."""
+    letters = folded.str.replace(r'\s+', '', regex=True).fillna('').to_numpy(dtype=object)
+    lengths = np.fromiter(map(len, letters), dtype=np.int64, count=len(letters))
+    codepoints = np.frombuffer(''.join(letters).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(letters)), lengths)
+    # Pad with n - 1 zeros so that every position starts a full window
+    padded = np.concatenate([codepoints, np.zeros(n - 1, dtype=np.uint64)])
+    codes = np.zeros(len(codepoints), dtype=np.uint64)
+    for offset in range(n):
+        # Characters past the end of their string count as zeros
+        inside = np.arange(offset, len(codepoints) + offset) < ends[owner] if offset else True
+        codes = codes * np.uint64(1_000_003) + np.where(inside, padded[offset:offset + len(codepoints)], 0)
+    # A window starts at every position that leaves n characters, and at the first one of shorter strings
+    position = np.arange(len(codepoints)) - (ends - lengths)[owner]
+    starts = (position <= (lengths - n)[owner]) | (position == 0)
+    return owner[starts], codes[starts]
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer, spreading the bits of 64-bit integers."""
+    values = values.astype(np.uint64)
+    with np.errstate(over='ignore'):
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+def _set_hashes(owner: np.ndarray, items, size: int) -> np.ndarray:
+    """Order-independent 64-bit hash of the set of items of each of size strings; 0 for strings without items."""
+    hashes = pd.util.hash_array(np.asarray(items), categorize=False)
+    # Each distinct (string, item) pair counts once; the pairs are told apart by one hash
+    first = ~pd.Series(hashes ^ _mix(owner)).duplicated().to_numpy()
+    keys = np.zeros(size, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        np.add.at(keys, owner[first], hashes[first])
+    # Strings with items never get the key 0
+    keys[owner] |= np.uint64(1)
+    return keys
+
+def collision_keys(strings, method: str = 'fingerprint', n: int = 2) -> np.ndarray:
+    """
+    Computes the keys of strings as 64-bit hashes.
+
+    Args:
+        strings (list): Distinct strings.
+        method (str, optional): The key, one of KEY_METHODS.
+        n (int, optional): The n-gram size of the 'ngram' method.
+
+    Returns:
+        np.ndarray: One uint64 key per string; 0 for strings without words.
+    """
+    if method not in KEY_METHODS:
+        raise ValueError(f"Invalid key method. Choose one of {', '.join(KEY_METHODS)}.")
+    if n < 1:
+        raise ValueError("The n-gram size must be at least 1.")
+    folded = _fold(strings)
+    if method == 'ngram':
+        owner, items = _ngrams(folded, n)
+        return _set_hashes(owner, items, len(folded))
+    owner, words = _words(folded)
+    if method == 'phonetic':
+        # Words repeat across values, so each distinct word is coded once
+        word_ids, distinct = pd.factorize(words)
+        words = _soundex(distinct)[word_ids]
+    return _set_hashes(owner, words, len(folded))
+
+def readable_keys(strings, method: str = 'fingerprint', n: int = 2) -> list:
+    """Spell out the keys of a few strings: their sorted distinct words, n-grams or Soundex codes."""
+    folded = _fold(strings).fillna('').tolist()
+    if method == 'ngram':
+        letters = [''.join(s.split()) for s in folded]
+        return [' '.join(sorted({s[i:i + n] for i in range(max(len(s) - n + 1, 1))})) for s in letters]
+    if method == 'phonetic':
+        return [' '.join(sorted(set(_soundex(s.split())))) for s in folded]
+    return [' '.join(sorted(set(s.split()))) for s in folded]
+
+def key_collision_clusters(values, method: str = 'fingerprint', n: int = 2) -> pd.DataFrame:
+    """
+    Groups the distinct values of a column whose keys collide.
+
+    Args:
+        values (pd.Series): The values; missing values are left out.
+        method (str, optional): The key, one of KEY_METHODS.
+        n (int, optional): The n-gram size of the 'ngram' method.
+
+    Returns:
+        pd.DataFrame: One row per value in a cluster of two or more distinct values, with
+                      the columns cluster, value and rows (its number of rows). Clusters
+                      are numbered from the one covering most rows, and their values listed
+                      from the most common.
+    """
+    counts = pd.Series(values).value_counts(dropna=True, sort=False)
+    keys = collision_keys(counts.index.astype(str), method, n)
+    table = pd.DataFrame({'value': counts.index, 'rows': counts.to_numpy(), 'hash': keys})
+    # Values without words have no key and join no cluster
+    table = table[table['hash'] != 0]
+    table = table[table.groupby('hash', sort=False)['value'].transform('size') > 1]
+    table['total'] = table.groupby('hash', sort=False)['rows'].transform('sum')
+    table = table.sort_values(['total', 'hash', 'rows'], ascending=[False, True, False], kind='stable')
+    table['cluster'] = pd.factorize(table['hash'])[0]
+    return table[['cluster', 'value', 'rows']].reset_index(drop=True)
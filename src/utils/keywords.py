@@ -0,0 +1,177 @@
+"""
+Multi-keyword search: which of a set of keywords occur in each text of a column.
+
+The keywords are compiled once into a single matcher that scans every text once, however
+many keywords there are:
+
+- an Aho-Corasick automaton when pyahocorasick is installed, which reports every keyword
+  occurrence in one pass over the text;
+- otherwise one regular expression shaped like a trie of the keywords (keywords sharing a
+  prefix share its branch), tried at every position of the text in a lookahead, so that
+  overlapping keywords are all found, as with a search per keyword.
+
+Texts and keywords are case-folded unless the search is case-sensitive. With whole-word
+matching a keyword must not touch a letter, digit or underscore on either side, so 'cat'
+is found in 'a cat.' but not in 'concatenate'. Each distinct text of a column is searched
+once, optionally in a pool of worker processes.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Distinct texts sent to a worker process at a time
+CHUNK_SIZE = 20_000
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _trie_pattern(node: dict) -> str:
+    """Regular expression matching the keywords of a trie; '' marks the end of a keyword."""
+    branches, chars = [], []
+    for char, child in sorted((char, child) for char, child in node.items() if char != ''):
+        rest = _trie_pattern(child)
+        if rest:
+            branches.append(re.escape(char) + rest)
+        else:
+            chars.append(re.escape(char))
+    if chars:
+        branches.append(chars[0] if len(chars) == 1 else '[' + ''.join(chars) + ']')
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # A keyword ends here; the longer keywords are tried first
+        pattern = '(?:' + pattern + ')?' if len(branches) > 1 or len(pattern) > 1 else pattern + '?'
+    return pattern
+
+class KeywordMatcher:
+    """
+    A set of keywords compiled for searching texts.
+
+    Args:
+        keywords (list): The keywords. Keywords equal after case folding count once.
+        case_sensitive (bool, optional): Match the case of the keywords exactly.
+        whole_words (bool, optional): Only match keywords that are not part of a longer word.
+        backend (str, optional): 'ahocorasick' or 'regex'; defaults to 'ahocorasick' when
+                                 pyahocorasick is installed.
+    """
+
+    def __init__(self, keywords, case_sensitive: bool = False, whole_words: bool = True, backend: str = None):
+        if backend is None:
+            backend = 'ahocorasick' if AHOCORASICK_AVAILABLE else 'regex'
+        if backend not in ('ahocorasick', 'regex'):
+            raise ValueError("Invalid backend. Choose 'ahocorasick' or 'regex'.")
+        if backend == 'ahocorasick' and not AHOCORASICK_AVAILABLE:
+            raise ImportError("The 'ahocorasick' backend needs pyahocorasick. Install it with 'pip install pyahocorasick'.")
+        self.case_sensitive, self.whole_words, self.backend = case_sensitive, whole_words, backend
+        # Keyword ids follow the order of the keywords
+        self.keywords, self._ids = [], {}
+        for keyword in keywords:
+            folded = self._fold(str(keyword))
+            if folded and folded not in self._ids:
+                self._ids[folded] = len(self.keywords)
+                self.keywords.append(keyword)
+        if backend == 'ahocorasick':
+            self._automaton = ahocorasick.Automaton()
+            for folded, keyword_id in self._ids.items():
+                self._automaton.add_word(folded, (keyword_id, len(folded)))
+            if self._ids:
+                self._automaton.make_automaton()
+        else:
+            self._regex = self._compile_regex()
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.casefold()
+
+    def _compile_regex(self):
+        trie = {}
+        for folded in self._ids:
+            node = trie
+            for char in folded:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        # Only the longest keyword starting at a position is matched there; the keywords it
+        # starts with are implied, as long as they end where a whole word may end
+        self._implied = {}
+        for folded, keyword_id in self._ids.items():
+            self._implied[folded] = [self._ids[folded[:end]] for end in range(1, len(folded) + 1)
+                                     if folded[:end] in self._ids
+                                     and (not self.whole_words or end == len(folded) or not _is_word(folded[end]))]
+        if not trie:
+            return None
+        pattern = f'({_trie_pattern(trie)})'
+        if self.whole_words:
+            pattern = rf'(?<!\w){pattern}(?!\w)'
+        return re.compile(f'(?={pattern})')
+
+    def find(self, text) -> list:
+        """The ids of the keywords found in text, in the order of the keywords; none for missing values."""
+        if not isinstance(text, str) or not self.keywords:
+            return []
+        text = self._fold(text)
+        found = set()
+        if self.backend == 'ahocorasick':
+            for end, (keyword_id, length) in self._automaton.iter(text):
+                start = end - length + 1
+                if self.whole_words and ((start > 0 and _is_word(text[start - 1])) or
+                                         (end + 1 < len(text) and _is_word(text[end + 1]))):
+                    continue
+                found.add(keyword_id)
+        else:
+            for match in self._regex.finditer(text):
+                found.update(self._implied[match.group(1)])
+        return sorted(found)
+
+    def find_all(self, texts) -> list:
+        """The ids of the keywords found in each of texts."""
+        return [self.find(text) for text in texts]
+
+_worker_matcher = None
+
+def _init_worker(keywords, case_sensitive, whole_words, backend):
+    global _worker_matcher
+    _worker_matcher = KeywordMatcher(keywords, case_sensitive, whole_words, backend)
+
+def _find_chunk(texts):
+    return _worker_matcher.find_all(texts)
+
+def find_keywords(texts, keywords, case_sensitive: bool = False, whole_words: bool = True, workers: int = 1,
+                  backend: str = None) -> tuple:
+    """
+    Finds which keywords occur in each text.
+
+    Args:
+        texts (pd.Series): The texts; values that are not strings contain no keywords.
+        keywords (list): The keywords.
+        case_sensitive (bool, optional): Match the case of the keywords exactly.
+        whole_words (bool, optional): Only match keywords that are not part of a longer word.
+        workers (int, optional): Processes searching chunks of the distinct texts; 1 searches
+                                 in this process, -1 uses all cores.
+        backend (str, optional): See KeywordMatcher.
+
+    Returns:
+        tuple: The keywords without duplicates; the codes of the rows (see pd.factorize(),
+               -1 for missing values); and for each distinct text, the sorted ids (positions
+               in the keywords) of the keywords found in it.
+    """
+    matcher = KeywordMatcher(keywords, case_sensitive, whole_words, backend)
+    codes, uniques = pd.factorize(pd.Series(texts))
+    distinct = np.asarray(uniques, dtype=object)
+    workers = (os.cpu_count() or 1) if workers in (None, -1) else max(1, workers)
+    if workers > 1 and len(distinct) > CHUNK_SIZE:
+        chunks = [distinct[start:start + CHUNK_SIZE] for start in range(0, len(distinct), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(matcher.keywords, case_sensitive, whole_words, matcher.backend)) as pool:
+            found = [ids for chunk in pool.map(_find_chunk, chunks) for ids in chunk]
+    else:
+        found = matcher.find_all(distinct)
+    return matcher.keywords, codes, found
@@ -1,426 +1,822 @@
-import streamlit as st
+LABELS = {
+    'en': {
+        'title': "🧹 Data Cleaner App",
+        'data_overview': "Data Overview",
+        'missing_data': "Missing Data",
+        'duplicates': "Duplicates",
+        'format_fixing': "Format Fixing",
+        'categorical_data': "Categorical Data",
+        'error_correction_tab': "Error Correction",
+        'text_parsing_tab': "Text Parsing",
+        'type_conversion_tab': "Type Conversion",
+        'column_operations_tab': "Column Operations",
+        'noisy_data_tab': "Noisy Data",
+        'reshape_data_tab': "Reshape Data",
+        'unstructured_data_tab': "Unstructured Data",
+        'cleaning_history_tab': "Cleaning History",
+        'fix_inconsistent_formats': "Fix Inconsistent Formats",
+        'select_column_to_fix_format': "Select column to fix format",
+        'select_format_type': "Select format type",
+        'date': "Date",
+        'phone_number': "Phone Number",
+        'currency': "Currency",
+        # General
+        'apply': "Apply",
+        'error_generic': "Error: {error}",
+        'please_upload': "Please upload a CSV file first.",
+        # Overview
+        'data_overview': "Data Overview",
+        'basic_statistics': "Basic Statistics",
+        'data_types': "Data Types",
+        'missing_values': "Missing Values",
+        'sample_data': "Sample Data",
+        'shape_of_data': "Shape of Data",
+        'rows_cols': "Rows: {rows}, Columns: {cols}",
+        'no_data_display': "No data available for display.",
+        'memory_usage': "Memory Usage",
+        'memory_usage_summary': "Memory at load time: {before:.2f} MB before optimization, {after:.2f} MB after ({ratio:.1f}x smaller)",
+        # Missing Data
+        'handle_missing_data': "Handle Missing Data",
+        'missing_values_count': "Missing Values Count:",
+        'choose_option_missing': "Choose a method to handle missing data:",
+        'drop_rows': "Drop Rows",
+        'impute_values': "Impute Values",
+        'flag_missing': "Flag Missing",
+        'enter_value_impute': "Enter value for imputing missing data:",
+        'dropped_rows': "Rows with missing values were dropped.",
+        'imputed_values': "Missing values were imputed with '{value}'.",
+        'please_enter_value': "Please enter a value for imputation.",
+        'flagged_missing': "Missing values were flagged.",
+        'cleaned_data': "Cleaned Data:",
+        # Duplicates
+        'remove_duplicates': "Remove Duplicates",
+        'remove_exact_duplicates': "Remove Exact Duplicates",
+        'removed_exact_duplicates': "Removed {count} exact duplicates.",
+        'remove_fuzzy_duplicates': "Remove Fuzzy Duplicates",
+        'fuzzy_required': "Fuzzy matching requires the 'rapidfuzz' library. Install it with 'pip install rapidfuzz' and restart the app.",
+        'select_column_fuzzy': "Select column for fuzzy matching",
+        'set_similarity_threshold': "Set similarity threshold",
+        'removed_fuzzy_duplicates': "Removed {count} duplicates based on fuzzy matching.",
+        'no_data_remove_duplicates': "No data available to remove duplicates.",
+        # Categorical
+        'column_not_exist': "Column '{column}' does not exist in the DataFrame.",
+        'standardized_column': "Column '{column}' standardized successfully.",
+        # Formatting
+        'unsupported_format_type': "Unsupported format type. Choose 'date', 'phone' or 'currency'.",
+        'select_column_to_fix_format_tooltip': "Select the column whose data format you want to correct.",
+        'select_format_type_tooltip': "Choose the type of data format (Date, Phone Number, Currency) to apply.",
+        'fix_format_button': "Fix Format",
+        'fixed_format_action': "Fixed {format_type} format in column '{column}'",
+        'format_fixed_success': "Format fixed successfully for column '{column}'.",
+        # Error Correction
+        'error_correction': "Error Correction",
+        'data_issues_detection': "Data Issues Detection",
+        'no_obvious_issues': "No obvious issues detected in column names and values.",
+        'correct_data_errors': "Correct Data Errors",
+        'select_correction_method': "Select correction method",
+        'correct_outliers': "Correct Outliers (Z-score, MAD or IQR)",
+        'fix_negative_values': "Fix Negative Values",
+        'cap_percentile': "Cap Values at Percentile Limits",
+        'no_numeric_outlier': "No numeric columns found for outlier detection.",
+        'select_columns_outliers': "Select columns for outlier detection",
+        'outlier_threshold_zscore': "Z-score threshold",
+        'detect_fix_outliers': "Detect and Fix Outliers",
+        'found_outliers': "Found {count} outliers in column '{col}'",
+        'replaced_outliers_median_action': "Replaced {count} outliers in '{col}' with median ({median})",
+        'outliers_replaced': "Outliers replaced!",
+        'no_outliers_found': "No outliers found with the current threshold.",
+        'no_numeric_columns': "No numeric columns found.",
+        'select_columns_negative': "Select columns to fix negative values",
+        'how_fix_negative': "How to fix negative values",
+        'set_zero': "Set to Zero",
+        'set_abs': "Set to Absolute Value",
+        'remove_rows': "Remove Rows",
+        'set_negative_zero': "Set {count} negative values to zero in '{col}'",
+        'set_negative_abs': "Converted {count} negative values to absolute in '{col}'",
+        'removed_negative_rows': "Removed {count} rows with negative values in '{col}'",
+        'negative_fixed': "Negative values fixed!",
+        'no_negative_found': "No negative values found in the selected columns.",
+        'select_columns_cap': "Select columns to cap",
+        'lower_percentile': "Lower Percentile Limit",
+        'upper_percentile': "Upper Percentile Limit",
+        'cap_values': "Cap Values",
+        'capped_values': "Capped values in '{col}' between {lower}th and {upper}th percentile",
+        'below_limit': " ({count} values below the limit)",
+        'above_limit': " ({count} values above the limit)",
+        'values_capped': "Values were capped at the specified percentile limits!",
+        'no_values_outside': "No values found outside the specified limits.",
+        'apply_general_error_correction': "Apply General Error Correction",
+        'general_error_applied': "General error correction applied!",
+        'corrected_outliers_action': "Corrected outliers in column '{column}' with median {median}",
+        'corrected_outliers_report': "Corrected outliers in column '{column}'",
+        'replaced_with_median': "Replaced with median",
+        'errors_corrected': "Errors corrected in the dataset.",
+        'impossible_age': "Column '{col}' contains impossible age values",
+        'impossible_pct': "Column '{col}' contains percentages outside the range 0-100",
+        # Column Operations
+        'column_operations': "Column Operations",
+        'select_operation': "Select operation",
+        'merge_columns': "Merge Columns",
+        'split_column': "Split Column",
+        'select_first_column_merge': "Select first column to merge",
+        'select_second_column_merge': "Select second column to merge",
+        'enter_new_column_name': "Enter new column name",
+        'enter_separator': "Enter separator (default is space)",
+        'merge': "Merge",
+        'columns_merged': "Columns '{col1}' and '{col2}' merged into '{new_col}'.",
+        'columns_not_exist': "One or both columns '{col1}' and '{col2}' do not exist in the DataFrame.",
+        'select_column_split': "Select column to split",
+        'enter_new_col1_name': "Enter name for new column 1",
+        'enter_new_col2_name': "Enter name for new column 2",
+        'split': "Split",
+        'column_split': "Column '{col}' split into '{new_col1}' and '{new_col2}'.",
+        # Noisy Data
+        'noisy_data_cleaned': "Noise in the data was successfully removed!",
+        # Reshape
+        'reshape_data': "Reshape Data",
+        'select_reshape_operation': "Select reshape operation",
+        'pivot': "Pivot",
+        'melt': "Melt",
+        'transpose': "Transpose",
+        'select_index_column': "Select column as index",
+        'select_columns_column': "Select column for columns",
+        'select_values_column': "Select column for values",
+        'pivot_data': "Pivot Data",
+        'data_pivoted': "Data was successfully reshaped with pivot!",
+        'select_id_vars': "Select identifier variables",
+        'select_value_vars': "Select value variables",
+        'melt_data': "Melt Data",
+        'data_melted': "Data was successfully reshaped with melt!",
+        'transpose_data': "Transpose Data",
+        'data_transposed': "Data was successfully transposed!",
+        'please_upload_reshape': "Please upload a CSV file to reshape data.",
+        # Text Parsing
+        'text_parsing': "Text Parsing",
+        'select_parsing_option': "Select parsing option",
+        'split_full_names': "Split Full Names",
+        'extract_keywords': "Extract Keywords",
+        'clean_text_column': "Clean Text Column",
+        'parse_dates': "Parse Dates",
+        'no_text_columns': "No text columns found in the dataset.",
+        'select_column_full_names': "Select column with full names",
+        'split_names': "Split Names",
+        'split_names_success': "Names successfully split from '{col}'",
+        'first_name_col': "First Name",
+        'last_name_col': "Last Name",
+        'split_full_names_action': "Full names in column '{col}' split into 'First Name' and 'Last Name'",
+        'select_text_column': "Select text column",
+        'enter_keywords': "Enter keywords (separated by comma)",
+        'extract_keywords_btn': "Extract Keywords",
+        'extract_keywords_success': "Keywords successfully extracted from '{col}'",
+        'extracted_keywords_action': "Keywords extracted from column '{col}' to '{col}_keywords'",
+        'select_text_column_clean': "Select text column for cleaning",
+        'clean_text_btn': "Clean Text",
+        'clean_text_success': "Text successfully cleaned in '{col}'",
+        'cleaned_text_action': "Text in column '{col}' cleaned by removing special characters and extra spaces",
+        'select_column_dates': "Select column with dates",
+        'select_date_format': "Select date format",
+        'custom': "Custom",
+        'enter_custom_date_format': "Enter custom date format (e.g. %Y-%m-%d)",
+        'parse_dates_btn': "Parse Dates",
+        'parse_dates_success': "Dates successfully parsed in '{col}'",
+        'parsed_dates_action': "Dates in column '{col}' parsed with format '{fmt}'",
+        # Type Conversion
+        'converted_to_numeric': "Columns converted to numeric.",
+        'converted_to_datetime': "Columns converted to date/time.",
+        'converted_to_string': "Columns converted to text.",
+        # Unstructured Data
+        'unstructured_data_cleaning': "Cleaning Unstructured Data",
+        'clean_data_btn': "Clean Data",
+        'data_cleaned_success': "Data successfully cleaned!",
+        'download_cleaned_data': "Download cleaned data",
+        # File Upload
+        'ingest_options': "Import Options",
+        'ingest_mode': "Import mode",
+        'ingest_mode_tooltip': "Standard parses the file in one pass. Parallel parses it on all CPU cores. Streaming reads it in row chunks with compact column types to keep memory usage low on large uploads.",
+        'standard_ingest': "Standard",
+        'parallel_ingest': "Parallel (all cores)",
+        'streaming_ingest': "Streaming (low memory)",
+        'chunk_rows': "Rows per chunk",
+        'reading_file_progress': "Reading file... {percent}%",
+        'optimize_memory': "Optimize memory usage",
+        'optimize_memory_tooltip': "Store columns in the smallest lossless types: narrower numbers, categories for repeated text and nullable integer and boolean types.",
+        'columns_to_load': "Columns to load",
+        'columns_to_load_tooltip': "Only the selected columns are read from the file.",
+        'row_filter_column': "Filter rows by column",
+        'no_row_filter': "(no filter)",
+        'row_filter_operator': "Operator",
+        'row_filter_value': "Value",
+        # Cleaning recipes
+        'cleaning_recipe': "Cleaning Recipe",
+        'recipe_summary': "{count} replayable steps recorded. Download the recipe to apply them to other files here or with `python src/batch_clean.py`.",
+        'download_recipe': "Download Recipe (JSON)",
+        'upload_recipe': "Apply a saved recipe to the current data",
+        'apply_recipe': "Apply Recipe",
+        'applied_recipe_step_action': "Applied recipe step {step}: {operation}",
+        'recipe_applied': "Applied {count} recipe steps.",
+        'recipe_error': "Could not apply the recipe: {error}",
+        # Navigation
+        'section': "Section",
+        # Approximate statistics
+        'approximate_statistics': "Approximate statistics (sketches)",
+        'approximate_statistics_help': "Estimate the statistics chunk by chunk with mergeable sketches instead of exact scans and sorts. Faster and lighter on very large data.",
+        'approximate_errors': "Statistics are estimates. Error bounds per column:",
+        'error_unique': "Distinct values (± % std. error)",
+        'error_freq': "Top frequency (max. undercount)",
+        'error_quantile': "Quartiles (± % of rows in rank)",
+        'approximate_quantiles': "Use approximate quantiles (faster on large data)",
+        # Data viewer
+        'browse_all_rows': "Browse all rows (search, sort, filter)",
+        'preview_rows': "Showing the first {count} of {total} rows.",
+        'search_rows': "Search",
+        'sort_by': "Sort by",
+        'no_sorting': "(no sorting)",
+        'sort_descending': "Descending",
+        'page_size': "Rows per page",
+        'filter_column': "Filter column",
+        'no_filter': "(no filter)",
+        'filter_min': "Minimum",
+        'filter_max': "Maximum",
+        'filter_values': "Keep values",
+        'page': "Page",
+        'rows_range': "Rows {start}–{end} of {matched} matching ({total} in total), page {page} of {pages}.",
+        # Entity resolution
+        'resolve_entities': "Resolve entities across several columns",
+        'select_columns_entities': "Select the columns that identify an entity",
+        'comparison_method': "Comparison for '{col}'",
+        'comparison_weight': "Weight of '{col}'",
+        'comparator_fuzzy': "Fuzzy text",
+        'comparator_exact': "Exact",
+        'comparator_numeric': "Numeric",
+        'match_threshold': "Minimum weighted similarity of a match",
+        'survivor_rule': "Row to keep in each cluster",
+        'survivor_most_complete': "Most complete",
+        'survivor_most_recent': "Most recent",
+        'survivor_first': "First",
+        'recency_column': "Date column for the most recent row",
+        'keep_all_add_cluster': "Keep all rows and add a 'cluster_id' column",
+        'resolve_entities_button': "Resolve entities",
+        'resolved_entities': "Found {clusters} clusters with {rows} rows; removed {removed} rows.",
+        # Hash-based deduplication
+        'select_key_columns': "Key columns (leave empty to compare whole rows)",
+        'remove_seen_rows': "Remove rows already seen in earlier files",
+        'upload_hash_set': "Hash set of earlier files (.npy, optional)",
+        'hash_size': "Hash size in bits",
+        'remove_seen_rows_button': "Remove seen rows",
+        'removed_seen_rows': "Removed {count} rows, {seen} of them seen in earlier files.",
+        'download_hash_set': "Download the updated hash set ({count} rows)",
+        # Date parsing
+        'dates_day_first': "Day before month in ambiguous dates",
+        'dates_day_first_tooltip': "Read dates such as 03/04/2024 as 3 April instead of March 4. Formats are inferred from the column; this only decides ties.",
+        'failed_rows': "{count} values of '{column}' could not be converted and are now missing. The first of them:",
+        # Phone numbers
+        'default_phone_region': "Region of numbers without a country code",
+        'default_phone_region_tooltip': "Numbers are written in E.164 (+<country code><number>); numbers without + or 00 are taken to be from this region.",
+        'add_phone_valid_column': "Add a column flagging valid numbers",
+        'invalid_phone_rows': "{count} values of '{column}' are not valid phone numbers and were left as they are. The first of them:",
+        # Number parsing
+        'decimal_separator': "Decimal separator",
+        'decimal_separator_tooltip': "The other separator is taken to separate thousands. When detected automatically, values such as 1.234,56 or 12,5 decide.",
+        'detect_automatically': "Detect automatically",
+        # Synonym dictionaries
+        'upload_synonyms': "Synonym dictionary (optional)",
+        'upload_synonyms_tooltip': "A JSON object of standard values mapped to lists of their variants, or a CSV file with a header row and two columns: the variant and its standard value. Without one, common spellings of gender values are standardized.",
+        'values_mapped': "{count} distinct values mapped to a standard value.",
+        # Value clustering
+        'cluster_values': "Cluster Similar Values",
+        'cluster_method': "Keying method",
+        'cluster_method_fingerprint': "Fingerprint (case, accents, punctuation and word order)",
+        'cluster_method_ngram': "Character n-grams (also words run together)",
+        'cluster_method_phonetic': "Phonetic (Soundex, spellings that sound alike)",
+        'ngram_size': "N-gram size",
+        'find_clusters': "Find Clusters",
+        'no_clusters_found': "No clusters of near-duplicate values found.",
+        'clusters_found': "{clusters} clusters covering {values} distinct values. Untick a cluster to leave it as it is.",
+        'showing_first_clusters': "Showing the {count} clusters covering most rows; merge them and search again for the rest.",
+        'cluster_key': "Key: {key}",
+        'canonical_value': "Merge into",
+        'merge_clusters_button': "Merge Selected Clusters",
+        'merged_clusters': "Merged {clusters} clusters in column '{column}', changing {rows} rows.",
+        # Outlier engine
+        'outlier_method': "Outlier method",
+        'outlier_method_zscore': "Z-score (distance from the mean)",
+        'outlier_method_mad': "MAD (robust distance from the median)",
+        'outlier_method_iqr': "IQR (Tukey's fences)",
+        'outlier_threshold_mad': "Modified z-score threshold (scaled MADs from the median)",
+        'outlier_threshold_iqr': "IQR multiplier (beyond the quartiles)",
+        'outlier_replacement': "Replace outliers with",
+        'outlier_replacement_median': "Column median",
+        'outlier_replacement_clip': "Nearest bound (cap)",
+        'outlier_replacement_nan': "Missing value",
+        'outlier_column': "Column",
+        'outlier_count': "Outliers",
+        'outlier_lower': "Lower bound",
+        'outlier_upper': "Upper bound",
+        'outlier_median': "Median",
+        'replaced_outliers_clip_action': "Capped {count} outliers in '{col}' to [{lower:.4g}, {upper:.4g}]",
+        'replaced_outliers_nan_action': "Set {count} outliers in '{col}' to missing",
+        # Multivariate anomaly detection
+        'detect_anomalies': "Detect Multivariate Anomalies",
+        'select_columns_anomalies': "Select the columns rows are compared on",
+        'anomaly_method': "Detection method",
+        'anomaly_method_isolation_forest': "Isolation forest",
+        'anomaly_method_lof': "Local Outlier Factor",
+        'anomaly_contamination': "Expected share of anomalies",
+        'anomaly_sample_size': "Rows the model is fitted on",
+        'anomaly_action': "What to do with anomalous rows",
+        'anomaly_action_flag': "Flag them in a column",
+        'anomaly_action_quarantine': "Quarantine (remove) them",
+        'anomaly_flag_column': "Flag column name",
+        'anomaly_keep_scores': "Also keep the anomaly score of every row",
+        'detect_anomalies_button': "Detect Anomalies",
+        'scoring_rows_progress': "Scoring rows... {percent}%",
+        'sklearn_missing': "Anomaly detection needs scikit-learn. Install it with 'pip install scikit-learn'.",
+        'flagged_anomalies_action': "Flagged {count} anomalous rows in '{col}'",
+        'quarantined_anomalies_action': "Quarantined {count} anomalous rows",
+        'anomalies_found': "{count} anomalous rows found.",
+        'no_anomalies_found': "No anomalous rows found.",
+        'download_quarantined': "Download the {count} quarantined rows",
+        # Rule validation
+        'validate_with_rules': "Validate with a rule file",
+        'upload_rules': "Upload a rule file (JSON)",
+        'upload_rules_tooltip': "A list of rules such as {\"type\": \"range\", \"column\": \"age\", \"min\": 0, \"max\": 120}, {\"type\": \"regex\", \"column\": \"zip\", \"pattern\": \"[0-9]{5}\"}, {\"type\": \"allowed\", \"column\": \"status\", \"values\": [\"open\", \"closed\"]} or {\"type\": \"expression\", \"expression\": \"end_date >= start_date\"}.",
+        'rule_action': "Rows that violate a rule",
+        'rule_action_report': "Only report them",
+        'rule_action_flag': "Flag them with their number of violations",
+        'rule_action_remove': "Remove them",
+        'check_rules': "Check Rules",
+        'rule_rule': "Rule",
+        'rule_type': "Type",
+        'rule_column': "Column",
+        'rule_count': "Violations",
+        'rule_rows': "First rows",
+        'no_rule_violations': "All rows satisfy every rule.",
+        'rule_violations_found': "{count} rows violate at least one of the {rules} rules.",
+        'flagged_rule_violations_action': "Flagged {count} rows that violate validation rules",
+        'removed_rule_violations_action': "Removed {count} rows that violate validation rules",
+        # Group-wise error correction
+        'group_by_columns': "Group by (optional)",
+        'group_by_tooltip': "Compute the statistics within each group of rows, e.g. judge salaries against the other salaries of the same country.",
+        'outlier_groups': "Groups with outliers",
+        'replaced_outliers_grouped_action': "Replaced {count} outliers in '{col}' within {groups} groups of {group_by}",
+        'within_groups': " within groups of {group_by}",
+        # Keyword extraction
+        'upload_keywords': "Or upload a keyword list",
+        'upload_keywords_tooltip': "A text file with one keyword per line, added to the keywords typed above.",
+        'match_whole_words': "Match whole words only",
+        'match_case': "Match case",
+        'keyword_output': "Output",
+        'keyword_output_list': "One column listing the keywords found",
+        'keyword_output_multi_hot': "One True/False column per keyword",
+        'use_all_cores': "Use all CPU cores",
+        'extracted_keyword_columns_action': "Added a True/False column per keyword for {count} keywords searched in column '{col}'",
+        'rows_with_keywords': "{count} rows contain at least one keyword.",
 
-def get_label(label_key):
-    labels = {
-        'en': {
-            'title': "🧹 Data Cleaner App",
-            'data_overview': "Data Overview",
-            'missing_data': "Missing Data",
-            'duplicates': "Duplicates",
-            'format_fixing': "Format Fixing",
-            'categorical_data': "Categorical Data",
-            'error_correction_tab': "Error Correction",
-            'text_parsing_tab': "Text Parsing",
-            'type_conversion_tab': "Type Conversion",
-            'column_operations_tab': "Column Operations",
-            'noisy_data_tab': "Noisy Data",
-            'reshape_data_tab': "Reshape Data",
-            'unstructured_data_tab': "Unstructured Data",
-            'cleaning_history_tab': "Cleaning History",
-            'fix_inconsistent_formats': "Fix Inconsistent Formats",
-            'select_column_to_fix_format': "Select column to fix format",
-            'select_format_type': "Select format type",
-            'date': "Date",
-            'phone_number': "Phone Number",
-            'currency': "Currency",
-            # General
-            'apply': "Apply",
-            'error_generic': "Error: {error}",
-            'please_upload': "Please upload a CSV file first.",
-            # Overview
-            'data_overview': "Data Overview",
-            'basic_statistics': "Basic Statistics",
-            'data_types': "Data Types",
-            'missing_values': "Missing Values",
-            'sample_data': "Sample Data",
-            'shape_of_data': "Shape of Data",
-            'rows_cols': "Rows: {rows}, Columns: {cols}",
-            'no_data_display': "No data available for display.",
-            # Missing Data
-            'handle_missing_data': "Handle Missing Data",
-            'missing_values_count': "Missing Values Count:",
-            'choose_option_missing': "Choose a method to handle missing data:",
-            'drop_rows': "Drop Rows",
-            'impute_values': "Impute Values",
-            'flag_missing': "Flag Missing",
-            'enter_value_impute': "Enter value for imputing missing data:",
-            'dropped_rows': "Rows with missing values were dropped.",
-            'imputed_values': "Missing values were imputed with '{value}'.",
-            'please_enter_value': "Please enter a value for imputation.",
-            'flagged_missing': "Missing values were flagged.",
-            'cleaned_data': "Cleaned Data:",
-            # Duplicates
-            'remove_duplicates': "Remove Duplicates",
-            'remove_exact_duplicates': "Remove Exact Duplicates",
-            'removed_exact_duplicates': "Removed {count} exact duplicates.",
-            'remove_fuzzy_duplicates': "Remove Fuzzy Duplicates",
-            'fuzzy_required': "Fuzzy matching requires the 'thefuzz' library. Install it with 'pip install thefuzz python-Levenshtein' and restart the app.",
-            'select_column_fuzzy': "Select column for fuzzy matching",
-            'set_similarity_threshold': "Set similarity threshold",
-            'removed_fuzzy_duplicates': "Removed {count} duplicates based on fuzzy matching.",
-            'no_data_remove_duplicates': "No data available to remove duplicates.",
-            # Categorical
-            'column_not_exist': "Column '{column}' does not exist in the DataFrame.",
-            'standardized_column': "Column '{column}' standardized successfully.",
-            # Formatting
-            'unsupported_format_type': "Unsupported format type. Choose 'date', 'phone' or 'currency'.",
-            'select_column_to_fix_format_tooltip': "Select the column whose data format you want to correct.",
-            'select_format_type_tooltip': "Choose the type of data format (Date, Phone Number, Currency) to apply.",
-            'fix_format_button': "Fix Format",
-            'fixed_format_action': "Fixed {format_type} format in column '{column}'",
-            'format_fixed_success': "Format fixed successfully for column '{column}'.",
-            # Error Correction
-            'error_correction': "Error Correction",
-            'data_issues_detection': "Data Issues Detection",
-            'no_obvious_issues': "No obvious issues detected in column names and values.",
-            'correct_data_errors': "Correct Data Errors",
-            'select_correction_method': "Select correction method",
-            'correct_outliers': "Correct Outliers (Z-score method)",
-            'fix_negative_values': "Fix Negative Values",
-            'cap_percentile': "Cap Values at Percentile Limits",
-            'no_numeric_outlier': "No numeric columns found for outlier detection.",
-            'select_columns_outliers': "Select columns for outlier detection",
-            'zscore_threshold': "Z-score threshold",
-            'detect_fix_outliers': "Detect and Fix Outliers",
-            'found_outliers': "Found {count} outliers in column '{col}'",
-            'replaced_outliers_action': "Replaced {count} outliers in '{col}' with median ({median})",
-            'outliers_replaced': "Outliers replaced with median!",
-            'no_outliers_found': "No outliers found with the current threshold.",
-            'no_numeric_columns': "No numeric columns found.",
-            'select_columns_negative': "Select columns to fix negative values",
-            'how_fix_negative': "How to fix negative values",
-            'set_zero': "Set to Zero",
-            'set_abs': "Set to Absolute Value",
-            'remove_rows': "Remove Rows",
-            'set_negative_zero': "Set {count} negative values to zero in '{col}'",
-            'set_negative_abs': "Converted {count} negative values to absolute in '{col}'",
-            'removed_negative_rows': "Removed {count} rows with negative values in '{col}'",
-            'negative_fixed': "Negative values fixed!",
-            'no_negative_found': "No negative values found in the selected columns.",
-            'select_columns_cap': "Select columns to cap",
-            'lower_percentile': "Lower Percentile Limit",
-            'upper_percentile': "Upper Percentile Limit",
-            'cap_values': "Cap Values",
-            'capped_values': "Capped values in '{col}' between {lower}th and {upper}th percentile",
-            'below_limit': " ({count} values below the limit)",
-            'above_limit': " ({count} values above the limit)",
-            'values_capped': "Values were capped at the specified percentile limits!",
-            'no_values_outside': "No values found outside the specified limits.",
-            'apply_general_error_correction': "Apply General Error Correction",
-            'general_error_applied': "General error correction applied!",
-            'corrected_outliers_action': "Corrected outliers in column '{column}' with median {median}",
-            'corrected_outliers_report': "Corrected outliers in column '{column}'",
-            'replaced_with_median': "Replaced with median",
-            'errors_corrected': "Errors corrected in the dataset.",
-            'impossible_age': "Column '{col}' contains impossible age values",
-            'impossible_pct': "Column '{col}' contains percentages outside the range 0-100",
-            # Column Operations
-            'column_operations': "Column Operations",
-            'select_operation': "Select operation",
-            'merge_columns': "Merge Columns",
-            'split_column': "Split Column",
-            'select_first_column_merge': "Select first column to merge",
-            'select_second_column_merge': "Select second column to merge",
-            'enter_new_column_name': "Enter new column name",
-            'enter_separator': "Enter separator (default is space)",
-            'merge': "Merge",
-            'columns_merged': "Columns '{col1}' and '{col2}' merged into '{new_col}'.",
-            'columns_not_exist': "One or both columns '{col1}' and '{col2}' do not exist in the DataFrame.",
-            'select_column_split': "Select column to split",
-            'enter_new_col1_name': "Enter name for new column 1",
-            'enter_new_col2_name': "Enter name for new column 2",
-            'split': "Split",
-            'column_split': "Column '{col}' split into '{new_col1}' and '{new_col2}'.",
-            # Noisy Data
-            'noisy_data_cleaned': "Noise in the data was successfully removed!",
-            # Reshape
-            'reshape_data': "Reshape Data",
-            'select_reshape_operation': "Select reshape operation",
-            'pivot': "Pivot",
-            'melt': "Melt",
-            'transpose': "Transpose",
-            'select_index_column': "Select column as index",
-            'select_columns_column': "Select column for columns",
-            'select_values_column': "Select column for values",
-            'pivot_data': "Pivot Data",
-            'data_pivoted': "Data was successfully reshaped with pivot!",
-            'select_id_vars': "Select identifier variables",
-            'select_value_vars': "Select value variables",
-            'melt_data': "Melt Data",
-            'data_melted': "Data was successfully reshaped with melt!",
-            'transpose_data': "Transpose Data",
-            'data_transposed': "Data was successfully transposed!",
-            'please_upload_reshape': "Please upload a CSV file to reshape data.",
-            # Text Parsing
-            'text_parsing': "Text Parsing",
-            'select_parsing_option': "Select parsing option",
-            'split_full_names': "Split Full Names",
-            'extract_keywords': "Extract Keywords",
-            'clean_text_column': "Clean Text Column",
-            'parse_dates': "Parse Dates",
-            'no_text_columns': "No text columns found in the dataset.",
-            'select_column_full_names': "Select column with full names",
-            'split_names': "Split Names",
-            'split_names_success': "Names successfully split from '{col}'",
-            'first_name_col': "First Name",
-            'last_name_col': "Last Name",
-            'split_full_names_action': "Full names in column '{col}' split into 'First Name' and 'Last Name'",
-            'select_text_column': "Select text column",
-            'enter_keywords': "Enter keywords (separated by comma)",
-            'extract_keywords_btn': "Extract Keywords",
-            'extract_keywords_success': "Keywords successfully extracted from '{col}'",
-            'extracted_keywords_action': "Keywords extracted from column '{col}' to '{col}_keywords'",
-            'select_text_column_clean': "Select text column for cleaning",
-            'clean_text_btn': "Clean Text",
-            'clean_text_success': "Text successfully cleaned in '{col}'",
-            'cleaned_text_action': "Text in column '{col}' cleaned by removing special characters and extra spaces",
-            'select_column_dates': "Select column with dates",
-            'select_date_format': "Select date format",
-            'custom': "Custom",
-            'enter_custom_date_format': "Enter custom date format (e.g. %Y-%m-%d)",
-            'parse_dates_btn': "Parse Dates",
-            'parse_dates_success': "Dates successfully parsed in '{col}'",
-            'parsed_dates_action': "Dates in column '{col}' parsed with format '{fmt}'",
-            # Type Conversion
-            'converted_to_numeric': "Columns converted to numeric.",
-            'converted_to_datetime': "Columns converted to date/time.",
-            'converted_to_string': "Columns converted to text.",
-            # Unstructured Data
-            'unstructured_data_cleaning': "Cleaning Unstructured Data",
-            'clean_data_btn': "Clean Data",
-            'data_cleaned_success': "Data successfully cleaned!",
-            'download_cleaned_data': "Download cleaned data",
+        # New app UI labels
+        'app_description': "A comprehensive tool for cleaning and preprocessing your data for analysis",
+        'upload': "Upload Data",
+        'choose_file': "Choose a CSV, Parquet, Feather or Arrow file",
+        'reset': "Reset Data",
+        'reset_tooltip': "Reset to the original uploaded data",
+        'reset_success': "Data has been reset to original state",
+        'undo': "Undo",
+        'undo_tooltip': "Undo the last cleaning step",
+        'redo': "Redo",
+        'redo_tooltip': "Redo the last undone cleaning step",
+        'go_to_step': "Go to step",
+        'go_to_step_btn': "Restore this step",
+        'original_data_step': "0. Original data",
+        'versions_memory': "{count} versions stored using {size:.2f} MB (unchanged columns are shared)",
+        'converted_to_numeric_action': "Converted columns {columns} to numeric",
+        'converted_to_datetime_action': "Converted columns {columns} to date/time",
+        'converted_to_string_action': "Converted columns {columns} to text",
+        'success_loaded': "Successfully loaded {filename}",
+        'error': "Error: {error}",
+        'download': "Download Cleaned Data",
+        'download_csv': "Download as CSV",
+        'download_parquet': "Download as Parquet",
+        'file_info': "File Information",
+        'filename': "Filename",
+        'dimensions': "Dimensions",
+        'rows': "rows",
+        'columns': "columns",
+        'export_options': "Export Options",
+        'welcome': "Welcome to Data Cleaner",
+        'upload_instruction': "Upload a CSV file to get started with data cleaning",
+        'app_features': "Features",
+        'feature_overview': "Analyze data shape, types, and summary statistics",
+        'feature_missing': "Handle missing data using various strategies",
+        'feature_duplicates': "Remove exact and fuzzy duplicates",
+        'feature_format': "Standardize date, currency, and phone number formats",
+        'feature_more': "And much more!",
+        'getting_started': "Getting Started",
+        'getting_started_text': "Upload a CSV file using the sidebar, then use the tabs to clean your data in different ways. Your cleaning history will be recorded.",
+        'standardize': "Standardize"
+    },
+    'el': {
+        'title': "🧹 Εφαρμογή Καθαρισμού Δεδομένων",
+        'data_overview': "Επισκόπηση Δεδομένων",
+        'missing_data': "Ελλιπή Δεδομένα",
+        'duplicates': "Διπλότυπα",
+        'format_fixing': "Διόρθωση Μορφοποίησης",
+        'categorical_data': "Κατηγορικά Δεδομένα",
+        'error_correction_tab': "Διόρθωση Σφαλμάτων",
+        'text_parsing_tab': "Ανάλυση Κειμένου",
+        'type_conversion_tab': "Μετατροπή Τύπου",
+        'column_operations_tab': "Ενέργειες Στηλών",
+        'noisy_data_tab': "Θορυβώδη Δεδομένα",
+        'reshape_data_tab': "Αναδιάταξη Δεδομένων",
+        'unstructured_data_tab': "Μη Δομημένα Δεδομένα",
+        'cleaning_history_tab': "Ιστορικό Καθαρισμού",
+        'fix_inconsistent_formats': "Διόρθωση Ασυνεπών Μορφών",
+        'select_column_to_fix_format': "Επιλέξτε στήλη για διόρθωση μορφής",
+        'select_format_type': "Επιλέξτε τύπο μορφής",
+        'date': "Ημερομηνία",
+        'phone_number': "Τηλέφωνο",
+        'currency': "Νόμισμα",
+        # General
+        'apply': "Εφαρμογή",
+        'error_generic': "Σφάλμα: {error}",
+        'please_upload': "Παρακαλώ ανεβάστε πρώτα ένα αρχείο CSV.",
+        # Overview
+        'data_overview': "Επισκόπηση Δεδομένων",
+        'basic_statistics': "Βασικά Στατιστικά",
+        'data_types': "Τύποι Δεδομένων",
+        'missing_values': "Ελλιπείς Τιμές",
+        'sample_data': "Δείγμα Δεδομένων",
+        'shape_of_data': "Διάσταση Δεδομένων",
+        'rows_cols': "Γραμμές: {rows}, Στήλες: {cols}",
+        'no_data_display': "Δεν υπάρχουν διαθέσιμα δεδομένα για εμφάνιση.",
+        'memory_usage': "Χρήση Μνήμης",
+        'memory_usage_summary': "Μνήμη κατά τη φόρτωση: {before:.2f} MB πριν τη βελτιστοποίηση, {after:.2f} MB μετά ({ratio:.1f}x μικρότερη)",
+        # Missing Data
+        'handle_missing_data': "Διαχείριση Ελλιπών Δεδομένων",
+        'missing_values_count': "Αριθμός Ελλιπών Τιμών:",
+        'choose_option_missing': "Επιλέξτε τρόπο διαχείρισης ελλιπών δεδομένων:",
+        'drop_rows': "Διαγραφή Γραμμών",
+        'impute_values': "Συμπλήρωση Τιμών",
+        'flag_missing': "Σημείωση Ελλιπών",
+        'enter_value_impute': "Εισάγετε τιμή για συμπλήρωση ελλιπών δεδομένων:",
+        'dropped_rows': "Οι γραμμές με ελλιπείς τιμές διαγράφηκαν.",
+        'imputed_values': "Οι ελλιπείς τιμές συμπληρώθηκαν με '{value}'.",
+        'please_enter_value': "Παρακαλώ εισάγετε μια τιμή για συμπλήρωση.",
+        'flagged_missing': "Οι ελλιπείς τιμές σημειώθηκαν.",
+        'cleaned_data': "Καθαρισμένα Δεδομένα:",
+        # Duplicates
+        'remove_duplicates': "Αφαίρεση Διπλοτύπων",
+        'remove_exact_duplicates': "Αφαίρεση ακριβών διπλοτύπων",
+        'removed_exact_duplicates': "Αφαιρέθηκαν {count} ακριβή διπλότυπα.",
+        'remove_fuzzy_duplicates': "Αφαίρεση διπλοτύπων με ασαφή αντιστοίχιση",
+        'fuzzy_required': "Η ασαφής αντιστοίχιση απαιτεί τη βιβλιοθήκη 'rapidfuzz'. Εγκαταστήστε τη με 'pip install rapidfuzz' και επανεκκινήστε την εφαρμογή.",
+        'select_column_fuzzy': "Επιλέξτε στήλη για ασαφή αντιστοίχιση",
+        'set_similarity_threshold': "Ορίστε το όριο ομοιότητας",
+        'removed_fuzzy_duplicates': "Αφαιρέθηκαν {count} διπλότυπα με βάση την ασαφή αντιστοίχιση.",
+        'no_data_remove_duplicates': "Δεν υπάρχουν διαθέσιμα δεδομένα για αφαίρεση διπλοτύπων.",
+        # Categorical
+        'column_not_exist': "Η στήλη '{column}' δεν υπάρχει στο DataFrame.",
+        'standardized_column': "Η στήλη '{column}' τυποποιήθηκε επιτυχώς.",
+        # Formatting
+        'unsupported_format_type': "Μη υποστηριζόμενος τύπος μορφής. Επιλέξτε 'date', 'phone' ή 'currency'.",
+        'select_column_to_fix_format_tooltip': "Επιλέξτε τη στήλη των δεδομένων που θέλετε να διορθώσετε.",
+        'select_format_type_tooltip': "Επιλέξτε τον τύπο των δεδομένων (Ημερομηνία, Αριθμός Τηλεφώνου, Νόμισμα) που θέλετε να εφαρμόσετε.",
+        'fix_format_button': "Διόρθωση Μορφής",
+        'fixed_format_action': "Διορθώθηκε η μορφή {format_type} στη στήλη '{column}'",
+        'format_fixed_success': "Η μορφή διορθώθηκε επιτυχώς για τη στήλη '{column}'.",
+        # Error Correction
+        'error_correction': "Διόρθωση Σφαλμάτων",
+        'data_issues_detection': "Ανίχνευση Προβλημάτων Δεδομένων",
+        'no_obvious_issues': "Δεν εντοπίστηκαν εμφανή προβλήματα στα ονόματα και τις τιμές των στηλών.",
+        'correct_data_errors': "Διόρθωση Σφαλμάτων Δεδομένων",
+        'select_correction_method': "Επιλέξτε μέθοδο διόρθωσης",
+        'correct_outliers': "Διόρθωση Ακραίων Τιμών (Z-score, MAD ή IQR)",
+        'fix_negative_values': "Διόρθωση Αρνητικών Τιμών",
+        'cap_percentile': "Περιορισμός Τιμών σε Ποσοστιαία Όρια",
+        'no_numeric_outlier': "Δεν βρέθηκαν αριθμητικές στήλες για ανίχνευση ακραίων τιμών.",
+        'select_columns_outliers': "Επιλέξτε στήλες για έλεγχο ακραίων τιμών",
+        'outlier_threshold_zscore': "Όριο Z-score",
+        'detect_fix_outliers': "Ανίχνευση και Διόρθωση Ακραίων Τιμών",
+        'found_outliers': "Βρέθηκαν {count} ακραίες τιμές στη στήλη '{col}'",
+        'replaced_outliers_median_action': "Αντικαταστάθηκαν {count} ακραίες τιμές στη '{col}' με τη διάμεσο ({median})",
+        'outliers_replaced': "Οι ακραίες τιμές αντικαταστάθηκαν!",
+        'no_outliers_found': "Δεν βρέθηκαν ακραίες τιμές με το τρέχον όριο.",
+        'no_numeric_columns': "Δεν βρέθηκαν αριθμητικές στήλες.",
+        'select_columns_negative': "Επιλέξτε στήλες για διόρθωση αρνητικών τιμών",
+        'how_fix_negative': "Πώς να διορθωθούν οι αρνητικές τιμές",
+        'set_zero': "Ορισμός σε Μηδέν",
+        'set_abs': "Ορισμός σε Απόλυτη Τιμή",
+        'remove_rows': "Αφαίρεση Γραμμών",
+        'set_negative_zero': "Ορίστηκαν {count} αρνητικές τιμές σε μηδέν στη '{col}'",
+        'set_negative_abs': "Μετατράπηκαν {count} αρνητικές τιμές σε απόλυτες στη '{col}'",
+        'removed_negative_rows': "Αφαιρέθηκαν {count} γραμμές με αρνητικές τιμές στη '{col}'",
+        'negative_fixed': "Οι αρνητικές τιμές διορθώθηκαν!",
+        'no_negative_found': "Δεν βρέθηκαν αρνητικές τιμές στις επιλεγμένες στήλες.",
+        'select_columns_cap': "Επιλέξτε στήλες για περιορισμό",
+        'lower_percentile': "Κατώτερο Ποσοστιαίο Όριο",
+        'upper_percentile': "Ανώτερο Ποσοστιαίο Όριο",
+        'cap_values': "Περιορισμός Τιμών",
+        'capped_values': "Περιορίστηκαν τιμές στη '{col}' μεταξύ {lower}ου και {upper}ου ποσοστού",
+        'below_limit': " ({count} τιμές κάτω από το όριο)",
+        'above_limit': " ({count} τιμές πάνω από το όριο)",
+        'values_capped': "Οι τιμές περιορίστηκαν στα καθορισμένα ποσοστιαία όρια!",
+        'no_values_outside': "Δεν βρέθηκαν τιμές εκτός των καθορισμένων ορίων.",
+        'apply_general_error_correction': "Εφαρμογή Γενικής Διόρθωσης Σφαλμάτων",
+        'general_error_applied': "Η γενική διόρθωση σφαλματος εφαρμόστηκε!",
+        'corrected_outliers_action': "Διορθώθηκαν ακραίες τιμές στη στήλη '{column}' με τη διάμεσο {median}",
+        'corrected_outliers_report': "Διορθωμένες ακραίες τιμές στη στήλη '{column}'",
+        'replaced_with_median': "Αντικαταστάθηκε με τη διάμεσο",
+        'errors_corrected': "Σφάλματα διορθώθηκαν στο σύνολο δεδομένων.",
+        'impossible_age': "Η στήλη '{col}' περιέχει αδύνατες τιμές ηλικίας",
+        'impossible_pct': "Η στήλη '{col}' περιέχει ποσοστά εκτός της κλίμακας 0-100",
+        # Column Operations
+        'column_operations': "Ενέργειες Στηλών",
+        'select_operation': "Επιλέξτε ενέργεια",
+        'merge_columns': "Συγχώνευση Στηλών",
+        'split_column': "Διαχωρισμός Στήλης",
+        'select_first_column_merge': "Επιλέξτε την πρώτη στήλη για συγχώνευση",
+        'select_second_column_merge': "Επιλέξτε τη δεύτερη στήλη για συγχώνευση",
+        'enter_new_column_name': "Εισάγετε το όνομα της νέας στήλης",
+        'enter_separator': "Εισάγετε διαχωριστικό (προεπιλογή είναι το κενό)",
+        'merge': "Συγχώνευση",
+        'columns_merged': "Οι στήλες '{col1}' και '{col2}' συγχωνεύθηκαν σε '{new_col}'.",
+        'columns_not_exist': "Μία ή και οι δύο στήλες '{col1}' και '{col2}' δεν υπάρχουν στο DataFrame.",
+        'select_column_split': "Επιλέξτε στήλη για διαχωρισμό",
+        'enter_new_col1_name': "Εισάγετε το όνομα για τη νέα στήλη 1",
+        'enter_new_col2_name': "Εισάγετε το όνομα για τη νέα στήλη 2",
+        'split': "Διαχωρισμός",
+        'column_split': "Η στήλη '{col}' διαχωρίστηκε σε '{new_col1}' και '{new_col2}'.",
+        # Noisy Data
+        'noisy_data_cleaned': "Ο θόρυβος στα δεδομένα αφαιρέθηκε με επιτυχία!",
+        'select_text_columns_to_clean': "Επιλέξτε στήλες κειμένου για καθαρισμό",
+        'remove_noise': "Αφαίρεση Θορύβου",
+        'removed_noise_action': "Αφαιρέθηκε θόρυβος από τις επιλεγμένες στήλες",
+        'please_select_text_column': "Παρακαλώ επιλέξτε τουλάχιστον μία στήλη κειμένου.",
 
-            # New app UI labels
-            'app_description': "A comprehensive tool for cleaning and preprocessing your data for analysis",
-            'upload': "Upload Data",
-            'choose_file': "Choose a CSV file",
-            'reset': "Reset Data",
-            'reset_tooltip': "Reset to the original uploaded data",
-            'reset_success': "Data has been reset to original state",
-            'success_loaded': "Successfully loaded {filename}",
-            'error': "Error: {error}",
-            'download': "Download Cleaned Data",
-            'download_csv': "Download as CSV",
-            'file_info': "File Information",
-            'filename': "Filename",
-            'dimensions': "Dimensions",
-            'rows': "rows",
-            'columns': "columns",
-            'export_options': "Export Options",
-            'welcome': "Welcome to Data Cleaner",
-            'upload_instruction': "Upload a CSV file to get started with data cleaning",
-            'app_features': "Features",
-            'feature_overview': "Analyze data shape, types, and summary statistics",
-            'feature_missing': "Handle missing data using various strategies",
-            'feature_duplicates': "Remove exact and fuzzy duplicates",
-            'feature_format': "Standardize date, currency, and phone number formats",
-            'feature_more': "And much more!",
-            'getting_started': "Getting Started",
-            'getting_started_text': "Upload a CSV file using the sidebar, then use the tabs to clean your data in different ways. Your cleaning history will be recorded.",
-            'standardize': "Standardize"
-        },
-        'el': {
-            'title': "🧹 Εφαρμογή Καθαρισμού Δεδομένων",
-            'data_overview': "Επισκόπηση Δεδομένων",
-            'missing_data': "Ελλιπή Δεδομένα",
-            'duplicates': "Διπλότυπα",
-            'format_fixing': "Διόρθωση Μορφοποίησης",
-            'categorical_data': "Κατηγορικά Δεδομένα",
-            'error_correction_tab': "Διόρθωση Σφαλμάτων",
-            'text_parsing_tab': "Ανάλυση Κειμένου",
-            'type_conversion_tab': "Μετατροπή Τύπου",
-            'column_operations_tab': "Ενέργειες Στηλών",
-            'noisy_data_tab': "Θορυβώδη Δεδομένα",
-            'reshape_data_tab': "Αναδιάταξη Δεδομένων",
-            'unstructured_data_tab': "Μη Δομημένα Δεδομένα",
-            'cleaning_history_tab': "Ιστορικό Καθαρισμού",
-            'fix_inconsistent_formats': "Διόρθωση Ασυνεπών Μορφών",
-            'select_column_to_fix_format': "Επιλέξτε στήλη για διόρθωση μορφής",
-            'select_format_type': "Επιλέξτε τύπο μορφής",
-            'date': "Ημερομηνία",
-            'phone_number': "Τηλέφωνο",
-            'currency': "Νόμισμα",
-            # General
-            'apply': "Εφαρμογή",
-            'error_generic': "Σφάλμα: {error}",
-            'please_upload': "Παρακαλώ ανεβάστε πρώτα ένα αρχείο CSV.",
-            # Overview
-            'data_overview': "Επισκόπηση Δεδομένων",
-            'basic_statistics': "Βασικά Στατιστικά",
-            'data_types': "Τύποι Δεδομένων",
-            'missing_values': "Ελλιπείς Τιμές",
-            'sample_data': "Δείγμα Δεδομένων",
-            'shape_of_data': "Διάσταση Δεδομένων",
-            'rows_cols': "Γραμμές: {rows}, Στήλες: {cols}",
-            'no_data_display': "Δεν υπάρχουν διαθέσιμα δεδομένα για εμφάνιση.",
-            # Missing Data
-            'handle_missing_data': "Διαχείριση Ελλιπών Δεδομένων",
-            'missing_values_count': "Αριθμός Ελλιπών Τιμών:",
-            'choose_option_missing': "Επιλέξτε τρόπο διαχείρισης ελλιπών δεδομένων:",
-            'drop_rows': "Διαγραφή Γραμμών",
-            'impute_values': "Συμπλήρωση Τιμών",
-            'flag_missing': "Σημείωση Ελλιπών",
-            'enter_value_impute': "Εισάγετε τιμή για συμπλήρωση ελλιπών δεδομένων:",
-            'dropped_rows': "Οι γραμμές με ελλιπείς τιμές διαγράφηκαν.",
-            'imputed_values': "Οι ελλιπείς τιμές συμπληρώθηκαν με '{value}'.",
-            'please_enter_value': "Παρακαλώ εισάγετε μια τιμή για συμπλήρωση.",
-            'flagged_missing': "Οι ελλιπείς τιμές σημειώθηκαν.",
-            'cleaned_data': "Καθαρισμένα Δεδομένα:",
-            # Duplicates
-            'remove_duplicates': "Αφαίρεση Διπλοτύπων",
-            'remove_exact_duplicates': "Αφαίρεση ακριβών διπλοτύπων",
-            'removed_exact_duplicates': "Αφαιρέθηκαν {count} ακριβή διπλότυπα.",
-            'remove_fuzzy_duplicates': "Αφαίρεση διπλοτύπων με ασαφή αντιστοίχιση",
-            'fuzzy_required': "Η ασαφής αντιστοίχιση απαιτεί τη βιβλιοθήκη 'thefuzz'. Εγκαταστήστε τη με 'pip install thefuzz python-Levenshtein' και επανεκκινήστε την εφαρμογή.",
-            'select_column_fuzzy': "Επιλέξτε στήλη για ασαφή αντιστοίχιση",
-            'set_similarity_threshold': "Ορίστε το όριο ομοιότητας",
-            'removed_fuzzy_duplicates': "Αφαιρέθηκαν {count} διπλότυπα με βάση την ασαφή αντιστοίχιση.",
-            'no_data_remove_duplicates': "Δεν υπάρχουν διαθέσιμα δεδομένα για αφαίρεση διπλοτύπων.",
-            # Categorical
-            'column_not_exist': "Η στήλη '{column}' δεν υπάρχει στο DataFrame.",
-            'standardized_column': "Η στήλη '{column}' τυποποιήθηκε επιτυχώς.",
-            # Formatting
-            'unsupported_format_type': "Μη υποστηριζόμενος τύπος μορφής. Επιλέξτε 'date', 'phone' ή 'currency'.",
-            'select_column_to_fix_format_tooltip': "Επιλέξτε τη στήλη των δεδομένων που θέλετε να διορθώσετε.",
-            'select_format_type_tooltip': "Επιλέξτε τον τύπο των δεδομένων (Ημερομηνία, Αριθμός Τηλεφώνου, Νόμισμα) που θέλετε να εφαρμόσετε.",
-            'fix_format_button': "Διόρθωση Μορφής",
-            'fixed_format_action': "Διορθώθηκε η μορφή {format_type} στη στήλη '{column}'",
-            'format_fixed_success': "Η μορφή διορθώθηκε επιτυχώς για τη στήλη '{column}'.",
-            # Error Correction
-            'error_correction': "Διόρθωση Σφαλμάτων",
-            'data_issues_detection': "Ανίχνευση Προβλημάτων Δεδομένων",
-            'no_obvious_issues': "Δεν εντοπίστηκαν εμφανή προβλήματα στα ονόματα και τις τιμές των στηλών.",
-            'correct_data_errors': "Διόρθωση Σφαλμάτων Δεδομένων",
-            'select_correction_method': "Επιλέξτε μέθοδο διόρθωσης",
-            'correct_outliers': "Διόρθωση Ακραίων Τιμών (μέθοδος Z-score)",
-            'fix_negative_values': "Διόρθωση Αρνητικών Τιμών",
-            'cap_percentile': "Περιορισμός Τιμών σε Ποσοστιαία Όρια",
-            'no_numeric_outlier': "Δεν βρέθηκαν αριθμητικές στήλες για ανίχνευση ακραίων τιμών.",
-            'select_columns_outliers': "Επιλέξτε στήλες για έλεγχο ακραίων τιμών",
-            'zscore_threshold': "Όριο Z-score",
-            'detect_fix_outliers': "Ανίχνευση και Διόρθωση Ακραίων Τιμών",
-            'found_outliers': "Βρέθηκαν {count} ακραίες τιμές στη στήλη '{col}'",
-            'replaced_outliers_action': "Αντικαταστάθηκαν {count} ακραίες τιμές στη '{col}' με τη διάμεσο ({median})",
-            'outliers_replaced': "Οι ακραίες τιμές αντικαταστάθηκαν με τη διάμεσο!",
-            'no_outliers_found': "Δεν βρέθηκαν ακραίες τιμές με το τρέχον όριο.",
-            'no_numeric_columns': "Δεν βρέθηκαν αριθμητικές στήλες.",
-            'select_columns_negative': "Επιλέξτε στήλες για διόρθωση αρνητικών τιμών",
-            'how_fix_negative': "Πώς να διορθωθούν οι αρνητικές τιμές",
-            'set_zero': "Ορισμός σε Μηδέν",
-            'set_abs': "Ορισμός σε Απόλυτη Τιμή",
-            'remove_rows': "Αφαίρεση Γραμμών",
-            'set_negative_zero': "Ορίστηκαν {count} αρνητικές τιμές σε μηδέν στη '{col}'",
-            'set_negative_abs': "Μετατράπηκαν {count} αρνητικές τιμές σε απόλυτες στη '{col}'",
-            'removed_negative_rows': "Αφαιρέθηκαν {count} γραμμές με αρνητικές τιμές στη '{col}'",
-            'negative_fixed': "Οι αρνητικές τιμές διορθώθηκαν!",
-            'no_negative_found': "Δεν βρέθηκαν αρνητικές τιμές στις επιλεγμένες στήλες.",
-            'select_columns_cap': "Επιλέξτε στήλες για περιορισμό",
-            'lower_percentile': "Κατώτερο Ποσοστιαίο Όριο",
-            'upper_percentile': "Ανώτερο Ποσοστιαίο Όριο",
-            'cap_values': "Περιορισμός Τιμών",
-            'capped_values': "Περιορίστηκαν τιμές στη '{col}' μεταξύ {lower}ου και {upper}ου ποσοστού",
-            'below_limit': " ({count} τιμές κάτω από το όριο)",
-            'above_limit': " ({count} τιμές πάνω από το όριο)",
-            'values_capped': "Οι τιμές περιορίστηκαν στα καθορισμένα ποσοστιαία όρια!",
-            'no_values_outside': "Δεν βρέθηκαν τιμές εκτός των καθορισμένων ορίων.",
-            'apply_general_error_correction': "Εφαρμογή Γενικής Διόρθωσης Σφαλμάτων",
-            'general_error_applied': "Η γενική διόρθωση σφαλματος εφαρμόστηκε!",
-            'corrected_outliers_action': "Διορθώθηκαν ακραίες τιμές στη στήλη '{column}' με τη διάμεσο {median}",
-            'corrected_outliers_report': "Διορθωμένες ακραίες τιμές στη στήλη '{column}'",
-            'replaced_with_median': "Αντικαταστάθηκε με τη διάμεσο",
-            'errors_corrected': "Σφάλματα διορθώθηκαν στο σύνολο δεδομένων.",
-            'impossible_age': "Η στήλη '{col}' περιέχει αδύνατες τιμές ηλικίας",
-            'impossible_pct': "Η στήλη '{col}' περιέχει ποσοστά εκτός της κλίμακας 0-100",
-            # Column Operations
-            'column_operations': "Ενέργειες Στηλών",
-            'select_operation': "Επιλέξτε ενέργεια",
-            'merge_columns': "Συγχώνευση Στηλών",
-            'split_column': "Διαχωρισμός Στήλης",
-            'select_first_column_merge': "Επιλέξτε την πρώτη στήλη για συγχώνευση",
-            'select_second_column_merge': "Επιλέξτε τη δεύτερη στήλη για συγχώνευση",
-            'enter_new_column_name': "Εισάγετε το όνομα της νέας στήλης",
-            'enter_separator': "Εισάγετε διαχωριστικό (προεπιλογή είναι το κενό)",
-            'merge': "Συγχώνευση",
-            'columns_merged': "Οι στήλες '{col1}' και '{col2}' συγχωνεύθηκαν σε '{new_col}'.",
-            'columns_not_exist': "Μία ή και οι δύο στήλες '{col1}' και '{col2}' δεν υπάρχουν στο DataFrame.",
-            'select_column_split': "Επιλέξτε στήλη για διαχωρισμό",
-            'enter_new_col1_name': "Εισάγετε το όνομα για τη νέα στήλη 1",
-            'enter_new_col2_name': "Εισάγετε το όνομα για τη νέα στήλη 2",
-            'split': "Διαχωρισμός",
-            'column_split': "Η στήλη '{col}' διαχωρίστηκε σε '{new_col1}' και '{new_col2}'.",
-            # Noisy Data
-            'noisy_data_cleaned': "Ο θόρυβος στα δεδομένα αφαιρέθηκε με επιτυχία!",
-            'select_text_columns_to_clean': "Επιλέξτε στήλες κειμένου για καθαρισμό",
-            'remove_noise': "Αφαίρεση Θορύβου",
-            'removed_noise_action': "Αφαιρέθηκε θόρυβος από τις επιλεγμένες στήλες",
-            'please_select_text_column': "Παρακαλώ επιλέξτε τουλάχιστον μία στήλη κειμένου.",
+        # Reshape Data
+        'reshape_data': "Αναδιάταξη Δεδομένων",
+        'select_reshape_operation': "Επιλέξτε λειτουργία αναδιάταξης",
+        'pivot': "Περιστροφή (Pivot)",
+        'melt': "Τήξη (Melt)",
+        'transpose': "Αναστροφή",
+        'select_index_column': "Επιλέξτε στήλη ως δείκτη",
+        'select_columns_column': "Επιλέξτε στήλη για στήλες",
+        'select_values_column': "Επιλέξτε στήλη για τιμές",
+        'pivot_data': "Περιστροφή Δεδομένων",
+        'data_pivoted': "Τα δεδομένα αναδιατάχθηκαν με επιτυχία με περιστροφή!",
+        'select_id_vars': "Επιλέξτε μεταβλητές αναγνώρισης",
+        'select_value_vars': "Επιλέξτε μεταβλητές τιμών",
+        'melt_data': "Τήξη Δεδομένων",
+        'data_melted': "Τα δεδομένα αναδιατάχθηκαν με επιτυχία με τήξη!",
+        'transpose_data': "Αναστροφή Δεδομένων",
+        'data_transposed': "Τα δεδομένα αναστράφηκαν με επιτυχία!",
+        'please_upload_reshape': "Παρακαλώ ανεβάστε ένα αρχείο CSV για αναδιάταξη δεδομένων.",
 
-            # Reshape Data
-            'reshape_data': "Αναδιάταξη Δεδομένων",
-            'select_reshape_operation': "Επιλέξτε λειτουργία αναδιάταξης",
-            'pivot': "Περιστροφή (Pivot)",
-            'melt': "Τήξη (Melt)",
-            'transpose': "Αναστροφή",
-            'select_index_column': "Επιλέξτε στήλη ως δείκτη",
-            'select_columns_column': "Επιλέξτε στήλη για στήλες",
-            'select_values_column': "Επιλέξτε στήλη για τιμές",
-            'pivot_data': "Περιστροφή Δεδομένων",
-            'data_pivoted': "Τα δεδομένα αναδιατάχθηκαν με επιτυχία με περιστροφή!",
-            'select_id_vars': "Επιλέξτε μεταβλητές αναγνώρισης",
-            'select_value_vars': "Επιλέξτε μεταβλητές τιμών",
-            'melt_data': "Τήξη Δεδομένων",
-            'data_melted': "Τα δεδομένα αναδιατάχθηκαν με επιτυχία με τήξη!",
-            'transpose_data': "Αναστροφή Δεδομένων",
-            'data_transposed': "Τα δεδομένα αναστράφηκαν με επιτυχία!",
-            'please_upload_reshape': "Παρακαλώ ανεβάστε ένα αρχείο CSV για αναδιάταξη δεδομένων.",
+        # Type Conversion
+        'converted_to_numeric': "Οι στήλες μετατράπηκαν σε αριθμητικές.",
+        'converted_to_datetime': "Οι στήλες μετατράπηκαν σε ημερομηνία/ώρα.",
+        'converted_to_string': "Οι στήλες μετατράπηκαν σε κείμενο.",
 
-            # Type Conversion
-            'converted_to_numeric': "Οι στήλες μετατράπηκαν σε αριθμητικές.",
-            'converted_to_datetime': "Οι στήλες μετατράπηκαν σε ημερομηνία/ώρα.",
-            'converted_to_string': "Οι στήλες μετατράπηκαν σε κείμενο.",
+        # Unstructured Data
+        'unstructured_data_cleaning': "Καθαρισμός Μη Δομημένων Δεδομένων",
+        'clean_data_btn': "Καθαρισμός Δεδομένων",
+        'data_cleaned_success': "Τα δεδομένα καθαρίστηκαν με επιτυχία!",
+        'download_cleaned_data': "Κατέβασμα καθαρισμένων δεδομένων",
+        'cleaned_unstructured_data_action': "Καθαρίστηκαν μη δομημένα δεδομένα",
+        # File Upload
+        'ingest_options': "Επιλογές Εισαγωγής",
+        'ingest_mode': "Τρόπος εισαγωγής",
+        'ingest_mode_tooltip': "Η τυπική ανάγνωση επεξεργάζεται το αρχείο σε ένα πέρασμα. Η παράλληλη χρησιμοποιεί όλους τους πυρήνες της CPU. Η ροή διαβάζει το αρχείο σε τμήματα γραμμών με συμπαγείς τύπους στηλών για χαμηλή χρήση μνήμης σε μεγάλα αρχεία.",
+        'standard_ingest': "Τυπική",
+        'parallel_ingest': "Παράλληλη (όλοι οι πυρήνες)",
+        'streaming_ingest': "Ροή (χαμηλή μνήμη)",
+        'chunk_rows': "Γραμμές ανά τμήμα",
+        'reading_file_progress': "Ανάγνωση αρχείου... {percent}%",
+        'optimize_memory': "Βελτιστοποίηση χρήσης μνήμης",
+        'optimize_memory_tooltip': "Αποθήκευση των στηλών στους μικρότερους τύπους χωρίς απώλεια: στενότεροι αριθμοί, κατηγορίες για επαναλαμβανόμενο κείμενο και ακέραιοι και λογικοί τύποι με κενές τιμές.",
+        'columns_to_load': "Στήλες προς φόρτωση",
+        'columns_to_load_tooltip': "Διαβάζονται από το αρχείο μόνο οι επιλεγμένες στήλες.",
+        'row_filter_column': "Φιλτράρισμα γραμμών κατά στήλη",
+        'no_row_filter': "(χωρίς φίλτρο)",
+        'row_filter_operator': "Τελεστής",
+        'row_filter_value': "Τιμή",
+        # Cleaning recipes
+        'cleaning_recipe': "Συνταγή Καθαρισμού",
+        'recipe_summary': "Καταγράφηκαν {count} επαναλήψιμα βήματα. Κατεβάστε τη συνταγή για να τα εφαρμόσετε σε άλλα αρχεία εδώ ή με την εντολή `python src/batch_clean.py`.",
+        'download_recipe': "Λήψη Συνταγής (JSON)",
+        'upload_recipe': "Εφαρμογή αποθηκευμένης συνταγής στα τρέχοντα δεδομένα",
+        'apply_recipe': "Εφαρμογή Συνταγής",
+        'applied_recipe_step_action': "Εφαρμόστηκε το βήμα συνταγής {step}: {operation}",
+        'recipe_applied': "Εφαρμόστηκαν {count} βήματα συνταγής.",
+        'recipe_error': "Δεν ήταν δυνατή η εφαρμογή της συνταγής: {error}",
+        # Navigation
+        'section': "Ενότητα",
+        # Approximate statistics
+        'approximate_statistics': "Προσεγγιστικά στατιστικά (sketches)",
+        'approximate_statistics_help': "Εκτίμηση των στατιστικών ανά τμήμα με συγχωνεύσιμα sketches αντί για ακριβείς σαρώσεις και ταξινομήσεις. Ταχύτερη και ελαφρύτερη για πολύ μεγάλα δεδομένα.",
+        'approximate_errors': "Τα στατιστικά είναι εκτιμήσεις. Όρια σφάλματος ανά στήλη:",
+        'error_unique': "Μοναδικές τιμές (± % τυπικό σφάλμα)",
+        'error_freq': "Μέγιστη συχνότητα (μέγ. υποεκτίμηση)",
+        'error_quantile': "Τεταρτημόρια (± % γραμμών στη θέση)",
+        'approximate_quantiles': "Χρήση προσεγγιστικών ποσοστημορίων (ταχύτερα σε μεγάλα δεδομένα)",
+        # Data viewer
+        'browse_all_rows': "Περιήγηση σε όλες τις γραμμές (αναζήτηση, ταξινόμηση, φίλτρο)",
+        'preview_rows': "Εμφανίζονται οι πρώτες {count} από {total} γραμμές.",
+        'search_rows': "Αναζήτηση",
+        'sort_by': "Ταξινόμηση κατά",
+        'no_sorting': "(χωρίς ταξινόμηση)",
+        'sort_descending': "Φθίνουσα",
+        'page_size': "Γραμμές ανά σελίδα",
+        'filter_column': "Στήλη φίλτρου",
+        'no_filter': "(χωρίς φίλτρο)",
+        'filter_min': "Ελάχιστο",
+        'filter_max': "Μέγιστο",
+        'filter_values': "Διατήρηση τιμών",
+        'page': "Σελίδα",
+        'rows_range': "Γραμμές {start}–{end} από {matched} που ταιριάζουν ({total} συνολικά), σελίδα {page} από {pages}.",
+        # Entity resolution
+        'resolve_entities': "Ταυτοποίηση οντοτήτων σε πολλές στήλες",
+        'select_columns_entities': "Επιλέξτε τις στήλες που ταυτοποιούν μια οντότητα",
+        'comparison_method': "Σύγκριση για '{col}'",
+        'comparison_weight': "Βάρος της '{col}'",
+        'comparator_fuzzy': "Ασαφές κείμενο",
+        'comparator_exact': "Ακριβής",
+        'comparator_numeric': "Αριθμητική",
+        'match_threshold': "Ελάχιστη σταθμισμένη ομοιότητα αντιστοίχισης",
+        'survivor_rule': "Γραμμή που διατηρείται σε κάθε ομάδα",
+        'survivor_most_complete': "Η πιο πλήρης",
+        'survivor_most_recent': "Η πιο πρόσφατη",
+        'survivor_first': "Η πρώτη",
+        'recency_column': "Στήλη ημερομηνίας για την πιο πρόσφατη γραμμή",
+        'keep_all_add_cluster': "Διατήρηση όλων των γραμμών και προσθήκη στήλης 'cluster_id'",
+        'resolve_entities_button': "Ταυτοποίηση οντοτήτων",
+        'resolved_entities': "Βρέθηκαν {clusters} ομάδες με {rows} γραμμές· αφαιρέθηκαν {removed} γραμμές.",
+        # Hash-based deduplication
+        'select_key_columns': "Στήλες κλειδιά (αφήστε κενό για σύγκριση ολόκληρων γραμμών)",
+        'remove_seen_rows': "Αφαίρεση γραμμών που εμφανίστηκαν σε προηγούμενα αρχεία",
+        'upload_hash_set': "Σύνολο κατακερματισμών προηγούμενων αρχείων (.npy, προαιρετικό)",
+        'hash_size': "Μέγεθος κατακερματισμού σε bit",
+        'remove_seen_rows_button': "Αφαίρεση γραμμών που εμφανίστηκαν",
+        'removed_seen_rows': "Αφαιρέθηκαν {count} γραμμές, {seen} από αυτές εμφανίστηκαν σε προηγούμενα αρχεία.",
+        'download_hash_set': "Λήψη του ενημερωμένου συνόλου κατακερματισμών ({count} γραμμές)",
+        # Date parsing
+        'dates_day_first': "Η ημέρα πριν από τον μήνα στις αμφίσημες ημερομηνίες",
+        'dates_day_first_tooltip': "Οι ημερομηνίες όπως 03/04/2024 διαβάζονται ως 3 Απριλίου αντί για 4 Μαρτίου. Οι μορφές συνάγονται από τη στήλη· αυτό αποφασίζει μόνο τις ισοπαλίες.",
+        'failed_rows': "{count} τιμές της '{column}' δεν μπόρεσαν να μετατραπούν και λείπουν πλέον. Οι πρώτες από αυτές:",
+        # Phone numbers
+        'default_phone_region': "Περιοχή των αριθμών χωρίς κωδικό χώρας",
+        'default_phone_region_tooltip': "Οι αριθμοί γράφονται σε μορφή E.164 (+<κωδικός χώρας><αριθμός>)· οι αριθμοί χωρίς + ή 00 θεωρούνται από αυτή την περιοχή.",
+        'add_phone_valid_column': "Προσθήκη στήλης που σημειώνει τους έγκυρους αριθμούς",
+        'invalid_phone_rows': "{count} τιμές της '{column}' δεν είναι έγκυροι αριθμοί τηλεφώνου και έμειναν ως είχαν. Οι πρώτες από αυτές:",
+        # Number parsing
+        'decimal_separator': "Διαχωριστικό δεκαδικών",
+        'decimal_separator_tooltip': "Το άλλο διαχωριστικό θεωρείται διαχωριστικό χιλιάδων. Κατά την αυτόματη ανίχνευση αποφασίζουν τιμές όπως 1.234,56 ή 12,5.",
+        'detect_automatically': "Αυτόματη ανίχνευση",
+        # Synonym dictionaries
+        'upload_synonyms': "Λεξικό συνωνύμων (προαιρετικό)",
+        'upload_synonyms_tooltip': "Ένα αντικείμενο JSON με τις τυπικές τιμές και τις λίστες των παραλλαγών τους, ή ένα αρχείο CSV με γραμμή επικεφαλίδας και δύο στήλες: την παραλλαγή και την τυπική της τιμή. Χωρίς λεξικό, τυποποιούνται οι συνήθεις γραφές τιμών φύλου.",
+        'values_mapped': "{count} διακριτές τιμές αντιστοιχίστηκαν σε τυπική τιμή.",
+        # Value clustering
+        'cluster_values': "Ομαδοποίηση Παρόμοιων Τιμών",
+        'cluster_method': "Μέθοδος κλειδιού",
+        'cluster_method_fingerprint': "Αποτύπωμα (πεζά/κεφαλαία, τόνοι, στίξη και σειρά λέξεων)",
+        'cluster_method_ngram': "N-γράμματα χαρακτήρων (και λέξεις γραμμένες μαζί)",
+        'cluster_method_phonetic': "Φωνητική (Soundex, γραφές που ακούγονται ίδιες)",
+        'ngram_size': "Μέγεθος n-γράμματος",
+        'find_clusters': "Εύρεση Ομάδων",
+        'no_clusters_found': "Δεν βρέθηκαν ομάδες σχεδόν διπλότυπων τιμών.",
+        'clusters_found': "{clusters} ομάδες που καλύπτουν {values} διακριτές τιμές. Αποεπιλέξτε μια ομάδα για να μείνει ως έχει.",
+        'showing_first_clusters': "Εμφανίζονται οι {count} ομάδες με τις περισσότερες γραμμές· συγχωνεύστε τις και αναζητήστε ξανά για τις υπόλοιπες.",
+        'cluster_key': "Κλειδί: {key}",
+        'canonical_value': "Συγχώνευση σε",
+        'merge_clusters_button': "Συγχώνευση Επιλεγμένων Ομάδων",
+        'merged_clusters': "Συγχωνεύτηκαν {clusters} ομάδες στη στήλη '{column}', αλλάζοντας {rows} γραμμές.",
+        # Outlier engine
+        'outlier_method': "Μέθοδος ακραίων τιμών",
+        'outlier_method_zscore': "Z-score (απόσταση από τη μέση τιμή)",
+        'outlier_method_mad': "MAD (ανθεκτική απόσταση από τη διάμεσο)",
+        'outlier_method_iqr': "IQR (φράχτες του Tukey)",
+        'outlier_threshold_mad': "Όριο τροποποιημένου z-score (κλιμακωμένες MAD από τη διάμεσο)",
+        'outlier_threshold_iqr': "Πολλαπλασιαστής IQR (πέρα από τα τεταρτημόρια)",
+        'outlier_replacement': "Αντικατάσταση ακραίων τιμών με",
+        'outlier_replacement_median': "Διάμεσο της στήλης",
+        'outlier_replacement_clip': "Πλησιέστερο όριο (περιορισμός)",
+        'outlier_replacement_nan': "Κενή τιμή",
+        'outlier_column': "Στήλη",
+        'outlier_count': "Ακραίες τιμές",
+        'outlier_lower': "Κάτω όριο",
+        'outlier_upper': "Άνω όριο",
+        'outlier_median': "Διάμεσος",
+        'replaced_outliers_clip_action': "Περιορίστηκαν {count} ακραίες τιμές στη '{col}' στο [{lower:.4g}, {upper:.4g}]",
+        'replaced_outliers_nan_action': "Ορίστηκαν ως κενές {count} ακραίες τιμές στη '{col}'",
+        # Multivariate anomaly detection
+        'detect_anomalies': "Εντοπισμός Πολυμεταβλητών Ανωμαλιών",
+        'select_columns_anomalies': "Επιλέξτε τις στήλες στις οποίες συγκρίνονται οι γραμμές",
+        'anomaly_method': "Μέθοδος εντοπισμού",
+        'anomaly_method_isolation_forest': "Δάσος απομόνωσης (Isolation forest)",
+        'anomaly_method_lof': "Τοπικός Παράγοντας Ακραίας Τιμής (LOF)",
+        'anomaly_contamination': "Αναμενόμενο ποσοστό ανωμαλιών",
+        'anomaly_sample_size': "Γραμμές εκπαίδευσης του μοντέλου",
+        'anomaly_action': "Τι να γίνει με τις ανώμαλες γραμμές",
+        'anomaly_action_flag': "Σήμανση σε στήλη",
+        'anomaly_action_quarantine': "Απομόνωση (αφαίρεση)",
+        'anomaly_flag_column': "Όνομα στήλης σήμανσης",
+        'anomaly_keep_scores': "Διατήρηση και της βαθμολογίας ανωμαλίας κάθε γραμμής",
+        'detect_anomalies_button': "Εντοπισμός Ανωμαλιών",
+        'scoring_rows_progress': "Βαθμολόγηση γραμμών... {percent}%",
+        'sklearn_missing': "Ο εντοπισμός ανωμαλιών απαιτεί το scikit-learn. Εγκαταστήστε το με 'pip install scikit-learn'.",
+        'flagged_anomalies_action': "Σημειώθηκαν {count} ανώμαλες γραμμές στη στήλη '{col}'",
+        'quarantined_anomalies_action': "Απομονώθηκαν {count} ανώμαλες γραμμές",
+        'anomalies_found': "Βρέθηκαν {count} ανώμαλες γραμμές.",
+        'no_anomalies_found': "Δεν βρέθηκαν ανώμαλες γραμμές.",
+        'download_quarantined': "Λήψη των {count} απομονωμένων γραμμών",
+        # Rule validation
+        'validate_with_rules': "Έλεγχος με αρχείο κανόνων",
+        'upload_rules': "Ανεβάστε αρχείο κανόνων (JSON)",
+        'upload_rules_tooltip': "Μια λίστα κανόνων όπως {\"type\": \"range\", \"column\": \"age\", \"min\": 0, \"max\": 120}, {\"type\": \"regex\", \"column\": \"zip\", \"pattern\": \"[0-9]{5}\"}, {\"type\": \"allowed\", \"column\": \"status\", \"values\": [\"open\", \"closed\"]} ή {\"type\": \"expression\", \"expression\": \"end_date >= start_date\"}.",
+        'rule_action': "Γραμμές που παραβιάζουν κάποιον κανόνα",
+        'rule_action_report': "Μόνο αναφορά",
+        'rule_action_flag': "Σήμανση με τον αριθμό παραβιάσεων",
+        'rule_action_remove': "Αφαίρεση",
+        'check_rules': "Έλεγχος Κανόνων",
+        'rule_rule': "Κανόνας",
+        'rule_type': "Τύπος",
+        'rule_column': "Στήλη",
+        'rule_count': "Παραβιάσεις",
+        'rule_rows': "Πρώτες γραμμές",
+        'no_rule_violations': "Όλες οι γραμμές ικανοποιούν όλους τους κανόνες.",
+        'rule_violations_found': "{count} γραμμές παραβιάζουν τουλάχιστον έναν από τους {rules} κανόνες.",
+        'flagged_rule_violations_action': "Σημειώθηκαν {count} γραμμές που παραβιάζουν κανόνες ελέγχου",
+        'removed_rule_violations_action': "Αφαιρέθηκαν {count} γραμμές που παραβιάζουν κανόνες ελέγχου",
+        # Group-wise error correction
+        'group_by_columns': "Ομαδοποίηση κατά (προαιρετικό)",
+        'group_by_tooltip': "Υπολογισμός των στατιστικών μέσα σε κάθε ομάδα γραμμών, π.χ. σύγκριση μισθών με τους άλλους μισθούς της ίδιας χώρας.",
+        'outlier_groups': "Ομάδες με ακραίες τιμές",
+        'replaced_outliers_grouped_action': "Αντικαταστάθηκαν {count} ακραίες τιμές στη στήλη '{col}' σε {groups} ομάδες κατά {group_by}",
+        'within_groups': " μέσα στις ομάδες κατά {group_by}",
+        # Keyword extraction
+        'upload_keywords': "Ή ανεβάστε μια λίστα λέξεων-κλειδιών",
+        'upload_keywords_tooltip': "Ένα αρχείο κειμένου με μία λέξη-κλειδί ανά γραμμή, που προστίθενται σε όσες πληκτρολογήσατε παραπάνω.",
+        'match_whole_words': "Μόνο ολόκληρες λέξεις",
+        'match_case': "Διάκριση πεζών-κεφαλαίων",
+        'keyword_output': "Έξοδος",
+        'keyword_output_list': "Μία στήλη με τις λέξεις-κλειδιά που βρέθηκαν",
+        'keyword_output_multi_hot': "Μία στήλη Αληθές/Ψευδές ανά λέξη-κλειδί",
+        'use_all_cores': "Χρήση όλων των πυρήνων CPU",
+        'extracted_keyword_columns_action': "Προστέθηκε μία στήλη Αληθές/Ψευδές για καθεμία από τις {count} λέξεις-κλειδιά που αναζητήθηκαν στη στήλη '{col}'",
+        'rows_with_keywords': "{count} γραμμές περιέχουν τουλάχιστον μία λέξη-κλειδί.",
 
-            # Unstructured Data
-            'unstructured_data_cleaning': "Καθαρισμός Μη Δομημένων Δεδομένων",
-            'clean_data_btn': "Καθαρισμός Δεδομένων",
-            'data_cleaned_success': "Τα δεδομένα καθαρίστηκαν με επιτυχία!",
-            'download_cleaned_data': "Κατέβασμα καθαρισμένων δεδομένων",
-            'cleaned_unstructured_data_action': "Καθαρίστηκαν μη δομημένα δεδομένα",
-
-            # New app UI labels
-            'app_description': "Ένα ολοκληρωμένο εργαλείο για καθαρισμό και προεπεξεργασία των δεδομένων σας για ανάλυση",
-            'upload': "Ανέβασμα Δεδομένων",
-            'choose_file': "Επιλέξτε ένα αρχείο CSV",
-            'reset': "Επαναφορά Δεδομένων",
-            'reset_tooltip': "Επαναφορά στα αρχικά δεδομένα",
-            'reset_success': "Τα δεδομένα έχουν επαναφερθεί στην αρχική κατάσταση",
-            'success_loaded': "Επιτυχής φόρτωση του {filename}",
-            'error': "Σφάλμα: {error}",
-            'download': "Κατέβασμα Καθαρισμένων Δεδομένων",
-            'download_csv': "Κατέβασμα ως CSV",
-            'file_info': "Πληροφορίες Αρχείου",
-            'filename': "Όνομα αρχείου",
-            'dimensions': "Διαστάσεις",
-            'rows': "γραμμές",
-            'columns': "στήλες",
-            'export_options': "Επιλογές Εξαγωγής",
-            'welcome': "Καλώς ήρθατε στο Data Cleaner",
-            'upload_instruction': "Ανεβάστε ένα αρχείο CSV για να ξεκινήσετε τον καθαρισμό δεδομένων",
-            'app_features': "Χαρακτηριστικά",
-            'feature_overview': "Ανάλυση σχήματος δεδομένων, τύπων και στατιστικών στοιχείων",
-            'feature_missing': "Διαχείριση ελλιπών δεδομένων με διάφορες στρατηγικές",
-            'feature_duplicates': "Αφαίρεση ακριβών και ασαφών διπλοτύπων",
-            'feature_format': "Τυποποίηση μορφών ημερομηνίας, νομίσματος και τηλεφωνικών αριθμών",
-            'feature_more': "Και πολλά άλλα!",
-            'getting_started': "Ξεκινώντας",
-            'getting_started_text': "Ανεβάστε ένα αρχείο CSV από την πλαϊνή μπάρα και στη συνέχεια χρησιμοποιήστε τις καρτέλες για να καθαρίσετε τα δεδομένα σας με διάφορους τρόπους. Το ιστορικό καθαρισμού σας θα καταγραφεί.",
-            'standardize': "Τυποποίηση"
-        }
+        # New app UI labels
+        'app_description': "Ένα ολοκληρωμένο εργαλείο για καθαρισμό και προεπεξεργασία των δεδομένων σας για ανάλυση",
+        'upload': "Ανέβασμα Δεδομένων",
+        'choose_file': "Επιλέξτε ένα αρχείο CSV, Parquet, Feather ή Arrow",
+        'reset': "Επαναφορά Δεδομένων",
+        'reset_tooltip': "Επαναφορά στα αρχικά δεδομένα",
+        'reset_success': "Τα δεδομένα έχουν επαναφερθεί στην αρχική κατάσταση",
+        'undo': "Αναίρεση",
+        'undo_tooltip': "Αναίρεση του τελευταίου βήματος καθαρισμού",
+        'redo': "Επανάληψη",
+        'redo_tooltip': "Επανάληψη του τελευταίου βήματος που αναιρέθηκε",
+        'go_to_step': "Μετάβαση σε βήμα",
+        'go_to_step_btn': "Επαναφορά σε αυτό το βήμα",
+        'original_data_step': "0. Αρχικά δεδομένα",
+        'versions_memory': "{count} εκδόσεις αποθηκευμένες σε {size:.2f} MB (οι αμετάβλητες στήλες είναι κοινές)",
+        'converted_to_numeric_action': "Οι στήλες {columns} μετατράπηκαν σε αριθμητικές",
+        'converted_to_datetime_action': "Οι στήλες {columns} μετατράπηκαν σε ημερομηνία/ώρα",
+        'converted_to_string_action': "Οι στήλες {columns} μετατράπηκαν σε κείμενο",
+        'success_loaded': "Επιτυχής φόρτωση του {filename}",
+        'error': "Σφάλμα: {error}",
+        'download': "Κατέβασμα Καθαρισμένων Δεδομένων",
+        'download_csv': "Κατέβασμα ως CSV",
+        'download_parquet': "Κατέβασμα ως Parquet",
+        'file_info': "Πληροφορίες Αρχείου",
+        'filename': "Όνομα αρχείου",
+        'dimensions': "Διαστάσεις",
+        'rows': "γραμμές",
+        'columns': "στήλες",
+        'export_options': "Επιλογές Εξαγωγής",
+        'welcome': "Καλώς ήρθατε στο Data Cleaner",
+        'upload_instruction': "Ανεβάστε ένα αρχείο CSV για να ξεκινήσετε τον καθαρισμό δεδομένων",
+        'app_features': "Χαρακτηριστικά",
+        'feature_overview': "Ανάλυση σχήματος δεδομένων, τύπων και στατιστικών στοιχείων",
+        'feature_missing': "Διαχείριση ελλιπών δεδομένων με διάφορες στρατηγικές",
+        'feature_duplicates': "Αφαίρεση ακριβών και ασαφών διπλοτύπων",
+        'feature_format': "Τυποποίηση μορφών ημερομηνίας, νομίσματος και τηλεφωνικών αριθμών",
+        'feature_more': "Και πολλά άλλα!",
+        'getting_started': "Ξεκινώντας",
+        'getting_started_text': "Ανεβάστε ένα αρχείο CSV από την πλαϊνή μπάρα και στη συνέχεια χρησιμοποιήστε τις καρτέλες για να καθαρίσετε τα δεδομένα σας με διάφορους τρόπους. Το ιστορικό καθαρισμού σας θα καταγραφεί.",
+        'standardize': "Τυποποίηση"
     }
+}
 
+def current_language():
+    """Return the language selected in the app, or 'en' outside a Streamlit session."""
     try:
-        lang = st.session_state.get('language', 'en')
+        import streamlit as st
+        return st.session_state.get('language', 'en')
     except Exception:
-        lang = 'en'
-    
-    return labels.get(lang, labels['en']).get(label_key, label_key)
+        return 'en'
+
+def get_label(label_key, lang=None):
+    """Return the text of a label in lang, defaulting to the language selected in the app."""
+    if lang is None:
+        lang = current_language()
+    return LABELS.get(lang, LABELS['en']).get(label_key, label_key)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_bool_dtype, is_float_dtype, is_integer_dtype
+
+# Pre-check if pyarrow is available for Arrow-backed strings
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRINGS_AVAILABLE = True
+except ImportError:
+    ARROW_STRINGS_AVAILABLE = False
+
+_SIGNED_INTS = [np.int8, np.int16, np.int32, np.int64]
+_NULLABLE_INTS = ['Int8', 'Int16', 'Int32', 'Int64']
+
+def _smallest_int(min_value, max_value, candidates):
+    """Return the first candidate integer dtype whose range holds min_value and max_value, or None."""
+    for candidate, limits in zip(candidates, _SIGNED_INTS):
+        info = np.iinfo(limits)
+        if info.min <= min_value and max_value <= info.max:
+            return candidate
+    return None
+
+def optimized_dtype(series: pd.Series, category_threshold: float = 0.5):
+    """
+    Chooses the most compact dtype that holds every value of a column without loss.
+
+    - Integers are narrowed to the smallest signed width that fits their range.
+    - Floats holding only whole numbers and NaN become nullable integers; other floats
+      become float32 when every value round-trips exactly.
+    - Object columns of booleans and missing values become the nullable boolean dtype.
+    - Text columns whose share of distinct values is at most category_threshold become
+      categoricals, other text columns Arrow-backed strings when pyarrow is installed.
+
+    Args:
+        series (pd.Series): The column to inspect.
+        category_threshold (float, optional): Maximum distinct/non-null ratio for a categorical.
+
+    Returns:
+        The dtype to convert the column to, or None if it should be kept as is.
+    """
+    if is_bool_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype):
+        return None
+
+    values = series.dropna()
+    if values.empty:
+        return None
+
+    if is_integer_dtype(series.dtype):
+        nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+        target = _smallest_int(values.min(), values.max(), _NULLABLE_INTS if nullable else _SIGNED_INTS)
+        return None if target is None or pd.api.types.pandas_dtype(target) == series.dtype else target
+
+    if is_float_dtype(series.dtype):
+        array = values.to_numpy(dtype=np.float64)
+        if np.all(np.isfinite(array)) and np.all(np.mod(array, 1) == 0):
+            return _smallest_int(array.min(), array.max(), _NULLABLE_INTS)
+        if series.dtype == np.float64 and np.array_equal(array.astype(np.float32).astype(np.float64), array):
+            return np.float32
+        return None
+
+    if series.dtype == object:
+        kind = infer_dtype(values, skipna=False)
+        if kind == 'boolean':
+            return 'boolean'
+        if kind != 'string':
+            return None
+        if values.nunique() / len(values) <= category_threshold:
+            return 'category'
+        if ARROW_STRINGS_AVAILABLE:
+            return 'string[pyarrow]'
+    return None
+
+def optimize_dtypes(df: pd.DataFrame, category_threshold: float = 0.5):
+    """
+    Converts every column of a DataFrame to its most compact lossless dtype.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to optimize. It is not modified.
+        category_threshold (float, optional): Maximum distinct/non-null ratio for a categorical.
+
+    Returns:
+        tuple: The optimized DataFrame and a report DataFrame with one row per column
+               giving the dtype and memory usage (bytes) before and after.
+    """
+    memory_before = df.memory_usage(deep=True, index=False)
+    conversions = {}
+    for column in df.columns:
+        target = optimized_dtype(df[column], category_threshold)
+        if target is not None:
+            conversions[column] = target
+
+    optimized = df.astype(conversions) if conversions else df.copy()
+    memory_after = optimized.memory_usage(deep=True, index=False)
+
+    report = pd.DataFrame({
+        "column": df.columns,
+        "dtype_before": [str(dtype) for dtype in df.dtypes],
+        "dtype_after": [str(dtype) for dtype in optimized.dtypes],
+        "memory_before": memory_before.to_numpy(),
+        "memory_after": memory_after.to_numpy(),
+    })
+    return optimized, report
@@ -0,0 +1,126 @@
+"""
+Parsing of numbers and amounts written for people rather than for programs.
+
+Handles thousands separators (1,234.56 or 1.234,56, and spaces or apostrophes), currency
+symbols and ISO codes (€ 12, 12 EUR, USD 12), percentages, parenthesized accounting
+negatives ((1,200.00)) and trailing minus signs (1200-). The decimal separator of a column
+is inferred from a sample of its values when not given; values whose separators do not
+fit it (1.234,56 in a column of 1,234.56) are failures, not numbers read the wrong way.
+
+The text is cleaned with vectorized Arrow string operations over the distinct values of
+the column (pd.factorize) and converted with pd.to_numeric(), so each distinct string is
+handled once, and the values that are not numbers are reported rather than silently
+turned into NaN.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+try:
+    import pyarrow  # noqa: F401  (string[pyarrow] runs the string operations in Arrow)
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string[python]'
+
+DECIMAL_SEPARATORS = ('.', ',')
+# Written for RE2, which Arrow runs without a Python call per value: no lookarounds and
+# inline flags only
+_CURRENCY = (r'(?i)[$€£¥₹₽₩₺₪₴₫฿₦₱]|Kč|zł|лв|\b(?:USD|EUR|GBP|JPY|CHF|CAD|AUD|NZD|CNY|HKD|SGD|SEK|NOK|DKK|PLN|CZK|'
+             r'HUF|RON|BGN|TRY|RUB|INR|BRL|MXN|ZAR|ILS|AED|KRW|kr|Fr|Rs|lei)\b')
+# A comma followed by one, two or more than three digits at the end is a decimal comma
+# (1.234,5 or 12,75); a dot the same way is a decimal point
+_DECIMAL_COMMA = r'\d,(?:\d{1,2}|\d{4,})$|\d\.\d{3}(?:\.\d{3})*,\d+$'
+_DECIMAL_POINT = r'\d\.(?:\d{1,2}|\d{4,})$|\d,\d{3}(?:,\d{3})*\.\d+$'
+
+def _clean(strings: pd.Series) -> pd.Series:
+    """Remove currencies and whitespace from the strings."""
+    strings = strings.str.replace(_CURRENCY, '', regex=True)
+    # Whitespace of any kind, including the no-break spaces used as thousands separators
+    return strings.str.replace(r'\s+', '', regex=True).str.replace('−', '-', regex=False)
+
+def infer_decimal_separator(strings, sample_size: int = 1_000, default: str = '.', seed: int = 0) -> str:
+    """
+    Infers the decimal separator of numbers written as text from a sample of them.
+
+    Values such as 1,234 or 1.234 could use either separator and are not counted;
+    default is returned when no value of the sample decides.
+
+    Args:
+        strings (list): Distinct strings.
+        sample_size (int, optional): Number of strings the separator is inferred from.
+        default (str, optional): The separator returned when the sample does not decide.
+        seed (int, optional): Seed of the random sample.
+
+    Returns:
+        str: '.' or ','.
+    """
+    strings = np.asarray(strings, dtype=object)
+    if len(strings) > sample_size:
+        strings = np.random.default_rng(seed).choice(strings, sample_size, replace=False)
+    sample = _clean(pd.Series(strings, dtype=_STRING_DTYPE)).str.rstrip('%)-')
+    commas = int(sample.str.contains(_DECIMAL_COMMA, regex=True).sum())
+    points = int(sample.str.contains(_DECIMAL_POINT, regex=True).sum())
+    if commas == points:
+        return default
+    return ',' if commas > points else '.'
+
+def parse_numbers(values, decimal: str = None, sample_size: int = 1_000) -> tuple:
+    """
+    Parses a column of numbers written as text.
+
+    Args:
+        values (pd.Series): The values. Numeric columns are returned as they are.
+        decimal (str, optional): The decimal separator, '.' or ','; the other one (and
+                                 spaces and apostrophes) separates thousands. Inferred
+                                 from a sample of the distinct values when not given.
+        sample_size (int, optional): Number of distinct values the separator is inferred from.
+
+    Returns:
+        tuple: The numbers as a Series aligned with values (int64 when they are all whole
+               numbers and none is missing, float64 otherwise), a boolean array marking the
+               rows with a value that is not a number (missing values and empty strings
+               are not failures), and the decimal separator used.
+    """
+    series = pd.Series(values)
+    if is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+        return series, np.zeros(len(series), dtype=bool), decimal or '.'
+    if decimal is not None and decimal not in DECIMAL_SEPARATORS:
+        raise ValueError(f"Invalid decimal separator. Choose one of {', '.join(DECIMAL_SEPARATORS)}.")
+
+    codes, uniques = pd.factorize(series)
+    strings = _clean(pd.Series(pd.Index(uniques, dtype=object).astype(str), dtype=_STRING_DTYPE))
+    present = (strings != '').to_numpy(dtype=bool)
+    if decimal is None:
+        decimal = infer_decimal_separator(uniques[present], sample_size)
+
+    # Accounting negatives in parentheses and trailing minus signs
+    parenthesized = strings.str.startswith('(') & strings.str.endswith(')')
+    trailing_minus = strings.str.endswith('-') & ~strings.str.startswith('-')
+    percent = strings.str.endswith('%')
+    strings = strings.str.strip('()%').str.rstrip('-').str.replace("'", '', regex=False)
+    thousands = ',' if decimal == '.' else '.'
+    # Written with the other convention (1.234,56 when '.' is the decimal separator): a
+    # second decimal separator, or a thousands separator after the decimal one
+    after_decimal = r'\..*[.,]' if decimal == '.' else r',.*[.,]'
+    misfit = strings.str.contains(after_decimal, regex=True).to_numpy(dtype=bool, na_value=False)
+    strings = strings.str.replace(thousands, '', regex=False)
+    if decimal == ',':
+        strings = strings.str.replace(',', '.', regex=False)
+
+    numbers = pd.to_numeric(strings.to_numpy(dtype=object, na_value=None), errors='coerce')
+    negative = (parenthesized | trailing_minus).to_numpy(dtype=bool)
+    if negative.any():
+        numbers = np.where(negative, -numbers, numbers)
+    if percent.any():
+        numbers = np.where(percent.to_numpy(dtype=bool), numbers / 100, numbers)
+    if misfit.any():
+        numbers = np.where(misfit, np.nan, numbers)
+    unparsed = np.isnan(numbers.astype(np.float64)) & present
+
+    # Missing values have the code -1, which picks the value appended at the end
+    if (codes < 0).any() or unparsed.any():
+        numbers = np.append(numbers.astype(np.float64), np.nan)
+    else:
+        numbers = np.append(numbers, numbers[:1])
+    parsed = pd.Series(numbers[codes], index=series.index, name=series.name)
+    return parsed, np.append(unparsed, False)[codes], decimal
@@ -0,0 +1,246 @@
+"""
+Outlier detection and replacement over many numeric columns at once.
+
+The selected columns are stacked into one 2-D float array (in blocks of columns when the
+frame is large) and the statistics of every column come out of a single NaN-aware NumPy
+reduction along the rows, so missing values are ignored instead of making a column be
+skipped. Three estimators are supported:
+
+- zscore: values more than threshold standard deviations from the mean;
+- mad: values more than threshold scaled median absolute deviations from the median
+  (the modified z-score, robust to the outliers themselves);
+- iqr: values more than threshold interquartile ranges below the first or above the third
+  quartile (Tukey's fences).
+
+Only the columns that have outliers are written back, each once.
+
+With group_by, the statistics are those of each row's group (e.g. salaries judged within
+their country): they come from groupby transforms and one groupby quantile over all the
+columns of a block, broadcast back to the rows, so the cost does not grow with the number
+of groups.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from utils.sketches import quantile_sketch
+
+OUTLIER_METHODS = ('zscore', 'mad', 'iqr')
+REPLACEMENTS = ('median', 'clip', 'nan')
+DEFAULT_THRESHOLDS = {'zscore': 3.0, 'mad': 3.5, 'iqr': 1.5}
+# Scales the median absolute deviation to the standard deviation of normal data
+MAD_SCALE = 1.4826
+# Largest number of cells stacked into one array
+BLOCK_CELLS = 50_000_000
+
+def _check(method, replacement):
+    if method not in OUTLIER_METHODS:
+        raise ValueError(f"Invalid outlier method. Choose one of {', '.join(OUTLIER_METHODS)}.")
+    if replacement not in REPLACEMENTS:
+        raise ValueError(f"Invalid replacement. Choose one of {', '.join(REPLACEMENTS)}.")
+
+def _sketch_quartiles(frame, columns, sketches):
+    """First quartile, median and third quartile of columns estimated with quantile sketches, as a (3, columns) array."""
+    return np.column_stack([(sketches.get(col) or quantile_sketch(frame[col])).quantiles([0.25, 0.5, 0.75])
+                            for col in columns])
+
+def _stack(df, columns) -> np.ndarray:
+    """Columns of df as one float array in column-major order, so that each column is contiguous."""
+    values = np.empty((len(df), len(columns)), dtype=np.float64, order='F')
+    for j, col in enumerate(columns):
+        values[:, j] = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return values
+
+def _mean_std(values: np.ndarray) -> tuple:
+    """Means and sample standard deviations of the columns of values, ignoring NaNs."""
+    missing = np.isnan(values)
+    counts = len(values) - missing.sum(axis=0)
+    deviations = np.where(missing, 0, values)
+    mean = deviations.sum(axis=0) / counts
+    deviations -= mean
+    deviations[missing] = 0
+    return mean, np.sqrt(np.einsum('ij,ij->j', deviations, deviations) / (counts - 1))
+
+def outlier_bounds(values: np.ndarray, method: str = 'zscore', threshold: float = None, quartiles=None) -> tuple:
+    """
+    Computes the outlier bounds of every column of a 2-D array, ignoring NaNs.
+
+    Args:
+        values (np.ndarray): Float array of shape (rows, columns).
+        method (str, optional): One of OUTLIER_METHODS.
+        threshold (float, optional): Defaults to DEFAULT_THRESHOLDS[method].
+        quartiles (np.ndarray, optional): Estimated first quartiles, medians and third
+                                          quartiles, shape (3, columns), used instead of
+                                          computing them exactly.
+
+    Returns:
+        tuple: The lower bounds, upper bounds and medians, one per column; the medians are
+               None when the method did not need them. Bounds are NaN (and flag nothing)
+               for columns without enough values; the MAD bounds are infinite for columns
+               whose MAD is 0.
+    """
+    if threshold is None:
+        threshold = DEFAULT_THRESHOLDS[method]
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        # Columns without values give NaN statistics, with a RuntimeWarning each
+        warnings.simplefilter('ignore', RuntimeWarning)
+        if method == 'zscore':
+            mean, std = _mean_std(values)
+            median = quartiles[1] if quartiles is not None else None
+            return mean - threshold * std, mean + threshold * std, median
+        if method == 'mad':
+            median = quartiles[1] if quartiles is not None else np.nanmedian(values, axis=0)
+            mad = np.nanmedian(np.abs(values - median), axis=0)
+            # A MAD of 0 means that most values are equal; nothing is flagged then
+            spread = np.where(mad > 0, threshold * MAD_SCALE * mad, np.inf)
+            return median - spread, median + spread, median
+        if quartiles is None:
+            quartiles = np.nanpercentile(values, [25, 50, 75], axis=0)
+        spread = threshold * (quartiles[2] - quartiles[0])
+        return quartiles[0] - spread, quartiles[2] + spread, quartiles[1]
+
+def group_codes(df, group_by) -> np.ndarray:
+    """Number the groups of the rows of df by the values of the group_by columns; missing values form groups too."""
+    group_by = [group_by] if isinstance(group_by, str) else list(group_by)
+    return df.groupby(group_by, sort=False, dropna=False, observed=True).ngroup().to_numpy()
+
+def group_quantiles(values: np.ndarray, groups: np.ndarray, fractions) -> np.ndarray:
+    """
+    Quantiles of the columns of values within groups, ignoring NaNs.
+
+    Args:
+        values (np.ndarray): Float array of shape (rows, columns).
+        groups (np.ndarray): The group number of every row, from 0 (see group_codes()).
+        fractions (list): The quantiles to compute.
+
+    Returns:
+        np.ndarray: Shape (fractions, rows, columns): each quantile of each row's group.
+    """
+    fractions = list(fractions)
+    # One grouped sort for all the quantiles; the result has a row per (group, fraction)
+    quantiles = pd.DataFrame(values, copy=False).groupby(groups).quantile(fractions).to_numpy()
+    quantiles = quantiles.reshape(-1, len(fractions), values.shape[1])
+    return quantiles[groups].transpose(1, 0, 2)
+
+def _group_transform(values: np.ndarray, groups: np.ndarray, statistic: str) -> np.ndarray:
+    return pd.DataFrame(values, copy=False).groupby(groups, sort=False).transform(statistic).to_numpy()
+
+def group_outlier_bounds(values: np.ndarray, groups: np.ndarray, method: str = 'zscore', threshold: float = None) -> tuple:
+    """
+    Computes outlier bounds like outlier_bounds(), from the statistics of each row's group.
+
+    Args:
+        values (np.ndarray): Float array of shape (rows, columns).
+        groups (np.ndarray): The group number of every row (see group_codes()).
+        method (str, optional): One of OUTLIER_METHODS.
+        threshold (float, optional): Defaults to DEFAULT_THRESHOLDS[method].
+
+    Returns:
+        tuple: The lower bounds, upper bounds and medians, arrays shaped like values; the
+               medians are None when the method did not need them. Groups without
+               enough values have NaN bounds and flag nothing.
+    """
+    if threshold is None:
+        threshold = DEFAULT_THRESHOLDS[method]
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        if method == 'zscore':
+            mean, std = _group_transform(values, groups, 'mean'), _group_transform(values, groups, 'std')
+            return mean - threshold * std, mean + threshold * std, None
+        if method == 'mad':
+            median = _group_transform(values, groups, 'median')
+            mad = _group_transform(np.abs(values - median), groups, 'median')
+            spread = np.where(mad > 0, threshold * MAD_SCALE * mad, np.inf)
+            return median - spread, median + spread, median
+        q1, median, q3 = group_quantiles(values, groups, [0.25, 0.5, 0.75])
+        spread = threshold * (q3 - q1)
+        return q1 - spread, q3 + spread, median
+
+def _replace(series: pd.Series, values: np.ndarray, mask: np.ndarray, replacement):
+    """Put replacement in the masked rows of series, keeping its dtype where the replacement fits."""
+    if series.dtype == np.float64:
+        # values holds the column already; only the masked rows are written
+        values = values.copy()
+        values[mask] = replacement if np.ndim(replacement) == 0 else replacement[mask]
+        return values
+    try:
+        return series.where(~mask, replacement)
+    except (TypeError, ValueError):
+        # Nullable integer columns cannot hold fractional replacements
+        return series.astype('Float64').where(~mask, replacement)
+
+def correct_outliers(df, columns, method: str = 'zscore', threshold: float = None, replacement: str = 'median',
+                     approximate: bool = False, sketches: dict = None, block_cells: int = BLOCK_CELLS,
+                     group_by=None) -> tuple:
+    """
+    Finds and replaces the outliers of numeric columns.
+
+    Args:
+        df (pd.DataFrame): The data; it is not modified.
+        columns (list): Numeric columns.
+        method (str, optional): One of OUTLIER_METHODS.
+        threshold (float, optional): Defaults to DEFAULT_THRESHOLDS[method].
+        replacement (str, optional): 'median' replaces outliers with the column median,
+                                     'clip' with the bound they crossed, 'nan' with a
+                                     missing value.
+        approximate (bool, optional): Estimate medians and quartiles with quantile sketches
+                                      instead of sorting the columns.
+        sketches (dict, optional): QuantileSketch objects to reuse, by column.
+        block_cells (int, optional): Largest number of cells stacked into one array.
+        group_by (str or list, optional): Columns whose values group the rows; the bounds
+                                          and medians are then those of each row's group,
+                                          computed exactly (approximate is ignored).
+
+    Returns:
+        tuple: df with the outliers replaced (a new frame sharing its other columns), and one dict per column with
+               outliers: its name, the number of outliers, and the bounds and the median, or
+               with group_by the number of groups with outliers instead.
+    """
+    _check(method, replacement)
+    columns = list(columns)
+    sketches = sketches or {}
+    groups = group_codes(df, group_by) if group_by else None
+    corrected, updates = [], {}
+    width = max(1, block_cells // max(len(df), 1))
+    if groups is not None:
+        # Grouped bounds and medians are as large as the block itself
+        width = max(1, width // 4)
+    for start in range(0, len(columns), width):
+        block = columns[start:start + width]
+        values = _stack(df, block)
+        if groups is not None:
+            lower, upper, median = group_outlier_bounds(values, groups, method, threshold)
+        else:
+            quartiles = _sketch_quartiles(df, block, sketches) if approximate else None
+            lower, upper, median = outlier_bounds(values, method, threshold, quartiles)
+        outliers = values < lower
+        outliers |= values > upper
+        counts = outliers.sum(axis=0)
+        affected = np.flatnonzero(counts)
+        if median is None:
+            # The z-score needs no median; it is computed for the columns with outliers only
+            median = np.full(lower.shape, np.nan)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                median[..., affected] = np.nanmedian(values[:, affected], axis=0) if groups is None else \
+                    _group_transform(values[:, affected], groups, 'median')
+        for j in affected:
+            col, mask = block[j], outliers[:, j]
+            if replacement == 'median':
+                updates[col] = _replace(df[col], values[:, j], mask, median[..., j])
+            elif replacement == 'clip':
+                updates[col] = _replace(df[col], values[:, j], mask,
+                                        np.where(values[:, j] < lower[..., j], lower[..., j], upper[..., j]))
+            else:
+                updates[col] = _replace(df[col], values[:, j], mask, np.nan)
+            if groups is None:
+                corrected.append({"column": col, "count": int(counts[j]), "lower": float(lower[j]),
+                                  "upper": float(upper[j]), "median": float(median[j])})
+            else:
+                corrected.append({"column": col, "count": int(counts[j]), "groups": len(np.unique(groups[mask]))})
+    if updates:
+        # One concat instead of a setitem per column, which is slow on wide frames
+        changed = pd.DataFrame(updates, index=df.index)
+        df = pd.concat([df.drop(columns=list(updates)), changed], axis=1)[df.columns]
+    return df, corrected
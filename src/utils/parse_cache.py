@@ -0,0 +1,96 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+def content_digest(content: bytes, options: dict = None) -> str:
+    """
+    Builds a cache key from the raw bytes of an upload and the options used to parse it.
+
+    Args:
+        content (bytes): The raw file content.
+        options (dict, optional): Parse options that change the resulting DataFrame.
+
+    Returns:
+        str: A hex digest that is identical for identical content and options.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(content)
+    hasher.update(json.dumps(options or {}, sort_keys=True, default=str).encode())
+    return hasher.hexdigest()
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Return the in-memory size of a DataFrame in bytes, including object payloads."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+class ParseCache:
+    """
+    Least-recently-used cache of parsed DataFrames, bounded by their total size in bytes.
+
+    Entries are dictionaries with the parsed frame under "data", caller supplied
+    information under "metadata" and the accounted size under "nbytes". Cached
+    frames are shared between readers and must not be modified in place.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key):
+        """Return the entry stored under key and mark it as recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, df: pd.DataFrame, metadata: dict = None) -> dict:
+        """
+        Stores a parsed DataFrame and evicts the least recently used entries until
+        the cache fits in max_bytes again.
+
+        A frame larger than max_bytes on its own is not retained, but the entry is
+        still returned so callers can use it for the current run.
+
+        Args:
+            key (str): The cache key, usually from content_digest().
+            df (pd.DataFrame): The parsed DataFrame.
+            metadata (dict, optional): Extra information to keep next to the frame.
+
+        Returns:
+            dict: The cache entry.
+        """
+        entry = {"data": df, "metadata": dict(metadata or {}), "nbytes": frame_nbytes(df)}
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)["nbytes"]
+            if entry["nbytes"] > self.max_bytes:
+                return entry
+            self._entries[key] = entry
+            self._total_bytes += entry["nbytes"]
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted["nbytes"]
+        return entry
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
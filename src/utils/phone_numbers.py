@@ -0,0 +1,132 @@
+"""
+Normalization of phone numbers to E.164 (+<country code><national number>).
+
+The rules run as vectorized string operations over the distinct raw values of a column
+(pd.factorize), so every distinct number is normalized once whatever the number of rows,
+and no Python callback runs per value. They cover the formats found in contact data:
+international numbers written with + or 00, national numbers with or without the trunk
+prefix (the leading 0 of most European numbers, the 1 of North American ones) and
+national numbers written with their country code but without the +.
+
+Validation checks the length of the national number for the regions in REGIONS and the
+E.164 limits for the other country codes; it does not check number ranges the way
+libphonenumber does.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+try:
+    import pyarrow  # noqa: F401  (string[pyarrow] runs the string operations in Arrow)
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string[python]'
+
+# Region: (country code, trunk prefix, shortest and longest national number)
+REGIONS = {
+    'US': ('1', '1', 10, 10), 'CA': ('1', '1', 10, 10), 'GB': ('44', '0', 9, 10), 'IE': ('353', '0', 7, 9),
+    'GR': ('30', '', 10, 10), 'CY': ('357', '', 8, 8), 'DE': ('49', '0', 5, 13), 'AT': ('43', '0', 4, 13),
+    'CH': ('41', '0', 9, 9), 'FR': ('33', '0', 9, 9), 'BE': ('32', '0', 8, 9), 'NL': ('31', '0', 9, 9),
+    'LU': ('352', '', 4, 11), 'IT': ('39', '', 6, 11), 'ES': ('34', '', 9, 9), 'PT': ('351', '', 9, 9),
+    'DK': ('45', '', 8, 8), 'SE': ('46', '0', 7, 13), 'NO': ('47', '', 8, 8), 'FI': ('358', '0', 5, 12),
+    'PL': ('48', '', 9, 9), 'CZ': ('420', '', 9, 9), 'SK': ('421', '0', 9, 9), 'HU': ('36', '06', 8, 9),
+    'RO': ('40', '0', 9, 9), 'BG': ('359', '0', 8, 9), 'HR': ('385', '0', 8, 9), 'SI': ('386', '0', 8, 8),
+    'TR': ('90', '0', 10, 10), 'RU': ('7', '8', 10, 10), 'UA': ('380', '0', 9, 9), 'IL': ('972', '0', 8, 9),
+    'IN': ('91', '0', 10, 10), 'CN': ('86', '0', 10, 11), 'JP': ('81', '0', 9, 10), 'KR': ('82', '0', 8, 10),
+    'AU': ('61', '0', 9, 9), 'NZ': ('64', '0', 8, 10), 'ZA': ('27', '0', 9, 9), 'BR': ('55', '0', 10, 11),
+    'MX': ('52', '', 10, 10), 'AR': ('54', '0', 10, 10), 'AE': ('971', '0', 8, 9), 'EG': ('20', '0', 9, 10),
+}
+
+# ITU country codes of one and two digits; every other code has three. No code is the
+# prefix of another, so the first digits of an international number name its country.
+_ONE_DIGIT_CODES = {'1', '7'}
+_TWO_DIGIT_CODES = {
+    '20', '27', '30', '31', '32', '33', '34', '36', '39', '40', '41', '43', '44', '45', '46', '47', '48', '49',
+    '51', '52', '53', '54', '55', '56', '57', '58', '60', '61', '62', '63', '64', '65', '66',
+    '81', '82', '84', '86', '90', '91', '92', '93', '94', '95', '98',
+}
+_EXTENSION = re.compile(r'\s*(?:ext\.?|extension|x|#)\s*\d+\s*$', re.IGNORECASE)
+
+# Shortest and longest national number per country code; regions sharing a code agree.
+# Other codes get the E.164 bounds
+_SHORTEST = {code: shortest for code, _, shortest, _ in REGIONS.values()}
+_LONGEST = {code: longest for code, _, _, longest in REGIONS.values()}
+
+def _country_codes(digits: pd.Series) -> pd.Series:
+    """Return the country code each string of digits starts with."""
+    one, two = digits.str[:1], digits.str[:2]
+    return one.where(one.isin(_ONE_DIGIT_CODES), two.where(two.isin(_TWO_DIGIT_CODES), digits.str[:3]))
+
+def _valid(country: pd.Series, national: pd.Series) -> pd.Series:
+    """Check the length of the national numbers, and the area code and exchange of North American ones."""
+    length = national.str.len()
+    shortest = country.map(_SHORTEST).fillna(4)
+    longest = country.map(_LONGEST).fillna(14)
+    valid = (length >= shortest) & (length <= longest) & (length + country.str.len() <= 15)
+    # North American area codes and exchanges start with 2 to 9
+    nanp = country == '1'
+    nanp_valid = national.str[0].isin(list('23456789')) & national.str[3].isin(list('23456789'))
+    return (valid & (~nanp | nanp_valid)).fillna(False)
+
+def _as_text(uniques) -> pd.Index:
+    """The distinct values as text; whole floats (a numeric column with a blank cell is read as float64) without '.0'."""
+    uniques = pd.Index(uniques)
+    if is_float_dtype(uniques.dtype):
+        numbers = uniques.to_numpy(dtype=np.float64)
+        whole = np.isfinite(numbers) & (numbers == np.trunc(numbers))
+        text = uniques.astype(str).to_numpy(dtype=object, copy=True)
+        text[whole] = numbers[whole].astype(np.int64).astype(str)
+        return pd.Index(text, dtype=object)
+    return pd.Index(uniques, dtype=object).astype(str)
+
+def normalize_phone_numbers(values, default_region: str = 'US') -> tuple:
+    """
+    Normalizes phone numbers to E.164.
+
+    Args:
+        values (pd.Series): Raw phone numbers.
+        default_region (str, optional): Region of the numbers written without a country
+                                        code, a key of REGIONS.
+
+    Returns:
+        tuple: The numbers in E.164 as a Series aligned with values (missing where the
+               number is not valid) and a boolean array marking the valid numbers.
+    """
+    if default_region not in REGIONS:
+        raise ValueError(f"Unknown region '{default_region}'. Choose one of {', '.join(sorted(REGIONS))}.")
+    region_code, trunk, shortest, longest = REGIONS[default_region]
+    series = pd.Series(values)
+    codes, uniques = pd.factorize(series)
+
+    # Every step below runs once per distinct value
+    raw = pd.Series(_as_text(uniques), dtype=_STRING_DTYPE)
+    raw = raw.str.replace(_EXTENSION.pattern, '', regex=True, flags=re.IGNORECASE).str.strip()
+    # "+44 (0)20 ..." repeats the trunk prefix inside an international number
+    raw = raw.str.replace('(0)', '', regex=False)
+    digits = raw.str.replace(r'\D', '', regex=True)
+    plus = raw.str.startswith('+')
+    international = plus | digits.str.startswith('00')
+    digits = digits.where(plus | ~international, digits.str[2:])
+    # National numbers written with the country code of the default region but without the +
+    length = digits.str.len()
+    international |= (digits.str.startswith(region_code) & ~length.between(shortest, longest) &
+                      (length - len(region_code)).between(shortest, longest))
+
+    country = _country_codes(digits).where(international, region_code)
+    code_length = country.str.len().where(international, 0)
+    national = digits.str[1:].where(code_length == 1, digits.str[2:].where(code_length == 2, digits.str[3:]))
+    national = national.where(international, digits)
+    if trunk:
+        # The trunk prefix is only dialled inside the country
+        trunk_dialled = ~international & national.str.startswith(trunk) & \
+            (national.str.len() - len(trunk)).between(shortest, longest)
+        national = national.where(~trunk_dialled, national.str[len(trunk):])
+
+    valid = _valid(country, national).to_numpy(dtype=bool)
+    e164 = ('+' + country + national).to_numpy(dtype=object, na_value=None)
+    e164[~valid] = None
+    # Missing values have the code -1, which picks the None (and False) appended at the end
+    normalized = pd.Series(np.append(e164, None)[codes], index=series.index, name=series.name, dtype=object)
+    return normalized, np.append(valid, False)[codes]
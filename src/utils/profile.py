@@ -0,0 +1,153 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.sketches import sketch_frame
+
+# Number of rows from which the app estimates statistics with sketches by default
+APPROXIMATE_PROFILE_ROWS = 5_000_000
+
+# Row order of the statistics, as in DataFrame.describe(include='all')
+STATISTICS = ['count', 'unique', 'top', 'freq', 'first', 'last', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+def profile_column(series: pd.Series) -> dict:
+    """
+    Computes the summary statistics of one column.
+
+    Returns:
+        dict: The dtype, the number of missing values and the statistics of Series.describe().
+    """
+    return {
+        "dtype": series.dtype,
+        "missing": int(series.isnull().sum()),
+        "stats": series.describe().to_dict(),
+    }
+
+def sketch_profile(sketch) -> dict:
+    """
+    Builds a column profile from a ColumnSketch (see utils.sketches).
+
+    Returns:
+        dict: The same keys as profile_column(), plus the error bounds of the estimated
+              statistics and the sketch itself for reuse by the cleaning operations.
+    """
+    return {
+        "dtype": sketch.dtype,
+        "missing": sketch.missing,
+        "stats": sketch.stats(),
+        "errors": sketch.errors(),
+        "sketch": sketch,
+    }
+
+class DataProfile:
+    """Summary statistics of every column of a DataFrame, built from per-column profiles."""
+
+    def __init__(self, rows: int, columns: dict, approximate: bool = False):
+        self.rows = rows
+        self.columns = columns
+        self.approximate = approximate
+
+    def describe(self) -> pd.DataFrame:
+        """Return the statistics as a table laid out like DataFrame.describe(include='all')."""
+        table = pd.DataFrame({name: pd.Series(column["stats"], dtype=object) for name, column in self.columns.items()})
+        return table.reindex([statistic for statistic in STATISTICS if statistic in table.index])
+
+    def dtypes(self) -> pd.Series:
+        return pd.Series({name: column["dtype"] for name, column in self.columns.items()}, dtype=object)
+
+    def missing_counts(self) -> pd.Series:
+        """Return the number of missing values per column."""
+        return pd.Series({name: column["missing"] for name, column in self.columns.items()}, dtype='int64')
+
+    def stat(self, column, statistic, default=None):
+        """Return one statistic of a column, or default when it does not apply to the column's dtype."""
+        return self.columns[column]["stats"].get(statistic, default)
+
+    def errors(self) -> pd.DataFrame:
+        """
+        Return the error bounds of an approximate profile, one row per column: the relative
+        standard error of 'unique', the largest undercount of 'freq' and the rank error of
+        the quantiles as a fraction of the rows. Empty for exact profiles.
+        """
+        errors = {name: column["errors"] for name, column in self.columns.items() if "errors" in column}
+        return pd.DataFrame.from_dict(errors, orient='index', columns=['unique', 'freq', 'quantile_rank'])
+
+    def quantile_sketches(self, columns) -> dict:
+        """Return the quantile sketches of the given columns that have one in this profile."""
+        sketches = {}
+        for name in columns:
+            sketch = self.columns[name].get("sketch")
+            if sketch is not None and sketch.quantiles is not None:
+                sketches[name] = sketch.quantiles
+        return sketches
+
+class ProfileCache:
+    """
+    Per-column profiles keyed by the column tokens of a DatasetStore.
+
+    A token stays the same for as long as its column is unchanged, so after a cleaning
+    step only the columns the step modified are profiled again; the others, and every
+    column of versions reached with undo or redo, reuse their cached profiles. Tokens are
+    only unique within one store, so a new dataset needs a new cache.
+
+    Exact and approximate profiles of a column are cached separately.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def profile(self, df: pd.DataFrame, tokens: dict = None, approximate: bool = False) -> DataProfile:
+        """
+        Builds the profile of df, reusing cached column profiles.
+
+        Args:
+            df (pd.DataFrame): The data to profile.
+            tokens (dict, optional): Column name to token, from DatasetStore.column_tokens().
+                                     Without tokens every column is profiled and nothing is cached.
+            approximate (bool, optional): Estimate the statistics with mergeable sketches,
+                                          computed chunk by chunk in parallel, instead of
+                                          exact scans and sorts.
+
+        Returns:
+            DataProfile: The profile of every column of df.
+        """
+        columns = [None] * df.shape[1]
+        keys = [None] * df.shape[1]
+        for i, name in enumerate(df.columns):
+            token = tokens.get(name) if tokens else None
+            if token is None:
+                continue
+            keys[i] = (token, approximate)
+            with self._lock:
+                columns[i] = self._entries.get(keys[i])
+                if columns[i] is not None:
+                    self._entries.move_to_end(keys[i])
+
+        missing = [i for i, column in enumerate(columns) if column is None]
+        if approximate and missing:
+            sketches = sketch_frame(df.iloc[:, missing])
+            for position, i in enumerate(missing):
+                columns[i] = sketch_profile(sketches[position])
+        else:
+            for i in missing:
+                columns[i] = profile_column(df.iloc[:, i])
+        for i in missing:
+            if keys[i] is not None:
+                self._store(keys[i], columns[i])
+        return DataProfile(len(df), dict(zip(df.columns, columns)), approximate)
+
+    def _store(self, token, column):
+        with self._lock:
+            self._entries[token] = column
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,266 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+
+from kernels.categorical import merge_category_clusters, standardize_categorical_data
+from kernels.column_operations import merge_columns, split_column
+from kernels.duplicates import drop_duplicates, remove_fuzzy_duplicates
+from kernels.entity_resolution import resolve_entities
+from kernels.error_correction import (cap_percentiles, correct_errors, detect_anomalies, fix_negative_values,
+                                     replace_outliers, validate_rules)
+from kernels.formatting import fix_inconsistent_formats
+from kernels.missing_data import handle_missing_data
+from kernels.noisy_data import handle_noisy_data
+from kernels.reshape import melt_data, pivot_data, transpose_data
+from kernels.text_parsing import clean_text_column, extract_keywords, parse_dates, split_full_name
+from kernels.type_conversion import type_conversion
+from kernels.unstructured_data import clean_unstructured_data
+from utils.file_operations import read_data_file, write_data_file
+from utils.memory_optimizer import optimize_dtypes
+from utils.row_hashing import deduplicate_file
+
+RECIPE_VERSION = 1
+
+# Operation name to the kernel that applies it. Every kernel takes the DataFrame followed by
+# the parameters of the step as keyword arguments and returns the result and its record.
+OPERATIONS = {
+    "handle_missing_data": handle_missing_data,
+    "drop_duplicates": drop_duplicates,
+    "remove_fuzzy_duplicates": remove_fuzzy_duplicates,
+    "resolve_entities": resolve_entities,
+    "fix_inconsistent_formats": fix_inconsistent_formats,
+    "standardize_categorical_data": standardize_categorical_data,
+    "merge_category_clusters": merge_category_clusters,
+    "correct_errors": correct_errors,
+    "replace_outliers": replace_outliers,
+    "fix_negative_values": fix_negative_values,
+    "cap_percentiles": cap_percentiles,
+    "detect_anomalies": detect_anomalies,
+    "validate_rules": validate_rules,
+    "split_full_name": split_full_name,
+    "extract_keywords": extract_keywords,
+    "clean_text_column": clean_text_column,
+    "parse_dates": parse_dates,
+    "type_conversion": type_conversion,
+    "merge_columns": merge_columns,
+    "split_column": split_column,
+    "handle_noisy_data": handle_noisy_data,
+    "clean_unstructured_data": clean_unstructured_data,
+    "pivot": pivot_data,
+    "melt": melt_data,
+    "transpose": transpose_data,
+}
+
+def recipe_step(operation: str, **params) -> dict:
+    """
+    Describes one cleaning operation and its parameters so that it can be replayed.
+
+    Args:
+        operation (str): The name of the operation, one of the keys of OPERATIONS.
+        **params: The keyword arguments the operation is called with.
+
+    Returns:
+        dict: The recipe step.
+    """
+    return {"operation": operation, "params": params}
+
+def recipe_from_history(history, source=None) -> dict:
+    """
+    Builds a recipe from the cleaning history entries that carry an operation record.
+
+    Args:
+        history (list): Cleaning history entries, as in st.session_state.cleaning_history.
+        source (str, optional): The name of the file the recipe was recorded on.
+
+    Returns:
+        dict: The recipe, with its steps in the order they were applied.
+    """
+    return {
+        "version": RECIPE_VERSION,
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "source": source,
+        "steps": [recipe_step(entry["operation"]["operation"], **entry["operation"]["params"])
+                  for entry in history if "operation" in entry],
+    }
+
+def validate_recipe(recipe: dict) -> dict:
+    """Check that a recipe has a supported version and only known operations, and return it."""
+    if not isinstance(recipe, dict) or not isinstance(recipe.get("steps"), list):
+        raise ValueError("A recipe must be an object with a list of steps.")
+    if recipe.get("version", RECIPE_VERSION) > RECIPE_VERSION:
+        raise ValueError(f"Recipe version {recipe['version']} is not supported.")
+    known = OPERATIONS
+    for number, step in enumerate(recipe["steps"], start=1):
+        if step.get("operation") not in known:
+            raise ValueError(f"Step {number} uses the unknown operation '{step.get('operation')}'.")
+        if not isinstance(step.get("params", {}), dict):
+            raise ValueError(f"The parameters of step {number} must be an object.")
+    return recipe
+
+def _json_default(value):
+    """Serialize the numpy scalars and arrays that end up in step parameters."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def recipe_to_json(recipe: dict) -> str:
+    """Serialize a recipe to JSON."""
+    return json.dumps(recipe, indent=2, default=_json_default)
+
+def recipe_from_json(text) -> dict:
+    """Parse and validate a recipe from JSON text or bytes."""
+    return validate_recipe(json.loads(text))
+
+def save_recipe(recipe, file_path):
+    """Save a recipe as a JSON file."""
+    with open(file_path, 'w') as f:
+        f.write(recipe_to_json(recipe))
+
+def load_recipe(file_path):
+    """Load and validate a recipe from a JSON file."""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"The recipe file {file_path} does not exist.")
+    with open(file_path, 'r') as f:
+        return recipe_from_json(f.read())
+
+def apply_step(df, step):
+    """Apply a single recipe step to df and return the result and its operation record."""
+    return OPERATIONS[step["operation"]](df, **step.get("params", {}))
+
+def apply_recipe(df, recipe, progress_callback=None):
+    """
+    Replays every step of a recipe on a DataFrame.
+
+    Args:
+        df (pd.DataFrame): The data to clean. It is not modified.
+        recipe (dict): The recipe, e.g. from load_recipe() or recipe_from_history().
+        progress_callback (callable, optional): Called with the number of the step and the
+                                                step after each step is applied.
+
+    Returns:
+        pd.DataFrame: The cleaned DataFrame.
+    """
+    validate_recipe(recipe)
+    for number, step in enumerate(recipe["steps"], start=1):
+        try:
+            df, _ = apply_step(df, step)
+        except Exception as e:
+            raise ValueError(f"Step {number} ({step['operation']}) failed: {e}") from e
+        if progress_callback:
+            progress_callback(number, step)
+    return df
+
+def output_path_for(input_path, output_dir, output_format=None):
+    """Return the path a cleaned file is written to: same name in output_dir, optionally with another extension."""
+    stem, extension = os.path.splitext(os.path.basename(input_path))
+    if output_format:
+        extension = '.' + output_format.lstrip('.')
+    return os.path.join(output_dir, stem + extension)
+
+def clean_file(recipe, input_path, output_path, optimize=True):
+    """
+    Reads a data file, applies a recipe and writes the result.
+
+    Errors are reported in the returned summary instead of being raised, so that one bad
+    file does not stop a batch.
+
+    Args:
+        recipe (dict): The recipe to apply.
+        input_path (str): The CSV, Parquet, Feather or Arrow IPC file to clean.
+        output_path (str): Where to write the cleaned data; the format follows the extension.
+        optimize (bool, optional): Convert columns to compact dtypes after reading, as the app does.
+
+    Returns:
+        dict: The input and output paths, row counts before and after, elapsed seconds and
+              the error message if the file could not be cleaned.
+    """
+    summary = {"input": input_path, "output": output_path, "rows_in": None, "rows_out": None, "error": None}
+    start = time.perf_counter()
+    try:
+        df = read_data_file(input_path)
+        summary["rows_in"] = len(df)
+        if optimize:
+            df, _ = optimize_dtypes(df)
+        df = apply_recipe(df, recipe)
+        write_data_file(df, output_path)
+        summary["rows_out"] = len(df)
+    except Exception as e:
+        summary["error"] = str(e)
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+def run_recipe_batch(recipe, input_paths, output_dir, workers=None, output_format=None, optimize=True, progress_callback=None):
+    """
+    Applies a recipe to many files, cleaning each file in its own worker process.
+
+    Args:
+        recipe (dict): The recipe to apply.
+        input_paths (list): The files to clean.
+        output_dir (str): The directory the cleaned files are written to. It is created if needed.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs,
+                                 capped at the number of files.
+        output_format (str, optional): Extension of the output files ('csv', 'parquet',
+                                       'feather' or 'arrow'). Defaults to the input's extension.
+        optimize (bool, optional): Convert columns to compact dtypes after reading.
+        progress_callback (callable, optional): Called with each file summary as it finishes.
+
+    Returns:
+        list: One summary per input file (see clean_file()), in the order of input_paths.
+    """
+    validate_recipe(recipe)
+    input_paths = list(input_paths)
+    if not input_paths:
+        return []
+    os.makedirs(output_dir, exist_ok=True)
+    output_paths = [output_path_for(path, output_dir, output_format) for path in input_paths]
+    if len(set(output_paths)) != len(output_paths):
+        raise ValueError("Several input files would be written to the same output file; use distinct file names.")
+    workers = min(workers or os.cpu_count() or 1, len(input_paths))
+
+    summaries = [None] * len(input_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(clean_file, recipe, input_path, output_path, optimize): i
+            for i, (input_path, output_path) in enumerate(zip(input_paths, output_paths))
+        }
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries[futures[future]] = summary
+            if progress_callback:
+                progress_callback(summary)
+    return summaries
+
+def deduplicate_outputs(summaries, hash_set, subset=None, chunksize=100_000):
+    """
+    Removes the rows of the cleaned files that repeat a row of an earlier file or of
+    hash_set, one file after the other in the order of summaries, rewriting each file in
+    place. CSV files are streamed chunksize rows at a time; only the row hashes are kept
+    across files (see utils.row_hashing).
+
+    Args:
+        summaries (list): File summaries from run_recipe_batch(). Files that failed are skipped.
+        hash_set (RowHashSet): Hashes of the rows seen so far; it is updated.
+        subset (list, optional): The key columns. Defaults to all columns.
+        chunksize (int, optional): Rows per chunk when streaming CSV files.
+
+    Returns:
+        list: The summaries, with rows_out updated and the number of rows removed in
+              duplicates_removed.
+    """
+    for summary in summaries:
+        if summary["error"]:
+            continue
+        try:
+            _, rows_out = deduplicate_file(summary["output"], summary["output"], hash_set, subset, chunksize)
+        except Exception as e:
+            summary["error"] = f"Deduplication failed: {e}"
+            continue
+        summary["duplicates_removed"] = summary["rows_out"] - rows_out
+        summary["rows_out"] = rows_out
+    return summaries
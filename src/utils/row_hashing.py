@@ -0,0 +1,291 @@
+"""
+Exact deduplication by row hashes.
+
+Each row is reduced to a 64- or 128-bit hash of its key columns, so telling duplicates
+apart takes 8 or 16 bytes per row instead of the width of the rows. The hashes of the
+rows kept so far are held in sorted arrays (RowHashSet) that chunks of a file are
+checked against one after the other, and that can be saved and loaded again to
+deduplicate later files of the same feed against the earlier ones.
+
+Two different rows share a 64-bit hash with a probability of about n^2 / 2^65 for n
+rows (about 1 in 37,000 for 1 million rows); use 128 bits when that is too much.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_integer_dtype, is_numeric_dtype
+from utils.file_operations import columnar_format, read_data_file, write_data_file
+
+HASH_BITS = (64, 128)
+# hash_pandas_object() takes a 16-character key; the second half of a 128-bit hash uses another one
+_HASH_KEYS = ('0123456789123456', 'fedcba9876543210')
+
+_INT64_MIN, _INT64_MAX = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+
+def _numeric_words(series: pd.Series) -> tuple:
+    """
+    Split a numeric column into an int64 and a float64 array that hold every value exactly:
+    integers (and floats with an integer value) as (value, 0.0), other floats as (0, value)
+    and missing values as (0, NaN). A float64 cast would merge integers above 2^53.
+    """
+    if is_integer_dtype(series.dtype):
+        missing = series.isna().to_numpy()
+        if series.dtype.kind == 'u' or str(series.dtype).startswith('UInt'):
+            values = series.to_numpy(dtype=np.uint64, na_value=0)
+            # Above the int64 range: the wrapped value, told apart from the integers by a 1.0
+            # (a float that is not an integer is never 1.0)
+            rest = np.where(missing, np.nan, np.where(values > _INT64_MAX, 1.0, 0.0))
+            return values.view(np.int64), rest
+        return series.to_numpy(dtype=np.int64, na_value=0), np.where(missing, np.nan, 0.0)
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    # 2^63 is a float64 but not an int64
+    integral = (values == np.trunc(values)) & (values >= _INT64_MIN) & (values < -float(_INT64_MIN))
+    integers = np.where(integral, values, 0).astype(np.int64)
+    return integers, np.where(integral, 0.0, values)
+
+def _normalize_keys(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the key columns to the dtypes they are hashed as, so that the same values hash
+    the same whether a file was read as int8, Int64 or float64, or with a time zone or not.
+    Numeric columns become two columns (see _numeric_words()).
+    """
+    columns = {}
+    for position, column in enumerate(frame.columns):
+        series = frame[column]
+        if is_datetime64_any_dtype(series.dtype):
+            if getattr(series.dtype, 'tz', None) is not None:
+                series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+            columns[(position, 0)] = series.astype('datetime64[ns]')
+        elif is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+            columns[(position, 0)], columns[(position, 1)] = _numeric_words(series)
+        else:
+            columns[(position, 0)] = series
+    return pd.DataFrame(columns, index=frame.index)
+
+def row_hashes(df: pd.DataFrame, subset=None, bits: int = 64) -> np.ndarray:
+    """
+    Hashes every row of df over the key columns.
+
+    Args:
+        df (pd.DataFrame): The data.
+        subset (list, optional): The key columns, in the order they are hashed. Defaults
+                                 to all columns.
+        bits (int, optional): 64 for uint64 hashes, 128 for pairs of them.
+
+    Returns:
+        np.ndarray: One uint64 hash per row, or for 128 bits one row of two uint64 words
+                    (high, low) per row.
+    """
+    if bits not in HASH_BITS:
+        raise ValueError(f"Invalid hash size. Choose one of {', '.join(map(str, HASH_BITS))}.")
+    keys = _normalize_keys(df[list(subset)] if subset is not None else df)
+    hashes = [pd.util.hash_pandas_object(keys, index=False, hash_key=key).to_numpy(dtype=np.uint64)
+              for key in _HASH_KEYS[:bits // 64]]
+    return hashes[0] if bits == 64 else np.column_stack(hashes)
+
+def first_occurrences(hashes: np.ndarray, keep='first') -> np.ndarray:
+    """Return a boolean mask of the hashes that are not repeats, as DataFrame.duplicated(keep) would mark them."""
+    if hashes.ndim == 2:
+        repeated = pd.DataFrame(hashes).duplicated(keep=keep)
+    else:
+        repeated = pd.Series(hashes).duplicated(keep=keep)
+    return ~repeated.to_numpy()
+
+def _words(hashes: np.ndarray) -> list:
+    """Split hashes into their 64-bit words, most significant first, as contiguous arrays."""
+    if hashes.ndim == 1:
+        return [np.ascontiguousarray(hashes, dtype=np.uint64)]
+    return [np.ascontiguousarray(hashes[:, i], dtype=np.uint64) for i in range(hashes.shape[1])]
+
+def _search(run, words) -> np.ndarray:
+    """Return the positions the hashes would be inserted at to keep a sorted run sorted."""
+    high = run[0]
+    positions = np.searchsorted(high, words[0])
+    if len(run) == 1:
+        return positions
+    # Equal high words are ordered by their low word. Two distinct hashes hardly ever
+    # share a high word, so runs longer than one are searched one by one
+    low = run[1]
+    runs = np.searchsorted(high, words[0], side='right') - positions
+    single = np.flatnonzero(runs == 1)
+    positions[single] += low[positions[single]] < words[1][single]
+    for k in np.flatnonzero(runs > 1):
+        positions[k] += np.searchsorted(low[positions[k]:positions[k] + runs[k]], words[1][k])
+    return positions
+
+def _find(run, words) -> np.ndarray:
+    positions = _search(run, words)
+    found = positions < len(run[0])
+    for word, query in zip(run, words):
+        found[found] &= word[positions[found]] == query[found]
+    return found
+
+def _merge(run, other) -> list:
+    """Merge two sorted runs without common hashes into one, in linear time."""
+    positions = _search(run, other)
+    return [np.insert(word, positions, query) for word, query in zip(run, other)]
+
+class RowHashSet:
+    """
+    A set of row hashes kept sorted, 8 or 16 bytes per row.
+
+    128-bit hashes are stored as two arrays of 64-bit words sorted together, high word
+    first, so they are searched with the fast uint64 searchsorted instead of comparing
+    records.
+
+    The hashes are held in sorted runs, each at least twice as long as the next: the
+    hashes of a chunk become a new run, merged into the run before it while that one is
+    not twice as long. A hash is merged about log2(n) times, where inserting every chunk
+    into one sorted array would copy the whole set each time and make a stream of chunks
+    quadratic; lookups search the (at most about log2(n)) runs.
+    """
+    def __init__(self, bits: int = 64, hashes: np.ndarray = None):
+        if bits not in HASH_BITS:
+            raise ValueError(f"Invalid hash size. Choose one of {', '.join(map(str, HASH_BITS))}.")
+        self.bits = bits
+        self._runs = []
+        if hashes is not None:
+            self.add(hashes)
+
+    def __len__(self):
+        return sum(len(run[0]) for run in self._runs)
+
+    @property
+    def nbytes(self):
+        return sum(word.nbytes for run in self._runs for word in run)
+
+    @property
+    def words(self) -> list:
+        """The hashes in the set as one sorted array per 64-bit word; the runs are merged into one."""
+        while len(self._runs) > 1:
+            other = self._runs.pop()
+            self._runs[-1] = _merge(self._runs[-1], other)
+        return self._runs[0] if self._runs else [np.empty(0, dtype=np.uint64) for _ in range(self.bits // 64)]
+
+    def hashes(self) -> np.ndarray:
+        """Return the hashes in the set, sorted, in the layout row_hashes() returns."""
+        words = self.words
+        return words[0] if self.bits == 64 else np.column_stack(words)
+
+    def _find(self, words) -> np.ndarray:
+        """Return a boolean mask of the hashes in the set, for hashes sorted high word first."""
+        found = np.zeros(len(words[0]), dtype=bool)
+        for run in self._runs:
+            found |= _find(run, words)
+        return found
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of the hashes that are in the set."""
+        words = _words(hashes)
+        # searchsorted is several times faster for sorted queries, which it searches in cache order
+        order = np.lexsort(words[::-1])
+        found = np.empty(len(order), dtype=bool)
+        found[order] = self._find([word[order] for word in words])
+        return found
+
+    def add(self, hashes: np.ndarray):
+        """Add hashes to the set."""
+        self.filter(hashes)
+
+    def filter(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Return a boolean mask of the hashes seen neither in the set nor earlier in hashes,
+        and add them to the set.
+        """
+        words = _words(hashes)
+        # Sort the hashes (high word first); the first of equal hashes in this order is the
+        # first in hashes too, as lexsort is stable
+        order = np.lexsort(words[::-1])
+        words = [word[order] for word in words]
+        repeated = np.ones(max(len(order) - 1, 0), dtype=bool)
+        for word in words:
+            repeated &= word[1:] == word[:-1]
+        new = np.r_[True, ~repeated][:len(order)] & ~self._find(words)
+        if new.any():
+            self._runs.append([word[new] for word in words])
+            while len(self._runs) > 1 and len(self._runs[-2][0]) < 2 * len(self._runs[-1][0]):
+                other = self._runs.pop()
+                self._runs[-1] = _merge(self._runs[-1], other)
+        keep = np.empty(len(order), dtype=bool)
+        keep[order] = new
+        return keep
+
+    def save(self, file_path):
+        """Save the set as a .npy file with one column per 64-bit word."""
+        np.save(file_path, np.column_stack(self.words))
+
+    @classmethod
+    def load(cls, file_path):
+        """Load a set saved with save()."""
+        stored = np.load(file_path)
+        hash_set = cls(64 * stored.shape[1])
+        if len(stored):
+            hash_set._runs = [_words(stored if stored.shape[1] > 1 else stored[:, 0])]
+        return hash_set
+
+    @classmethod
+    def open(cls, file_path, bits: int = 64):
+        """Load the set saved at file_path, or start an empty one if there is none yet."""
+        return cls.load(file_path) if os.path.exists(file_path) else cls(bits)
+
+def deduplicate_against(df: pd.DataFrame, hash_set: RowHashSet, subset=None) -> pd.DataFrame:
+    """Return the rows of df not in hash_set and not repeating an earlier row, and add them to hash_set."""
+    return df[hash_set.filter(row_hashes(df, subset, hash_set.bits))]
+
+def deduplicate_chunks(chunks, hash_set: RowHashSet, subset=None):
+    """
+    Drops the rows of a stream of DataFrames whose key columns repeat a row of an earlier
+    chunk, an earlier row of the same chunk, or a row already in hash_set. The kept rows
+    are added to hash_set.
+
+    Args:
+        chunks (iterable): The DataFrames, e.g. pd.read_csv(..., chunksize=...).
+        hash_set (RowHashSet): The hashes of the rows seen so far; it is updated.
+        subset (list, optional): The key columns. Defaults to all columns.
+
+    Yields:
+        pd.DataFrame: Each chunk without its duplicate rows.
+    """
+    for chunk in chunks:
+        yield deduplicate_against(chunk, hash_set, subset)
+
+def deduplicate_csv(input_path, output_path, hash_set: RowHashSet, subset=None, chunksize=100_000, **read_options):
+    """
+    Streams a CSV file through deduplicate_chunks() and writes the rows kept to output_path,
+    which may be input_path itself. Only one chunk and the hashes are held in memory.
+
+    Returns:
+        tuple: The number of rows read and the number of rows written.
+    """
+    temporary_path = output_path + '.dedup'
+    rows_in = rows_out = 0
+    with open(temporary_path, 'w', newline='') as output:
+        header = True
+        for chunk in pd.read_csv(input_path, chunksize=chunksize, **read_options):
+            rows_in += len(chunk)
+            kept = deduplicate_against(chunk, hash_set, subset)
+            kept.to_csv(output, index=False, header=header)
+            header = False
+            rows_out += len(kept)
+        if header:
+            # No data rows: keep the header line
+            pd.read_csv(input_path, nrows=0, **read_options).to_csv(output, index=False)
+    os.replace(temporary_path, output_path)
+    return rows_in, rows_out
+
+def deduplicate_file(input_path, output_path, hash_set: RowHashSet, subset=None, chunksize=100_000):
+    """
+    Deduplicates a data file against hash_set (see deduplicate_chunks()) and writes the rows
+    kept to output_path, which may be input_path itself. CSV files are streamed; columnar
+    files are read whole, since their writers need the whole frame.
+
+    Returns:
+        tuple: The number of rows read and the number of rows written.
+    """
+    if not columnar_format(input_path):
+        return deduplicate_csv(input_path, output_path, hash_set, subset, chunksize)
+    df = read_data_file(input_path)
+    kept = deduplicate_against(df, hash_set, subset)
+    write_data_file(kept, output_path)
+    return len(df), len(kept)
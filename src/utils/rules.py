@@ -0,0 +1,229 @@
+"""
+Declarative validation rules, loaded from a file and evaluated as vectorized masks.
+
+A rule names a condition that every row should meet:
+
+- range: {"type": "range", "column": "age", "min": 0, "max": 120}; either bound may be
+  left out, and bounds of date columns are dates;
+- regex: {"type": "regex", "column": "zip", "pattern": "[0-9]{5}"}; the whole value must
+  match;
+- allowed: {"type": "allowed", "column": "status", "values": ["open", "closed"]};
+- expression: {"type": "expression", "expression": "end_date >= start_date"}; any
+  DataFrame.eval() expression over the columns, with names that are not identifiers
+  quoted in backticks.
+
+Every rule may have a "name" (the report lists rules by it) and "required": true, which
+makes missing values violate it; otherwise missing values never do.
+
+Rules are evaluated column by column, and the work one column needs is done once for all
+its rules: a range rule reads the column as a number or date array, regex and allowed
+rules are tested on the distinct values of the column only and the results broadcast back
+through its codes. Each rule is then one NumPy mask over the rows, counted and reduced
+into the number of rules every row violates, so hundreds of rules make hundreds of
+vectorized operations and no loop over rows.
+"""
+import ast
+import io
+import json
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+RULE_TYPES = ('range', 'regex', 'allowed', 'expression')
+
+def load_rules(source) -> list:
+    """
+    Loads rules from a JSON file holding a list of rules, or an object with the list under "rules".
+
+    Args:
+        source (str or file-like): A file path, or a file object or bytes (such as an upload).
+
+    Returns:
+        list: The rules, checked with compile_rules().
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            rules = json.load(f)
+    else:
+        rules = json.load(source)
+    if isinstance(rules, dict):
+        rules = rules.get("rules")
+    if not isinstance(rules, list):
+        raise ValueError("A rule file must hold a list of rules, or an object with the list under \"rules\".")
+    return compile_rules(rules)
+
+def compile_rules(rules) -> list:
+    """
+    Checks rules and fills in their defaults.
+
+    Args:
+        rules (list): Rule dicts (see the module docstring).
+
+    Returns:
+        list: Copies of the rules, each with a "name". They hold only the values of the
+              rule file, so that they can be saved with a recipe again.
+
+    Raises:
+        ValueError: If a rule has an unknown type or lacks what its type needs.
+    """
+    compiled = []
+    for position, rule in enumerate(rules, 1):
+        rule = dict(rule)
+        kind = rule.get("type")
+        if kind not in RULE_TYPES:
+            raise ValueError(f"Rule {position}: invalid rule type. Choose one of {', '.join(RULE_TYPES)}.")
+        if kind == 'expression':
+            if not rule.get("expression"):
+                raise ValueError(f"Rule {position}: an expression rule needs an \"expression\".")
+        elif not rule.get("column"):
+            raise ValueError(f"Rule {position}: a {kind} rule needs a \"column\".")
+        if kind == 'range' and rule.get("min") is None and rule.get("max") is None:
+            raise ValueError(f"Rule {position}: a range rule needs a \"min\", a \"max\" or both.")
+        if kind == 'regex':
+            try:
+                re.compile(rule.get("pattern") or '')
+            except re.error as e:
+                raise ValueError(f"Rule {position}: invalid pattern: {e}") from e
+        if kind == 'allowed' and not isinstance(rule.get("values"), list):
+            raise ValueError(f"Rule {position}: an allowed rule needs a list of \"values\".")
+        rule.setdefault("name", f"{rule.get('column') or rule['expression']} {kind}")
+        compiled.append(rule)
+    return compiled
+
+class _Column:
+    """The views of one column that its rules share, each computed on first use."""
+
+    def __init__(self, series: pd.Series):
+        self.series = series
+        self._missing = self._values = self._codes = None
+
+    @property
+    def missing(self) -> np.ndarray:
+        if self._missing is None:
+            # The codes already tell missing values apart, without another scan of the strings
+            self._missing = self._codes[0] < 0 if self._codes is not None else self.series.isna().to_numpy()
+        return self._missing
+
+    @property
+    def values(self) -> np.ndarray:
+        """The column as float64 or datetime64 values; values that are neither are NaN."""
+        if self._values is None:
+            series = self.series
+            if is_datetime64_any_dtype(series.dtype):
+                self._values = series.to_numpy(dtype='datetime64[ns]')
+            elif is_numeric_dtype(series.dtype):
+                self._values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                self._values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._values
+
+    @property
+    def distinct(self) -> tuple:
+        """The codes of the rows and the distinct values of the column; missing values have the code -1."""
+        if self._codes is None:
+            if isinstance(self.series.dtype, pd.CategoricalDtype):
+                self._codes = self.series.cat.codes.to_numpy(), self.series.cat.categories
+            else:
+                self._codes = pd.factorize(self.series)
+        return self._codes
+
+    def broadcast(self, passed) -> np.ndarray:
+        """Rows whose distinct value failed, from one bool per distinct value; missing values pass."""
+        codes, _ = self.distinct
+        return np.append(~np.asarray(passed, dtype=bool), False)[codes]
+
+def _bound(value, values: np.ndarray):
+    return np.datetime64(pd.Timestamp(value).tz_localize(None), 'ns') if values.dtype.kind == 'M' else float(value)
+
+def _range_violations(column: _Column, rule) -> np.ndarray:
+    values = column.values
+    # Values that are not numbers (or dates) cannot be in range; missing values are handled by the caller
+    failed = np.isnat(values) if values.dtype.kind == 'M' else np.isnan(values)
+    if rule.get("min") is not None:
+        failed |= values < _bound(rule["min"], values)
+    if rule.get("max") is not None:
+        failed |= values > _bound(rule["max"], values)
+    return failed
+
+def _expression_columns(df, expression) -> list:
+    """The columns of df an expression reads: its names and its backtick-quoted names."""
+    quoted = set(re.findall(r'`([^`]*)`', expression))
+    tree = ast.parse(re.sub(r'`[^`]*`', '_', expression).strip(), mode='eval')
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    return [col for col in df.columns if str(col) in names or str(col) in quoted]
+
+def _expression_violations(df, rule) -> tuple:
+    """Rows the expression is false for, and the rows missing a value it reads."""
+    result = pd.Series(df.eval(rule["expression"]), index=df.index)
+    if not pd.api.types.is_bool_dtype(result.dtype):
+        raise ValueError(f"Rule '{rule['name']}': the expression must give True or False for every row.")
+    columns = _expression_columns(df, rule["expression"])
+    missing = df[columns].isna().to_numpy().any(axis=1) if columns else np.zeros(len(df), dtype=bool)
+    return ~result.fillna(True).to_numpy(dtype=bool), missing
+
+def _first_rows(failed: np.ndarray, limit: int) -> np.ndarray:
+    """Positions of the first limit True values of failed, looking only as far as needed."""
+    end = max(limit, 1) * 64
+    while True:
+        rows = np.flatnonzero(failed[:end])
+        if len(rows) >= limit or end >= len(failed):
+            return rows[:limit]
+        end *= 8
+
+def evaluate_rules(df, rules, limit: int = 100) -> tuple:
+    """
+    Evaluates rules against every row of df.
+
+    Args:
+        df (pd.DataFrame): The data.
+        rules (list): Rule dicts (see the module docstring).
+        limit (int, optional): Number of violating row labels listed per rule.
+
+    Returns:
+        tuple: One dict per rule with its name, type, column (None for expressions), the
+               number of violating rows under "count" and the labels of the first limit of
+               them under "rows"; and the number of rules each row violates, as an array.
+
+    Raises:
+        ValueError: If a rule is invalid or reads a column that is not in df.
+    """
+    rules = compile_rules(rules)
+    for rule in rules:
+        if rule["type"] != 'expression' and rule["column"] not in df.columns:
+            raise ValueError(f"Rule '{rule['name']}': column '{rule['column']}' does not exist in the DataFrame.")
+
+    counts = np.zeros(len(df), dtype=np.uint16)
+    report = [None] * len(rules)
+    # Rules of the same column run together, so that the column is converted once for all of them
+    order = sorted(range(len(rules)), key=lambda i: (rules[i]["type"] == 'expression', str(rules[i].get("column"))))
+    column, column_name = None, None
+    for i in order:
+        rule = rules[i]
+        if rule["type"] == 'expression':
+            failed, missing = _expression_violations(df, rule)
+            failed = failed | missing if rule.get("required") else failed & ~missing
+        else:
+            if column is None or column_name != rule["column"]:
+                column, column_name = _Column(df[rule["column"]]), rule["column"]
+            if rule["type"] == 'range':
+                failed = _range_violations(column, rule)
+                failed = failed | column.missing if rule.get("required") else failed & ~column.missing
+            else:
+                distinct = pd.Series(np.asarray(column.distinct[1], dtype=object))
+                if rule["type"] == 'regex':
+                    passed = distinct.astype(str).map(re.compile(rule.get("pattern") or '').fullmatch).notna()
+                else:
+                    # Values are compared as they are and as text, so that 1 and "1" both match
+                    passed = distinct.isin(rule["values"]) | distinct.astype(str).isin([str(v) for v in rule["values"]])
+                # Missing values pass the broadcast mask
+                failed = column.broadcast(passed)
+                if rule.get("required"):
+                    failed |= column.missing
+        counts += failed
+        report[i] = {"rule": rule["name"], "type": rule["type"], "column": rule.get("column"),
+                     "count": int(np.count_nonzero(failed)), "rows": df.index[_first_rows(failed, limit)].tolist()}
+    return report, counts
@@ -0,0 +1,88 @@
+import streamlit as st
+from utils.dataset_store import DatasetStore, make_history_entry
+from utils.profile import ProfileCache
+
+def init_dataset(df):
+    """
+    Starts a new versioned dataset from freshly loaded data.
+
+    The DatasetStore replaces the raw data slot: st.session_state.data always holds the
+    current version and st.session_state.cleaning_history the entries of the steps that
+    led to it.
+    """
+    store = DatasetStore(df)
+    st.session_state.dataset_store = store
+    # Column tokens are only unique within a store, so profiles start over with it
+    st.session_state.profile_cache = ProfileCache()
+    st.session_state.original_data = df
+    _sync(store)
+
+def _sync(store):
+    st.session_state.data = store.current
+    st.session_state.cleaning_history = store.history()
+
+def update_data(df, action=None, operation=None, **details):
+    """
+    Records df as the next version of the dataset.
+
+    History entries that were appended to st.session_state.cleaning_history since the
+    last version are attached to this step, followed by action when it is given. A call
+    that neither changes the data nor describes a step is ignored.
+
+    Args:
+        df (pd.DataFrame): The new state of the dataset.
+        action (str, optional): Description of the step for the cleaning history.
+        operation (dict, optional): The operation record returned by the kernel that made
+                                    the change (see kernels.operation_record). It is stored
+                                    on the last history entry of the step.
+        **details: Extra fields stored with the history entry.
+    """
+    store = st.session_state.get('dataset_store')
+    history = st.session_state.cleaning_history
+    start = len(store.history()) if store is not None else len(history)
+    if action:
+        history.append(make_history_entry(action, **details))
+    if operation is not None and len(history) > start:
+        history[-1] = dict(history[-1], operation=operation)
+
+    if store is None:
+        st.session_state.data = df
+        return
+
+    store.commit(df, history[start:])
+    _sync(store)
+
+def undo_step():
+    store = st.session_state.dataset_store
+    store.undo()
+    _sync(store)
+
+def redo_step():
+    store = st.session_state.dataset_store
+    store.redo()
+    _sync(store)
+
+def go_to_step(step):
+    """Move the dataset to the state after the given cleaning step (0 is the original data)."""
+    store = st.session_state.dataset_store
+    store.checkout(step)
+    _sync(store)
+
+def reset_data():
+    """Go back to the original data and clear the cleaning history."""
+    store = st.session_state.dataset_store
+    store.reset()
+    _sync(store)
+    st.session_state.cleaning_report["cleaning_steps"] = []
+
+def current_profile(approximate=False):
+    """
+    Return the profile of the current data. Only the columns changed since they were last
+    profiled are scanned; the other columns reuse the cached statistics. With approximate,
+    the statistics are estimated with sketches (see utils.sketches).
+    """
+    store = st.session_state.get('dataset_store')
+    cache = st.session_state.get('profile_cache')
+    if store is None or cache is None:
+        return ProfileCache().profile(st.session_state.data, approximate=approximate)
+    return cache.profile(store.current, store.column_tokens(), approximate)
@@ -0,0 +1,333 @@
+"""
+Mergeable sketches for approximate statistics over very large columns.
+
+Every sketch can be updated chunk by chunk and two sketches of the same kind can be
+merged, so a column can be summarized in parallel over row ranges with bounded memory:
+
+- HyperLogLog estimates the number of distinct values.
+- QuantileSketch (KLL) estimates quantiles with a bounded rank error.
+- FrequentItems (Misra-Gries) keeps the most frequent values with a bounded undercount.
+"""
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """Return a 64-bit hash of every value of a Series, equal for equal values."""
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of significant bits of every uint64 value (0 for 0)."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # frexp is exact for integers below 2**53, so split into 32-bit halves
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+class HyperLogLog:
+    """Distinct count estimate with a relative standard error of 1.04 / sqrt(2 ** precision)."""
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update_hashes(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+        rank = (bits - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, series: pd.Series):
+        self.update_hashes(hash_values(series.dropna()))
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return m * math.log(m / zeros)
+        return float(raw)
+
+class QuantileSketch:
+    """
+    KLL quantile sketch. Values are kept in levels of sorted compactors; a full level is
+    halved by keeping every other value, which doubles the weight of the survivors.
+    Quantile estimates are within rank_error * n ranks of the true quantile.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        # Normalized rank error of a single quantile query, as published for KLL sketches
+        return 2.446 / self.k ** 0.9433
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(8, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                # An odd value out stays at this level with its current weight
+                keep = items[:1] if len(items) % 2 else items[:0]
+                items = items[len(keep):]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, fractions) -> np.ndarray:
+        """Return the estimated values at the given fractions (between 0 and 1) of the data."""
+        fractions = np.atleast_1d(np.asarray(fractions, dtype=np.float64))
+        if self.n == 0:
+            return np.full(len(fractions), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, fractions * cumulative[-1], side='left')
+        return items[np.minimum(positions, len(items) - 1)]
+
+    def quantile(self, fraction: float) -> float:
+        return float(self.quantiles([fraction])[0])
+
+class FrequentItems:
+    """
+    Misra-Gries summary of the most frequent values. Counts are lower bounds that are at
+    most `error` below the true counts, and error never exceeds n / (k + 1).
+    """
+
+    def __init__(self, k: int = 64):
+        self.k = k
+        self.n = 0
+        self.error = 0
+        self.counts = pd.Series(dtype='int64')
+
+    def update(self, series: pd.Series):
+        self.update_counts(series.dropna().value_counts(sort=False))
+
+    def update_counts(self, counts: pd.Series):
+        """Add exact counts of distinct values, e.g. from value_counts() of a chunk."""
+        counts = counts[counts > 0].astype('int64')
+        if isinstance(counts.index, pd.CategoricalIndex):
+            counts.index = counts.index.astype(object)
+        self.n += int(counts.sum())
+        self._add(counts)
+
+    def merge(self, other: "FrequentItems"):
+        self.n += other.n
+        self.error += other.error
+        self._add(other.counts)
+
+    def _prune(self, counts: pd.Series) -> pd.Series:
+        """Subtract the (k+1)-th largest count from every counter and drop the ones at zero."""
+        if len(counts) <= self.k:
+            return counts
+        cut = int(np.partition(counts.to_numpy(), len(counts) - self.k - 1)[len(counts) - self.k - 1])
+        self.error += cut
+        counts = counts - cut
+        return counts[counts > 0]
+
+    def _add(self, counts: pd.Series):
+        # Pruning before combining keeps the alignment small; summaries stay mergeable either way
+        counts = self._prune(counts)
+        if not self.counts.empty:
+            counts = self._prune(self.counts.add(counts, fill_value=0).astype('int64'))
+        self.counts = counts
+
+    def top(self, n: int = 1) -> pd.Series:
+        """Return the n values with the highest estimated counts."""
+        return self.counts.nlargest(n)
+
+class ColumnSketch:
+    """
+    Approximate summary of one column: exact count, missing values, min, max, mean and
+    standard deviation, plus sketches for distinct values, frequent values and quantiles.
+    """
+
+    def __init__(self, kind: str, dtype=None, precision: int = 14, k: int = 200, top_k: int = 64):
+        self.kind = kind  # 'numeric', 'datetime' or 'other'
+        self.dtype = dtype
+        self.rows = 0
+        self.missing = 0
+        self.distinct = HyperLogLog(precision)
+        # Series.describe() only reports the most frequent value of non-numeric columns
+        self.frequent = FrequentItems(top_k) if kind == 'other' else None
+        self.quantiles = QuantileSketch(k) if kind != 'other' else None
+        # Mergeable moments (Chan et al.) and extremes for numeric and datetime columns
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @staticmethod
+    def kind_of(series: pd.Series) -> str:
+        if is_bool_dtype(series.dtype):
+            return 'other'
+        if is_datetime64_any_dtype(series.dtype):
+            return 'datetime'
+        if is_numeric_dtype(series.dtype):
+            return 'numeric'
+        return 'other'
+
+    def update(self, series: pd.Series):
+        values = series.dropna()
+        self.rows += len(series)
+        self.missing += len(series) - len(values)
+        if self.frequent is not None:
+            # Count each distinct value once and hash only the distinct values
+            codes, uniques = pd.factorize(values, sort=False)
+            counts = np.bincount(codes, minlength=len(uniques))
+            self.distinct.update_hashes(hash_values(pd.Series(uniques)))
+            self.frequent.update_counts(pd.Series(counts, index=uniques))
+        else:
+            self.distinct.update_hashes(hash_values(values))
+        if self.quantiles is not None and len(values):
+            if self.kind == 'datetime':
+                numbers = values.dt.as_unit('ns').array.asi8.astype(np.float64)
+            else:
+                numbers = values.to_numpy(dtype=np.float64)
+            self.quantiles.update(numbers)
+            self._add_moments(len(numbers), float(numbers.mean()), float(((numbers - numbers.mean()) ** 2).sum()),
+                              float(numbers.min()), float(numbers.max()))
+
+    def _add_moments(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def merge(self, other: "ColumnSketch"):
+        self.rows += other.rows
+        self.missing += other.missing
+        self.distinct.merge(other.distinct)
+        if self.frequent is not None:
+            self.frequent.merge(other.frequent)
+        if self.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+            if other.count:
+                self._add_moments(other.count, other.mean, other.m2, other.min, other.max)
+
+    def stats(self) -> dict:
+        """Return the statistics under the names used by Series.describe()."""
+        stats = {"count": self.rows - self.missing}
+        if self.kind == 'other':
+            top = self.frequent.top(1)
+            stats.update({
+                "unique": min(int(round(self.distinct.estimate())), stats["count"]),
+                "top": top.index[0] if len(top) else np.nan,
+                "freq": int(top.iloc[0]) if len(top) else np.nan,
+            })
+            return stats
+        if not self.count:
+            return stats
+        q25, q50, q75 = self.quantiles.quantiles([0.25, 0.5, 0.75])
+        values = {"mean": self.mean, "min": self.min, "25%": q25, "50%": q50, "75%": q75, "max": self.max}
+        if self.kind == 'datetime':
+            tz = getattr(self.dtype, 'tz', None)
+            stats.update({name: pd.Timestamp(int(value), tz=tz) for name, value in values.items()})
+        else:
+            stats.update(values)
+            stats["std"] = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        return stats
+
+    def errors(self) -> dict:
+        """Return the error bounds of the estimated statistics."""
+        errors = {"unique": self.distinct.relative_error}
+        if self.frequent is not None:
+            errors["freq"] = self.frequent.error
+        if self.quantiles is not None:
+            errors["quantile_rank"] = self.quantiles.rank_error
+        return errors
+
+def quantile_sketch(series: pd.Series, k: int = 200) -> QuantileSketch:
+    """Build a QuantileSketch of the values of a numeric Series."""
+    sketch = QuantileSketch(k)
+    sketch.update(series.to_numpy(dtype=np.float64, na_value=np.nan))
+    return sketch
+
+def sketch_series(series: pd.Series, **sketch_options) -> ColumnSketch:
+    """Summarize a whole Series in one ColumnSketch."""
+    sketch = ColumnSketch(ColumnSketch.kind_of(series), series.dtype, **sketch_options)
+    sketch.update(series)
+    return sketch
+
+def sketch_frame(df: pd.DataFrame, chunk_rows: int = 1_000_000, workers: int = None, **sketch_options) -> dict:
+    """
+    Summarizes every column of a DataFrame with ColumnSketch objects.
+
+    The rows are split into chunks of chunk_rows; each (column, chunk) pair is sketched
+    on a thread pool and the chunk sketches of a column are merged. Hashing, counting
+    and sorting run in pandas and numpy code that releases the GIL for most of the work.
+
+    Args:
+        df (pd.DataFrame): The data to summarize.
+        chunk_rows (int, optional): Rows per chunk.
+        workers (int, optional): Number of threads. Defaults to the number of CPUs.
+        **sketch_options: precision, k and top_k for ColumnSketch.
+
+    Returns:
+        dict: Column position to its ColumnSketch.
+    """
+    starts = range(0, max(len(df), 1), chunk_rows)
+    tasks = [(position, start) for position in range(df.shape[1]) for start in starts]
+
+    def run(task):
+        position, start = task
+        return position, sketch_series(df.iloc[start:start + chunk_rows, position], **sketch_options)
+
+    sketches = {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        for position, sketch in executor.map(run, tasks):
+            if position in sketches:
+                sketches[position].merge(sketch)
+            else:
+                sketches[position] = sketch
+    return sketches
@@ -0,0 +1,168 @@
+"""
+Standardization of categorical values against synonym dictionaries.
+
+A dictionary maps each standard value to its variants, e.g. {"United States": ["us",
+"usa", "u.s.a."]}, and is loaded from a JSON or CSV file with load_synonyms(). Values are
+matched after case folding and trimming, so the dictionary lists each spelling once.
+
+The work runs over the distinct values of a column (the categories of a categorical
+column, the uniques of pd.factorize() otherwise): each one is normalized and looked up once
+in a single dictionary lookup, and the results are broadcast back through the codes, so
+the cost grows with the number of distinct values rather than rows. Missing values stay
+missing. merge_values() replaces exact values the same way, e.g. to merge the clusters of
+utils.key_collision into their canonical values.
+"""
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_string_dtype
+
+try:
+    import pyarrow  # noqa: F401  (string[pyarrow] runs the string operations in Arrow)
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string[python]'
+
+def normalize_labels(strings) -> pd.Series:
+    """Case-fold, trim and collapse the inner whitespace of strings; missing values stay missing."""
+    strings = pd.Series(strings, dtype=object).astype(_STRING_DTYPE)
+    return strings.str.lower().str.strip().str.replace(r'\s+', ' ', regex=True)
+
+def synonym_lookup(synonyms: dict) -> dict:
+    """
+    Builds the lookup table of a synonym dictionary.
+
+    Args:
+        synonyms (dict): Standard values mapped to lists of their variants.
+
+    Returns:
+        dict: Normalized variants (and standard values) mapped to their standard value.
+
+    Raises:
+        ValueError: If a variant is listed under two standard values.
+    """
+    standards, variants = [], []
+    for standard, spellings in synonyms.items():
+        spellings = [spellings] if isinstance(spellings, str) else list(spellings)
+        standards.extend([standard] * (len(spellings) + 1))
+        variants.extend([standard, *spellings])
+    # All spellings are normalized in one pass
+    table = pd.DataFrame({'key': normalize_labels(variants).to_numpy(dtype=object), 'standard': standards,
+                          'variant': variants}).dropna(subset=['key']).drop_duplicates(['key', 'standard'])
+    conflicts = table[table.duplicated('key', keep=False)]
+    if len(conflicts):
+        first, second = conflicts.iloc[0], conflicts[conflicts['key'] == conflicts.iloc[0]['key']].iloc[1]
+        raise ValueError(f"'{second['variant']}' is a variant of both '{first['standard']}' and '{second['standard']}'.")
+    return dict(zip(table['key'], table['standard']))
+
+def load_synonyms(source, file_type: str = None) -> dict:
+    """
+    Loads a synonym dictionary from a JSON or CSV file.
+
+    JSON files hold an object of standard values mapped to lists of variants. CSV files
+    have a header row and two columns, the variant and its standard value; a standard value
+    may take any number of rows.
+
+    Args:
+        source (str or file-like): A file path, or a file object or bytes (such as an upload).
+        file_type (str, optional): 'json' or 'csv'. Taken from the file name when not given.
+
+    Returns:
+        dict: Standard values mapped to lists of their variants.
+    """
+    if file_type is None:
+        name = source if isinstance(source, str) else getattr(source, 'name', '')
+        file_type = os.path.splitext(name)[1].lstrip('.').lower() or 'json'
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if file_type == 'json':
+        if isinstance(source, str):
+            with open(source, 'r', encoding='utf-8') as f:
+                synonyms = json.load(f)
+        else:
+            synonyms = json.load(source)
+        if not isinstance(synonyms, dict):
+            raise ValueError("A synonym file must hold an object of standard values mapped to lists of variants.")
+        return synonyms
+    if file_type == 'csv':
+        table = pd.read_csv(source, dtype=str, keep_default_na=False)
+        if table.shape[1] < 2:
+            raise ValueError("A synonym file must have two columns: the variant and its standard value.")
+        variants, standards = table.columns[:2]
+        return table.groupby(standards, sort=False)[variants].agg(list).to_dict()
+    raise ValueError(f"Unsupported synonym file type '{file_type}'. Use a JSON or CSV file.")
+
+def _distinct(series: pd.Series) -> tuple:
+    """Codes and distinct values of a column: the categories of a categorical one, the uniques of pd.factorize() otherwise."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series)
+
+def _broadcast(series: pd.Series, codes: np.ndarray, distinct: np.ndarray) -> pd.Series:
+    """Build the column whose rows take the new distinct values through codes, keeping its kind."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories that now share a spelling are merged
+        new_codes, categories = pd.factorize(distinct)
+        codes = np.append(new_codes, -1)[codes]
+        result = pd.Categorical.from_codes(codes, categories, ordered=series.cat.ordered and
+                                           len(categories) == len(distinct))
+        return pd.Series(result, index=series.index, name=series.name)
+
+    # Missing values have the code -1, which picks the missing value appended at the end
+    result = pd.Series(np.append(distinct, np.nan)[codes], index=series.index, name=series.name, dtype=object)
+    if is_string_dtype(series.dtype) and series.dtype != object:
+        result = result.astype(series.dtype)
+    return result
+
+def standardize_values(values, synonyms: dict = None) -> tuple:
+    """
+    Normalizes categorical values and maps their variants to standard values.
+
+    Values are case-folded and trimmed; the ones found in synonyms take their standard
+    value as it is written there, the others are kept normalized.
+
+    Args:
+        values (pd.Series): The values. Categorical columns stay categorical, with
+                            their categories standardized and merged.
+        synonyms (dict, optional): Standard values mapped to lists of their variants.
+
+    Returns:
+        tuple: The standardized values as a Series aligned with values, and the number of
+               distinct values that were mapped to a standard value.
+    """
+    series = pd.Series(values)
+    codes, uniques = _distinct(series)
+
+    # Every step below runs once per distinct value
+    normalized = normalize_labels(pd.Index(uniques, dtype=object).astype(str))
+    standard = normalized.map(synonym_lookup(synonyms or {}))
+    mapped = int(standard.notna().sum())
+    standardized = standard.astype(object).where(standard.notna(), normalized.astype(object)).to_numpy()
+    return _broadcast(series, codes, standardized), mapped
+
+def merge_values(values, merges: dict) -> tuple:
+    """
+    Replaces values by the canonical value of their cluster, matching them exactly.
+
+    Args:
+        values (pd.Series): The values. Categorical columns stay categorical.
+        merges (dict): Canonical values mapped to lists of the values merged into them.
+
+    Returns:
+        tuple: The merged values as a Series aligned with values, and the number of rows
+               whose value changed.
+    """
+    series = pd.Series(values)
+    codes, uniques = _distinct(series)
+    replacements = {value: canonical for canonical, merged in merges.items() for value in merged}
+    distinct = np.asarray(uniques, dtype=object)
+    # Values are looked up as they are and as text, since recipes store them as JSON strings
+    merged = pd.Series(distinct).map(lambda value: replacements.get(value, replacements.get(str(value), value)))
+    merged = merged.to_numpy(dtype=object)
+    changed = np.append(merged != distinct, False)[codes]
+    if not changed.any():
+        return series, 0
+    return _broadcast(series, codes, merged), int(changed.sum())
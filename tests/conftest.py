@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app modules import each other as top-level packages (utils.x, components.x), as when run with streamlit
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
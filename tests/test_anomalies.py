@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.error_correction import detect_anomalies
+from src.utils.anomalies import score_anomalies
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"x": rng.normal(0, 1, 2_000), "y": rng.normal(0, 1, 2_000), "name": ["a"] * 2_000})
+    # Far from every other row in both columns together
+    frame.loc[7, ["x", "y"]] = 6.0, -6.0
+    frame.loc[11, "x"] = np.nan
+    return frame
+
+@pytest.mark.parametrize("method", ['isolation_forest', 'lof'])
+def test_the_planted_anomaly_scores_lowest(df, method):
+    scores, anomalous = score_anomalies(df, ["x", "y"], method, contamination=0.005, sample_size=1_000)
+
+    assert scores.argmin() == 7
+    assert anomalous[7]
+    assert anomalous.sum() <= 30
+
+def test_identical_rows_score_alike_and_batches_do_not_change_scores(df):
+    df = pd.concat([df, df.head(50)], ignore_index=True)
+
+    scores, _ = score_anomalies(df, ["x", "y"], sample_size=500, batch_size=100_000)
+    batched, _ = score_anomalies(df, ["x", "y"], sample_size=500, batch_size=64, workers=2)
+
+    np.testing.assert_array_equal(scores[:50], scores[-50:])
+    np.testing.assert_allclose(scores, batched)
+
+def test_flag_and_quarantine(df):
+    progress = []
+    flagged, record = detect_anomalies(df, ["x", "y"], contamination=0.005, score_column="score",
+                                       progress_callback=progress.append)
+    quarantined, _ = detect_anomalies(df, ["x", "y"], contamination=0.005, action='quarantine')
+
+    assert flagged.loc[7, "is_anomaly"] and "is_anomaly" not in df
+    assert record["details"]["anomalies"]["count"] == flagged["is_anomaly"].sum() == len(df) - len(quarantined)
+    assert 7 in record["details"]["anomalies"]["rows"] and 7 not in quarantined.index
+    assert flagged["score"].idxmin() == 7
+    assert progress[-1] == 1.0
+
+def test_invalid_parameters(df):
+    with pytest.raises(ValueError):
+        detect_anomalies(df, ["x"], method='svm')
+    with pytest.raises(ValueError):
+        detect_anomalies(df, ["x"], contamination=0.9)
+    with pytest.raises(ValueError):
+        detect_anomalies(df, ["x"], action='delete')
+    with pytest.raises(ValueError):
+        detect_anomalies(df, ["missing"])
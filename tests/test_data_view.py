@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.data_view import query_rows
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'amount': rng.integers(0, 50, 1_000).astype(float),
+        'city': rng.choice(['Athens', 'Paris', 'Thessaloniki', None], 1_000),
+    })
+    df.loc[::9, 'amount'] = np.nan
+    return df
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("page", [0, 5, 19])
+def test_sorted_pages_match_a_stable_sort(df, ascending, page):
+    rows, matched = query_rows(df, page, 50, sort_by='amount', ascending=ascending)
+
+    expected = df.sort_values('amount', ascending=ascending, kind='stable').iloc[page * 50:(page + 1) * 50]
+    assert matched == len(df)
+    pd.testing.assert_frame_equal(rows, expected)
+
+def test_search_and_filters_are_combined(df):
+    rows, matched = query_rows(df, 0, 1_000, search='SALON', filters={'amount': {'min': 10, 'max': 20}})
+
+    expected = df[df['city'].eq('Thessaloniki') & df['amount'].between(10, 20)]
+    assert matched == len(expected)
+    pd.testing.assert_frame_equal(rows, expected)
+
+def test_page_is_clamped_to_the_last_page(df):
+    rows, matched = query_rows(df, 100, 300, filters={'city': {'values': ['Paris']}})
+
+    expected = df[df['city'] == 'Paris']
+    pd.testing.assert_frame_equal(rows, expected.iloc[(len(expected) - 1) // 300 * 300:])
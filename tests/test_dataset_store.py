@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.dataset_store import DatasetStore, enable_copy_on_write, make_history_entry
+
+@pytest.fixture
+def store():
+    enable_copy_on_write()
+    df = pd.DataFrame({'id': np.arange(1000), 'name': ['Alice', 'Bob'] * 500, 'salary': np.linspace(1, 2, 1000)})
+    return DatasetStore(df)
+
+def test_commit_stores_only_changed_columns(store):
+    df = store.current.copy(deep=False)
+    df['name'] = df['name'].str.upper()
+    changed = store.commit(df, [make_history_entry("Uppercased names")])
+
+    assert changed == ['name']
+    assert store.column_tokens(1)['id'] == store.column_tokens(0)['id']
+    assert store.column_tokens(1)['name'] != store.column_tokens(0)['name']
+    assert store.history()[0]['step'] == 1
+
+def test_in_place_edits_do_not_leak_into_earlier_versions(store):
+    df = store.current
+    df.loc[0, 'salary'] = -1.0
+    store.commit(df)
+    assert store.original.loc[0, 'salary'] == 1.0
+    assert store.current.loc[0, 'salary'] == -1.0
+
+def test_undo_redo_and_checkout(store):
+    for i in range(3):
+        df = store.current.copy(deep=False)
+        df[f'extra_{i}'] = i
+        store.commit(df, [make_history_entry(f"Added extra_{i}")])
+
+    store.undo()
+    assert 'extra_2' not in store.current.columns and store.can_redo
+    store.checkout(1)
+    assert list(store.current.columns) == ['id', 'name', 'salary', 'extra_0']
+    store.redo()
+    assert 'extra_1' in store.current.columns
+    assert len(store.history()) == 2
+
+def test_unchanged_commit_without_entries_is_ignored(store):
+    store.commit(store.current.copy())
+    assert store.latest == 0
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.formatting import fix_inconsistent_formats
+from src.kernels.type_conversion import type_conversion
+from src.utils.date_parsing import infer_date_formats, parse_dates
+
+MIXED = pd.Series(['2024-01-15', '15/01/2024', 'Jan 16, 2024', '2024-01-17 10:30:00', ' 2024-01-18 ',
+                   'not a date', '', None, '2024-01-15'])
+
+def test_mixed_formats_are_parsed_and_failures_reported():
+    dates, failed, formats = parse_dates(MIXED, fallback=False)
+
+    expected = [pd.Timestamp(day) for day in ['2024-01-15', '2024-01-15', '2024-01-16', '2024-01-17 10:30', '2024-01-18']]
+    pd.testing.assert_series_equal(dates, pd.Series(expected + [pd.NaT] * 3 + [pd.Timestamp('2024-01-15')]))
+    assert failed.tolist() == [False] * 5 + [True] + [False] * 3
+    assert formats[0] == 'ISO8601'
+
+@pytest.mark.parametrize("dayfirst, month", [(False, 3), (True, 4)])
+def test_dayfirst_decides_ambiguous_columns_only(dayfirst, month):
+    ambiguous, _, _ = parse_dates(pd.Series(['03/04/2024', '05/06/2024']), dayfirst=dayfirst)
+    day_first, failed, _ = parse_dates(pd.Series(['03/04/2024', '13/04/2024']), dayfirst=dayfirst)
+
+    assert ambiguous.dt.month.tolist() == [month, month + 2]
+    assert day_first.dt.month.tolist() == [4, 4]
+    assert not failed.any()
+
+def test_formats_are_inferred_from_the_most_common_first():
+    strings = [f"{day:02d}.05.2023" for day in range(1, 29)] + ["May 3, 2023"]
+
+    assert infer_date_formats(strings) == ['%d.%m.%Y', '%b %d, %Y']
+
+def test_kernels_report_the_rows_that_failed():
+    df = pd.DataFrame({'when': MIXED.to_numpy()}, index=np.arange(10, 19))
+
+    fixed, record = fix_inconsistent_formats(df, 'when', 'date')
+    converted, conversion = type_conversion(df, {'datetime': ['when']})
+
+    assert fixed['when'].tolist()[:3] == ['2024-01-15', '2024-01-15', '2024-01-16']
+    assert record["details"]["failed"] == {"count": 1, "rows": [15]}
+    assert conversion["details"]["failed"] == {"when": {"count": 1, "rows": [15]}}
+    assert converted['when'].dtype == 'datetime64[ns]'
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.entity_resolution import component_roots, resolve_entities
+
+@pytest.fixture
+def customers():
+    return pd.DataFrame({
+        'name': ['Acme Corporation', 'ACME Corporation Inc', 'Globex Ltd', 'Acme Corporaton', 'Initech', 'Globex Limited'],
+        'city': ['Athens', 'Athens', 'Paris', 'Athens', 'Berlin', 'Paris'],
+        'phone': ['2101234567', None, '0144556677', '2101234567', '0301112233', '0144556677'],
+        'updated': pd.to_datetime(['2021-01-01', '2023-05-01', '2020-01-01', '2022-01-01', '2021-01-01', '2024-02-01']),
+    })
+
+COMPARATORS = [
+    {"column": "name", "method": "fuzzy", "weight": 2},
+    {"column": "city", "method": "exact"},
+    {"column": "phone", "method": "exact"},
+]
+
+def test_components_are_named_after_their_first_member():
+    roots = component_roots(6, np.array([4, 1, 5]), np.array([2, 4, 3]))
+
+    assert roots.tolist() == [0, 1, 1, 3, 1, 3]
+    # Repeated edges and edges from an element to itself change nothing
+    roots = component_roots(6, np.array([4, 1, 5, 2, 0]), np.array([2, 4, 3, 4, 0]))
+    assert roots.tolist() == [0, 1, 1, 3, 1, 3]
+
+def test_records_are_clustered_and_the_most_complete_row_survives(customers):
+    resolved, record = resolve_entities(customers, COMPARATORS, cluster_column='cluster')
+
+    assert resolved.index.tolist() == [0, 2, 4]
+    assert resolved['cluster'].tolist() == [0, 1, 2]
+    assert record["details"]["clusters"] == 2
+    assert record["details"]["rows_in_clusters"] == 5
+    assert record["details"]["rows_removed"] == 3
+
+def test_most_recent_survivor_and_keeping_all_rows(customers):
+    kept, _ = resolve_entities(customers, COMPARATORS, drop=False, cluster_column='cluster')
+    resolved, _ = resolve_entities(customers, COMPARATORS, survivor='most_recent', recency_column='updated')
+
+    assert kept['cluster'].tolist() == [0, 0, 1, 0, 2, 1]
+    assert resolved.index.tolist() == [1, 4, 5]
+
+def test_too_many_candidate_pairs_raise(customers):
+    with pytest.raises(ValueError, match="candidate pairs"):
+        resolve_entities(customers, COMPARATORS, max_pairs=2)
@@ -0,0 +1,84 @@
+import io
+import pandas as pd
+import pytest
+from src.utils import file_operations
+from src.utils.file_operations import read_csv_chunked, read_csv_file, split_csv_ranges
+
+@pytest.fixture
+def csv_bytes():
+    df = pd.DataFrame({
+        'id': range(1, 1001),
+        'city': ['New York', 'Chicago', 'Houston', 'Boston'] * 250,
+        'name': [f'Person {i}' for i in range(1000)],
+        'salary': [50000.5 + i for i in range(1000)]
+    })
+    # A trailing block without any cities would be parsed as float64 on its own
+    df.loc[900:, 'city'] = None
+    return df.to_csv(index=False).encode()
+
+def test_read_csv_chunked_matches_one_shot_read(csv_bytes):
+    expected = pd.read_csv(io.BytesIO(csv_bytes))
+    result = read_csv_chunked(io.BytesIO(csv_bytes), chunksize=100, sample_rows=200)
+    assert isinstance(result['city'].dtype, pd.CategoricalDtype)
+    assert result['name'].dtype == object
+    pd.testing.assert_frame_equal(result.astype({'city': object}), expected)
+
+def test_read_csv_chunked_reports_progress(csv_bytes):
+    progress = []
+    read_csv_file(io.BytesIO(csv_bytes), chunksize=250, progress_callback=progress.append)
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0
+
+def test_split_csv_ranges_never_splits_quoted_newlines():
+    content = b'id,comment\n1,"first\nline"\n2,"say ""hi""\n, twice"\n3,plain\n'
+    header, ranges = split_csv_ranges(content, parts=10)
+    assert header == b'id,comment\n'
+    records = [content[start:end] for start, end in ranges]
+    assert b''.join(records) == content[len(header):]
+    for record in records:
+        assert record.count(b'"') % 2 == 0
+
+def test_read_csv_parallel_matches_one_shot_read(csv_bytes, monkeypatch):
+    monkeypatch.setattr(file_operations, 'PARALLEL_MIN_BYTES', 0)
+    expected = pd.read_csv(io.BytesIO(csv_bytes))
+    result = file_operations.read_csv_parallel(io.BytesIO(csv_bytes), workers=4, use_processes=False)
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_read_csv_parallel_infers_each_column_over_the_whole_file(monkeypatch):
+    monkeypatch.setattr(file_operations, 'PARALLEL_MIN_BYTES', 0)
+    df = pd.DataFrame({
+        # Leading zeros early on, letters later: only text holds both
+        'code': [f'{i:03d}' for i in range(500)] + [f'A{i}' for i in range(500)],
+        'flag': ['True', 'False'] * 450 + ['unknown'] * 100,
+        'amount': list(range(999)) + [0.5],
+    })
+    content = df.to_csv(index=False).encode()
+    expected = pd.read_csv(io.BytesIO(content))
+    result = file_operations.read_csv_parallel(content, workers=4, use_processes=False)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result['code'].iloc[0] == '000'
+    subset = file_operations.read_csv_parallel(content, workers=4, use_processes=False, usecols=['amount', 'code'])
+    pd.testing.assert_frame_equal(subset, pd.read_csv(io.BytesIO(content), usecols=['amount', 'code']))
+
+@pytest.mark.parametrize('extension', ['parquet', 'feather', 'arrow'])
+def test_columnar_round_trip_with_projection_and_filters(tmp_path, extension):
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'id': range(10), 'city': ['Athens', 'Patras'] * 5, 'salary': [1000.0 * i for i in range(10)]})
+    path = tmp_path / f'data.{extension}'
+    file_operations.write_data_file(df, path)
+
+    result = file_operations.read_data_file(path, columns=['id', 'city'], filters=[('city', '==', 'Athens')])
+    assert list(result.columns) == ['id', 'city']
+    assert result['id'].tolist() == [0, 2, 4, 6, 8]
+
+@pytest.mark.parametrize('extension, row_groups', [('parquet', None), ('parquet', [0]), ('feather', None), ('arrow', None)])
+def test_columnar_filters_on_columns_outside_the_projection(tmp_path, extension, row_groups):
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'id': range(10), 'city': ['Athens', 'Patras'] * 5, 'salary': [1000.0 * i for i in range(10)]})
+    path = tmp_path / f'data.{extension}'
+    file_operations.write_data_file(df, path)
+
+    result = file_operations.read_data_file(path, columns=['id'], row_groups=row_groups,
+                                            filters=[[('city', '==', 'Athens'), ('salary', '>', 3000)]])
+    assert list(result.columns) == ['id']
+    assert result['id'].tolist() == [4, 6, 8]
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.fuzzy_matching import candidate_pairs, similar_strings
+
+from src.kernels.duplicates import remove_fuzzy_duplicates
+
+NAMES = [
+    "Acme Corporation", "ACME Corp.", "Acme Corporatoin", "Globex Inc", "Globex Incorporated",
+    "Initech", "Initech LLC", "Umbrella Holdings", "Umbrela Holdings", "Hooli", "Stark Industries",
+    "Wayne Enterprises", "Wayne Enterprise", "Café Olé", "Cafe Ole", "Tyrell", "Cyberdyne Systems",
+    "Soylent Green Co", "Soylent Co", "Vandelay Industries", "x", "",
+]
+
+def quadratic_similar(values, threshold):
+    process = pytest.importorskip("thefuzz.process")
+    duplicates = set()
+    for value in values:
+        duplicates.update(m[0] for m in process.extract(value, values, limit=None) if m[1] >= threshold and m[0] != value)
+    return duplicates
+
+@pytest.mark.parametrize("threshold", [80, 88, 90, 95])
+def test_matches_thefuzz_extract(threshold):
+    assert similar_strings(NAMES, threshold) == quadratic_similar(NAMES, threshold)
+
+def test_candidate_pairs_share_an_ngram():
+    pairs = candidate_pairs(["abcd", "xbcd", "wxyz", "abcd wxyz"])
+
+    assert pairs.tolist() == [[0, 1], [0, 3], [1, 3], [2, 3]]
+    assert candidate_pairs(["abcd", "abcd wxyz"], min_overlap=0.9).tolist() == [[0, 1]]
+    assert candidate_pairs(["abc", "xyz"], max_block=1).shape == (0, 2)
+
+def test_remove_fuzzy_duplicates_keeps_unmatched_rows():
+    df = pd.DataFrame({"company": ["Acme Corporation", "Acme Corporatoin", "Hooli", None, "Hooli"]})
+
+    cleaned, record = remove_fuzzy_duplicates(df, "company", 90)
+
+    assert cleaned["company"].tolist() == ["Hooli", None, "Hooli"]
+    assert record["details"] == {"rows_removed": 2, "similar_values": 2}
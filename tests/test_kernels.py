@@ -0,0 +1,49 @@
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from src.utils.recipes import OPERATIONS
+
+from src.kernels.error_correction import fix_negative_values
+from src.kernels.missing_data import handle_missing_data
+from src.kernels.text_parsing import split_full_name
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'name': ['Ann Lee', 'Bob Ray', None], 'amount': [10.0, -5.0, None]})
+
+def test_kernels_return_result_and_record_without_modifying_input(df):
+    fixed, record = fix_negative_values(df, ['amount'], method='zero')
+
+    assert fixed['amount'].tolist()[:2] == [10.0, 0.0]
+    assert df['amount'].tolist()[1] == -5.0
+    assert record == {
+        "operation": "fix_negative_values",
+        "params": {"columns": ['amount'], "method": 'zero'},
+        "details": {"columns": [{"column": 'amount', "count": 1}]},
+    }
+
+def test_record_params_replay_the_operation(df):
+    first, record = split_full_name(df, 'name', 'Given', 'Family')
+    replayed, _ = OPERATIONS[record["operation"]](df, **record["params"])
+
+    pd.testing.assert_frame_equal(first, replayed)
+    assert first['Family'].tolist()[:2] == ['Lee', 'Ray']
+
+def test_kernels_run_in_worker_processes(df):
+    pickle.dumps(OPERATIONS)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(handle_missing_data, [df, df], ['drop', 'flag']))
+
+    assert results[0][1]["details"] == {"rows_removed": 1}
+    assert results[1][0]['missing_flag'].tolist() == [False, False, True]
+
+def test_kernels_do_not_import_streamlit():
+    code = "import sys, utils.recipes; assert 'streamlit' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=SRC, check=True)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.categorical import merge_category_clusters
+from src.utils.key_collision import collision_keys, key_collision_clusters, readable_keys
+
+COMPANIES = pd.Series(["Acme Inc.", "ACME, Inc", "acme inc", "Acme Inc.", "inc acme", "Data Corp", "DataCorp",
+                       "Smith Jonson", "Smyth Johnson", "Café Noir", "cafe noir", None, " -- ", "Other"])
+
+def clusters_of(table):
+    return sorted(sorted(group) for group in table.groupby("cluster")["value"].agg(list))
+
+def test_fingerprint_ignores_case_accents_punctuation_and_word_order():
+    table = key_collision_clusters(COMPANIES, 'fingerprint')
+
+    assert clusters_of(table) == [["ACME, Inc", "Acme Inc.", "acme inc", "inc acme"], ["Café Noir", "cafe noir"]]
+    # The cluster covering most rows comes first, its most common value first
+    assert table.iloc[0].tolist() == [0, "Acme Inc.", 2]
+
+def test_ngram_and_phonetic_keys_catch_other_variants():
+    ngram = clusters_of(key_collision_clusters(COMPANIES, 'ngram', 2))
+    phonetic = clusters_of(key_collision_clusters(COMPANIES, 'phonetic'))
+
+    assert ["Data Corp", "DataCorp"] in ngram
+    assert ["Smith Jonson", "Smyth Johnson"] in phonetic
+    assert readable_keys(["Robert", "Rupert", "Ashcraft Tymczak"], 'phonetic') == ["r163", "r163", "a261 t522"]
+
+def test_keys_do_not_depend_on_the_other_strings():
+    strings = ["Data Corp", "DataCorp", "corp data", "data"]
+
+    keys = collision_keys(strings, 'ngram', 3)
+
+    assert keys[0] == keys[1] and keys[2] != keys[0]
+    assert (collision_keys(strings[::-1], 'ngram', 3)[::-1] == keys).all()
+    assert collision_keys([" -- "])[0] == 0
+    with pytest.raises(ValueError):
+        collision_keys(strings, 'soundex')
+
+def test_clusters_merge_into_their_canonical_values():
+    df = pd.DataFrame({"company": COMPANIES.to_numpy(), "n": np.arange(len(COMPANIES))})
+    table = key_collision_clusters(df["company"])
+    merges = {"Acme Inc.": table.loc[table["cluster"] == 0, "value"].tolist()}
+
+    merged, record = merge_category_clusters(df, "company", merges)
+
+    assert merged["company"].tolist()[:5] == ["Acme Inc."] * 5
+    assert merged["company"].isna().tolist() == COMPANIES.isna().tolist()
+    assert record["details"] == {"clusters": 1, "rows_changed": 3}
+    categorical, _ = merge_category_clusters(df.astype({"company": "category"}), "company", merges)
+    assert categorical["company"].cat.categories.tolist().count("Acme Inc.") == 1
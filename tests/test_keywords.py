@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+from src.kernels.text_parsing import extract_keywords
+from src.utils import keywords as keyword_module
+from src.utils.keywords import AHOCORASICK_AVAILABLE, KeywordMatcher, find_keywords
+
+BACKENDS = ['regex', pytest.param('ahocorasick', marks=pytest.mark.skipif(
+    not AHOCORASICK_AVAILABLE, reason="pyahocorasick is not installed"))]
+
+KEYWORDS = ['new york', 'York City', 'york', 'cat', 'c++', 'C#', 'new']
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'text': ['New York City is big', 'I love new-york', 'concatenate cats', 'C++ and c# rock',
+                                  None, 'New York City is big', 'york city? cat.']})
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_overlapping_keywords_are_all_found_as_whole_words(backend):
+    matcher = KeywordMatcher(KEYWORDS, backend=backend)
+
+    def found(text):
+        return [matcher.keywords[i] for i in matcher.find(text)]
+
+    assert found('New York City is big') == ['new york', 'York City', 'york', 'new']
+    assert found('I love new-york') == ['york', 'new']
+    assert found('concatenate cats') == []
+    assert found('C++ and c# rock') == ['c++', 'C#']
+    assert found('york city? cat.') == ['York City', 'york', 'cat']
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_case_and_partial_words(backend):
+    assert KeywordMatcher(['cat', 'Cat'], case_sensitive=True, backend=backend).find('Cat') == [1]
+    assert KeywordMatcher(['cat', 'Cat'], backend=backend).keywords == ['cat']
+    assert KeywordMatcher(['cat', 'ten'], whole_words=False, backend=backend).find('concatenate') == [0, 1]
+
+def test_list_output_keeps_the_keyword_order_and_blanks_missing_values(df):
+    result, record = extract_keywords(df, 'text', KEYWORDS)
+
+    assert result['text_keywords'].tolist() == ['new york,York City,york,new', 'york,new', '', 'c++,C#', '',
+                                                'new york,York City,york,new', 'York City,york,cat']
+    assert record['params'] == {'text_column': 'text', 'keywords': KEYWORDS}
+    assert record['details']['rows_with_keywords'] == 5
+
+def test_multi_hot_output(df):
+    result, _ = extract_keywords(df, 'text', ['cat', 'york'], whole_words=False, output='multi_hot')
+
+    assert result['text_cat'].tolist() == [False, False, True, False, False, False, True]
+    assert result['text_york'].tolist() == [True, True, False, False, False, True, True]
+    with pytest.raises(ValueError):
+        extract_keywords(df, 'text', ['cat'], output='json')
+
+def test_worker_processes_give_the_same_result(df, monkeypatch):
+    monkeypatch.setattr(keyword_module, 'CHUNK_SIZE', 2)
+    texts = pd.concat([df['text']] * 3, ignore_index=True)
+
+    assert find_keywords(texts, KEYWORDS, workers=2)[2] == find_keywords(texts, KEYWORDS)[2]
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from src.utils.memory_optimizer import optimize_dtypes
+
+def test_optimize_dtypes_is_lossless_and_smaller():
+    df = pd.DataFrame({
+        'id': np.arange(1000),
+        'age': [25.0, None, 40.0, 31.0] * 250,
+        'score': [0.5, 0.25, 1.75, 2.0] * 250,
+        'ratio': np.linspace(0, 1, 1000),
+        'city': ['Athens', 'Patras', 'Athens', None] * 250,
+        'active': [True, False, None, True] * 250,
+    })
+    optimized, report = optimize_dtypes(df)
+
+    assert optimized['id'].dtype == np.int16
+    assert optimized['age'].dtype == 'Int8'
+    assert optimized['score'].dtype == np.float32
+    assert optimized['ratio'].dtype == np.float64
+    assert isinstance(optimized['city'].dtype, pd.CategoricalDtype)
+    assert optimized['active'].dtype == 'boolean'
+    assert optimized['city'].isna().sum() == 250
+    pd.testing.assert_frame_equal(optimized.astype(object).where(optimized.notna(), None),
+                                  df.astype(object).where(df.notna(), None), check_dtype=False)
+    assert report['memory_after'].sum() < report['memory_before'].sum()
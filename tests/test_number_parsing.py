@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.formatting import fix_inconsistent_formats
+from src.kernels.type_conversion import type_conversion
+from src.utils.number_parsing import infer_decimal_separator, parse_numbers
+
+@pytest.mark.parametrize("raw, expected", [
+    ("$1,234.56", 1234.56),
+    ("(1,200.00)", -1200.0),
+    ("1200-", -1200.0),
+    ("12 EUR", 12.0),
+    ("USD 7", 7.0),
+    ("15%", 0.15),
+    ("1 234 567.8", 1234567.8),
+    ("1'234.5", 1234.5),
+    ("−3.5", -3.5),
+])
+def test_amounts_are_parsed(raw, expected):
+    numbers, failed, _ = parse_numbers(pd.Series([raw]), decimal='.')
+
+    assert numbers[0] == pytest.approx(expected)
+    assert not failed.any()
+
+def test_decimal_comma_is_inferred():
+    values = pd.Series(['1.234,56', '€ 12,5', '(3,00)', '1.000'])
+
+    numbers, failed, decimal = parse_numbers(values)
+
+    assert decimal == ','
+    assert numbers.tolist() == [1234.56, 12.5, -3.0, 1000.0]
+    assert infer_decimal_separator(['1,234', '1.234']) == '.'
+
+def test_values_written_with_the_other_convention_fail():
+    values = pd.Series(['$1,234.56', 'EUR 1.234,56', '1.2.3', '12.5', '7'])
+
+    numbers, failed, decimal = parse_numbers(values)
+    comma_numbers, comma_failed, _ = parse_numbers(pd.Series(['1.234,56', '1,234.56', '3,5,0']), decimal=',')
+
+    assert decimal == '.'
+    assert failed.tolist() == [False, True, True, False, False]
+    assert numbers.isna().tolist() == [False, True, True, False, False]
+    assert comma_failed.tolist() == [False, True, True]
+    assert comma_numbers[0] == 1234.56
+
+def test_whole_numbers_stay_integers_and_failures_are_reported():
+    numbers, failed, _ = parse_numbers(pd.Series(['1', '2', '3']))
+    mixed, mixed_failed, _ = parse_numbers(pd.Series(['1', 'n/a', None, '']))
+
+    assert numbers.dtype == np.int64
+    assert not failed.any()
+    assert mixed.isna().tolist() == [False, True, True, True]
+    assert mixed_failed.tolist() == [False, True, False, False]
+
+def test_kernels_no_longer_fail_on_one_bad_cell():
+    df = pd.DataFrame({'price': ['$1,200.50', 'call us', '(300)']}, index=[3, 4, 5])
+
+    fixed, record = fix_inconsistent_formats(df, 'price', 'currency')
+    converted, conversion = type_conversion(df, {'numeric': ['price']})
+
+    np.testing.assert_array_equal(fixed['price'], [1200.5, np.nan, -300.0])
+    assert record["details"]["failed"] == {"count": 1, "rows": [4]}
+    pd.testing.assert_series_equal(converted['price'], fixed['price'])
+    assert conversion["details"]["failed"] == {"price": {"count": 1, "rows": [4]}}
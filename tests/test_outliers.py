@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.error_correction import cap_percentiles, correct_errors, replace_outliers
+from src.utils.outliers import correct_outliers, outlier_bounds
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"a": rng.normal(10, 1, 500), "b": rng.integers(0, 10, 500), "c": rng.normal(0, 1, 500),
+                          "name": ["x"] * 500})
+    frame.loc[3, "a"], frame.loc[4, "b"], frame.loc[5, "a"] = 100.0, 1_000, np.nan
+    return frame
+
+def test_bounds_match_the_per_column_statistics(df):
+    values = df[["a", "c"]].to_numpy()
+
+    lower, upper, _ = outlier_bounds(values, 'zscore', 3.0)
+    q1, q3 = df["c"].quantile([0.25, 0.75])
+    iqr_lower, iqr_upper, median = outlier_bounds(values, 'iqr', 1.5)
+
+    assert lower[0] == pytest.approx(df["a"].mean() - 3 * df["a"].std())
+    assert upper[1] == pytest.approx(df["c"].mean() + 3 * df["c"].std())
+    assert (iqr_lower[1], iqr_upper[1]) == pytest.approx((q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)))
+    assert median[0] == pytest.approx(df["a"].median())
+
+def test_columns_with_missing_values_are_corrected(df):
+    corrected, record = correct_errors(df)
+
+    assert corrected.loc[3, "a"] == pytest.approx(df["a"].median())
+    assert corrected.loc[4, "b"] == df["b"].median()
+    assert np.isnan(corrected.loc[5, "a"])
+    assert {item["column"] for item in record["details"]["columns"]} >= {"a", "b"}
+    assert df.loc[3, "a"] == 100.0
+
+@pytest.mark.parametrize("method", ['mad', 'iqr'])
+def test_robust_methods_clip_or_blank_only_the_affected_columns(df, method):
+    clipped, details = correct_outliers(df, ["a", "b"], method, replacement='clip')
+    blanked, _ = correct_outliers(df, ["a", "b"], method, replacement='nan')
+
+    by_column = {item["column"]: item for item in details}
+    assert clipped.loc[3, "a"] == pytest.approx(by_column["a"]["upper"])
+    assert clipped.loc[4, "b"] == pytest.approx(by_column["b"]["upper"])
+    assert np.isnan(blanked.loc[3, "a"]) and np.isnan(blanked.loc[4, "b"])
+    assert clipped["c"].equals(df["c"])
+    assert list(clipped.columns) == list(df.columns)
+
+def test_blocks_of_columns_give_the_same_result(df):
+    whole, _ = correct_outliers(df, ["a", "b", "c"], 'mad')
+    blocks, _ = correct_outliers(df, ["a", "b", "c"], 'mad', block_cells=len(df))
+
+    pd.testing.assert_frame_equal(whole, blocks)
+
+def test_replace_outliers_records_method_and_replacement(df):
+    _, record = replace_outliers(df, ["a"], 3.5, method='mad', replacement='nan')
+
+    assert record["params"] == {"columns": ["a"], "z_threshold": 3.5, "approximate": False,
+                                "method": "mad", "replacement": "nan"}
+    with pytest.raises(ValueError):
+        replace_outliers(df, ["a"], method='sigma')
+
+@pytest.fixture
+def salaries():
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame({"country": rng.choice(["GR", "US", "CH"], 900), "age": rng.integers(20, 60, 900)})
+    frame["salary"] = frame["country"].map({"GR": 20_000, "US": 60_000, "CH": 100_000}) + rng.normal(0, 2_000, 900)
+    # Normal among all salaries, but not among Greek ones
+    frame.loc[0, ["country", "salary"]] = ["GR", 95_000.0]
+    frame.loc[1, "country"] = None
+    return frame
+
+@pytest.mark.parametrize("method", ['zscore', 'mad', 'iqr'])
+def test_grouped_bounds_are_those_of_each_group(salaries, method):
+    corrected, details = correct_outliers(salaries, ["salary", "age"], method, group_by="country")
+    corrected_globally, _ = correct_outliers(salaries, ["salary", "age"], method)
+
+    greek = salaries[salaries["country"] == "GR"]
+    assert corrected.loc[0, "salary"] == pytest.approx(greek["salary"].median())
+    assert corrected_globally.loc[0, "salary"] == 95_000
+    for country, group in salaries.groupby("country"):
+        lower, upper, _ = outlier_bounds(group[["salary"]].to_numpy(), method)
+        expected = group.index[(group["salary"] < lower[0]) | (group["salary"] > upper[0])]
+        changed = group.index[corrected.loc[group.index, "salary"] != group["salary"]]
+        assert changed.tolist() == expected.tolist()
+    # The row without a country is its own group, which has too few values for outliers
+    assert corrected.loc[1, "salary"] == salaries.loc[1, "salary"]
+    assert details[0]["column"] == "salary" and details[0]["groups"] >= 1
+
+def test_grouped_percentiles_cap_each_group(salaries):
+    capped, record = cap_percentiles(salaries, ["salary"], 5, 95, group_by=["country"])
+
+    for country, group in salaries.groupby("country"):
+        low, high = group["salary"].quantile([0.05, 0.95])
+        assert capped.loc[group.index, "salary"].between(low, high).all()
+    assert capped.loc[0, "salary"] < 95_000
+    assert record["params"]["group_by"] == ["country"]
+
+@pytest.mark.filterwarnings("error::FutureWarning")
+def test_grouping_by_a_categorical_column_skips_unobserved_categories(salaries):
+    categorical = salaries.astype({"country": pd.CategoricalDtype(["GR", "US", "CH", "FR"])})
+
+    corrected, details = correct_outliers(categorical, ["salary"], 'mad', group_by="country")
+    capped, _ = cap_percentiles(categorical, ["salary"], 5, 95, group_by=["country"])
+
+    expected, expected_details = correct_outliers(salaries, ["salary"], 'mad', group_by="country")
+    pd.testing.assert_series_equal(corrected["salary"], expected["salary"])
+    assert details == expected_details
+    pd.testing.assert_series_equal(capped["salary"], cap_percentiles(salaries, ["salary"], 5, 95, group_by=["country"])[0]["salary"])
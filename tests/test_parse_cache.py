@@ -0,0 +1,28 @@
+import pandas as pd
+from src.utils.parse_cache import ParseCache, content_digest, frame_nbytes
+
+def make_frame(rows):
+    return pd.DataFrame({'id': range(rows), 'value': [float(i) for i in range(rows)]})
+
+def test_content_digest_depends_on_content_and_options():
+    content = b"id,name\n1,Alice\n"
+    assert content_digest(content) == content_digest(content, {})
+    assert content_digest(content) != content_digest(content + b"2,Bob\n")
+    assert content_digest(content, {'sep': ','}) != content_digest(content, {'sep': ';'})
+
+def test_parse_cache_evicts_least_recently_used_by_bytes():
+    small = make_frame(100)
+    cache = ParseCache(max_bytes=frame_nbytes(small) * 2)
+    cache.put('a', small)
+    cache.put('b', make_frame(100))
+    cache.get('a')  # 'b' is now the least recently used entry
+    cache.put('c', make_frame(100))
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+def test_parse_cache_does_not_retain_oversized_frames():
+    cache = ParseCache(max_bytes=10)
+    entry = cache.put('big', make_frame(100), {'rows': 100})
+    assert entry['metadata']['rows'] == 100
+    assert len(cache) == 0
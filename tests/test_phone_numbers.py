@@ -0,0 +1,48 @@
+import io
+
+import pandas as pd
+import pytest
+from src.kernels.formatting import fix_inconsistent_formats
+from src.utils.phone_numbers import normalize_phone_numbers
+
+@pytest.mark.parametrize("raw, region, expected", [
+    ("(212) 555-0123", "US", "+12125550123"),
+    ("1-212-555-0123", "US", "+12125550123"),
+    ("212.555.0123 ext. 45", "US", "+12125550123"),
+    ("+44 (0)20 7946 0958", "US", "+442079460958"),
+    ("0044 20 7946 0958", "US", "+442079460958"),
+    ("020 7946 0958", "GB", "+442079460958"),
+    ("302101234567", "GR", "+302101234567"),
+    ("210 123 4567", "GR", "+302101234567"),
+    ("555-0123", "US", None),
+    ("(212) 055-0123", "US", None),
+    ("not a number", "GR", None),
+])
+def test_numbers_are_normalized_to_e164(raw, region, expected):
+    numbers, valid = normalize_phone_numbers(pd.Series([raw]), region)
+
+    assert numbers[0] == expected
+    assert valid[0] == (expected is not None)
+
+def test_phone_kernel_flags_invalid_numbers_and_keeps_them():
+    df = pd.DataFrame({'phone': ['212-555-0123', 'n/a', None, '+1 212 555 0123']}, index=[5, 6, 7, 8])
+
+    fixed, record = fix_inconsistent_formats(df, 'phone', 'phone', default_region='US', valid_column='phone_valid')
+
+    assert fixed['phone'].tolist() == ['+12125550123', 'n/a', None, '+12125550123']
+    assert fixed['phone_valid'].tolist() == [True, False, False, True]
+    assert record["details"]["failed"] == {"count": 1, "rows": [6]}
+
+def test_digit_only_numbers_read_as_floats_are_valid():
+    # A CSV column of digits with a blank cell is read as float64
+    phones = pd.read_csv(io.StringIO("id,phone\n1,2125550123\n2,\n3,13125550188\n"))['phone']
+    assert phones.dtype == 'float64'
+
+    numbers, valid = normalize_phone_numbers(phones, 'US')
+
+    assert numbers.tolist() == ['+12125550123', None, '+13125550188']
+    assert valid.tolist() == [True, False, True]
+
+def test_unknown_region_is_rejected():
+    with pytest.raises(ValueError, match="Unknown region"):
+        normalize_phone_numbers(pd.Series(['123']), 'XX')
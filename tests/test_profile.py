@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.dataset_store import DatasetStore, enable_copy_on_write, make_history_entry
+from src.utils.profile import ProfileCache
+
+from src.kernels.error_correction import find_impossible_values
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'age': [25.0, 130.0, None, 40.0],
+        'city': ['Athens', 'Paris', 'Athens', None],
+        'score_pct': [10, 50, 90, 100],
+    })
+
+def test_profile_matches_pandas(df):
+    profile = ProfileCache().profile(df)
+
+    expected = df.describe(include='all')
+    pd.testing.assert_frame_equal(profile.describe().loc[expected.index].astype(object), expected.astype(object))
+    assert profile.missing_counts().to_dict() == {'age': 1, 'city': 1, 'score_pct': 0}
+
+def test_only_changed_columns_are_profiled_again(df):
+    enable_copy_on_write()
+    store = DatasetStore(df)
+    cache = ProfileCache()
+    before = cache.profile(store.current, store.column_tokens())
+
+    changed = store.current.copy(deep=False)
+    changed['city'] = changed['city'].str.upper()
+    store.commit(changed, [make_history_entry("Uppercased cities")])
+    after = cache.profile(store.current, store.column_tokens())
+
+    assert after.columns['age'] is before.columns['age']
+    assert after.columns['city'] is not before.columns['city']
+    assert after.stat('city', 'top') == 'ATHENS'
+    assert len(cache) == 4
+
+    store.undo()
+    assert cache.profile(store.current, store.column_tokens()).columns['city'] is before.columns['city']
+
+def test_impossible_values_from_profile(df):
+    profile = ProfileCache().profile(df)
+
+    assert find_impossible_values(df, profile) == find_impossible_values(df) == [('age', 'age')]
@@ -0,0 +1,64 @@
+import json
+
+import pandas as pd
+import pytest
+from src.utils.recipes import (apply_recipe, load_recipe, recipe_from_history, recipe_step,
+                               recipe_to_json, run_recipe_batch, save_recipe)
+
+@pytest.fixture
+def recipe():
+    return {
+        "version": 1,
+        "steps": [
+            recipe_step("handle_missing_data", strategy='drop'),
+            recipe_step("drop_duplicates"),
+            recipe_step("merge_columns", column1='first', column2='last', new_column='name', separator=' '),
+            recipe_step("fix_negative_values", columns=['amount'], method='abs'),
+        ],
+    }
+
+@pytest.fixture
+def raw():
+    return pd.DataFrame({
+        'first': ['Ann', 'Bob', 'Bob', None],
+        'last': ['Lee', 'Ray', 'Ray', 'Kay'],
+        'amount': [10.0, -5.0, -5.0, 1.0],
+    })
+
+def test_apply_recipe_replays_steps_in_order(raw, recipe):
+    result = apply_recipe(raw, recipe)
+
+    assert result['name'].tolist() == ['Ann Lee', 'Bob Ray']
+    assert result['amount'].tolist() == [10.0, 5.0]
+    assert raw['amount'].tolist() == [10.0, -5.0, -5.0, 1.0]
+
+def test_recipe_from_history_keeps_only_replayable_entries(recipe):
+    history = [{"action": "Loaded", "timestamp": "t"}] + [{"action": "step", "timestamp": "t", "operation": step} for step in recipe["steps"]]
+
+    assert recipe_from_history(history, "feed.csv")["steps"] == recipe["steps"]
+
+def test_recipe_round_trips_through_json(tmp_path, recipe):
+    path = tmp_path / "recipe.json"
+    save_recipe(recipe, path)
+
+    assert load_recipe(path)["steps"] == json.loads(recipe_to_json(recipe))["steps"]
+
+def test_unknown_operation_is_rejected(raw):
+    with pytest.raises(ValueError, match="unknown operation"):
+        apply_recipe(raw, {"version": 1, "steps": [recipe_step("shred")]})
+
+def test_run_recipe_batch_cleans_each_file(tmp_path, raw, recipe):
+    inputs = []
+    for day in range(3):
+        path = tmp_path / f"feed_{day}.csv"
+        raw.to_csv(path, index=False)
+        inputs.append(str(path))
+    broken = tmp_path / "broken.csv"
+    broken.write_text("other\n1\n")
+    inputs.append(str(broken))
+
+    summaries = run_recipe_batch(recipe, inputs, tmp_path / "out", workers=2)
+
+    assert [summary["rows_out"] for summary in summaries[:3]] == [2, 2, 2]
+    assert summaries[3]["error"] and "Step 3" in summaries[3]["error"]
+    assert pd.read_csv(tmp_path / "out" / "feed_0.csv")['name'].tolist() == ['Ann Lee', 'Bob Ray']
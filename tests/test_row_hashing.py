@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.duplicates import drop_duplicates
+from src.utils.row_hashing import RowHashSet, deduplicate_chunks, deduplicate_file, row_hashes
+
+@pytest.fixture
+def orders():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'customer': rng.integers(0, 50, 5_000),
+        'product': rng.choice(['apple', 'pear', None], 5_000),
+        'amount': rng.integers(0, 10, 5_000) / 2,
+    })
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_streamed_chunks_match_drop_duplicates(orders, bits):
+    hash_set = RowHashSet(bits)
+    chunks = (orders.iloc[start:start + 700] for start in range(0, len(orders), 700))
+
+    kept = pd.concat(deduplicate_chunks(chunks, hash_set, subset=['customer', 'product']))
+
+    pd.testing.assert_frame_equal(kept, orders.drop_duplicates(['customer', 'product']))
+    assert len(hash_set) == len(kept)
+    assert hash_set.nbytes == len(kept) * bits // 8
+
+def test_hashes_do_not_depend_on_the_dtype_values_were_read_as():
+    compact = pd.DataFrame({'id': pd.array([1, None, -3], dtype='Int8'),
+                            'at': pd.to_datetime(['2024-01-01 10:00'] * 3).tz_localize('Europe/Athens')})
+    wide = pd.DataFrame({'id': [1.0, np.nan, -3.0],
+                         'at': pd.to_datetime(['2024-01-01 08:00'] * 3)})
+
+    np.testing.assert_array_equal(row_hashes(compact, bits=128), row_hashes(wide, bits=128))
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_saved_hash_set_deduplicates_the_next_file(tmp_path, orders, bits):
+    first, second = orders.iloc[:3_000], orders.iloc[3_000:]
+    hash_set = RowHashSet(bits)
+    drop_duplicates(first, seen=hash_set)
+    hash_set.save(tmp_path / "seen.npy")
+
+    second.to_csv(tmp_path / "second.csv", index=False)
+    rows_in, rows_out = deduplicate_file(str(tmp_path / "second.csv"), str(tmp_path / "second.csv"),
+                                         RowHashSet.load(tmp_path / "seen.npy"), chunksize=500)
+
+    expected = orders[~orders.duplicated()].loc[3_000:]
+    assert (rows_in, rows_out) == (len(second), len(expected))
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "second.csv").fillna({'product': ''}),
+                                  expected.reset_index(drop=True).fillna({'product': ''}))
+
+def test_drop_duplicates_reports_rows_seen_before(orders):
+    hash_set = RowHashSet(64, row_hashes(orders.iloc[:10]))
+
+    cleaned, record = drop_duplicates(orders.iloc[:20], seen=hash_set)
+
+    assert record["details"]["seen_before"] == 10
+    assert record["params"]["hash_bits"] == 64
+    rows = orders.iloc[:20]
+    pd.testing.assert_frame_equal(cleaned, rows[~rows.duplicated()].loc[10:])
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_ids_above_2_53_are_not_merged(bits):
+    ids = [1234567890123456789, 1234567890123456788, 1234567890123456700, 2 ** 53 + 1, 2 ** 53]
+    df = pd.DataFrame({'order_id': ids * 2})
+
+    cleaned, _ = drop_duplicates(df, hash_bits=bits)
+
+    pd.testing.assert_frame_equal(cleaned, df.drop_duplicates())
+    # The same integers hash the same whatever they were read as
+    same = [pd.Series(ids, dtype='Int64'), pd.Series(ids, dtype='uint64'), pd.Series([2 ** 53, 7], dtype='float64')]
+    hashes = [row_hashes(series.to_frame('order_id'), bits=bits) for series in same]
+    np.testing.assert_array_equal(hashes[0], row_hashes(df.iloc[:5], bits=bits))
+    np.testing.assert_array_equal(hashes[1], hashes[0])
+    np.testing.assert_array_equal(hashes[2], row_hashes(pd.DataFrame({'order_id': [2 ** 53, 7]}), bits=bits))
+    assert row_hashes(pd.DataFrame({'x': [0.5, 1.0]}))[1] == row_hashes(pd.DataFrame({'x': [1]}))[0]
+
+def test_hash_set_of_many_chunks_holds_each_hash_once():
+    rng = np.random.default_rng(1)
+    chunks = [rng.integers(0, 2 ** 63, 200, dtype=np.uint64) % np.uint64(5_000) for _ in range(100)]
+    hash_set = RowHashSet(64)
+    for chunk in chunks:
+        hash_set.add(chunk)
+
+    expected = np.unique(np.concatenate(chunks))
+    assert len(hash_set) == len(expected)
+    np.testing.assert_array_equal(hash_set.contains(expected), True)
+    np.testing.assert_array_equal(hash_set.hashes(), expected)
@@ -0,0 +1,83 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.error_correction import find_impossible_values, validate_rules
+from src.utils.recipes import apply_recipe, recipe_from_history, recipe_to_json
+from src.utils.rules import evaluate_rules, load_rules
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'age': [25, 130, None, -1],
+        'zip': ['12345', '1234', None, 'abcde'],
+        'status': pd.Categorical(['open', 'x', 'closed', None]),
+        'start': pd.to_datetime(['2020-01-01', '2020-02-01', None, '2020-03-01']),
+        'end': pd.to_datetime(['2020-01-05', '2020-01-01', '2020-01-01', '2020-03-01']),
+    }, index=list('abcd'))
+
+RULES = [
+    {"type": "range", "column": "age", "min": 0, "max": 120},
+    {"type": "regex", "column": "zip", "pattern": "[0-9]{5}"},
+    {"name": "known status", "type": "allowed", "column": "status", "values": ["open", "closed"], "required": True},
+    {"type": "expression", "expression": "end >= start"},
+    {"type": "range", "column": "start", "min": "2020-01-15"},
+]
+
+def test_each_rule_reports_its_violating_rows(df):
+    report, counts = evaluate_rules(df, RULES)
+
+    assert [(item["rule"], item["count"], item["rows"]) for item in report] == [
+        ("age range", 2, ['b', 'd']),
+        ("zip regex", 2, ['b', 'd']),
+        ("known status", 2, ['b', 'd']),
+        # Rows missing a date the expression reads do not violate it
+        ("end >= start expression", 1, ['b']),
+        ("start range", 1, ['a']),
+    ]
+    assert counts.tolist() == [1, 4, 0, 3]
+
+def test_rules_load_from_json_and_violating_rows_are_flagged_or_removed(df):
+    rules = load_rules(io.BytesIO(json.dumps({"rules": RULES}).encode()))
+
+    flagged, record = validate_rules(df, rules, 'flag')
+    removed, _ = validate_rules(df, rules, 'remove')
+    reported, reported_record = validate_rules(df, rules, limit=1)
+
+    assert flagged['rule_violations'].tolist() == [1, 4, 0, 3]
+    assert record["details"]["rows_violating"] == 3
+    assert removed.index.tolist() == ['c']
+    assert reported is df
+    assert reported_record["details"]["rules"][0]["rows"] == ['b']
+
+def test_recipe_with_loaded_rules_exports_and_replays(df):
+    rules = load_rules(io.BytesIO(json.dumps(RULES).encode()))
+    flagged, record = validate_rules(df, rules, 'flag')
+
+    exported = recipe_to_json(recipe_from_history([{"action": "validate", "timestamp": "t", "operation": record}]))
+
+    replayed = apply_recipe(df, json.loads(exported))
+    pd.testing.assert_frame_equal(replayed, flagged)
+
+def test_invalid_rules_are_rejected(df):
+    with pytest.raises(ValueError, match="invalid rule type"):
+        evaluate_rules(df, [{"type": "between", "column": "age"}])
+    with pytest.raises(ValueError, match="needs a \"min\""):
+        evaluate_rules(df, [{"type": "range", "column": "age"}])
+    with pytest.raises(ValueError, match="does not exist"):
+        evaluate_rules(df, [{"type": "regex", "column": "missing", "pattern": "x"}])
+
+def test_impossible_values_are_found_with_the_rule_engine():
+    df = pd.DataFrame({'age': [25, 130], 'score_pct': [10, 50], 'Percent done': [5, 101], 'name': ['a', 'b']})
+
+    assert find_impossible_values(df) == [('age', 'age'), ('pct', 'Percent done')]
+
+def test_violations_far_apart_are_all_counted():
+    values = np.zeros(1_000_000)
+    values[[3, 999_999]] = -1
+
+    report, _ = evaluate_rules(pd.DataFrame({'x': values}), [{"type": "range", "column": "x", "min": 0}], limit=5)
+
+    assert report[0]["count"] == 2 and report[0]["rows"] == [3, 999_999]
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+from src.utils.profile import ProfileCache
+from src.utils.sketches import FrequentItems, HyperLogLog, QuantileSketch, hash_values, sketch_frame
+
+from src.kernels.error_correction import cap_percentiles
+
+def test_hyperloglog_estimate_within_error():
+    values = pd.Series(np.arange(200_000)).astype(str)
+    hll = HyperLogLog()
+    hll.update(values)
+
+    assert abs(hll.estimate() - 200_000) < 4 * hll.relative_error * 200_000
+
+def test_quantiles_within_rank_error_and_merge_matches_whole():
+    values = np.random.default_rng(0).normal(size=100_000)
+    parts = [QuantileSketch(seed=i) for i in range(4)]
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        part.update(chunk)
+    for part in parts[1:]:
+        parts[0].merge(part)
+
+    estimates = parts[0].quantiles([0.05, 0.5, 0.95])
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+    assert parts[0].n == len(values)
+    assert np.all(np.abs(ranks - [0.05, 0.5, 0.95]) <= 2 * parts[0].rank_error)
+
+def test_frequent_items_undercount_is_bounded():
+    values = pd.Series(['a'] * 500 + ['b'] * 300 + [str(i) for i in range(2_000)])
+    left, right = FrequentItems(k=10), FrequentItems(k=10)
+    left.update(values[:1_400])
+    right.update(values[1_400:])
+    left.merge(right)
+
+    top = left.top(2)
+    assert list(top.index) == ['a', 'b']
+    assert 500 - left.error <= top['a'] <= 500
+    assert left.error <= left.n / 11
+
+def test_sketch_frame_matches_exact_profile():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'x': rng.normal(10, 2, 50_000),
+        'city': pd.Categorical(rng.choice(['Athens', 'Paris', 'Rome'], 50_000, p=[0.5, 0.3, 0.2])),
+    })
+    df.loc[::10, 'x'] = np.nan
+
+    sketches = sketch_frame(df, chunk_rows=7_000, workers=2)
+    x, city = sketches[0].stats(), sketches[1].stats()
+    assert x['count'] == df['x'].count()
+    assert np.isclose(x['mean'], df['x'].mean()) and np.isclose(x['std'], df['x'].std())
+    assert x['min'] == df['x'].min() and x['max'] == df['x'].max()
+    assert abs(x['50%'] - df['x'].median()) < 0.1
+    assert (city['unique'], city['top']) == (3, 'Athens')
+    assert city['freq'] == (df['city'] == 'Athens').sum()
+    assert hash_values(pd.Series(['a'])).dtype == np.uint64
+
+def test_approximate_profile_reports_errors_and_feeds_capping():
+    df = pd.DataFrame({'x': np.arange(10_000, dtype=float), 'name': ['n'] * 10_000})
+    profile = ProfileCache().profile(df, approximate=True)
+
+    assert profile.approximate
+    assert list(profile.errors().index) == ['x', 'name']
+    sketches = profile.quantile_sketches(['x', 'name'])
+    assert list(sketches) == ['x']
+
+    capped, record = cap_percentiles(df, ['x'], 5, 95, approximate=True, sketches=sketches)
+    exact, _ = cap_percentiles(df, ['x'], 5, 95)
+    assert record["params"]["approximate"] is True
+    assert abs(capped['x'].min() - exact['x'].min()) <= 2 * sketches['x'].rank_error * len(df)
+    assert abs(capped['x'].max() - exact['x'].max()) <= 2 * sketches['x'].rank_error * len(df)
@@ -0,0 +1,53 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.kernels.categorical import standardize_categorical_data
+from src.utils.synonyms import load_synonyms, standardize_values, synonym_lookup
+
+COUNTRIES = {"United States": ["us", "USA", "u.s.a."], "Greece": ["gr", "Hellas", "Ελλάδα"]}
+
+def test_variants_map_to_standard_values_and_nulls_stay_null():
+    values = pd.Series([' USA', 'hellas', 'Greece', None, 'France ', np.nan, 'u.s.a.'])
+
+    standardized, mapped = standardize_values(values, COUNTRIES)
+
+    assert standardized.tolist()[:3] == ['United States', 'Greece', 'Greece']
+    assert standardized.isna().tolist() == [False, False, False, True, False, True, False]
+    assert standardized[4] == 'france'
+    assert mapped == 4
+
+def test_categorical_columns_keep_their_codes_and_merge_categories():
+    values = pd.Series(['us', 'USA', None, 'gr', 'Spain'], dtype='category')
+
+    standardized, _ = standardize_values(values, COUNTRIES)
+
+    assert isinstance(standardized.dtype, pd.CategoricalDtype)
+    assert sorted(standardized.cat.categories) == ['Greece', 'United States', 'spain']
+    assert standardized.tolist() == ['United States', 'United States', np.nan, 'Greece', 'spain']
+
+def test_string_columns_keep_their_dtype():
+    values = pd.Series(['M', 'woman', pd.NA], dtype='string')
+
+    fixed, record = standardize_categorical_data(pd.DataFrame({'gender': values}), 'gender')
+
+    assert fixed['gender'].dtype == 'string'
+    assert fixed['gender'].tolist()[:2] == ['male', 'female'] and fixed['gender'].isna()[2]
+    assert record["params"] == {"column_name": "gender"}
+
+def test_synonym_files_load_from_json_and_csv(tmp_path):
+    json_path = tmp_path / "countries.json"
+    json_path.write_text(json.dumps(COUNTRIES), encoding="utf-8")
+    csv_path = tmp_path / "countries.csv"
+    csv_path.write_text("variant,standard\nus,United States\nUSA,United States\nhellas,Greece\n", encoding="utf-8")
+
+    assert load_synonyms(str(json_path)) == COUNTRIES
+    assert load_synonyms(str(csv_path)) == {"United States": ["us", "USA"], "Greece": ["hellas"]}
+    fixed, record = standardize_categorical_data(pd.DataFrame({'country': ['usa', 'Hellas']}), 'country', str(csv_path))
+    assert fixed['country'].tolist() == ['United States', 'Greece']
+    assert record["params"]["synonyms"] == str(csv_path)
+
+def test_conflicting_variants_are_rejected():
+    with pytest.raises(ValueError, match="variant of both"):
+        synonym_lookup({"Georgia": ["GA"], "Gabon": ["ga"]})